@@ -43,6 +43,10 @@ class DynamicDocsManager:
                 "name": "Health",
                 "description": "V1 API - Health monitoring and system status",
             },
+            {
+                "name": "Metrics",
+                "description": "V1 API - Latency percentiles, turn waterfalls and cache statistics",
+            },
         ]
 
     def generate_description(self) -> str:
@@ -6,12 +6,13 @@ REST API endpoints organized by domain.
 
 Available endpoints:
 - health: Health checks and readiness probes
+- metrics: Latency percentiles, turn waterfalls and semantic cache stats
 - calls: Call management and lifecycle operations
 - events: Event system monitoring and processing  
 - media: Media streaming and transcription services
 - realtime: Real-time communication and WebSocket endpoints
 """
 
-from . import health, calls, media, realtime
+from . import health, calls, media, metrics, realtime
 
-__all__ = ["health", "calls", "media", "realtime"]
+__all__ = ["health", "calls", "media", "metrics", "realtime"]
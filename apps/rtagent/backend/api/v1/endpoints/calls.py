@@ -5,7 +5,7 @@ Call Management Endpoints
 REST API endpoints for managing phone calls through Azure Communication Services.
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
 from fastapi.responses import JSONResponse
 from opentelemetry import trace
@@ -33,6 +33,7 @@ from ..handlers.acs_call_lifecycle import ACSLifecycleHandler
 from ..dependencies.orchestrator import get_orchestrator
 from ..events import CallEventProcessor, ACSEventTypes
 from src.enums.stream_modes import StreamMode
+from src.pools.executors import Workload, run_in_workload
 from config import ACS_STREAMING_MODE
 from apps.rtagent.backend.src.agents.Lvagent.factory import build_lva_from_yaml
 import asyncio
@@ -42,6 +43,26 @@ logger = get_logger("api.v1.calls")
 tracer = trace.get_tracer(__name__)
 router = APIRouter()
 
+_CALL_LIST_PROJECTION = ["call_id", "status", "duration", "participants", "events"]
+
+
+async def _connect_voice_live_agent(app, agent_yaml: str) -> Dict[str, Any]:
+    """
+    Call-context entries holding a Voice Live agent for the media WS to claim.
+
+    With the pool running the agent is parked under a lease TTL, so it goes
+    back to the pool if the media WebSocket never connects; otherwise one is
+    connected directly.
+    """
+    pool = getattr(app.state, "voice_live_pool", None)
+    if pool is not None:
+        return {"lva_lease": await pool.park_agent(agent_yaml)}
+    agent = await run_in_workload(
+        Workload.MISC, build_lva_from_yaml, agent_yaml, enable_audio_io=False
+    )
+    await agent.connect_async()
+    return {"lva_agent": agent}
+
 
 def create_call_event(event_type: str, call_id: str, data: dict) -> CloudEvent:
     """
@@ -190,7 +211,7 @@ async def initiate_call(
                 if result.get("status") == "success":
                     call_id = result.get("callId")
 
-                    # Pre-initialize a Voice Live session bound to this call (no audio yet, no pool)
+                    # Pre-initialize a Voice Live session bound to this call (no audio yet)
                     try:
                         if ACS_STREAMING_MODE == StreamMode.VOICE_LIVE and hasattr(
                             http_request.app.state, "conn_manager"
@@ -199,15 +220,14 @@ async def initiate_call(
                                 "VOICE_LIVE_AGENT_YAML",
                                 "apps/rtagent/backend/src/agents/Lvagent/agent_store/auth_agent.yaml",
                             )
-                            lva_agent = build_lva_from_yaml(
-                                agent_yaml, enable_audio_io=False
+                            lva_context = await _connect_voice_live_agent(
+                                http_request.app, agent_yaml
                             )
-                            await asyncio.to_thread(lva_agent.connect)
                             # Store for media WS to claim later
                             await http_request.app.state.conn_manager.set_call_context(
                                 call_id,
                                 {
-                                    "lva_agent": lva_agent,
+                                    **lva_context,
                                     "target_number": request.target_number,
                                     "browser_session_id": browser_session_id,
                                 },
@@ -280,7 +300,8 @@ async def initiate_call(
     Retrieve a paginated list of calls with optional filtering.
     
     Supports:
-    - Pagination with page and limit parameters
+    - Pagination with page and limit parameters, or keyset pagination with
+      the continuation_token returned by the previous page
     - Filtering by call status
     - Sorting by creation time (newest first)
     """,
@@ -303,6 +324,7 @@ async def initiate_call(
                         "total": 25,
                         "page": 1,
                         "limit": 10,
+                        "continuation_token": "WyIyMDI1LTAxLTAxVDEyOjAwOjAwWiIsICJjYWxsX2FiYyJd",
                     }
                 }
             },
@@ -345,6 +367,10 @@ async def list_calls(
         ],
         examples={"default": {"summary": "status filter", "value": "connected"}},
     ),
+    continuation_token: Optional[str] = Query(
+        None,
+        description="Token from the previous response; takes precedence over page",
+    ),
 ) -> CallListResponse:
     """
     List calls with pagination and filtering.
@@ -357,6 +383,8 @@ async def list_calls(
     :type limit: int
     :param status_filter: Filter calls by status
     :type status_filter: Optional[str]
+    :param continuation_token: Keyset cursor returned by the previous page
+    :type continuation_token: Optional[str]
     :return: Paginated list of calls with filtering results
     :rtype: CallListResponse
     :raises HTTPException: When database query fails or invalid parameters provided
@@ -370,21 +398,32 @@ async def list_calls(
             # Get cosmos DB manager from app state
             cosmos_manager = request.app.state.cosmos
 
-            # Build query filter
-            query_filter = {}
+            # Build query filter (only call documents carry call_id)
+            query_filter = {"call_id": {"$exists": True}}
             if status_filter:
                 query_filter["status"] = status_filter
 
-            # Query calls from database
-            all_calls = cosmos_manager.query_documents(query_filter)
-
-            # Filter to only call documents (those with call_id field)
-            call_docs = [doc for doc in all_calls if "call_id" in doc]
-
-            # Apply pagination
-            start = (page - 1) * limit
-            end = start + limit
-            paginated_calls = call_docs[start:end]
+            # Page and count server-side on the storage pool, off the event loop
+            try:
+                (paginated_calls, next_token), total = await asyncio.gather(
+                    run_in_workload(
+                        Workload.STORAGE,
+                        cosmos_manager.query_page,
+                        query_filter,
+                        limit,
+                        sort_field="timestamp",
+                        projection=_CALL_LIST_PROJECTION,
+                        continuation_token=continuation_token,
+                        skip=(page - 1) * limit,
+                    ),
+                    run_in_workload(
+                        Workload.STORAGE, cosmos_manager.count_documents, query_filter
+                    ),
+                )
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+                )
 
             # Convert database documents to response models
             calls = []
@@ -398,17 +437,17 @@ async def list_calls(
                 )
                 calls.append(call_response)
 
-            op.log_info(f"Found {len(call_docs)} total calls, returning {len(calls)}")
+            op.log_info(f"Found {total} total calls, returning {len(calls)}")
 
             # Optional: Emit event for call list operations (for monitoring/analytics)
-            if call_docs:  # Only emit if we actually found calls
+            if calls:  # Only emit if we actually found calls
                 try:
                     event_processor = CallEventProcessor()
                     list_event = create_call_event(
                         event_type="CallListRequested",
                         call_id="api-operation",  # Use generic ID for API operations
                         data={
-                            "total_calls": len(call_docs),
+                            "total_calls": total,
                             "returned_calls": len(calls),
                             "page": page,
                             "limit": limit,
@@ -417,8 +456,6 @@ async def list_calls(
                         },
                     )
                     # Fire and forget - don't await to avoid adding latency
-                    import asyncio
-
                     asyncio.create_task(
                         event_processor.process_events([list_event], request.app.state)
                     )
@@ -427,9 +464,15 @@ async def list_calls(
                     op.log_info(f"Failed to emit list event: {e}")
 
             return CallListResponse(
-                calls=calls, total=len(call_docs), page=page, limit=limit
+                calls=calls,
+                total=total,
+                page=page,
+                limit=limit,
+                continuation_token=next_token,
             )
 
+        except HTTPException:
+            raise
         except Exception as e:
             op.set_error(str(e))
             raise HTTPException(
@@ -543,12 +586,11 @@ async def answer_inbound_call(
                                 "VOICE_LIVE_AGENT_YAML",
                                 "apps/rtagent/backend/src/agents/Lvagent/agent_store/auth_agent.yaml",
                             )
-                            lva_agent = build_lva_from_yaml(
-                                agent_yaml, enable_audio_io=False
+                            lva_context = await _connect_voice_live_agent(
+                                http_request.app, agent_yaml
                             )
-                            await asyncio.to_thread(lva_agent.connect)
                             await http_request.app.state.conn_manager.set_call_context(
-                                call_connection_id, {"lva_agent": lva_agent}
+                                call_connection_id, lva_context
                             )
                             logger.info(
                                 f"Pre-initialized Voice Live agent for inbound call {call_connection_id}"
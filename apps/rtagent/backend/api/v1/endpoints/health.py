@@ -9,7 +9,7 @@ Includes all critical dependency checks with proper timeouts and error handling.
 import asyncio
 import re
 import time
-from typing import Dict, List, Optional, Any
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 from pydantic import BaseModel
 from fastapi import APIRouter, HTTPException, Request, Depends
 from fastapi.responses import JSONResponse
@@ -33,6 +33,7 @@ from apps.rtagent.backend.api.v1.schemas.health import (
     ReadinessResponse,
 )
 from utils.ml_logging import get_logger
+from utils.readiness import ReadinessProber
 
 logger = get_logger("v1.health")
 
@@ -311,6 +312,11 @@ async def health_check(request: Request) -> HealthResponse:
     - AZURE_TENANT_ID is set and is a valid GUID  
     - ALLOWED_CLIENT_IDS contains at least one valid GUID
     
+    With ENABLE_READINESS_PROBER=true (default) checks run in the background on
+    their own interval with jitter and exponential backoff, and this endpoint
+    returns the cached results. Each check then reports `age_ms`, `stale` and
+    `consecutive_failures`; a stale healthy result is reported as unhealthy.
+    
     Returns 503 if any critical services are unhealthy, 200 if all systems are ready.
     """,
     tags=["Health"],
@@ -329,6 +335,9 @@ async def health_check(request: Request) -> HealthResponse:
                                 "status": "healthy",
                                 "check_time_ms": 12.5,
                                 "details": "Connected to Redis successfully",
+                                "age_ms": 4210.0,
+                                "stale": False,
+                                "consecutive_failures": 0,
                             },
                             {
                                 "component": "auth_configuration",
@@ -380,78 +389,20 @@ async def readiness_check(
     """
     Comprehensive readiness probe: checks all critical dependencies with timeouts.
     Returns 503 if any critical services are unhealthy.
+
+    When the background prober is running (``app.state.readiness_prober``)
+    the response is built from its cached snapshot without touching any
+    dependency; otherwise every check runs inline.
     """
     start_time = time.time()
-    health_checks: List[ServiceCheck] = []
-    overall_status = "ready"
-    timeout = 1.0  # seconds per check
-
-    async def fast_ping(check_fn, *args, component=None):
-        try:
-            result = await asyncio.wait_for(check_fn(*args), timeout=timeout)
-            return result
-        except Exception as e:
-            return ServiceCheck(
-                component=component or check_fn.__name__,
-                status="unhealthy",
-                error=str(e),
-                check_time_ms=round((time.time() - start_time) * 1000, 2),
-            )
-
-    # Pre-compute active session count (thread-safe)
-    active_sessions = 0
-    try:
-        if hasattr(request.app.state, "session_manager"):
-            active_sessions = await request.app.state.session_manager.get_session_count()  # type: ignore[attr-defined]
-    except Exception:
-        active_sessions = -1  # signal error fetching sessions
-
-    # Check Redis connectivity (minimal – no verbose details)
-    redis_status = await fast_ping(
-        _check_redis_fast, request.app.state.redis, component="redis"
-    )
-    health_checks.append(redis_status)
-
-    # Check Azure OpenAI client
-    aoai_status = await fast_ping(
-        _check_azure_openai_fast,
-        request.app.state.aoai_client,
-        component="azure_openai",
-    )
-    health_checks.append(aoai_status)
-
-    # Check Speech Services (configuration & pool readiness)
-    speech_status = await fast_ping(
-        _check_speech_configuration_fast,
-        getattr(request.app.state, "stt_pool", None),
-        getattr(request.app.state, "tts_pool", None),
-        component="speech_services",
-    )
-    health_checks.append(speech_status)
-
-    # Check ACS Caller
-    acs_status = await fast_ping(
-        _check_acs_caller_fast, request.app.state.acs_caller, component="acs_caller"
-    )
-    health_checks.append(acs_status)
-
-    # Check RT Agents
-    agent_status = await fast_ping(
-        _check_rt_agents_fast,
-        request.app.state.auth_agent,
-        request.app.state.claim_intake_agent,
-        component="rt_agents",
-    )
-    health_checks.append(agent_status)
-
-    # Check Authentication Configuration
-    auth_config_status = await fast_ping(
-        _check_auth_configuration_fast,
-        component="auth_configuration",
-    )
-    health_checks.append(auth_config_status)
+    prober = getattr(request.app.state, "readiness_prober", None)
+    if prober is not None and prober.running:
+        health_checks = _cached_readiness_checks(prober)
+    else:
+        health_checks = await _run_readiness_checks(request.app, start_time)
 
     # Determine overall status
+    overall_status = "ready"
     failed_checks = [check for check in health_checks if check.status != "healthy"]
     if failed_checks:
         overall_status = (
@@ -472,6 +423,106 @@ async def readiness_check(
     return JSONResponse(content=response_data.dict(), status_code=status_code)
 
 
+def _readiness_checks(app) -> Dict[str, Callable[[], Awaitable[ServiceCheck]]]:
+    """Readiness checks by component; app state is resolved on every call."""
+    state = app.state
+    return {
+        "redis": lambda: _check_redis_fast(getattr(state, "redis", None)),
+        "azure_openai": lambda: _check_azure_openai_fast(
+            getattr(state, "aoai_client", None)
+        ),
+        "speech_services": lambda: _check_speech_configuration_fast(
+            getattr(state, "stt_pool", None), getattr(state, "tts_pool", None)
+        ),
+        "acs_caller": lambda: _check_acs_caller_fast(getattr(state, "acs_caller", None)),
+        "rt_agents": lambda: _check_rt_agents_fast(
+            getattr(state, "auth_agent", None),
+            getattr(state, "claim_intake_agent", None),
+        ),
+        "auth_configuration": _check_auth_configuration_fast,
+    }
+
+
+def register_readiness_probes(prober: ReadinessProber, app) -> None:
+    """Register every readiness check with the background prober."""
+    for component, check in _readiness_checks(app).items():
+        prober.register(component, check)
+
+
+async def _run_readiness_checks(app, start_time: float) -> List[ServiceCheck]:
+    """Run every check inline, one after another, with a 1 s timeout each."""
+    timeout = 1.0  # seconds per check
+    health_checks: List[ServiceCheck] = []
+    for component, check in _readiness_checks(app).items():
+        try:
+            health_checks.append(await asyncio.wait_for(check(), timeout=timeout))
+        except Exception as e:
+            health_checks.append(
+                ServiceCheck(
+                    component=component,
+                    status="unhealthy",
+                    error=str(e),
+                    check_time_ms=round((time.time() - start_time) * 1000, 2),
+                )
+            )
+    return health_checks
+
+
+def _cached_readiness_checks(prober: ReadinessProber) -> List[ServiceCheck]:
+    """Build checks from the prober snapshot, annotated with age and staleness."""
+    now = time.monotonic()
+    health_checks: List[ServiceCheck] = []
+    for component, result in prober.snapshot().items():
+        age_s = result.age_s(now)
+        stale = prober.is_stale(component, now)
+        annotations = {
+            "age_ms": round(age_s * 1000, 1) if age_s is not None else None,
+            "stale": stale,
+            "consecutive_failures": result.consecutive_failures,
+        }
+        if isinstance(result.value, ServiceCheck):
+            check = result.value.model_copy(update=annotations)
+        else:
+            check = ServiceCheck(
+                component=component,
+                status="unhealthy",
+                error=result.error or "not probed yet",
+                check_time_ms=result.duration_ms,
+                **annotations,
+            )
+        if stale and check.status == "healthy":
+            check = check.model_copy(
+                update={
+                    "status": "unhealthy",
+                    "error": f"stale result ({annotations['age_ms']} ms old)",
+                }
+            )
+        health_checks.append(check)
+    return health_checks
+
+
+@router.get(
+    "/health/loop",
+    summary="Event Loop Health",
+    description="Event-loop lag, slow-callback stalls (with captured stacks) and executor occupancy for the workload, cleanup and default pools.",
+    tags=["Health"],
+)
+async def loop_health(request: Request) -> JSONResponse:
+    """
+    Report event-loop and executor saturation.
+
+    Served from the in-process monitor's rolling window; never touches
+    external dependencies, so it is safe to poll frequently.
+    """
+    monitor = getattr(request.app.state, "loop_monitor", None)
+    if monitor is None:
+        return JSONResponse(
+            content={"enabled": False, "error": "loop monitor not initialized"},
+            status_code=503,
+        )
+    return JSONResponse(content=monitor.snapshot())
+
+
 async def _check_redis_fast(redis_manager) -> ServiceCheck:
     """Fast Redis connectivity check."""
     start = time.time()
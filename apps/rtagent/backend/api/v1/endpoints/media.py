@@ -64,6 +64,7 @@ from config.app_settings import (
 )
 from src.speech.speech_recognizer import StreamingSpeechRecognizerFromBytes
 from src.enums.stream_modes import StreamMode
+from src.pools.executors import Workload, run_in_workload
 from src.stateful.state_managment import MemoManager
 from apps.rtagent.backend.src.utils.tracing import log_with_context
 from apps.rtagent.backend.src.utils.auth import validate_acs_ws_auth, AuthError
@@ -527,33 +528,45 @@ async def _create_media_handler(
 
     elif ACS_STREAMING_MODE == StreamMode.VOICE_LIVE:
         # Prefer a pre-initialized Voice Live agent bound at call initiation
+        voice_live_pool = getattr(websocket.app.state, "voice_live_pool", None)
         injected_agent = None
         try:
             call_ctx = await websocket.app.state.conn_manager.pop_call_context(
                 call_connection_id
-            )
-            if call_ctx and call_ctx.get("lva_agent"):
+            ) or {}
+            lease = call_ctx.get("lva_lease")
+            if lease is not None and voice_live_pool is not None:
+                # None when the lease expired before this WebSocket arrived
+                injected_agent = voice_live_pool.claim_lease(lease)
+            elif call_ctx.get("lva_agent"):
                 injected_agent = call_ctx.get("lva_agent")
+            if injected_agent is not None:
                 logger.info(
                     f"Bound pre-initialized Voice Live agent to call {call_connection_id}"
                 )
         except Exception as e:
             logger.debug(f"No pre-initialized Voice Live context found: {e}")
 
-        # Fallback to on-demand agent creation via factory (no pool)
+        # Fallback: lease a warm agent from the pool, else connect on demand
         if injected_agent is None:
             try:
                 agent_yaml = os.getenv(
                     "VOICE_LIVE_AGENT_YAML",
                     "apps/rtagent/backend/src/agents/Lvagent/agent_store/auth_agent.yaml",
                 )
-                injected_agent = build_lva_from_yaml(
-                    agent_yaml, enable_audio_io=False
-                )
-                await asyncio.to_thread(injected_agent.connect)
-                logger.info(
-                    f"Created and connected Voice Live agent on-demand for call {call_connection_id}"
-                )
+                if voice_live_pool is not None:
+                    injected_agent, tier = await voice_live_pool.get_agent(agent_yaml)
+                    logger.info(
+                        f"Leased {tier} Voice Live agent for call {call_connection_id}"
+                    )
+                else:
+                    injected_agent = await run_in_workload(
+                        Workload.MISC, build_lva_from_yaml, agent_yaml, enable_audio_io=False
+                    )
+                    await injected_agent.connect_async()
+                    logger.info(
+                        f"Created and connected Voice Live agent on-demand for call {call_connection_id}"
+                    )
             except Exception as e:
                 logger.error(
                     f"Failed to create Voice Live agent for call {call_connection_id}: {e}"
@@ -568,6 +581,7 @@ async def _create_media_handler(
             orchestrator=orchestrator,
             use_lva_agent=True,
             lva_agent=injected_agent,
+            voice_live_pool=voice_live_pool,
         )
 
         logger.info("Created V1 ACS voice live handler for VOICE_LIVE mode")
@@ -0,0 +1,129 @@
+"""
+Metrics Endpoints
+=================
+
+Read-only latency and cache metrics for dashboards and load tests: fleet
+latency percentiles, per-turn latency waterfalls and the semantic response
+cache. Health and readiness probes stay in :mod:`.health`.
+"""
+
+import json
+from typing import List, Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import JSONResponse
+
+from src.pools.executors import Workload, run_in_workload
+from src.stateful.state_managment import MemoManager
+from src.tools.turn_waterfall import (
+    aggregate_waterfalls,
+    build_waterfall,
+    session_waterfalls,
+)
+from utils.ml_logging import get_logger
+
+logger = get_logger("v1.metrics")
+
+router = APIRouter()
+
+
+@router.get(
+    "/metrics/latency",
+    summary="Fleet Latency Percentiles",
+    description="Per-stage p50/p90/p95/p99 merged across all replicas from the per-minute latency histograms in Redis.",
+    tags=["Metrics"],
+)
+async def fleet_latency_metrics(
+    request: Request,
+    window_minutes: int = Query(
+        15, ge=1, le=1440, description="Minutes to aggregate, ending with the current minute"
+    ),
+    stage: Optional[List[str]] = Query(
+        None, description="Restrict to these stages (repeatable)"
+    ),
+) -> JSONResponse:
+    """
+    Merge the latency histograms of the last ``window_minutes``.
+
+    One pipelined Redis read per request; the cost does not grow with call
+    volume. Samples reach Redis on each replica's flush interval.
+    """
+    recorder = getattr(request.app.state, "latency_recorder", None)
+    redis_mgr = getattr(request.app.state, "redis", None)
+    if recorder is None or redis_mgr is None:
+        return JSONResponse(
+            content={"enabled": False, "error": "latency histograms not enabled"},
+            status_code=503,
+        )
+    try:
+        result = await run_in_workload(
+            Workload.STORAGE,
+            recorder.query,
+            redis_mgr,
+            window_minutes=window_minutes,
+            stages=stage,
+        )
+    except Exception as exc:
+        logger.warning("fleet latency query failed: %s", exc)
+        return JSONResponse(
+            content={"enabled": True, "error": str(exc)}, status_code=503
+        )
+    return JSONResponse(content={"enabled": True, **result})
+
+
+@router.get(
+    "/metrics/waterfall/{session_id}",
+    summary="Turn Latency Waterfall",
+    description="Critical path of each turn (last voiced frame -> STT final -> LLM first token -> first TTS byte -> first frame sent) with dead air attributed to stages and gaps.",
+    tags=["Metrics"],
+)
+async def turn_waterfall(
+    session_id: str,
+    request: Request,
+    run_id: Optional[str] = Query(None, description="Only this turn's run id"),
+    top: int = Query(10, ge=1, le=50, description="Number of top contributors"),
+) -> JSONResponse:
+    """Build waterfalls from the session's persisted latency runs."""
+    redis_mgr = getattr(request.app.state, "redis", None)
+    if redis_mgr is None:
+        raise HTTPException(status_code=503, detail="Redis not initialized")
+
+    data = await redis_mgr.get_session_data_async(MemoManager.build_redis_key(session_id))
+    try:
+        latency = json.loads(data.get("corememory") or "{}").get("latency") or {}
+    except (TypeError, ValueError):
+        latency = {}
+    if not latency.get("runs"):
+        raise HTTPException(status_code=404, detail="No latency runs for session")
+
+    if run_id:
+        run = latency["runs"].get(run_id)
+        if run is None:
+            raise HTTPException(status_code=404, detail="Unknown run_id")
+        turns = [build_waterfall(run)]
+    else:
+        turns = session_waterfalls(latency)
+    return JSONResponse(
+        content={
+            "session_id": session_id,
+            "summary": aggregate_waterfalls(turns, top=top),
+            "turns": turns,
+        }
+    )
+
+
+@router.get(
+    "/metrics/semantic-cache",
+    summary="Semantic Response Cache",
+    description="Per-agent semantic response cache size, hit rate and estimated latency saved.",
+    tags=["Metrics"],
+)
+async def semantic_cache_metrics(request: Request) -> JSONResponse:
+    """Report the in-process semantic cache of each agent that has one enabled."""
+    agents = {}
+    for attr in ("auth_agent", "claim_intake_agent", "general_info_agent"):
+        agent = getattr(request.app.state, attr, None)
+        cache = getattr(agent, "semantic_cache", None)
+        if cache is not None:
+            agents[agent.name] = cache.stats()
+    return JSONResponse(content={"enabled": bool(agents), "agents": agents})
@@ -56,7 +56,21 @@ from opentelemetry import trace
 from opentelemetry.trace import SpanKind, Status, StatusCode
 
 # Core application imports
-from config import GREETING, ENABLE_AUTH_VALIDATION
+from config import (
+    GREETING,
+    ENABLE_AUTH_VALIDATION,
+    VAD_GATE_MODE,
+    VAD_GATE_ENERGY_DB,
+    VAD_GATE_HANGOVER_MS,
+    VAD_GATE_PAD_MS,
+    VAD_GATE_COMPRESS_KEEP_EVERY,
+    SPEECH_END_HANGOVER_MS,
+    ENABLE_LOCAL_BARGE_IN,
+    BARGE_IN_THRESHOLD_DB,
+    BARGE_IN_ECHO_RETURN_LOSS_DB,
+    BARGE_IN_TRIGGER_FRAMES,
+    BARGE_IN_CONFIRM_TIMEOUT_MS,
+)
 from apps.rtagent.backend.src.helpers import check_for_stopwords, receive_and_filter
 from src.tools.latency_tool import LatencyTool
 from apps.rtagent.backend.src.orchestration.artagent.orchestrator import route_turn
@@ -78,8 +92,11 @@ from apps.rtagent.backend.src.ws_helpers.envelopes import (
     make_event_envelope,
 )
 from src.speech.speech_recognizer import StreamingSpeechRecognizerFromBytes
+from src.vad.barge_in import BargeInDetector, ProvisionalBargeIn
+from src.vad.gate import SpeechEndTracker, VADGate, frame_level_db
 from src.postcall.push import build_and_flush
 from src.stateful.state_managment import MemoManager
+from src.pools.executors import OrderedWorkloadWriter, Workload
 from src.pools.session_manager import SessionContext
 from utils.ml_logging import get_logger
 
@@ -103,6 +120,20 @@ router = APIRouter()
 
 
 
+def _request_local_barge_in(provisional, latency_tool, level_db: float) -> None:
+    """Duck TTS on a local detector trigger and start the lead-time timer.
+
+    The cancel is committed only when an STT partial confirms the trigger;
+    the timer is stopped then, so the ``barge_in:local_lead`` stage reports
+    the stop latency saved per barge-in.
+    """
+    if provisional is None or not provisional.trigger(energy_level=level_db):
+        return
+    if latency_tool:
+        latency_tool.cancel("barge_in:local_lead")
+        latency_tool.start("barge_in:local_lead")
+
+
 def _pcm16le_rms(audio_bytes: bytes) -> float:
     if not audio_bytes:
         return 0.0
@@ -575,16 +606,27 @@ async def _initialize_conversation_session(
 
     def signal_tts_cancel() -> None:
         cancel_event = get_metadata("tts_cancel_event")
-        if not cancel_event:
+        detector = get_metadata("barge_in_detector")
+        if not cancel_event and not detector:
             return
 
+        def cancel_playback() -> None:
+            if detector:
+                # Queued TTS audio is discarded, so its echo envelope is too.
+                detector.set_playback_level(None)
+            provisional = get_metadata("provisional_barge_in")
+            if provisional:
+                provisional.discard()
+            if cancel_event:
+                cancel_event.set()
+
         loop = getattr(websocket.state, "_loop", None)
         if loop and loop.is_running():
-            loop.call_soon_threadsafe(cancel_event.set)
+            loop.call_soon_threadsafe(cancel_playback)
             return
 
         try:
-            cancel_event.set()
+            cancel_playback()
         except Exception as exc:  # noqa: BLE001
             logger.debug(
                 "[%s] Unable to signal TTS cancel event immediately: %s",
@@ -681,6 +723,28 @@ async def _initialize_conversation_session(
     # Persist initial state to Redis
     await memory_manager.persist_to_redis_async(redis_mgr)
 
+    def confirm_local_barge_in() -> None:
+        """Commit a ducked local barge-in and record the detector's lead."""
+        provisional = get_metadata("provisional_barge_in")
+        if provisional:
+            provisional.confirm()
+        detector = get_metadata("barge_in_detector")
+        lead_s = detector.confirm() if detector else None
+        if lead_s is None:
+            return
+        latency_tool = get_metadata("lt")
+        if latency_tool and latency_tool.is_running("barge_in:local_lead"):
+            try:
+                latency_tool.stop(
+                    "barge_in:local_lead",
+                    websocket.app.state.redis,
+                    meta={"lead_ms": round(lead_s * 1000, 1)},
+                )
+            except Exception as lt_exc:  # noqa: BLE001
+                logger.debug(
+                    "[%s] Failed to record barge-in lead: %s", session_id, lt_exc
+                )
+
     # Set up STT callbacks
     def on_partial(txt: str, lang: str, speaker_id: str):
         if not txt or not txt.strip():
@@ -688,6 +752,10 @@ async def _initialize_conversation_session(
         txt = txt.strip()
         logger.info(f"[{session_id}] User (partial) in {lang}: {txt}")
 
+        loop = getattr(websocket.state, "_loop", None)
+        if loop and loop.is_running():
+            loop.call_soon_threadsafe(confirm_local_barge_in)
+
         partial_seq = (get_metadata("stt_partial_seq", 0) or 0) + 1
         set_metadata_threadsafe("stt_partial_seq", partial_seq)
 
@@ -792,6 +860,9 @@ async def _initialize_conversation_session(
 
     def on_final(txt: str, lang: str, speaker_id: Optional[str] = None):
         logger.info(f"[{session_id}] User {speaker_id} (final) in {lang}: {txt}")
+        latency_tool = get_metadata("lt")
+        if latency_tool:
+            latency_tool.mark("stt_final", next_run=True)
         current_buffer = get_metadata("user_buffer", "")
         set_metadata("user_buffer", current_buffer + txt.strip() + "\n")
 
@@ -839,6 +910,66 @@ async def _initialize_conversation_session(
     stt_client.set_final_result_callback(on_final)
     stt_client.set_cancel_callback(on_cancel)
     stt_client.start()
+    set_metadata(
+        "stt_writer",
+        OrderedWorkloadWriter(
+            Workload.SPEECH_IO, stt_client.write_bytes, name=f"stt-writer[{session_id}]"
+        ),
+    )
+
+    if VAD_GATE_MODE != "off":
+        # Browser audio is 16 kHz PCM16; silence is gated before the recognizer.
+        set_metadata(
+            "vad_gate",
+            VADGate(
+                sample_rate=16000,
+                mode=VAD_GATE_MODE,
+                energy_threshold_db=VAD_GATE_ENERGY_DB,
+                hangover_ms=VAD_GATE_HANGOVER_MS,
+                pad_ms=VAD_GATE_PAD_MS,
+                compress_keep_every=VAD_GATE_COMPRESS_KEEP_EVERY,
+            ),
+        )
+
+    set_metadata(
+        "speech_end_tracker",
+        SpeechEndTracker(
+            energy_threshold_db=VAD_GATE_ENERGY_DB,
+            hangover_ms=SPEECH_END_HANGOVER_MS,
+        ),
+    )
+
+    if ENABLE_LOCAL_BARGE_IN:
+        detector = BargeInDetector(
+            sample_rate=16000,
+            threshold_db=BARGE_IN_THRESHOLD_DB,
+            echo_return_loss_db=BARGE_IN_ECHO_RETURN_LOSS_DB,
+            trigger_frames=BARGE_IN_TRIGGER_FRAMES,
+            confirm_timeout_ms=BARGE_IN_CONFIRM_TIMEOUT_MS,
+        )
+
+        def resume_after_false_trigger(meta) -> None:
+            # Cough, door slam or echo: no partial came, so playback resumes.
+            detector.reject()
+            lt = get_metadata("lt")
+            if lt:
+                lt.cancel("barge_in:local_lead")
+            barge_in_controller.resume_playback("local_energy", "audio_frame")
+
+        set_metadata("barge_in_detector", detector)
+        set_metadata(
+            "provisional_barge_in",
+            ProvisionalBargeIn(
+                duck=lambda meta: barge_in_controller.duck_playback(
+                    "local_energy", "audio_frame", energy_level=meta.get("energy_level")
+                ),
+                resume=resume_after_false_trigger,
+                commit=lambda meta: barge_in_controller.request(
+                    "local_energy", "audio_frame", energy_level=meta.get("energy_level")
+                ),
+                confirm_window_s=BARGE_IN_CONFIRM_TIMEOUT_MS / 1000,
+            ),
+        )
 
     # Persist the already-acquired TTS client into metadata
     set_metadata("tts_client", tts_client)
@@ -956,18 +1087,55 @@ async def _process_conversation_messages(
                         if cancel_requested and not (is_synth or audio_playing):
                             set_metadata("tts_cancel_requested", False)
 
+                        detector = get_metadata("barge_in_detector")
+                        if detector and detector.process(
+                            audio_bytes, playing=bool(is_synth or audio_playing)
+                        ):
+                            _request_local_barge_in(
+                                get_metadata("provisional_barge_in"),
+                                get_metadata("lt"),
+                                detector.last_level_db,
+                            )
+
+                        # Last voiced frame before a pause starts the turn waterfall.
+                        # Agent playback echoing back is ignored until a barge-in
+                        # is committed.
+                        latency_tool = get_metadata("lt")
+                        speech_end = get_metadata("speech_end_tracker")
+                        if latency_tool and speech_end:
+                            level_db = (
+                                detector.last_level_db
+                                if detector
+                                else frame_level_db(audio_bytes)
+                            )
+                            ended_at = speech_end.process(
+                                level_db,
+                                ignore=bool(
+                                    (is_synth or audio_playing)
+                                    and not get_metadata("tts_cancel_requested", False)
+                                ),
+                            )
+                            if ended_at is not None:
+                                latency_tool.mark("speech_end", next_run=True, at=ended_at)
+
                         if getattr(stt_client, "push_stream", None) is None:
                             logger.warning(
                                 "[%s] STT push_stream not ready; dropping audio frame",
                                 session_id,
                             )
-                        try:
-                            stt_client.write_bytes(audio_bytes)
-                        except Exception as write_exc:  # noqa: BLE001
-                            logger.error(
-                                "[%s] Failed to write audio to recognizer: %s",
+                        vad_gate = get_metadata("vad_gate")
+                        frames = (
+                            vad_gate.process(audio_bytes) if vad_gate else (audio_bytes,)
+                        )
+                        # The push stream write can block; a single per-session
+                        # writer keeps it off the event loop without reordering
+                        # frames across speech-io threads.
+                        pcm = b"".join(frames)
+                        stt_writer = get_metadata("stt_writer")
+                        if pcm and stt_writer and not stt_writer.submit(pcm):
+                            logger.debug(
+                                "[%s] Recognizer write queue full - audio frame dropped",
                                 session_id,
-                                write_exc,
                             )
 
                 # Process accumulated user buffer (moved outside audio handling to prevent duplication)
@@ -1310,6 +1478,35 @@ async def _cleanup_conversation_session(
                     connection.meta.handler["audio_playing"] = False
                     connection.meta.handler["tts_cancel_event"] = None
 
+                vad_gate = connection.meta.handler.get("vad_gate")
+                if vad_gate:
+                    logger.info(
+                        f"[{session_id}] VAD gate summary",
+                        extra={"vad_gate": vad_gate.stats()},
+                    )
+                barge_in_detector = connection.meta.handler.get("barge_in_detector")
+                if barge_in_detector:
+                    provisional = connection.meta.handler.get("provisional_barge_in")
+                    if provisional:
+                        provisional.discard()
+                    logger.info(
+                        f"[{session_id}] Local barge-in summary",
+                        extra={
+                            "barge_in": {
+                                **barge_in_detector.stats(),
+                                **(provisional.stats() if provisional else {}),
+                            }
+                        },
+                    )
+
+                stt_writer = connection.meta.handler.get("stt_writer")
+                if stt_writer:
+                    await stt_writer.close()
+                    logger.info(
+                        f"[{session_id}] Recognizer writer summary",
+                        extra={"stt_writer": stt_writer.stats()},
+                    )
+
                 # Clean up STT client
                 stt_client = connection.meta.handler.get("stt_client")
                 if stt_client and hasattr(websocket.app.state, "stt_pool"):
@@ -1376,7 +1573,11 @@ async def _cleanup_conversation_session(
                 await websocket.close()
 
             # Persist analytics if possible
-            if memory_manager and hasattr(websocket.app.state, "cosmos"):
+            archiver = getattr(websocket.app.state, "postcall_archiver", None)
+            if memory_manager and archiver is not None:
+                # Summary in Cosmos, compressed transcript in Blob (background)
+                archiver.submit(memory_manager)
+            elif memory_manager and hasattr(websocket.app.state, "cosmos"):
                 try:
                     await build_and_flush(
                         memory_manager, websocket.app.state.cosmos
@@ -11,6 +11,8 @@ import logging
 import asyncio
 from opentelemetry import trace
 
+from src.pools.executors import Workload, run_in_workload
+
 logger = logging.getLogger(__name__)
 tracer = trace.get_tracer(__name__)
 
@@ -104,7 +106,7 @@ async def get_simple_status(
     """
     try:
         snapshot = await asyncio.wait_for(
-            asyncio.to_thread(manager.snapshot), timeout=1.0
+            run_in_workload(Workload.MISC, manager.snapshot), timeout=1.0
         )
 
         return {"status": "ok", "timestamp": snapshot.get("metrics", {}).get("timestamp")}
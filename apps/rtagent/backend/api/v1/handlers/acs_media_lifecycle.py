@@ -34,13 +34,24 @@ from fastapi.websockets import WebSocketState
 from opentelemetry import trace
 from opentelemetry.trace import SpanKind, Status, StatusCode
 
-from config import GREETING, STT_PROCESSING_TIMEOUT
+from config import (
+    CALL_RECORDING_BLOCK_BYTES,
+    CALL_RECORDING_MAX_PENDING_BLOCKS,
+    ENABLE_CALL_RECORDING,
+    GREETING,
+    STT_PROCESSING_TIMEOUT,
+    TTS_SAMPLE_RATE_ACS,
+    VAD_GATE_ENERGY_DB,
+)
 from apps.rtagent.backend.src.ws_helpers.shared_ws import (
     send_response_to_acs,
     broadcast_message,
 )
 from apps.rtagent.backend.src.orchestration.artagent.orchestrator import route_turn
+from src.blob.call_recorder import CallRecorder
 from src.enums.stream_modes import StreamMode
+from src.vad.gate import frame_level_db
+from src.pools.executors import Workload, run_in_workload
 from src.speech.speech_recognizer import StreamingSpeechRecognizerFromBytes
 from src.stateful.state_managment import MemoManager
 from utils.ml_logging import get_logger
@@ -58,6 +69,10 @@ _handlers_cleanup_executor = ThreadPoolExecutor(
     max_workers=1, thread_name_prefix="handler-cleanup"
 )
 
+# Inbound ACS media is always PCM16_K_MONO (see src/acs/acs_helper.py); the
+# recording runs at this rate and outbound TTS is resampled to match.
+ACS_INBOUND_SAMPLE_RATE = 16000
+
 
 class SpeechEventType(Enum):
     """Types of speech recognition events."""
@@ -590,6 +605,13 @@ class RouteTurnThread:
             attributes={"speech.text": event.text, "speech.language": event.language},
         ):
             coro = None
+            latency_tool = getattr(self.websocket.state, "lt", None)
+            if latency_tool and event.timestamp:
+                # SpeechEvent.timestamp is wall-clock; latency marks use perf_counter.
+                queued_s = max(0.0, time.time() - event.timestamp)
+                latency_tool.mark(
+                    "stt_final", next_run=True, at=time.perf_counter() - queued_s
+                )
             try:
                 if not self.memory_manager:
                     logger.error(f"[{self.call_connection_id}] No memory manager available")
@@ -853,6 +875,11 @@ class MainEventLoop:
             try:
                 # Cancel current playback
                 await self._cancel_current_playback()
+                recorder = getattr(
+                    getattr(self.websocket, "_acs_media_handler", None), "recorder", None
+                )
+                if recorder is not None:
+                    recorder.clear_outbound()
 
                 # Cancel Route Turn Thread processing
                 if self.route_turn_thread:
@@ -939,13 +966,19 @@ class MainEventLoop:
                 )
                 is_silent = audio_data_section.get("silent", True)
 
+                # Record every frame (silent ones too) so the recording keeps time
+                recorder = getattr(acs_handler, "recorder", None)
+                audio_bytes = audio_data_section.get("data")
+                if recorder is not None and audio_bytes:
+                    audio_bytes = base64.b64decode(audio_bytes)
+                    recorder.tap_inbound(audio_bytes)
+
                 # Debug logging for audio data processing
                 logger.debug(
                     f"[{self.call_connection_id}] AudioData: silent={is_silent}, has_data={bool(audio_data_section.get('data'))}"
                 )
 
                 if not is_silent:
-                    audio_bytes = audio_data_section.get("data")
                     if audio_bytes and recognizer:
                         # logger.info(f"[{self.call_connection_id}] Processing audio chunk: {len(audio_bytes)} base64 chars, recognizer_started={getattr(acs_handler.speech_sdk_thread, 'recognizer_started', False)}")
 
@@ -997,10 +1030,14 @@ class MainEventLoop:
                 f"[{self.call_connection_id}] Audio chunk: {original_type} -> {decoded_len} bytes, push_stream_exists={bool(recognizer.push_stream if recognizer else False)}"
             )
 
+            latency_tool = getattr(self.websocket.state, "lt", None)
+            if latency_tool and frame_level_db(audio_bytes) >= VAD_GATE_ENERGY_DB:
+                latency_tool.mark("speech_end", next_run=True)
+
             if recognizer:
                 await asyncio.wait_for(
-                    asyncio.get_event_loop().run_in_executor(
-                        None, recognizer.write_bytes, audio_bytes
+                    run_in_workload(
+                        Workload.SPEECH_IO, recognizer.write_bytes, audio_bytes
                     ),
                     timeout=0.5,  # Reasonable timeout for audio chunk processing
                 )
@@ -1128,6 +1165,9 @@ class ACSMediaHandler:
         )
         self.thread_bridge.set_route_turn_thread(self.route_turn_thread)
 
+        # Optional streaming call recording (started in start())
+        self.recorder: Optional[CallRecorder] = None
+
         # Lifecycle management
         self.running = False
         self._stopped = False
@@ -1154,6 +1194,9 @@ class ACSMediaHandler:
                 # Store reference for greeting access
                 self.websocket._acs_media_handler = self
 
+                if ENABLE_CALL_RECORDING:
+                    await self._start_recording()
+
                 # Start threads
                 self.speech_sdk_thread.prepare_thread()
                 await self.route_turn_thread.start()
@@ -1164,6 +1207,23 @@ class ACSMediaHandler:
                 await self.stop()
                 raise
 
+    async def _start_recording(self) -> None:
+        """Open the call's streaming recording; the call proceeds without it on failure."""
+        try:
+            from src.blob.blob_helper import get_blob_helper
+
+            self.recorder = await get_blob_helper().open_call_recording(
+                self.call_connection_id,
+                sample_rate=ACS_INBOUND_SAMPLE_RATE,
+                outbound_sample_rate=TTS_SAMPLE_RATE_ACS,
+                block_bytes=CALL_RECORDING_BLOCK_BYTES,
+                max_pending_blocks=CALL_RECORDING_MAX_PENDING_BLOCKS,
+            )
+        except Exception as e:
+            logger.warning(
+                f"[{self.call_connection_id}] Call recording unavailable: {e}"
+            )
+
     async def handle_media_message(self, stream_data: str):
         """
         Handle incoming media messages (Main Event Loop responsibility).
@@ -1223,6 +1283,15 @@ class ACSMediaHandler:
                         f"[{self.call_connection_id}] Error cleaning up main event loop: {e}"
                     )
 
+                if self.recorder is not None:
+                    try:
+                        await self.recorder.finish()
+                    except Exception as e:
+                        cleanup_errors.append(f"recorder: {e}")
+                        logger.error(
+                            f"[{self.call_connection_id}] Error finishing call recording: {e}"
+                        )
+
                 # Final cleanup: ensure speech queue is completely drained
                 try:
                     await self._clear_speech_queue_final()
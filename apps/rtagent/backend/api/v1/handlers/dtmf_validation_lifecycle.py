@@ -26,6 +26,7 @@ from azure.communication.callautomation import CallConnectionClient
 from opentelemetry import trace
 from opentelemetry.trace import SpanKind
 
+from src.pools.executors import Workload, run_in_workload
 from utils.ml_logging import get_logger
 from ..events.types import CallEventContext
 
@@ -86,9 +87,8 @@ class DTMFValidationLifecycle:
             )
 
             # Start DTMF recognition in a non-blocking way using an executor
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
+            await run_in_workload(
+                Workload.MISC,
                 lambda: call_conn.start_continuous_dtmf_recognition(
                     target_participant=DTMFValidationLifecycle._get_target_participant(
                         call_conn
@@ -259,9 +259,9 @@ class DTMFValidationLifecycle:
                     stream_key = DTMFValidationLifecycle.DTMF_VALIDATION_STREAM_KEY_FORMAT.format(
                         call_connection_id=context.call_connection_id
                     )
-                    await context.redis_mgr.add_event_async(
-                        stream_key=stream_key,
-                        data={"validation_status": "completed", "result": "success"},
+                    await context.redis_mgr.publish_event_async(
+                        stream_key,
+                        {"validation_status": "completed", "result": "success"},
                     )
                     await context.memo_manager.persist_to_redis_async(context.redis_mgr)
             else:
@@ -288,6 +288,10 @@ class DTMFValidationLifecycle:
         """
         Wait for DTMF validation to complete by listening to Redis stream events.
 
+        The wait is served by the Redis manager's stream multiplexer, so
+        concurrent validations share one XREAD instead of each holding an
+        executor thread for up to ``timeout_ms``.
+
         Args:
             redis_mgr: Redis manager instance
             call_connection_id: Call connection ID
@@ -306,8 +310,8 @@ class DTMFValidationLifecycle:
                 f"🛑 Waiting for DTMF validation to complete on stream: {stream_key}"
             )
 
-            event = await redis_mgr.read_events_blocking_async(
-                stream_key=stream_key, last_id="$", block_ms=timeout_ms
+            event = await redis_mgr.wait_for_stream_event_async(
+                stream_key=stream_key, last_id="$", timeout_ms=timeout_ms
             )
 
             if event:
@@ -322,8 +326,8 @@ class DTMFValidationLifecycle:
                     if hasattr(redis_mgr, "get_call_connection"):
                         call_conn = call_connection_id
                         if call_conn:
-                            await asyncio.get_event_loop().run_in_executor(
-                                None, lambda: call_conn.hang_up(is_for_everyone=True)
+                            await run_in_workload(
+                                Workload.MISC, lambda: call_conn.hang_up(is_for_everyone=True)
                             )
                             logger.info(
                                 f"Call {call_connection_id} hung up due to DTMF validation timeout"
@@ -21,6 +21,15 @@ from datetime import datetime, timezone
 from typing import Dict, Union, Literal, Optional, Set, Callable, Awaitable
 from typing_extensions import TypedDict, Required
 from utils.ml_logging import get_logger
+from src.pools.executors import Workload, run_in_workload
+from src.vad.gate import VADGate
+from config import (
+    VAD_GATE_MODE,
+    VAD_GATE_ENERGY_DB,
+    VAD_GATE_HANGOVER_MS,
+    VAD_GATE_PAD_MS,
+    VAD_GATE_COMPRESS_KEEP_EVERY,
+)
 from apps.rtagent.backend.src.agents.Lvagent.factory import build_lva_from_yaml
 from apps.rtagent.backend.src.agents.Lvagent.base import AzureLiveVoiceAgent
 
@@ -122,6 +131,10 @@ class VoiceLiveHandler:
         self.sample_rate = 16000  # Default
         self.channels = 1  # Default
 
+        # Silence gate for raw browser audio (created on first frame so it
+        # picks up the sample rate from AudioMetadata).
+        self._vad_gate: Optional[VADGate] = None
+
         # Background tasks
         self._lva_event_task: Optional[asyncio.Task] = None
         self._sent_greeting: bool = False
@@ -139,11 +152,14 @@ class VoiceLiveHandler:
             # Optionally also connect the shared Azure Live Voice Agent for testing
             try:
                 if not self._lva_agent:
-                    self._lva_agent = build_lva_from_yaml(
-                        self._lva_yaml, enable_audio_io=False
+                    # Construction fetches auth tokens; keep it off the loop
+                    self._lva_agent = await run_in_workload(
+                        Workload.MISC,
+                        build_lva_from_yaml,
+                        self._lva_yaml,
+                        enable_audio_io=False,
                     )
-                    # Connect in a worker thread to avoid blocking the loop
-                    await asyncio.to_thread(self._lva_agent.connect)
+                    await self._lva_agent.connect_async()
                     logger.debug(
                         "LVA agent connected | url=%s | auth=%s",
                         getattr(self._lva_agent, "url", "(hidden)"),
@@ -169,9 +185,6 @@ class VoiceLiveHandler:
                 f"LVA agent event loop started for session {self.session_id}"
             )
 
-            # Give the receive task a moment to start
-            await asyncio.sleep(0.1)
-
             logger.info(
                 f"Voice live handler started successfully for session {self.session_id}"
             )
@@ -195,6 +208,12 @@ class VoiceLiveHandler:
             # Stop processing
             self.is_running = False
 
+            if self._vad_gate is not None:
+                logger.info(
+                    f"VAD gate summary for session {self.session_id}",
+                    extra={"vad_gate": self._vad_gate.stats()},
+                )
+
             # Cancel background task
             if self._lva_event_task and not self._lva_event_task.done():
                 self._lva_event_task.cancel()
@@ -214,9 +233,9 @@ class VoiceLiveHandler:
                             logger.warning(
                                 f"Pool release failed, closing agent: {e}"
                             )
-                            await asyncio.to_thread(self._lva_agent.close)
+                            await self._lva_agent.close_async()
                     else:
-                        await asyncio.to_thread(self._lva_agent.close)
+                        await self._lva_agent.close_async()
                 except Exception:
                     pass
                 self._lva_agent = None
@@ -353,7 +372,7 @@ class VoiceLiveHandler:
             }
 
             try:
-                self._lva_agent.send_event(audio_event)
+                await self._lva_agent.send_event_async(audio_event)
                 logger.debug(
                     f"[AUDIO SEND] Session {self.session_id}: Successfully sent audio chunk to Azure Voice Live"
                 )
@@ -463,7 +482,7 @@ class VoiceLiveHandler:
                 "event_id": str(uuid.uuid4()),
             }
 
-            self._lva_agent.send_event(greeting_event)
+            await self._lva_agent.send_event_async(greeting_event)
             logger.info(
                 f"[GREETING SENT] Session {self.session_id}: Successfully sent greeting: '{greeting_text}'"
             )
@@ -499,7 +518,7 @@ class VoiceLiveHandler:
                     f"Cannot send DTMF - LVA agent not available for session {self.session_id}"
                 )
                 return
-            self._lva_agent.send_event(dtmf_event)
+            await self._lva_agent.send_event_async(dtmf_event)
 
             # Also send to client via WebSocket for potential UI updates
             if self.websocket:
@@ -529,6 +548,10 @@ class VoiceLiveHandler:
 
             # (LVA path) assume connection is valid once agent is present
 
+            audio_bytes = self._gate_audio(audio_bytes)
+            if not audio_bytes:
+                return
+
             # DEBUG: Log raw audio details
             logger.debug(
                 f"[RAW AUDIO DEBUG] Session {self.session_id}: Received raw audio of {len(audio_bytes)} bytes"
@@ -553,7 +576,7 @@ class VoiceLiveHandler:
             }
 
             try:
-                self._lva_agent.send_event(audio_event)
+                await self._lva_agent.send_event_async(audio_event)
                 logger.debug(
                     f"[RAW AUDIO SEND] Session {self.session_id}: Successfully sent raw audio to Azure Voice Live"
                 )
@@ -590,6 +613,21 @@ class VoiceLiveHandler:
 
             logger.error(f"Traceback: {traceback.format_exc()}")
 
+    def _gate_audio(self, audio_bytes: bytes) -> bytes:
+        """Drop or compress silence before it is sent to Voice Live."""
+        if VAD_GATE_MODE == "off" or self.audio_format != "pcm":
+            return audio_bytes
+        if self._vad_gate is None or self._vad_gate.sample_rate != self.sample_rate:
+            self._vad_gate = VADGate(
+                sample_rate=self.sample_rate,
+                mode=VAD_GATE_MODE,
+                energy_threshold_db=VAD_GATE_ENERGY_DB,
+                hangover_ms=VAD_GATE_HANGOVER_MS,
+                pad_ms=VAD_GATE_PAD_MS,
+                compress_keep_every=VAD_GATE_COMPRESS_KEEP_EVERY,
+            )
+        return b"".join(self._vad_gate.process(audio_bytes))
+
     async def _configure_session(self) -> None:
         """Session configuration handled by AzureLiveVoiceAgent on connect (no-op)."""
         logger.debug(
@@ -599,22 +637,14 @@ class VoiceLiveHandler:
     # Legacy receive loop removed; LVA event loop handles inbound events
 
     async def _lva_event_loop(self) -> None:
-        """Background task to receive events from AzureLiveVoiceAgent when enabled."""
+        """Background task that awaits events from AzureLiveVoiceAgent."""
         logger.info(f"Starting LVA event loop for session {self.session_id}")
         try:
-            while self.is_running and self._use_lva_agent and self._lva_agent is not None:
-                try:
-                    raw = self._lva_agent.recv_raw(timeout_s=0.05)
-                except Exception as e:
-                    logger.warning(
-                        f"LVA transport receive error for session {self.session_id}: {e}"
-                    )
-                    raw = None
-
-                if not raw:
-                    await asyncio.sleep(0.01)
-                    continue
-
+            if not self._use_lva_agent or self._lva_agent is None:
+                return
+            async for raw in self._lva_agent.events():
+                if not self.is_running:
+                    break
                 try:
                     event = json.loads(raw)
                 except Exception:
@@ -632,6 +662,10 @@ class VoiceLiveHandler:
         except asyncio.CancelledError:
             logger.info(f"LVA event loop cancelled for session {self.session_id}")
             raise
+        except Exception as e:
+            logger.warning(
+                f"LVA transport receive error for session {self.session_id}: {e}"
+            )
         finally:
             logger.info(f"LVA event loop ended for session {self.session_id}")
 
@@ -977,7 +1011,7 @@ class VoiceLiveHandler:
             }
 
             if self._use_lva_agent and self._lva_agent is not None:
-                self._lva_agent.send_event(response_event)
+                await self._lva_agent.send_event_async(response_event)
             else:
                 await self.voice_live_connection.send(json.dumps(response_event))
             logger.info(
@@ -995,7 +1029,7 @@ class VoiceLiveHandler:
             }
 
             if self._use_lva_agent and self._lva_agent is not None:
-                self._lva_agent.send_event(generate_event)
+                await self._lva_agent.send_event_async(generate_event)
             else:
                 await self.voice_live_connection.send(json.dumps(generate_event))
             logger.info(
@@ -234,6 +234,11 @@ class CallListResponse(BaseModel):
     limit: int = Field(
         10, description="Number of items per page", json_schema_extra={"example": 10}
     )
+    continuation_token: Optional[str] = Field(
+        None,
+        description="Opaque token for the next page (null when there are no more calls)",
+        json_schema_extra={"example": "WyIyMDI1LTAxLTAxVDEyOjAwOjAwWiIsICJjYWxsX2FiYyJd"},
+    )
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -250,6 +255,7 @@ class CallListResponse(BaseModel):
                 "total": 25,
                 "page": 1,
                 "limit": 10,
+                "continuation_token": "WyIyMDI1LTAxLTAxVDEyOjAwOjAwWiIsICJjYWxsX2FiYyJd",
             }
         }
     )
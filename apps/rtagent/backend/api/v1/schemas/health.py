@@ -84,6 +84,21 @@ class ServiceCheck(BaseModel):
         description="Additional details about the check",
         json_schema_extra={"example": "Connected to Redis successfully"},
     )
+    age_ms: Optional[float] = Field(
+        None,
+        description="Milliseconds since the background prober last ran this check",
+        json_schema_extra={"example": 4210.0},
+    )
+    stale: Optional[bool] = Field(
+        None,
+        description="True when the cached result is older than the prober's staleness limit",
+        json_schema_extra={"example": False},
+    )
+    consecutive_failures: Optional[int] = Field(
+        None,
+        description="Failed probes in a row (drives exponential backoff)",
+        json_schema_extra={"example": 0},
+    )
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
@@ -29,6 +29,7 @@ from .infrastructure import (
     AZURE_SPEECH_ENDPOINT,
     AZURE_SPEECH_KEY,
     AZURE_SPEECH_RESOURCE_ID,
+    SPEECH_TOKEN_REFRESH_LEAD_S,
     # Azure Communication Services
     ACS_ENDPOINT,
     ACS_CONNECTION_STRING,
@@ -95,6 +96,17 @@ from .app_settings import (
     # Speech recognition
     VAD_SEMANTIC_SEGMENTATION,
     SILENCE_DURATION_MS,
+    VAD_GATE_MODE,
+    VAD_GATE_ENERGY_DB,
+    VAD_GATE_HANGOVER_MS,
+    VAD_GATE_PAD_MS,
+    VAD_GATE_COMPRESS_KEEP_EVERY,
+    SPEECH_END_HANGOVER_MS,
+    ENABLE_LOCAL_BARGE_IN,
+    BARGE_IN_THRESHOLD_DB,
+    BARGE_IN_ECHO_RETURN_LOSS_DB,
+    BARGE_IN_TRIGGER_FRAMES,
+    BARGE_IN_CONFIRM_TIMEOUT_MS,
     AUDIO_FORMAT,
     RECOGNIZED_LANGUAGE,
     # Connection management
@@ -105,6 +117,13 @@ from .app_settings import (
     CONNECTION_CRITICAL_THRESHOLD,
     CONNECTION_TIMEOUT_SECONDS,
     HEARTBEAT_INTERVAL_SECONDS,
+    EXECUTOR_SPEECH_IO_WORKERS,
+    EXECUTOR_TTS_SYNTHESIS_WORKERS,
+    EXECUTOR_STORAGE_WORKERS,
+    EXECUTOR_MISC_WORKERS,
+    ENABLE_DISTRIBUTED_SESSIONS,
+    DISTRIBUTED_OWNER_TTL_SECONDS,
+    DISTRIBUTED_LOOKUP_CACHE_SECONDS,
     # Session management
     SESSION_TTL_SECONDS,
     SESSION_CLEANUP_INTERVAL,
@@ -114,10 +133,27 @@ from .app_settings import (
     # Feature flags
     DTMF_VALIDATION_ENABLED,
     ENABLE_AUTH_VALIDATION,
+    ENABLE_CALL_RECORDING,
+    CALL_RECORDING_BLOCK_BYTES,
+    CALL_RECORDING_MAX_PENDING_BLOCKS,
+    ENABLE_POSTCALL_ARCHIVE,
+    POSTCALL_ARCHIVE_COMPRESSION,
+    POSTCALL_ARCHIVE_QUEUE_SIZE,
+    POSTCALL_ARCHIVE_WORKERS,
+    POSTCALL_ARCHIVE_MAX_ATTEMPTS,
     # AI settings
     DEFAULT_TEMPERATURE,
     DEFAULT_MAX_TOKENS,
     AOAI_REQUEST_TIMEOUT,
+    ENABLE_CONTEXT_WINDOW,
+    CONTEXT_WINDOW_MAX_TOKENS,
+    CONTEXT_WINDOW_MAX_TURNS,
+    CONTEXT_SUMMARY_MAX_TOKENS,
+    CONTEXT_SUMMARY_DEPLOYMENT_ID,
+    ENABLE_SEMANTIC_CACHE,
+    SEMANTIC_CACHE_EMBEDDING_DEPLOYMENT,
+    SEMANTIC_CACHE_EMBEDDING_TIMEOUT_S,
+    SEMANTIC_CACHE_LOOKUP_BUDGET_S,
     # CORS and security
     ALLOWED_ORIGINS,
     ENTRA_EXEMPT_PATHS,
@@ -134,6 +170,16 @@ from .app_settings import (
     ENABLE_TRACING,
     METRICS_COLLECTION_INTERVAL,
     POOL_METRICS_INTERVAL,
+    ENABLE_LOOP_MONITOR,
+    LOOP_MONITOR_INTERVAL_MS,
+    LOOP_SLOW_CALLBACK_MS,
+    ENABLE_READINESS_PROBER,
+    READINESS_PROBE_INTERVAL_S,
+    READINESS_PROBE_TIMEOUT_S,
+    READINESS_PROBE_MAX_BACKOFF_S,
+    ENABLE_LATENCY_HISTOGRAMS,
+    LATENCY_HISTOGRAM_FLUSH_S,
+    LATENCY_HISTOGRAM_RETENTION_MINUTES,
     # Validation
     validate_app_settings,
 )
@@ -37,3 +37,37 @@ DEFAULT_MAX_TOKENS = int(os.getenv("DEFAULT_MAX_TOKENS", "500"))
 
 # Request timeout settings
 AOAI_REQUEST_TIMEOUT = float(os.getenv("AOAI_REQUEST_TIMEOUT", "30.0"))
+
+# Token-budgeted conversation window: the system prompt, a pinned rolling
+# summary (with slots/tool outputs) and the newest whole turns that fit.
+ENABLE_CONTEXT_WINDOW = os.getenv("ENABLE_CONTEXT_WINDOW", "true").lower() in (
+    "true",
+    "1",
+    "yes",
+    "on",
+)
+CONTEXT_WINDOW_MAX_TOKENS = int(os.getenv("CONTEXT_WINDOW_MAX_TOKENS", "6000"))
+CONTEXT_WINDOW_MAX_TURNS = int(os.getenv("CONTEXT_WINDOW_MAX_TURNS", "12"))
+CONTEXT_SUMMARY_MAX_TOKENS = int(os.getenv("CONTEXT_SUMMARY_MAX_TOKENS", "300"))
+# Deployment used for background summaries (defaults to the chat deployment)
+CONTEXT_SUMMARY_DEPLOYMENT_ID = os.getenv("CONTEXT_SUMMARY_DEPLOYMENT_ID", "")
+
+# Semantic response cache for agents whose YAML declares a `cache` block
+# (opt-in globally as well; a lookup adds one embedding call per turn).
+ENABLE_SEMANTIC_CACHE = os.getenv("ENABLE_SEMANTIC_CACHE", "false").lower() in (
+    "true",
+    "1",
+    "yes",
+    "on",
+)
+SEMANTIC_CACHE_EMBEDDING_DEPLOYMENT = os.getenv(
+    "AZURE_OPENAI_EMBEDDING_DEPLOYMENT", "text-embedding-3-small"
+)
+SEMANTIC_CACHE_EMBEDDING_TIMEOUT_S = float(
+    os.getenv("SEMANTIC_CACHE_EMBEDDING_TIMEOUT_S", "0.5")
+)
+# Longest a turn waits for its embedding before starting the completion; a
+# slower embedding is still used to store the answer afterwards.
+SEMANTIC_CACHE_LOOKUP_BUDGET_S = float(
+    os.getenv("SEMANTIC_CACHE_LOOKUP_BUDGET_S", "0.15")
+)
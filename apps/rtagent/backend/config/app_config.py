@@ -20,6 +20,9 @@ from .connection_config import (
     CONNECTION_WARNING_THRESHOLD,
     CONNECTION_CRITICAL_THRESHOLD,
     CONNECTION_TIMEOUT_SECONDS,
+    ENABLE_DISTRIBUTED_SESSIONS,
+    DISTRIBUTED_OWNER_TTL_SECONDS,
+    DISTRIBUTED_LOOKUP_CACHE_SECONDS,
     SESSION_TTL_SECONDS,
     SESSION_CLEANUP_INTERVAL,
     MAX_CONCURRENT_SESSIONS,
@@ -41,6 +44,16 @@ from .feature_flags import (
     ENABLE_TRACING,
     METRICS_COLLECTION_INTERVAL,
     POOL_METRICS_INTERVAL,
+    ENABLE_LOOP_MONITOR,
+    LOOP_MONITOR_INTERVAL_MS,
+    LOOP_SLOW_CALLBACK_MS,
+    ENABLE_READINESS_PROBER,
+    READINESS_PROBE_INTERVAL_S,
+    READINESS_PROBE_TIMEOUT_S,
+    READINESS_PROBE_MAX_BACKOFF_S,
+    ENABLE_LATENCY_HISTOGRAMS,
+    LATENCY_HISTOGRAM_FLUSH_S,
+    LATENCY_HISTOGRAM_RETENTION_MINUTES,
     DTMF_VALIDATION_ENABLED,
     ENABLE_AUTH_VALIDATION,
 )
@@ -52,6 +65,10 @@ from .ai_config import (
     DEFAULT_TEMPERATURE,
     DEFAULT_MAX_TOKENS,
     AOAI_REQUEST_TIMEOUT,
+    ENABLE_CONTEXT_WINDOW,
+    CONTEXT_WINDOW_MAX_TOKENS,
+    CONTEXT_WINDOW_MAX_TURNS,
+    ENABLE_SEMANTIC_CACHE,
 )
 
 
@@ -89,6 +106,9 @@ class ConnectionConfig:
     warning_threshold: int = CONNECTION_WARNING_THRESHOLD
     critical_threshold: int = CONNECTION_CRITICAL_THRESHOLD
     timeout_seconds: float = CONNECTION_TIMEOUT_SECONDS
+    enable_distributed: bool = ENABLE_DISTRIBUTED_SESSIONS
+    owner_ttl_seconds: int = DISTRIBUTED_OWNER_TTL_SECONDS
+    lookup_cache_seconds: float = DISTRIBUTED_LOOKUP_CACHE_SECONDS
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -98,6 +118,9 @@ class ConnectionConfig:
             "warning_threshold": self.warning_threshold,
             "critical_threshold": self.critical_threshold,
             "timeout_seconds": self.timeout_seconds,
+            "enable_distributed": self.enable_distributed,
+            "owner_ttl_seconds": self.owner_ttl_seconds,
+            "lookup_cache_seconds": self.lookup_cache_seconds,
         }
 
 
@@ -152,12 +175,20 @@ class AIConfig:
     request_timeout: float = AOAI_REQUEST_TIMEOUT
     default_temperature: float = DEFAULT_TEMPERATURE
     default_max_tokens: int = DEFAULT_MAX_TOKENS
+    enable_context_window: bool = ENABLE_CONTEXT_WINDOW
+    context_window_max_tokens: int = CONTEXT_WINDOW_MAX_TOKENS
+    context_window_max_turns: int = CONTEXT_WINDOW_MAX_TURNS
+    enable_semantic_cache: bool = ENABLE_SEMANTIC_CACHE
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             "request_timeout": self.request_timeout,
             "default_temperature": self.default_temperature,
             "default_max_tokens": self.default_max_tokens,
+            "enable_context_window": self.enable_context_window,
+            "context_window_max_tokens": self.context_window_max_tokens,
+            "context_window_max_turns": self.context_window_max_turns,
+            "enable_semantic_cache": self.enable_semantic_cache,
         }
 
 
@@ -169,6 +200,16 @@ class MonitoringConfig:
     pool_metrics_interval: int = POOL_METRICS_INTERVAL
     enable_performance_logging: bool = ENABLE_PERFORMANCE_LOGGING
     enable_tracing: bool = ENABLE_TRACING
+    enable_loop_monitor: bool = ENABLE_LOOP_MONITOR
+    loop_monitor_interval_ms: int = LOOP_MONITOR_INTERVAL_MS
+    loop_slow_callback_ms: int = LOOP_SLOW_CALLBACK_MS
+    enable_readiness_prober: bool = ENABLE_READINESS_PROBER
+    readiness_probe_interval_s: float = READINESS_PROBE_INTERVAL_S
+    readiness_probe_timeout_s: float = READINESS_PROBE_TIMEOUT_S
+    readiness_probe_max_backoff_s: float = READINESS_PROBE_MAX_BACKOFF_S
+    enable_latency_histograms: bool = ENABLE_LATENCY_HISTOGRAMS
+    latency_histogram_flush_s: float = LATENCY_HISTOGRAM_FLUSH_S
+    latency_histogram_retention_minutes: int = LATENCY_HISTOGRAM_RETENTION_MINUTES
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -176,6 +217,16 @@ class MonitoringConfig:
             "pool_metrics_interval": self.pool_metrics_interval,
             "enable_performance_logging": self.enable_performance_logging,
             "enable_tracing": self.enable_tracing,
+            "enable_loop_monitor": self.enable_loop_monitor,
+            "loop_monitor_interval_ms": self.loop_monitor_interval_ms,
+            "loop_slow_callback_ms": self.loop_slow_callback_ms,
+            "enable_readiness_prober": self.enable_readiness_prober,
+            "readiness_probe_interval_s": self.readiness_probe_interval_s,
+            "readiness_probe_timeout_s": self.readiness_probe_timeout_s,
+            "readiness_probe_max_backoff_s": self.readiness_probe_max_backoff_s,
+            "enable_latency_histograms": self.enable_latency_histograms,
+            "latency_histogram_flush_s": self.latency_histogram_flush_s,
+            "latency_histogram_retention_minutes": self.latency_histogram_retention_minutes,
         }
 
 
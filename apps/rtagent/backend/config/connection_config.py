@@ -33,6 +33,15 @@ CONNECTION_TIMEOUT_SECONDS = int(
 )  # 5 minutes
 HEARTBEAT_INTERVAL_SECONDS = int(os.getenv("HEARTBEAT_INTERVAL_SECONDS", "30"))
 
+# Cross-worker routing (Redis pub/sub broadcasts + call/session ownership)
+ENABLE_DISTRIBUTED_SESSIONS = (
+    os.getenv("ENABLE_DISTRIBUTED_SESSIONS", "false").lower() == "true"
+)
+DISTRIBUTED_OWNER_TTL_SECONDS = int(os.getenv("DISTRIBUTED_OWNER_TTL_SECONDS", "120"))
+DISTRIBUTED_LOOKUP_CACHE_SECONDS = float(
+    os.getenv("DISTRIBUTED_LOOKUP_CACHE_SECONDS", "5.0")
+)
+
 # ==============================================================================
 # SESSION MANAGEMENT
 # ==============================================================================
@@ -62,3 +71,13 @@ POOL_SIZE_STT = int(os.getenv("POOL_SIZE_STT", "50"))
 POOL_LOW_WATER_MARK = int(os.getenv("POOL_LOW_WATER_MARK", "10"))
 POOL_HIGH_WATER_MARK = int(os.getenv("POOL_HIGH_WATER_MARK", "45"))
 POOL_ACQUIRE_TIMEOUT = float(os.getenv("POOL_ACQUIRE_TIMEOUT", "5.0"))
+
+# ==============================================================================
+# WORKLOAD EXECUTORS
+# ==============================================================================
+
+# Separately sized thread pools so one blocking subsystem cannot starve another
+EXECUTOR_SPEECH_IO_WORKERS = int(os.getenv("EXECUTOR_SPEECH_IO_WORKERS", "32"))
+EXECUTOR_TTS_SYNTHESIS_WORKERS = int(os.getenv("EXECUTOR_TTS_SYNTHESIS_WORKERS", "16"))
+EXECUTOR_STORAGE_WORKERS = int(os.getenv("EXECUTOR_STORAGE_WORKERS", "16"))
+EXECUTOR_MISC_WORKERS = int(os.getenv("EXECUTOR_MISC_WORKERS", "8"))
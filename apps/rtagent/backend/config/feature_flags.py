@@ -26,6 +26,28 @@ ENABLE_AUTH_VALIDATION = os.getenv("ENABLE_AUTH_VALIDATION", "false").lower() in
     "on",
 )
 
+# Streaming stereo call recording to Blob Storage (caller left, agent right)
+ENABLE_CALL_RECORDING = os.getenv("ENABLE_CALL_RECORDING", "false").lower() in (
+    "true",
+    "1",
+    "yes",
+    "on",
+)
+CALL_RECORDING_BLOCK_BYTES = int(os.getenv("CALL_RECORDING_BLOCK_BYTES", str(1 << 20)))
+CALL_RECORDING_MAX_PENDING_BLOCKS = int(os.getenv("CALL_RECORDING_MAX_PENDING_BLOCKS", "4"))
+
+# Post-call archival: compact summary in Cosmos, compressed transcript in Blob
+ENABLE_POSTCALL_ARCHIVE = os.getenv("ENABLE_POSTCALL_ARCHIVE", "false").lower() in (
+    "true",
+    "1",
+    "yes",
+    "on",
+)
+POSTCALL_ARCHIVE_COMPRESSION = os.getenv("POSTCALL_ARCHIVE_COMPRESSION", "zstd").lower()
+POSTCALL_ARCHIVE_QUEUE_SIZE = int(os.getenv("POSTCALL_ARCHIVE_QUEUE_SIZE", "256"))
+POSTCALL_ARCHIVE_WORKERS = int(os.getenv("POSTCALL_ARCHIVE_WORKERS", "2"))
+POSTCALL_ARCHIVE_MAX_ATTEMPTS = int(os.getenv("POSTCALL_ARCHIVE_MAX_ATTEMPTS", "5"))
+
 # Environment and debugging
 DEBUG_MODE = os.getenv("DEBUG", "false").lower() in ("true", "1", "yes", "on")
 ENVIRONMENT = os.getenv("ENVIRONMENT", "development").lower()
@@ -64,3 +86,36 @@ METRICS_COLLECTION_INTERVAL = int(
     os.getenv("METRICS_COLLECTION_INTERVAL", "60")
 )  # seconds
 POOL_METRICS_INTERVAL = int(os.getenv("POOL_METRICS_INTERVAL", "30"))  # seconds
+
+# Event-loop health monitor (lag sampling, stall detection, executor occupancy)
+ENABLE_LOOP_MONITOR = os.getenv("ENABLE_LOOP_MONITOR", "true").lower() in (
+    "true",
+    "1",
+    "yes",
+    "on",
+)
+LOOP_MONITOR_INTERVAL_MS = int(os.getenv("LOOP_MONITOR_INTERVAL_MS", "250"))
+LOOP_SLOW_CALLBACK_MS = int(os.getenv("LOOP_SLOW_CALLBACK_MS", "100"))
+
+# Background readiness prober (/api/v1/readiness is served from its cache)
+ENABLE_READINESS_PROBER = os.getenv("ENABLE_READINESS_PROBER", "true").lower() in (
+    "true",
+    "1",
+    "yes",
+    "on",
+)
+READINESS_PROBE_INTERVAL_S = float(os.getenv("READINESS_PROBE_INTERVAL_S", "10"))
+READINESS_PROBE_TIMEOUT_S = float(os.getenv("READINESS_PROBE_TIMEOUT_S", "1.0"))
+READINESS_PROBE_MAX_BACKOFF_S = float(os.getenv("READINESS_PROBE_MAX_BACKOFF_S", "120"))
+
+# Fleet latency histograms (mergeable per-minute, per-stage buckets in Redis)
+ENABLE_LATENCY_HISTOGRAMS = os.getenv("ENABLE_LATENCY_HISTOGRAMS", "true").lower() in (
+    "true",
+    "1",
+    "yes",
+    "on",
+)
+LATENCY_HISTOGRAM_FLUSH_S = float(os.getenv("LATENCY_HISTOGRAM_FLUSH_S", "10"))
+LATENCY_HISTOGRAM_RETENTION_MINUTES = int(
+    os.getenv("LATENCY_HISTOGRAM_RETENTION_MINUTES", "1440")
+)
@@ -56,6 +56,8 @@ AZURE_SPEECH_KEY: str = os.getenv("AZURE_SPEECH_KEY") or os.environ.get(
     "AZURE_OPENAI_STT_TTS_KEY", ""
 )
 AZURE_SPEECH_RESOURCE_ID: str = os.getenv("AZURE_SPEECH_RESOURCE_ID", "")
+# Renew the Speech AAD token this many seconds before it expires
+SPEECH_TOKEN_REFRESH_LEAD_S: int = int(os.getenv("SPEECH_TOKEN_REFRESH_LEAD_S", "300"))
 
 # ==============================================================================
 # AZURE COMMUNICATION SERVICES (ACS) CONFIGURATION
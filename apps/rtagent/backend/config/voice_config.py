@@ -78,6 +78,32 @@ VAD_SEMANTIC_SEGMENTATION = (
 )
 SILENCE_DURATION_MS = int(os.getenv("SILENCE_DURATION_MS", "1300"))
 
+# Server-side VAD gate in front of STT / Voice Live for browser audio
+# ("off" | "observe" | "drop" | "compress"). The hangover must cover
+# SILENCE_DURATION_MS or the recognizer never sees an end of utterance.
+VAD_GATE_MODE = os.getenv("VAD_GATE_MODE", "off").lower()
+VAD_GATE_ENERGY_DB = float(os.getenv("VAD_GATE_ENERGY_DB", "-45"))
+VAD_GATE_HANGOVER_MS = int(
+    os.getenv("VAD_GATE_HANGOVER_MS", str(SILENCE_DURATION_MS + 200))
+)
+VAD_GATE_PAD_MS = int(os.getenv("VAD_GATE_PAD_MS", "200"))
+VAD_GATE_COMPRESS_KEEP_EVERY = int(os.getenv("VAD_GATE_COMPRESS_KEEP_EVERY", "10"))
+# Quiet time after the last voiced frame before it is marked as the caller's
+# speech_end in the turn waterfall.
+SPEECH_END_HANGOVER_MS = int(os.getenv("SPEECH_END_HANGOVER_MS", "200"))
+
+# Local barge-in detection on inbound browser audio while TTS is playing.
+# A trigger ducks playback at once; the cancel is committed only when an STT
+# partial confirms it within BARGE_IN_CONFIRM_TIMEOUT_MS, otherwise playback
+# resumes and the margin is raised. Off by default until tuned for the
+# deployment's echo conditions.
+ENABLE_LOCAL_BARGE_IN = os.getenv("ENABLE_LOCAL_BARGE_IN", "false").lower() == "true"
+BARGE_IN_THRESHOLD_DB = float(os.getenv("BARGE_IN_THRESHOLD_DB", "-35"))
+BARGE_IN_ECHO_RETURN_LOSS_DB = float(os.getenv("BARGE_IN_ECHO_RETURN_LOSS_DB", "20"))
+BARGE_IN_TRIGGER_FRAMES = int(os.getenv("BARGE_IN_TRIGGER_FRAMES", "2"))
+# Playback stays ducked this long waiting for an STT partial to confirm a local trigger
+BARGE_IN_CONFIRM_TIMEOUT_MS = int(os.getenv("BARGE_IN_CONFIRM_TIMEOUT_MS", "800"))
+
 # Audio format configuration
 AUDIO_FORMAT = os.getenv("AUDIO_FORMAT", "pcm")
 
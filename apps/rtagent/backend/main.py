@@ -17,6 +17,11 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
 sys.path.insert(0, os.path.dirname(__file__))
 
+# Profile module imports from here until startup completes (startup dashboard).
+from utils.startup import ImportProfiler, StartupGraph
+
+_import_profiler = ImportProfiler.install()
+
 from src.pools.on_demand_pool import OnDemandResourcePool
 from utils.telemetry_config import setup_azure_monitor
 
@@ -29,10 +34,7 @@ logger = get_logger("main")
 
 import time
 import asyncio
-from typing import Awaitable, Callable, List, Optional, Tuple
-
-StepCallable = Callable[[], Awaitable[None]]
-LifecycleStep = Tuple[str, StepCallable, Optional[StepCallable]]
+from typing import List, Optional, Tuple
 
 import uvicorn
 from fastapi import FastAPI, Request, HTTPException
@@ -42,8 +44,19 @@ from opentelemetry import trace
 from opentelemetry.trace import Status, StatusCode
 from src.pools.connection_manager import ThreadSafeConnectionManager
 from src.pools.session_metrics import ThreadSafeSessionMetrics
+from src.pools.executors import (
+    Workload,
+    configure_workload_executors,
+    run_in_workload,
+    shutdown_workload_executors,
+)
+from utils.loop_health import EventLoopHealthMonitor
+from src.tools.latency_sketch import fleet_latency
+from utils.readiness import ReadinessProber
 from .src.services import AzureOpenAIClient, CosmosDBMongoCoreManager, AzureRedisManager, SpeechSynthesizer, StreamingSpeechRecognizerFromBytes
 from src.aoai.client_manager import AoaiClientManager
+from src.speech.auth_manager import get_speech_token_manager
+from src.enums.stream_modes import StreamMode
 from config.app_config import AppConfig
 from config.app_settings import (
     AGENT_AUTH_CONFIG,
@@ -68,6 +81,18 @@ from config.app_settings import (
     ENVIRONMENT,
     DEBUG_MODE,
     BASE_URL,
+    EXECUTOR_SPEECH_IO_WORKERS,
+    EXECUTOR_TTS_SYNTHESIS_WORKERS,
+    EXECUTOR_STORAGE_WORKERS,
+    EXECUTOR_MISC_WORKERS,
+    AZURE_SPEECH_KEY,
+    SPEECH_TOKEN_REFRESH_LEAD_S,
+    ACS_STREAMING_MODE,
+    ENABLE_POSTCALL_ARCHIVE,
+    POSTCALL_ARCHIVE_COMPRESSION,
+    POSTCALL_ARCHIVE_QUEUE_SIZE,
+    POSTCALL_ARCHIVE_WORKERS,
+    POSTCALL_ARCHIVE_MAX_ATTEMPTS,
 )
 
 from apps.rtagent.backend.src.agents.artagent.base import ARTAgent
@@ -87,6 +112,7 @@ from apps.rtagent.backend.src.services.acs.acs_caller import (
 )
 
 from apps.rtagent.backend.api.v1.events.registration import register_default_handlers
+from apps.rtagent.backend.api.v1.endpoints.health import register_readiness_probes
 
 
 # --------------------------------------------------------------------------- #
@@ -96,7 +122,8 @@ from apps.rtagent.backend.api.v1.events.registration import register_default_han
 def _build_startup_dashboard(
     app_config: AppConfig,
     app: FastAPI,
-    startup_results: List[Tuple[str, float]],
+    startup: StartupGraph,
+    import_profiler: Optional[ImportProfiler] = None,
 ) -> str:
     """Construct a concise ASCII dashboard for developers."""
 
@@ -119,7 +146,11 @@ def _build_startup_dashboard(
 
     endpoints = [
         ("GET", "/api/v1/health", "liveness"),
-        ("GET", "/api/v1/readiness", "dependency readiness"),
+        ("GET", "/api/v1/readiness", "dependency readiness (cached)"),
+        ("GET", "/api/v1/health/loop", "event loop & executor health"),
+        ("GET", "/api/v1/metrics/latency", "fleet latency percentiles"),
+        ("GET", "/api/v1/metrics/waterfall/{session_id}", "turn critical path"),
+        ("GET", "/api/v1/metrics/semantic-cache", "semantic response cache"),
         ("GET", "/api/info", "environment metadata"),
         ("POST", "/api/v1/calls/initiate", "outbound call"),
         ("POST", "/api/v1/calls/answer", "ACS inbound webhook"),
@@ -158,9 +189,14 @@ def _build_startup_dashboard(
         lines.append(" Docs       : DISABLED (set ENABLE_DOCS=true)")
 
     lines.append("")
-    lines.append(" Startup Stage Durations (sec):")
-    for stage_name, stage_duration in startup_results:
-        lines.append(f"   {stage_name:<13}{stage_duration:.2f}")
+    lines.append(" Startup Stage Durations (sec, @offset from lifespan start):")
+    lines.extend(startup.profile_lines())
+
+    if import_profiler is not None:
+        lines.append("")
+        lines.append(" Slowest Imports (sec, self time per package):")
+        for package, seconds in import_profiler.top(8):
+            lines.append(f"   {package:<20}{seconds:.2f}")
 
     lines.append("")
     agent_configs = [
@@ -202,7 +238,8 @@ async def lifespan(app: FastAPI):
     This function handles the initialization and cleanup of all application components
     including speech pools, Redis connections, Cosmos DB, Azure OpenAI clients, and
     ACS agents. It provides comprehensive resource management with proper tracing and
-    error handling for production deployment.
+    error handling for production deployment. Startup steps run as a dependency
+    graph, so independent service handshakes overlap.
 
     :param app: The FastAPI application instance requiring lifecycle management.
     :return: AsyncGenerator yielding control to the application runtime.
@@ -210,51 +247,9 @@ async def lifespan(app: FastAPI):
     """
     tracer = trace.get_tracer(__name__)
 
-    startup_steps: List[LifecycleStep] = []
-    executed_steps: List[LifecycleStep] = []
-    startup_results: List[Tuple[str, float]] = []
-
-    def add_step(name: str, start: StepCallable, shutdown: Optional[StepCallable] = None) -> None:
-        startup_steps.append((name, start, shutdown))
-
-    async def run_steps(steps: List[LifecycleStep], phase: str) -> None:
-        for name, start_fn, shutdown_fn in steps:
-            stage_span_name = f"{phase}.{name}"
-            with tracer.start_as_current_span(stage_span_name) as step_span:
-                step_start = time.perf_counter()
-                logger.info(f"{phase} stage started", extra={"stage": name})
-                try:
-                    await start_fn()
-                except Exception as exc:  # pragma: no cover - defensive path
-                    step_span.record_exception(exc)
-                    step_span.set_status(Status(StatusCode.ERROR, str(exc)))
-                    logger.error(f"{phase} stage failed", extra={"stage": name, "error": str(exc)})
-                    raise
-                step_duration = time.perf_counter() - step_start
-                step_span.set_attribute("duration_sec", step_duration)
-                rounded = round(step_duration, 2)
-                logger.info(f"{phase} stage completed", extra={"stage": name, "duration_sec": rounded})
-                executed_steps.append((name, start_fn, shutdown_fn))
-                startup_results.append((name, rounded))
-
-    async def run_shutdown(steps: List[LifecycleStep]) -> None:
-        for name, _, shutdown_fn in reversed(steps):
-            if shutdown_fn is None:
-                continue
-            stage_span_name = f"shutdown.{name}"
-            with tracer.start_as_current_span(stage_span_name) as step_span:
-                step_start = time.perf_counter()
-                logger.info("shutdown stage started", extra={"stage": name})
-                try:
-                    await shutdown_fn()
-                except Exception as exc:  # pragma: no cover - defensive path
-                    step_span.record_exception(exc)
-                    step_span.set_status(Status(StatusCode.ERROR, str(exc)))
-                    logger.error("shutdown stage failed", extra={"stage": name, "error": str(exc)})
-                    continue
-                step_duration = time.perf_counter() - step_start
-                step_span.set_attribute("duration_sec", step_duration)
-                logger.info("shutdown stage completed", extra={"stage": name, "duration_sec": round(step_duration, 2)})
+    # Steps declare what they depend on; independent steps start concurrently.
+    startup = StartupGraph(tracer)
+    add_step = startup.add
 
     app_config = AppConfig()
     logger.info(
@@ -268,9 +263,31 @@ async def lifespan(app: FastAPI):
 
     from src.pools.session_manager import ThreadSafeSessionManager
 
+    workload_executors = {}
+
+    async def start_executors() -> None:
+        workload_executors.update(
+            configure_workload_executors(
+                {
+                    Workload.SPEECH_IO: EXECUTOR_SPEECH_IO_WORKERS,
+                    Workload.TTS_SYNTHESIS: EXECUTOR_TTS_SYNTHESIS_WORKERS,
+                    Workload.STORAGE: EXECUTOR_STORAGE_WORKERS,
+                    Workload.MISC: EXECUTOR_MISC_WORKERS,
+                }
+            )
+        )
+
+    async def stop_executors() -> None:
+        shutdown_workload_executors(wait=False)
+        logger.info("workload executors stopped")
+
+    add_step("executors", start_executors, stop_executors)
+
     async def start_core_state() -> None:
         try:
-            app.state.redis = AzureRedisManager()
+            # Client construction performs the AAD token fetch and, in cluster
+            # mode, the slot discovery handshake.
+            app.state.redis = await run_in_workload(Workload.STORAGE, AzureRedisManager)
         except Exception as exc:
             raise RuntimeError(f"Azure Managed Redis initialization failed: {exc}")
 
@@ -282,6 +299,47 @@ async def lifespan(app: FastAPI):
         app.state.session_manager = ThreadSafeSessionManager()
         app.state.session_metrics = ThreadSafeSessionMetrics()
         app.state.greeted_call_ids = set()
+
+        connections = app_config.connections
+        if connections.enable_distributed:
+            session_bus = app.state.redis.create_session_bus(
+                owner_ttl_s=connections.owner_ttl_seconds,
+                cache_ttl_s=connections.lookup_cache_seconds,
+            )
+            await session_bus.start()
+            app.state.conn_manager.attach_bus(session_bus)
+            app.state.session_manager.attach_bus(session_bus)
+            app.state.session_bus = session_bus
+            logger.info(
+                "distributed session routing enabled",
+                extra={"node_id": session_bus.node_id},
+            )
+
+        from apps.rtagent.backend.api.v1.handlers.acs_media_lifecycle import (
+            _handlers_cleanup_executor,
+        )
+
+        monitoring = app_config.monitoring
+        loop_monitor = EventLoopHealthMonitor(
+            enabled=monitoring.enable_loop_monitor,
+            interval_ms=monitoring.loop_monitor_interval_ms,
+            slow_callback_ms=monitoring.loop_slow_callback_ms,
+        )
+        for workload, executor in workload_executors.items():
+            loop_monitor.register_executor(workload.value, lambda e=executor: e)
+        loop_monitor.register_executor(
+            "handlers_cleanup", lambda: _handlers_cleanup_executor
+        )
+        await loop_monitor.start()
+        app.state.loop_monitor = loop_monitor
+
+        if monitoring.enable_latency_histograms:
+            fleet_latency.configure(
+                flush_interval_s=monitoring.latency_histogram_flush_s,
+                retention_minutes=monitoring.latency_histogram_retention_minutes,
+            )
+            await fleet_latency.start(app.state.redis)
+            app.state.latency_recorder = fleet_latency
         logger.info(
             "core state ready",
             extra={
@@ -292,11 +350,38 @@ async def lifespan(app: FastAPI):
         )
 
     async def stop_core_state() -> None:
+        if hasattr(app.state, "loop_monitor"):
+            await app.state.loop_monitor.stop()
+        if hasattr(app.state, "latency_recorder"):
+            await app.state.latency_recorder.stop()
         if hasattr(app.state, "conn_manager"):
             await app.state.conn_manager.stop()
             logger.info("connection manager stopped")
-
-    add_step("core", start_core_state, stop_core_state)
+        if hasattr(app.state, "session_bus"):
+            await app.state.session_bus.stop()
+            logger.info("session bus stopped")
+        if hasattr(app.state, "redis"):
+            await app.state.redis.close_async()
+            logger.info("redis stream multiplexer stopped")
+
+    add_step("core", start_core_state, stop_core_state, depends_on=("executors",))
+
+    async def start_speech_auth() -> None:
+        if AZURE_SPEECH_KEY:
+            return
+        # One token for every synthesizer/recognizer in the process, renewed
+        # in the background before it expires.
+        manager = get_speech_token_manager()
+        await run_in_workload(Workload.MISC, manager.get_token)
+        manager.start_refresher(lead_seconds=SPEECH_TOKEN_REFRESH_LEAD_S)
+        app.state.speech_token_manager = manager
+
+    async def stop_speech_auth() -> None:
+        manager = getattr(app.state, "speech_token_manager", None)
+        if manager is not None:
+            manager.stop_refresher()
+
+    add_step("speech_auth", start_speech_auth, stop_speech_auth, depends_on=("executors",))
 
     async def start_speech_pools() -> None:
         async def make_tts() -> SpeechSynthesizer:
@@ -343,7 +428,28 @@ async def lifespan(app: FastAPI):
             await asyncio.gather(*shutdown_tasks, return_exceptions=True)
             logger.info("speech pools shutdown complete")
 
-    add_step("speech", start_speech_pools, stop_speech_pools)
+    add_step("speech", start_speech_pools, stop_speech_pools, depends_on=("speech_auth",))
+
+    async def start_voice_live_pool() -> None:
+        if ACS_STREAMING_MODE != StreamMode.VOICE_LIVE:
+            return
+        # Imported lazily: pulls in the Voice Live agent stack.
+        from src.pools.voice_live_pool import get_voice_live_pool
+
+        app.state.voice_live_pool = await get_voice_live_pool(background_prewarm=True)
+        logger.info("voice live pool ready")
+
+    async def stop_voice_live_pool() -> None:
+        if getattr(app.state, "voice_live_pool", None) is None:
+            return
+        from src.pools.voice_live_pool import cleanup_voice_live_pool
+
+        await cleanup_voice_live_pool()
+        app.state.voice_live_pool = None
+
+    add_step(
+        "voice_live_pool", start_voice_live_pool, stop_voice_live_pool, depends_on=("executors",)
+    )
 
     async def start_aoai_client() -> None:
         session_manager = getattr(app.state, "session_manager", None)
@@ -356,27 +462,77 @@ async def lifespan(app: FastAPI):
         app.state.aoai_client = await aoai_manager.get_client()
         logger.info("Azure OpenAI client attached", extra={"manager_enabled": True})
 
-    add_step("aoai", start_aoai_client)
+    add_step("aoai", start_aoai_client, depends_on=("core",))
 
     async def start_external_services() -> None:
-        app.state.cosmos = CosmosDBMongoCoreManager(
-            connection_string=AZURE_COSMOS_CONNECTION_STRING,
-            database_name=AZURE_COSMOS_DATABASE_NAME,
-            collection_name=AZURE_COSMOS_COLLECTION_NAME,
+        app.state.cosmos, app.state.acs_caller = await asyncio.gather(
+            run_in_workload(
+                Workload.STORAGE,
+                lambda: CosmosDBMongoCoreManager(
+                    connection_string=AZURE_COSMOS_CONNECTION_STRING,
+                    database_name=AZURE_COSMOS_DATABASE_NAME,
+                    collection_name=AZURE_COSMOS_COLLECTION_NAME,
+                ),
+            ),
+            run_in_workload(Workload.MISC, initialize_acs_caller_instance),
+        )
+        # Index builds can take a while on large collections (and the client
+        # connects lazily), so they run in the background instead of gating startup.
+        app.state.cosmos_index_task = asyncio.create_task(
+            run_in_workload(Workload.STORAGE, app.state.cosmos.ensure_indexes)
         )
-        app.state.acs_caller = initialize_acs_caller_instance()
         logger.info("external services ready")
 
-    add_step("services", start_external_services)
+    async def stop_external_services() -> None:
+        index_task = getattr(app.state, "cosmos_index_task", None)
+        if index_task and not index_task.done():
+            index_task.cancel()
+            await asyncio.gather(index_task, return_exceptions=True)
+
+    add_step(
+        "services", start_external_services, stop_external_services, depends_on=("executors",)
+    )
+
+    async def start_postcall_archive() -> None:
+        if not ENABLE_POSTCALL_ARCHIVE:
+            return
+        from src.blob.blob_helper import get_blob_helper
+        from src.postcall.archive import PostCallArchiver
+
+        app.state.postcall_archiver = PostCallArchiver(
+            get_blob_helper(),
+            app.state.cosmos,
+            codec=POSTCALL_ARCHIVE_COMPRESSION,
+            queue_size=POSTCALL_ARCHIVE_QUEUE_SIZE,
+            workers=POSTCALL_ARCHIVE_WORKERS,
+            max_attempts=POSTCALL_ARCHIVE_MAX_ATTEMPTS,
+        ).start()
+
+    async def stop_postcall_archive() -> None:
+        archiver = getattr(app.state, "postcall_archiver", None)
+        if archiver is not None:
+            await archiver.stop()
+            app.state.postcall_archiver = None
+
+    add_step(
+        "postcall_archive", start_postcall_archive, stop_postcall_archive, depends_on=("services",)
+    )
 
     async def start_agents() -> None:
-        app.state.auth_agent = ARTAgent(config_path=AGENT_AUTH_CONFIG)
-        app.state.claim_intake_agent = ARTAgent(config_path=AGENT_CLAIM_INTAKE_CONFIG)
-        app.state.general_info_agent = ARTAgent(config_path=AGENT_GENERAL_INFO_CONFIG)
-        app.state.promptsclient = PromptManager()
+        (
+            app.state.auth_agent,
+            app.state.claim_intake_agent,
+            app.state.general_info_agent,
+            app.state.promptsclient,
+        ) = await asyncio.gather(
+            run_in_workload(Workload.MISC, ARTAgent, config_path=AGENT_AUTH_CONFIG),
+            run_in_workload(Workload.MISC, ARTAgent, config_path=AGENT_CLAIM_INTAKE_CONFIG),
+            run_in_workload(Workload.MISC, ARTAgent, config_path=AGENT_GENERAL_INFO_CONFIG),
+            run_in_workload(Workload.MISC, PromptManager),
+        )
         logger.info("agents initialized")
 
-    add_step("agents", start_agents)
+    add_step("agents", start_agents, depends_on=("executors",))
 
     async def start_event_handlers() -> None:
         register_default_handlers()
@@ -385,6 +541,36 @@ async def lifespan(app: FastAPI):
 
     add_step("events", start_event_handlers)
 
+    async def start_readiness_prober() -> None:
+        monitoring = app_config.monitoring
+        if not monitoring.enable_readiness_prober:
+            logger.info("readiness prober disabled; /readiness checks run inline")
+            return
+        prober = ReadinessProber(
+            interval_s=monitoring.readiness_probe_interval_s,
+            timeout_s=monitoring.readiness_probe_timeout_s,
+            max_backoff_s=monitoring.readiness_probe_max_backoff_s,
+        )
+        register_readiness_probes(prober, app)
+        await prober.start()
+        app.state.readiness_prober = prober
+        logger.info(
+            "readiness prober started",
+            extra={"interval_s": monitoring.readiness_probe_interval_s},
+        )
+
+    async def stop_readiness_prober() -> None:
+        if hasattr(app.state, "readiness_prober"):
+            await app.state.readiness_prober.stop()
+            logger.info("readiness prober stopped")
+
+    add_step(
+        "readiness",
+        start_readiness_prober,
+        stop_readiness_prober,
+        depends_on=("core", "speech", "aoai", "services", "agents"),
+    )
+
     with tracer.start_as_current_span("startup.lifespan") as startup_span:
         startup_span.set_attributes(
             {
@@ -394,7 +580,13 @@ async def lifespan(app: FastAPI):
             }
         )
         startup_begin = time.perf_counter()
-        await run_steps(startup_steps, "startup")
+        try:
+            await startup.start()
+        except Exception:
+            await startup.shutdown()
+            raise
+        finally:
+            _import_profiler.stop()
         startup_duration = time.perf_counter() - startup_begin
         startup_span.set_attributes(
             {
@@ -407,7 +599,7 @@ async def lifespan(app: FastAPI):
         logger.info("startup complete", extra={"duration_sec": duration_rounded})
         logger.info(f"startup duration: {duration_rounded}s")
         
-    logger.info(_build_startup_dashboard(app_config, app, startup_results))
+    logger.info(_build_startup_dashboard(app_config, app, startup, _import_profiler))
 
     # ---- Run app ----
     yield
@@ -415,7 +607,7 @@ async def lifespan(app: FastAPI):
     with tracer.start_as_current_span("shutdown.lifespan") as shutdown_span:
         logger.info("🛑 shutdown…")
         shutdown_begin = time.perf_counter()
-        await run_shutdown(executed_steps)
+        await startup.shutdown()
 
         shutdown_span.set_attribute("shutdown.duration_sec", time.perf_counter() - shutdown_begin)
         shutdown_span.set_attribute("shutdown.success", True)
@@ -24,7 +24,7 @@ from .base import (
 
 from .factory import build_lva_from_yaml
 
-from .transport import WebSocketTransport
+from .transport import AsyncWebSocketTransport, WebSocketTransport
 
 from .audio_io import (
     MicSource,
@@ -44,6 +44,7 @@ __all__ = [
     
     # Transport
     "WebSocketTransport",
+    "AsyncWebSocketTransport",
     
     # Audio I/O
     "MicSource",
@@ -6,9 +6,12 @@ from collections import deque
 from typing import Optional
 
 import numpy as np
-import sounddevice as sd  # type: ignore[import-untyped]
+from utils.lazy_import import lazy_import
 from utils.ml_logging import get_logger
 
+# Only local mic/speaker use needs PortAudio; server sessions never touch it.
+sd = lazy_import("sounddevice")
+
 logger = get_logger(__name__)
 
 
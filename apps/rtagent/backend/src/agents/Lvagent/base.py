@@ -1,6 +1,7 @@
 # apps/rtagent/backend/src/lva/base.py
 from __future__ import annotations
 
+import asyncio
 import base64
 import json
 import os
@@ -9,7 +10,7 @@ import uuid
 import queue
 import threading
 from dataclasses import dataclass
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional
 
 import numpy as np
 from azure.identity import DefaultAzureCredential
@@ -19,7 +20,7 @@ from utils.ml_logging import get_logger
 # Load environment variables from .env file
 load_dotenv()
 
-from .transport import WebSocketTransport
+from .transport import AsyncWebSocketTransport, WebSocketTransport
 from .audio_io import MicSource, SpeakerSink, pcm_to_base64
 from utils.azure_auth import get_credential
 
@@ -170,8 +171,12 @@ class AzureLiveVoiceAgent:
         logger.info(f"  - Agent ID: {self._binding.agent_id}")
         logger.info(f"  - Project: {self._binding.project_name}")
         
-        # Initialize WebSocket transport
+        # asyncio transport (server sessions and run()); the threaded transport
+        # backs the synchronous connect/send_event/recv_raw API.
+        self._aws = AsyncWebSocketTransport(self._url, self._auth_headers)
         self._ws = WebSocketTransport(self._url, self._auth_headers)
+        # Conversation items on the service side, so a pooled agent can be reset.
+        self._item_ids: List[str] = []
         
         # Audio I/O setup (optional; disabled in server path)
         self._src: Optional[MicSource] = None
@@ -306,60 +311,85 @@ class AzureLiveVoiceAgent:
             logger.error(f"Failed to connect: {e}")
             raise
 
+    async def connect_async(self) -> None:
+        """
+        Connect on the running event loop and send the session configuration.
+        """
+        try:
+            await self._aws.connect()
+            logger.info("Connected to Azure Voice Live API")
+            await self._aws.send_dict(self._session_update())
+            logger.info("Session configuration sent")
+        except Exception as e:
+            logger.error(f"Failed to connect: {e}")
+            raise
+
     def run(self) -> None:
         """
-        Start the main audio streaming loop.
-        
-        This connects to the service, starts audio I/O, and handles real-time
-        bidirectional audio streaming with proper event processing.
+        Start the main audio streaming loop (blocking; see :meth:`run_async`).
         """
         try:
-            # Connect to the service
-            self.connect()
-            
+            asyncio.run(self.run_async())
+        except KeyboardInterrupt:
+            logger.info("Interrupted by user")
+
+    async def run_async(self) -> None:
+        """
+        Stream microphone audio to the service and play responses.
+
+        Inbound events are awaited on a receiver task; the microphone is read
+        at the chunk rate. Nothing polls the socket.
+        """
+        receiver: Optional[asyncio.Task] = None
+        try:
+            await self.connect_async()
+
             # Start audio I/O if enabled
             if self._enable_audio_io and self._src is not None and self._sink is not None:
                 self._src.start()
                 self._sink.start()
-            
+
             logger.info("Starting audio streaming loop")
-            
+            receiver = asyncio.create_task(self._receive_events())
+
             try:
-                while True:
-                    # Send microphone audio to the service (only if audio I/O enabled)
-                    if self._enable_audio_io and self._src is not None:
-                        pcm = self._src.read(self._frames)
-                        if pcm is not None and len(pcm) > 0:
-                            audio_message = {
-                                "type": "input_audio_buffer.append",
-                                "audio": pcm_to_base64(pcm),
-                                "event_id": str(uuid.uuid4())
-                            }
-                            self._ws.send_dict(audio_message)
-                    
-                    # Process incoming events (non-blocking)
-                    raw_event = self._ws.recv(timeout_s=0.01)
-                    if raw_event:
-                        self._handle_event(raw_event)
-                        
-            except KeyboardInterrupt:
-                logger.info("Interrupted by user")
+                if not (self._enable_audio_io and self._src is not None):
+                    await receiver
+                    return
+                while not receiver.done():
+                    pcm = self._src.read(self._frames)
+                    if pcm is None or len(pcm) == 0:
+                        await asyncio.sleep(DEFAULT_CHUNK_MS / 2000)
+                        continue
+                    await self._aws.send_dict(
+                        {
+                            "type": "input_audio_buffer.append",
+                            "audio": pcm_to_base64(pcm),
+                            "event_id": str(uuid.uuid4()),
+                        }
+                    )
             except Exception as e:
                 logger.exception(f"Audio streaming loop failed: {e}")
                 raise
-                
+
         finally:
             # Cleanup
+            if receiver is not None and not receiver.done():
+                receiver.cancel()
             try:
                 if self._src is not None:
                     self._src.stop()
                 if self._sink is not None:
                     self._sink.stop()
-                self._ws.close()
+                await self._aws.close()
                 logger.info("Audio streaming stopped and connections closed")
             except Exception as e:
                 logger.warning(f"Cleanup failed: {e}")
 
+    async def _receive_events(self) -> None:
+        async for raw_event in self._aws:
+            self._handle_event(raw_event)
+
     def send_text(self, text: str) -> None:
         """
         Send a text message to the agent.
@@ -402,6 +432,146 @@ class AzureLiveVoiceAgent:
         """Receive a raw JSON event string from the transport if available."""
         return self._ws.recv(timeout_s=timeout_s)
 
+    async def send_event_async(self, payload: Dict[str, Any]) -> None:
+        """Send an event dict, waiting while the socket's write buffer is full."""
+        await self._aws.send_dict(payload)
+
+    async def recv_raw_async(self, *, timeout_s: Optional[float] = None) -> Optional[str]:
+        """Await the next raw JSON event string (None on timeout or close)."""
+        return await self._aws.recv(timeout_s=timeout_s)
+
+    def events(self) -> AsyncIterator[str]:
+        """Iterate raw JSON events until the connection closes."""
+        return self._tracked_events()
+
+    async def _tracked_events(self) -> AsyncIterator[str]:
+        async for raw in self._aws:
+            self._track_items(raw)
+            yield raw
+
+    def _track_items(self, raw: str) -> Optional[Dict[str, Any]]:
+        # Substring test first: audio deltas are large and never match.
+        if "conversation.item.created" not in raw and "conversation.item.deleted" not in raw:
+            return None
+        try:
+            evt = json.loads(raw)
+        except ValueError:
+            return None
+        if evt.get("type") == "conversation.item.created":
+            item_id = (evt.get("item") or {}).get("id")
+            if item_id and item_id not in self._item_ids:
+                self._item_ids.append(item_id)
+        elif evt.get("type") == "conversation.item.deleted":
+            item_id = evt.get("item_id")
+            if item_id in self._item_ids:
+                self._item_ids.remove(item_id)
+        return evt
+
+    async def reset_async(self, *, timeout_s: float = 3.0) -> bool:
+        """
+        Prepare a connected agent for the next call without reconnecting.
+
+        Cancels any in-flight response, clears the input buffer, deletes
+        every conversation item seen on this connection and re-sends
+        ``session.update``. Returns ``True`` once the service has confirmed
+        the deletions and the session update within ``timeout_s``; the caller
+        should close the agent otherwise.
+        """
+        if not self._aws.is_connected:
+            return False
+        # Events left unread by the previous call may still create items.
+        while True:
+            raw = await self._aws.recv(timeout_s=0.01)
+            if raw is None:
+                break
+            self._track_items(raw)
+
+        pending: Dict[str, str] = {}  # delete event_id -> item_id
+        try:
+            await self._aws.send_dict({"type": "response.cancel", "event_id": str(uuid.uuid4())})
+            await self._aws.send_dict(
+                {"type": "input_audio_buffer.clear", "event_id": str(uuid.uuid4())}
+            )
+            for item_id in list(self._item_ids):
+                event_id = str(uuid.uuid4())
+                pending[event_id] = item_id
+                await self._aws.send_dict(
+                    {"type": "conversation.item.delete", "item_id": item_id, "event_id": event_id}
+                )
+            await self._aws.send_dict(self._session_update())
+        except Exception as e:
+            logger.warning(f"Voice Live reset failed to send: {e}")
+            return False
+
+        waiting_items = set(pending.values())
+        updated = False
+        deadline = time.monotonic() + timeout_s
+        while not (updated and not waiting_items):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.warning(
+                    "Voice Live reset timed out (items pending=%d, session updated=%s)",
+                    len(waiting_items),
+                    updated,
+                )
+                return False
+            raw = await self._aws.recv(timeout_s=remaining)
+            if raw is None:
+                if not self._aws.is_connected:
+                    return False
+                continue
+            evt = self._track_items(raw)
+            if evt is None:
+                if '"session.updated"' not in raw and '"error"' not in raw:
+                    continue
+                try:
+                    evt = json.loads(raw)
+                except ValueError:
+                    continue
+            event_type = evt.get("type")
+            if event_type == "conversation.item.deleted":
+                waiting_items.discard(evt.get("item_id"))
+            elif event_type == "session.updated":
+                updated = True
+            elif event_type == "error":
+                # Unknown item ids were already gone; cancel without an active
+                # response is expected. Anything else fails the reset.
+                failed = (evt.get("error") or {}).get("event_id")
+                if failed in pending:
+                    waiting_items.discard(pending[failed])
+                    if pending[failed] in self._item_ids:
+                        self._item_ids.remove(pending[failed])
+                elif (evt.get("error") or {}).get("code") != "response_cancel_not_active":
+                    logger.warning(f"Voice Live reset rejected: {evt.get('error')}")
+                    return False
+        return True
+
+    async def ping_async(self, *, timeout_s: float = 5.0) -> float:
+        """Round-trip a WebSocket ping; returns milliseconds."""
+        return await self._aws.ping(timeout_s=timeout_s)
+
+    @property
+    def pool_key(self) -> tuple:
+        """Agents with the same key are interchangeable after a reset."""
+        return (self._model.deployment_id, self._session.voice_name, self._binding.agent_id)
+
+    async def close_async(self) -> None:
+        """Close the asyncio connection and any audio I/O."""
+        try:
+            if self._src is not None:
+                self._src.stop()
+            if self._sink is not None:
+                self._sink.stop()
+            await self._aws.close()
+            logger.info("Azure Live Voice Agent connection closed")
+        except Exception as e:
+            logger.warning(f"Error during cleanup: {e}")
+
+    @property
+    def is_connected(self) -> bool:
+        """True while either transport is open."""
+        return self._aws.is_connected or self._ws.is_connected
+
     @property
     def url(self) -> str:
         """Get the WebSocket URL for debugging."""
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import queue
 import threading
 import time
 import uuid
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Optional
 
 import websocket  # websocket-client
+import websockets
+from websockets.exceptions import ConnectionClosed
 from utils.ml_logging import get_logger
 
 logger = get_logger(__name__)
@@ -200,3 +203,188 @@ class WebSocketTransport:
     def is_connected(self) -> bool:
         """True if the socket is currently open."""
         return self._connected.is_set()
+
+
+class AsyncWebSocketTransport:
+    """
+    asyncio-native WebSocket transport for Voice Live sessions.
+
+    Runs on the caller's event loop (``websockets``), so concurrent sessions
+    share the loop instead of each owning a receiver thread, and receiving
+    awaits the next frame instead of polling a queue.
+
+    Backpressure: at most ``max_queue`` inbound messages are buffered before
+    the socket stops reading (TCP pushes back on the service instead of
+    dropping audio), and ``send_*`` waits while more than ``write_limit``
+    bytes are unsent.
+
+    Usage:
+        ws = AsyncWebSocketTransport(url, headers)
+        await ws.connect()
+        await ws.send_dict({"type": "session.update", "session": {...}})
+        async for raw in ws:
+            ...
+        await ws.close()
+
+    :param url: Fully-qualified WS(S) URL.
+    :param headers: HTTP headers to include during the WebSocket upgrade.
+    :param ping_interval_s: Interval for automatic pings to keep the socket alive.
+    :param ping_timeout_s: Timeout before considering a ping failed.
+    :param max_queue: Max number of inbound messages to buffer.
+    :param write_limit: Unsent bytes above which sends wait for the socket to drain.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        *,
+        ping_interval_s: float = 20.0,
+        ping_timeout_s: float = 10.0,
+        max_queue: int = 256,
+        write_limit: int = 2**16,
+    ) -> None:
+        self._url = url
+        self._headers = headers or {}
+        self._ping_interval_s = ping_interval_s
+        self._ping_timeout_s = ping_timeout_s
+        self._max_queue = max_queue
+        self._write_limit = write_limit
+        self._ws: Optional[Any] = None
+        self._closed = False
+
+    # --------------------------------------------------------------------- #
+    # Lifecycle
+    # --------------------------------------------------------------------- #
+    async def connect(self, timeout_s: float = 10.0) -> None:
+        """
+        Open the WebSocket.
+
+        :param timeout_s: Time to wait for the opening handshake.
+        :raises ConnectionError: If the socket doesn't open within the timeout.
+        """
+        if self.is_connected:
+            logger.warning("WebSocket already connected; ignoring connect().")
+            return
+        options = dict(
+            ping_interval=self._ping_interval_s,
+            ping_timeout=self._ping_timeout_s,
+            max_queue=self._max_queue,
+            write_limit=self._write_limit,
+            open_timeout=timeout_s,
+        )
+        try:
+            try:
+                self._ws = await websockets.connect(
+                    self._url, additional_headers=self._headers, **options
+                )
+            except TypeError:  # websockets < 14
+                self._ws = await websockets.connect(
+                    self._url, extra_headers=self._headers, **options
+                )
+        except (OSError, asyncio.TimeoutError, websockets.WebSocketException) as exc:
+            raise ConnectionError(
+                f"WebSocket did not open within {timeout_s:.1f}s ({exc})"
+            ) from exc
+        self._closed = False
+        logger.info("WebSocket opened.")
+
+    async def close(self) -> None:
+        """Close the WebSocket (idempotent)."""
+        self._closed = True
+        ws, self._ws = self._ws, None
+        if ws is None:
+            return
+        try:
+            await ws.close()
+        except Exception:  # noqa: BLE001
+            logger.exception("Error while closing WebSocket.")
+
+    # --------------------------------------------------------------------- #
+    # I/O
+    # --------------------------------------------------------------------- #
+    async def send_text(self, data: str) -> None:
+        """
+        Send a raw text frame, waiting while the write buffer is full.
+
+        :param data: Text payload to send.
+        :raises RuntimeError: If the socket is not connected.
+        :raises ConnectionClosed: If the socket closes while sending.
+        """
+        if self._ws is None:
+            raise RuntimeError("WebSocket is not connected.")
+        await self._ws.send(data)
+
+    async def send_dict(self, payload: Dict[str, Any]) -> None:
+        """
+        Serialize a dict to JSON and send as a text frame.
+
+        :param payload: Dict payload to JSON-encode and send.
+        """
+        try:
+            data = json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+        except Exception:  # noqa: BLE001
+            logger.exception("Failed to serialize payload to JSON.")
+            return
+        await self.send_text(data)
+
+    async def recv(self, *, timeout_s: Optional[float] = None) -> Optional[str]:
+        """
+        Await the next message.
+
+        :param timeout_s: Max time to wait; ``None`` waits until a message arrives.
+        :return: Raw JSON string, or None on timeout or once the socket is closed.
+        """
+        if self._ws is None:
+            return None
+        try:
+            if timeout_s is None:
+                message = await self._ws.recv()
+            else:
+                message = await asyncio.wait_for(self._ws.recv(), timeout_s)
+        except asyncio.TimeoutError:
+            return None
+        except ConnectionClosed as exc:
+            if not self._closed:
+                logger.info("WebSocket closed: code=%s, reason=%s", exc.code, exc.reason)
+            return None
+        return message.decode("utf-8") if isinstance(message, bytes) else message
+
+    def __aiter__(self) -> AsyncIterator[str]:
+        return self._iter_messages()
+
+    async def _iter_messages(self) -> AsyncIterator[str]:
+        while True:
+            message = await self.recv()
+            if message is None:
+                return
+            yield message
+
+    async def ping(self, *, timeout_s: float = 5.0) -> float:
+        """
+        Round-trip a ping frame.
+
+        :param timeout_s: Max time to wait for the pong.
+        :return: Round-trip time in milliseconds.
+        :raises RuntimeError: If the socket is not connected.
+        :raises asyncio.TimeoutError: If no pong arrives in time.
+        """
+        if self._ws is None:
+            raise RuntimeError("WebSocket is not connected.")
+        start = time.perf_counter()
+        pong = await self._ws.ping()
+        await asyncio.wait_for(pong, timeout_s)
+        return (time.perf_counter() - start) * 1000
+
+    # --------------------------------------------------------------------- #
+    # Introspection
+    # --------------------------------------------------------------------- #
+    @property
+    def is_connected(self) -> bool:
+        """True if the socket is currently open."""
+        if self._ws is None or self._closed:
+            return False
+        state = getattr(self._ws, "state", None)
+        if state is not None:
+            return getattr(state, "name", "") == "OPEN"
+        return bool(getattr(self._ws, "open", False))
@@ -5,20 +5,57 @@ rt_agent.py – YAML-driven agents with per-agent memory, model params, tools, a
 a configurable *prompt template path*, with context-aware slot + tool output sharing.
 """
 
+import asyncio
+import time
 from pathlib import Path
 from textwrap import shorten
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 from fastapi import WebSocket
+from opentelemetry import metrics
 
 from apps.rtagent.backend.src.agents.artagent.prompt_store.prompt_manager import PromptManager
 from apps.rtagent.backend.src.agents.artagent.tool_store import tool_registry as tool_store
-from apps.rtagent.backend.src.orchestration.artagent.gpt_flow import process_gpt_response
+from apps.rtagent.backend.src.orchestration.artagent.gpt_flow import (
+    process_gpt_response,
+    replay_cached_response,
+)
+from config import (
+    ENABLE_SEMANTIC_CACHE,
+    SEMANTIC_CACHE_EMBEDDING_DEPLOYMENT,
+    SEMANTIC_CACHE_EMBEDDING_TIMEOUT_S,
+    SEMANTIC_CACHE_LOOKUP_BUDGET_S,
+)
+from src.aoai.semantic_cache import SemanticResponseCache
+from src.pools.executors import Workload, run_in_workload
 from utils.ml_logging import get_logger
 
 logger = get_logger("rt_agent")
 
+_meter = metrics.get_meter("rtagent.semantic_cache")
+_cache_lookups = _meter.create_counter(
+    "rtagent.semantic_cache.lookups",
+    description="Semantic response cache lookups by result (hit/miss)",
+)
+_cache_saved_ms = _meter.create_counter(
+    "rtagent.semantic_cache.saved_time",
+    unit="ms",
+    description="Estimated turn latency saved by semantic cache hits",
+)
+
+# Weight of the newest sample in the running averages used to estimate savings.
+_MISS_EWMA_ALPHA = 0.2
+# Lookups always run until this many have fed the hit-rate estimate; after
+# that, while they look unprofitable, one still runs every _CACHE_PROBE_EVERY
+# turns so the estimate can recover.
+_CACHE_WARMUP_LOOKUPS = 20
+_CACHE_PROBE_EVERY = 10
+
+
+def _ewma(current: Optional[float], sample: float) -> float:
+    return sample if current is None else current + _MISS_EWMA_ALPHA * (sample - current)
+
 
 class ARTAgent:
     CONFIG_PATH: str | Path = "agent.yaml"
@@ -83,6 +120,24 @@ class ARTAgent:
             else:
                 raise TypeError("Each tools entry must be a str or dict")
 
+        # Optional semantic response cache (YAML `cache:` block + ENABLE_SEMANTIC_CACHE)
+        cache_cfg = self._cfg.get("cache") or {}
+        self.cache_scope_slots: List[str] = list(cache_cfg.get("scope_slots", []))
+        self.cache_tools: set[str] = set(cache_cfg.get("tools", []))
+        self.semantic_cache: Optional[SemanticResponseCache] = None
+        if ENABLE_SEMANTIC_CACHE and cache_cfg.get("enabled", False):
+            self.semantic_cache = SemanticResponseCache(
+                similarity_threshold=float(cache_cfg.get("similarity_threshold", 0.92)),
+                ttl_seconds=float(cache_cfg.get("ttl_seconds", 3600)),
+                max_entries=int(cache_cfg.get("max_entries", 512)),
+                min_question_words=int(cache_cfg.get("min_question_words", 3)),
+            )
+        self._miss_ms_ewma: Optional[float] = None
+        self._embed_ms_ewma: Optional[float] = None
+        self._hit_rate_ewma: Optional[float] = None
+        self._turns_since_lookup = 0
+        self._lookups = 0
+
         self.pm: PromptManager = PromptManager(template_dir=template_dir)
         self._log_loaded_summary()
 
@@ -116,22 +171,181 @@ class ARTAgent:
             system_prompt=system_prompt,
         )
 
-        result = await process_gpt_response(
-            cm,
-            user_prompt,
-            ws,
-            agent_name=self.name,
-            is_acs=is_acs,
-            model_id=self.model_id,
-            temperature=self.temperature,
-            top_p=self.top_p,
-            max_tokens=self.max_tokens,
-            available_tools=self.tools,
-            session_id=cm.session_id,  # Pass session_id for AOAI client pooling
-        )
+        cache = self.semantic_cache
+        scope = self._cache_scope(cm) if cache is not None else None
+        embed_task: Optional[asyncio.Task] = None
+        if (
+            scope is not None
+            and cache.accepts(user_prompt)
+            and not self._follows_agent_question(cm)
+        ):
+            started = time.perf_counter()
+            # The embedding runs alongside the completion; the turn only waits
+            # for it (briefly) when a lookup is expected to pay off.
+            embed_task = asyncio.create_task(self._timed_embed(ws, user_prompt, cm.session_id))
+            hit = None
+            if self._should_wait_for_lookup():
+                done, _ = await asyncio.wait({embed_task}, timeout=SEMANTIC_CACHE_LOOKUP_BUDGET_S)
+                embedding = embed_task.result() if done else None
+                if embedding is not None:
+                    self._turns_since_lookup = 0
+                    self._lookups += 1
+                    hit = cache.lookup(scope, embedding)
+                    self._hit_rate_ewma = _ewma(self._hit_rate_ewma, 1.0 if hit else 0.0)
+                    result_label = "hit" if hit else "miss"
+                else:
+                    result_label = "late"
+            else:
+                result_label = "skipped"
+            _cache_lookups.add(1, {"agent": self.name, "result": result_label})
+            if hit:
+                entry, score = hit
+                await replay_cached_response(
+                    cm,
+                    user_prompt,
+                    entry.answer,
+                    ws,
+                    agent_name=self.name,
+                    is_acs=is_acs,
+                    session_id=cm.session_id,
+                )
+                hit_ms = (time.perf_counter() - started) * 1000
+                if self._miss_ms_ewma is not None:
+                    saved = max(0.0, self._miss_ms_ewma - hit_ms)
+                    cache.record_saved(saved)
+                    _cache_saved_ms.add(saved, {"agent": self.name})
+                logger.info(
+                    "Semantic cache hit for %s (score=%.3f, %.0f ms)",
+                    self.name,
+                    score,
+                    hit_ms,
+                    extra={"agent": self.name, "event_type": "semantic_cache_hit"},
+                )
+                return None
+
+        history_start = len(cm.get_history(self.name))
+        started = time.perf_counter()
+        try:
+            result = await process_gpt_response(
+                cm,
+                user_prompt,
+                ws,
+                agent_name=self.name,
+                is_acs=is_acs,
+                model_id=self.model_id,
+                temperature=self.temperature,
+                top_p=self.top_p,
+                max_tokens=self.max_tokens,
+                available_tools=self.tools,
+                session_id=cm.session_id,  # Pass session_id for AOAI client pooling
+            )
+        except BaseException:
+            if embed_task is not None:
+                embed_task.cancel()
+            raise
+
+        if embed_task is not None:
+            self._miss_ms_ewma = _ewma(
+                self._miss_ms_ewma, (time.perf_counter() - started) * 1000
+            )
+            embedding = await embed_task  # bounded by the embedding timeout
+            answer = self._cacheable_answer(cm.get_history(self.name)[history_start:])
+            if embedding is not None and answer:
+                cache.store(scope, embedding, user_prompt, answer)
 
         return result
 
+    # ------------------------------------------------------------------
+    # Semantic cache helpers
+    # ------------------------------------------------------------------
+    def _cache_scope(self, cm) -> Optional[Tuple[Any, ...]]:
+        """
+        Agent name plus the slot values a cached answer depends on.
+
+        ``None`` while any scope slot is unset: such a turn is neither served
+        from nor stored in the cache, so answers never leak across callers
+        whose identifying slots are still empty.
+        """
+        values = []
+        for slot in self.cache_scope_slots:
+            value = cm.get_context(slot)
+            if value is None:
+                value = cm.get_slot(slot)
+            if value is None:
+                return None
+            values.append(value)
+        return (self.name, *values)
+
+    def _follows_agent_question(self, cm) -> bool:
+        """
+        True when the agent's last message asked something.
+
+        Replies to a question ("yes please do that") only make sense with the
+        preceding turn, so they are neither served from nor stored in the cache.
+        """
+        for msg in reversed(cm.get_history(self.name)):
+            if msg.get("role") == "assistant" and isinstance(msg.get("content"), str):
+                return msg["content"].rstrip().endswith("?")
+        return False
+
+    def _should_wait_for_lookup(self) -> bool:
+        """Wait for the embedding only while the expected saving exceeds its cost."""
+        self._turns_since_lookup += 1
+        if self._lookups < _CACHE_WARMUP_LOOKUPS:
+            return True
+        if None in (self._miss_ms_ewma, self._embed_ms_ewma, self._hit_rate_ewma):
+            return True
+        if self._turns_since_lookup >= _CACHE_PROBE_EVERY:
+            return True
+        cost_ms = min(self._embed_ms_ewma, SEMANTIC_CACHE_LOOKUP_BUDGET_S * 1000)
+        return self._hit_rate_ewma * self._miss_ms_ewma > cost_ms
+
+    async def _timed_embed(
+        self, ws: WebSocket, text: str, session_id: Optional[str]
+    ) -> Optional[List[float]]:
+        started = time.perf_counter()
+        embedding = await self._embed(ws, text, session_id)
+        if embedding is not None:
+            self._embed_ms_ewma = _ewma(
+                self._embed_ms_ewma, (time.perf_counter() - started) * 1000
+            )
+        return embedding
+
+    def _cacheable_answer(self, turn: List[Dict[str, Any]]) -> Optional[str]:
+        """Final assistant text of a turn, unless it used a tool outside ``cache.tools``."""
+        answer = None
+        for msg in turn:
+            for call in msg.get("tool_calls") or ():
+                if (call.get("function") or {}).get("name") not in self.cache_tools:
+                    return None
+            if msg.get("role") == "assistant" and msg.get("content"):
+                answer = msg["content"]
+        return answer
+
+    async def _embed(self, ws: WebSocket, text: str, session_id: Optional[str]) -> Optional[List[float]]:
+        """Embed ``text`` with the shared AOAI client; None on error or timeout."""
+        state = ws.app.state
+        aoai_manager = getattr(state, "aoai_client_manager", None)
+        try:
+            client = (
+                await aoai_manager.get_client(session_id=session_id)
+                if aoai_manager is not None
+                else state.aoai_client
+            )
+            response = await asyncio.wait_for(
+                run_in_workload(
+                    Workload.MISC,
+                    client.embeddings.create,
+                    input=text,
+                    model=SEMANTIC_CACHE_EMBEDDING_DEPLOYMENT,
+                ),
+                timeout=SEMANTIC_CACHE_EMBEDDING_TIMEOUT_S,
+            )
+            return list(response.data[0].embedding)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Semantic cache embedding failed for %s: %s", self.name, exc)
+            return None
+
     @staticmethod
     def _load_yaml(path: Path) -> Dict[str, Any]:
         """
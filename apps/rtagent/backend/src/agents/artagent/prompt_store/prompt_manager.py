@@ -6,35 +6,63 @@ used to generate prompts for the backend of the browser_RTAgent application.
 It supports loading templates from a specified directory and rendering them with
 dynamic context, such as patient information.
 
+Templates are compiled once when the manager is created, and renders are
+memoized on a hash of the template inputs, so an agent re-rendering the same
+system prompt every turn gets back the identical string without re-running
+Jinja.
+
 """
 
+import hashlib
+import json
 import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Tuple
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, Template
 
 from utils.ml_logging import get_logger
 
 logger = get_logger()
 
 
+def _context_key(context: Dict[str, Any]) -> str:
+    blob = json.dumps(context, sort_keys=True, default=repr, ensure_ascii=False)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
 class PromptManager:
-    def __init__(self, template_dir: str = "templates"):
+    def __init__(self, template_dir: str = "templates", render_cache_size: int = 256):
         """
         Initialize the PromptManager with the given template directory.
 
         Args:
             template_dir (str): The directory containing the Jinja2 templates.
+            render_cache_size (int): Maximum number of rendered prompts kept in memory.
         """
         current_dir = os.path.dirname(os.path.abspath(__file__))
         template_path = os.path.join(current_dir, template_dir)
 
         self.env = Environment(
-            loader=FileSystemLoader(searchpath=template_path), autoescape=True
+            loader=FileSystemLoader(searchpath=template_path),
+            autoescape=True,
+            auto_reload=False,
         )
 
         templates = self.env.list_templates()
         logger.debug(f"Templates found: {templates}")
 
+        # Compile every template up front so the first turn does not pay for it.
+        self._templates: Dict[str, Template] = {
+            name: self.env.get_template(name) for name in templates
+        }
+        self._renders: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self._render_cache_size = render_cache_size
+        self._lock = threading.Lock()
+        self.render_hits = 0
+        self.render_misses = 0
+
     def get_prompt(self, template_name: str, **kwargs) -> str:
         """
         Render a template with the given context.
@@ -46,8 +74,27 @@ class PromptManager:
         Returns:
             str: The rendered template as a string.
         """
+        key = (template_name, _context_key(kwargs))
+        with self._lock:
+            rendered = self._renders.get(key)
+            if rendered is not None:
+                self._renders.move_to_end(key)
+                self.render_hits += 1
+                return rendered
+
         try:
-            template = self.env.get_template(template_name)
-            return template.render(**kwargs)
+            template = self._templates.get(template_name)
+            if template is None:
+                template = self._templates[template_name] = self.env.get_template(
+                    template_name
+                )
+            rendered = template.render(**kwargs)
         except Exception as e:
             raise ValueError(f"Error rendering template '{template_name}': {e}")
+
+        with self._lock:
+            self.render_misses += 1
+            self._renders[key] = rendered
+            while len(self._renders) > self._render_cache_size:
+                self._renders.popitem(last=False)
+        return rendered
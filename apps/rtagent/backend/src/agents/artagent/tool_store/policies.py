@@ -20,8 +20,6 @@ retriever or vector search.
 
 from typing import Dict, List, Optional, TypedDict
 
-from rapidfuzz import fuzz, process
-
 from utils.ml_logging import get_logger
 
 logger = get_logger("policy_lookup")
@@ -113,6 +111,9 @@ def _best_attr(question: str) -> Optional[str]:
     for syn, canon in ATTR_MAP.items():
         if syn in q:
             return canon
+    # Imported on first fuzzy match rather than at tool registration.
+    from rapidfuzz import fuzz, process
+
     match, score = process.extractOne(
         q, _CANONICAL_KEYS, scorer=fuzz.WRatio, score_cutoff=80
     )
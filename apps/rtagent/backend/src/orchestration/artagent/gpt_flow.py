@@ -12,19 +12,25 @@ import asyncio
 import json
 import os
 import random
+import re
 import time
 import uuid
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
 
 from fastapi import WebSocket
-from opentelemetry import trace
+from opentelemetry import metrics, trace
 from opentelemetry.trace import SpanKind
 from urllib.parse import urlparse
 
 from config import (
     AZURE_OPENAI_CHAT_DEPLOYMENT_ID,
     AZURE_OPENAI_ENDPOINT,
+    CONTEXT_SUMMARY_DEPLOYMENT_ID,
+    CONTEXT_SUMMARY_MAX_TOKENS,
+    CONTEXT_WINDOW_MAX_TOKENS,
+    CONTEXT_WINDOW_MAX_TURNS,
+    ENABLE_CONTEXT_WINDOW,
     TTS_END,
 )
 from apps.rtagent.backend.src.agents.artagent.tool_store.tool_registry import (
@@ -36,7 +42,10 @@ from apps.rtagent.backend.src.agents.artagent.tool_store.tools_helper import (
     push_tool_start,
 )
 from apps.rtagent.backend.src.helpers import add_space
+from src.agenticmemory.context_window import ContextWindow, estimate_tokens
+from src.agenticmemory.types import MessageThread
 from src.aoai.client import client as default_aoai_client, create_azure_openai_client
+from src.pools.executors import Workload, run_in_workload
 from apps.rtagent.backend.src.ws_helpers.shared_ws import (
     broadcast_message,
     get_connection_metadata,
@@ -63,11 +72,31 @@ if TYPE_CHECKING:  # pragma: no cover – typing-only import
 logger = get_logger("orchestration.gpt_flow")
 tracer = trace.get_tracer(__name__)
 
+_meter = metrics.get_meter("rtagent.gpt_flow")
+_prompt_tokens_counter = _meter.create_counter(
+    "rtagent.aoai.prompt_tokens",
+    unit="token",
+    description="Prompt tokens sent to Azure OpenAI chat completions",
+)
+_cached_tokens_counter = _meter.create_counter(
+    "rtagent.aoai.cached_prompt_tokens",
+    unit="token",
+    description="Prompt tokens served from the Azure OpenAI prompt cache",
+)
+
 _GPT_FLOW_TRACING = os.getenv("GPT_FLOW_TRACING", "true").lower() == "true"
 _STREAM_TRACING = os.getenv("STREAM_TRACING", "false").lower() == "true"  # High freq
 
 JSONDict = Dict[str, Any]
 
+# Bounds what each completion sends; older turns are summarized in the background.
+CONTEXT_WINDOW = ContextWindow(
+    max_tokens=CONTEXT_WINDOW_MAX_TOKENS,
+    max_turns=CONTEXT_WINDOW_MAX_TURNS,
+    summary_max_tokens=CONTEXT_SUMMARY_MAX_TOKENS,
+    enabled=ENABLE_CONTEXT_WINDOW,
+)
+
 
 # ---------------------------------------------------------------------------
 # Retry / Rate-limit configuration
@@ -572,10 +601,11 @@ def _validate_conversation_history(history: List[JSONDict], agent_name: str) ->
     """
     Validate conversation history for OpenAI API compliance.
     
-    Checks for common conversation integrity issues that cause OpenAI API errors:
-    - Orphaned tool calls (assistant with tool_calls but no tool responses)
-    - Invalid message sequences
-    - Malformed tool call structures
+    Checks for orphaned tool calls (assistant with tool_calls but no tool
+    responses), the most common integrity issue behind OpenAI 400 errors.
+    Histories obtained from ``MemoManager.get_history`` are ``MessageThread``
+    instances that track open tool calls as messages are appended, so this is
+    O(1); plain lists are scanned once.
     
     Args:
         history: List of conversation messages
@@ -586,30 +616,10 @@ def _validate_conversation_history(history: List[JSONDict], agent_name: str) ->
     """
     if not history:
         return True, None
-        
-    # Track tool calls that need responses
-    pending_tool_calls = {}
-    
-    for i, msg in enumerate(history):
-        role = msg.get("role")
-        
-        if role == "assistant":
-            tool_calls = msg.get("tool_calls")
-            if tool_calls:
-                # Register tool calls that need responses
-                for tool_call in tool_calls:
-                    if isinstance(tool_call, dict) and "id" in tool_call:
-                        pending_tool_calls[tool_call["id"]] = i
-                        
-        elif role == "tool":
-            tool_call_id = msg.get("tool_call_id")
-            if tool_call_id and tool_call_id in pending_tool_calls:
-                # Mark tool call as resolved
-                del pending_tool_calls[tool_call_id]
-    
-    # Check for orphaned tool calls
-    if pending_tool_calls:
-        orphaned_ids = list(pending_tool_calls.keys())
+
+    thread = history if isinstance(history, MessageThread) else MessageThread(history)
+    if not thread.is_valid:
+        orphaned_ids = thread.open_tool_calls
         error_msg = f"Orphaned tool calls detected: {orphaned_ids}"
         logger.error(
             "Conversation history validation failed for agent %s: %s",
@@ -642,7 +652,9 @@ def _repair_conversation_history(history: List[JSONDict], agent_name: str) -> Li
     Attempt to repair conversation history by adding missing tool responses.
     
     This is a recovery mechanism to prevent conversation corruption from
-    causing cascading failures.
+    causing cascading failures. A ``MessageThread`` is repaired in place by
+    appending synthetic tool responses at the tail; a plain list is copied
+    first and left untouched.
     
     Args:
         history: Original conversation history
@@ -651,51 +663,19 @@ def _repair_conversation_history(history: List[JSONDict], agent_name: str) -> Li
     Returns:
         List[JSONDict]: Repaired conversation history
     """
-    repaired_history = history.copy()
-    pending_tool_calls = {}
-    
-    # Identify orphaned tool calls
-    for i, msg in enumerate(history):
-        role = msg.get("role")
-        
-        if role == "assistant":
-            tool_calls = msg.get("tool_calls")
-            if tool_calls:
-                for tool_call in tool_calls:
-                    if isinstance(tool_call, dict) and "id" in tool_call:
-                        pending_tool_calls[tool_call["id"]] = tool_call
-                        
-        elif role == "tool":
-            tool_call_id = msg.get("tool_call_id")
-            if tool_call_id and tool_call_id in pending_tool_calls:
-                del pending_tool_calls[tool_call_id]
-    
-    # Add synthetic tool responses for orphaned tool calls
-    if pending_tool_calls:
+    repaired_history = history if isinstance(history, MessageThread) else MessageThread(history)
+    if not repaired_history.is_valid:
         logger.warning(
             "Repairing conversation history for agent %s: adding %d synthetic tool responses",
             agent_name,
-            len(pending_tool_calls),
+            len(repaired_history.open_tool_calls),
             extra={
                 "agent_name": agent_name,
-                "orphaned_count": len(pending_tool_calls),
+                "orphaned_count": len(repaired_history.open_tool_calls),
                 "event_type": "conversation_history_repair"
             }
         )
-        
-        for tool_call_id, tool_call in pending_tool_calls.items():
-            synthetic_response = {
-                "tool_call_id": tool_call_id,
-                "role": "tool",
-                "name": tool_call.get("function", {}).get("name", "unknown_tool"),
-                "content": json.dumps({
-                    "error": "Tool execution was interrupted",
-                    "message": "The previous tool execution was interrupted. Please try again.",
-                    "synthetic_response": True
-                }),
-            }
-            repaired_history.append(synthetic_response)
-    
+        repaired_history.repair()
     return repaired_history
 
 
@@ -728,9 +708,48 @@ def _build_completion_kwargs(
         # "top_p": top_p,
         "tools": tools or [],
         "tool_choice": "auto" if (tools or []) else "none",
+        # Final chunk carries usage, including prompt-cache hits.
+        "stream_options": {"include_usage": True},
     }
 
 
+def _record_prompt_usage(
+    usage: Any, *, model_id: str, agent_name: str, span: Any = None
+) -> Optional[Tuple[int, int]]:
+    """
+    Record prompt and cached-prompt token counts reported by AOAI.
+
+    :param usage: ``usage`` object from the final stream chunk (may be None).
+    :param model_id: Deployment used for the completion.
+    :param agent_name: Agent whose history was sent.
+    :param span: Optional span to annotate.
+    :return: (prompt_tokens, cached_tokens) or None when no usage was reported.
+    """
+    prompt_tokens = getattr(usage, "prompt_tokens", None)
+    if prompt_tokens is None:
+        return None
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached_tokens = getattr(details, "cached_tokens", None) or 0
+
+    attrs = {"model": model_id, "agent": agent_name}
+    _prompt_tokens_counter.add(prompt_tokens, attrs)
+    _cached_tokens_counter.add(cached_tokens, attrs)
+    if span is not None:
+        span.set_attribute("aoai.usage.prompt_tokens", prompt_tokens)
+        span.set_attribute("aoai.usage.cached_tokens", cached_tokens)
+        span.set_attribute(
+            "aoai.usage.cache_hit_ratio",
+            round(cached_tokens / prompt_tokens, 3) if prompt_tokens else 0.0,
+        )
+    logger.debug(
+        "AOAI prompt usage: agent=%s prompt_tokens=%d cached_tokens=%d",
+        agent_name,
+        prompt_tokens,
+        cached_tokens,
+    )
+    return prompt_tokens, cached_tokens
+
+
 class _ToolCallState:
     """Minimal state carrier for a single tool call parsed from stream deltas."""
     def __init__(self) -> None:
@@ -1002,6 +1021,7 @@ async def _consume_openai_stream(
     cm: "MemoManager",
     call_connection_id: Optional[str],
     session_id: Optional[str],
+    usage_sink: Optional[JSONDict] = None,
 ) -> Tuple[str, _ToolCallState]:
     """
     Consume the AOAI stream, emitting TTS chunks as punctuation arrives.
@@ -1012,6 +1032,7 @@ async def _consume_openai_stream(
     :param cm: MemoManager instance for conversation state.
     :param call_connection_id: Optional correlation ID for tracing.
     :param session_id: Optional session ID for tracing correlation.
+    :param usage_sink: Optional dict that receives the stream's ``usage`` object.
     :return: (full_assistant_text, tool_call_state)
     """
     collected: List[str] = []
@@ -1037,6 +1058,8 @@ async def _consume_openai_stream(
             except Exception:
                 consume_started = False
 
+        if usage_sink is not None and getattr(chunk, "usage", None) is not None:
+            usage_sink["usage"] = chunk.usage
         if not getattr(chunk, "choices", None):
             continue
         delta = chunk.choices[0].delta
@@ -1082,6 +1105,52 @@ async def _consume_openai_stream(
     return "".join(final_chunks).strip(), tool
 
 
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+
+
+async def replay_cached_response(
+    cm: "MemoManager",
+    user_prompt: str,
+    answer: str,
+    ws: WebSocket,
+    *,
+    agent_name: str,
+    is_acs: bool = False,
+    call_connection_id: Optional[str] = None,
+    session_id: Optional[str] = None,
+) -> None:
+    """
+    Speak a cached assistant answer without calling Azure OpenAI.
+
+    Emits the answer sentence by sentence through the same TTS/ACS path as a
+    streamed completion and records the turn in the agent's history.
+
+    :param cm: Active MemoManager instance for conversation state.
+    :param user_prompt: The caller utterance being answered.
+    :param answer: Cached assistant text to replay.
+    :param ws: WebSocket connection to the client.
+    :param agent_name: Agent whose history receives the turn.
+    :param is_acs: Flag indicating Azure Communication Services pathway.
+    :param call_connection_id: ACS call connection ID for tracing correlation.
+    :param session_id: Session ID for tracing correlation.
+    """
+    agent_history: List[JSONDict] = cm.get_history(agent_name)
+    agent_history.append({"role": "user", "content": user_prompt})
+    for sentence in _SENTENCE_BOUNDARY.split(answer.strip()):
+        if sentence:
+            await _emit_streaming_text(
+                add_space(sentence), ws, is_acs, cm, call_connection_id, session_id
+            )
+    agent_history.append({"role": "assistant", "content": answer})
+    await push_final(
+        ws,
+        _get_agent_sender_name(cm, include_autoauth=True),
+        answer,
+        is_acs=is_acs,
+    )
+    await _broadcast_dashboard(ws, cm, answer, include_autoauth=False)
+
+
 # ---------------------------------------------------------------------------
 # Main orchestration entry – now calls the retry/limit-aware streamer
 # ---------------------------------------------------------------------------
@@ -1124,6 +1193,10 @@ async def process_gpt_response(  # noqa: PLR0913
     """
     # Build history and tools
     agent_history: List[JSONDict] = cm.get_history(agent_name)
+    # O(1) on a tracked thread. An interrupted tool call is closed before the
+    # new user turn so its tool response still directly follows the call.
+    if not _validate_conversation_history(agent_history, agent_name)[0]:
+        agent_history = _repair_conversation_history(agent_history, agent_name)
     agent_history.append({"role": "user", "content": user_prompt})
     tool_set = available_tools or DEFAULT_TOOLS
 
@@ -1162,8 +1235,9 @@ async def process_gpt_response(  # noqa: PLR0913
     )
 
     with tracer.start_as_current_span("gpt_flow.process_response", attributes=span_attrs) as span:
+        prompt_messages, window_start = CONTEXT_WINDOW.select(cm, agent_name)
         chat_kwargs = _build_completion_kwargs(
-            history=agent_history,
+            history=prompt_messages,
             model_id=model_id,
             temperature=temperature,
             top_p=top_p,
@@ -1171,6 +1245,10 @@ async def process_gpt_response(  # noqa: PLR0913
             tools=tool_set,
         )
         span.set_attribute("chat.history_length", len(agent_history))
+        span.set_attribute("chat.window_length", len(prompt_messages))
+        span.set_attribute(
+            "chat.prompt_tokens_estimate", sum(estimate_tokens(m) for m in prompt_messages)
+        )
 
         # Dependency span for AOAI
         azure_openai_attrs = create_service_dependency_attrs(
@@ -1234,7 +1312,9 @@ async def process_gpt_response(  # noqa: PLR0913
                     aoai_client = getattr(ws.app.state, "aoai_client", default_aoai_client)
 
                     async def refresh_client_cb() -> Any:
-                        new_client = await asyncio.to_thread(create_azure_openai_client)
+                        new_client = await run_in_workload(
+                            Workload.MISC, create_azure_openai_client
+                        )
                         setattr(ws.app.state, "aoai_client", new_client)
                         return new_client
 
@@ -1248,8 +1328,12 @@ async def process_gpt_response(  # noqa: PLR0913
                 )
 
                 # Consume the stream and emit chunks
+                usage_sink: JSONDict = {}
                 full_text, tool_state = await _consume_openai_stream(
-                    response_stream, ws, is_acs, cm, call_connection_id, session_id
+                    response_stream, ws, is_acs, cm, call_connection_id, session_id, usage_sink
+                )
+                _record_prompt_usage(
+                    usage_sink.get("usage"), model_id=model_id, agent_name=agent_name, span=dep_span
                 )
 
                 dep_span.set_attribute("tool_call_detected", tool_state.started)
@@ -1298,6 +1382,18 @@ async def process_gpt_response(  # noqa: PLR0913
             except Exception:
                 pass
 
+        # Fold turns that left the window into the summary once this reply is out
+        try:
+            CONTEXT_WINDOW.schedule_summary(
+                cm,
+                agent_name,
+                window_start,
+                aoai_client,
+                CONTEXT_SUMMARY_DEPLOYMENT_ID or model_id,
+            )
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("Context summary not scheduled: %s", exc)
+
         # Finalize assistant text
         if full_text:
             agent_history.append({"role": "assistant", "content": full_text})
@@ -40,6 +40,7 @@ from config import (
     GREETING_VOICE_TTS,
 )
 from src.acs.acs_helper import AcsCaller
+from src.pools.executors import Workload, run_in_workload
 from utils.ml_logging import get_logger
 
 # --- Init Logger ---
@@ -283,10 +284,9 @@ async def play_response(
             )
         for attempt in range(max_retries):
             try:
-                # Run the synchronous play_media call in a thread pool to avoid blocking
-                loop = asyncio.get_event_loop()
-                response = await loop.run_in_executor(
-                    None,
+                # Run the synchronous play_media call on the misc executor to avoid blocking
+                response = await run_in_workload(
+                    Workload.MISC,
                     lambda: call_conn.play_media(
                         play_source=source,
                         # play_to=participants,
@@ -583,10 +583,9 @@ async def _play_response_direct(
 
         for attempt in range(max_retries):
             try:
-                # Run the synchronous play_media call in a thread pool to avoid blocking
-                loop = asyncio.get_event_loop()
-                response = await loop.run_in_executor(
-                    None,
+                # Run the synchronous play_media call on the misc executor to avoid blocking
+                response = await run_in_workload(
+                    Workload.MISC,
                     lambda: call_conn.play_media(
                         play_source=source,
                         # play_to=participants,
@@ -161,6 +161,63 @@ class BargeInController:
         finally:
             self.set_metadata("barge_in_inflight", False)
 
+    async def _send_playback_control(
+        self,
+        action: str,
+        trigger: str,
+        stage: str,
+        *,
+        energy_level: float | None = None,
+    ) -> None:
+        if action == "audio_duck" and not (
+            self.get_metadata("is_synthesizing", False)
+            or self.get_metadata("audio_playing", False)
+        ):
+            return
+        msg = {
+            "type": "control",
+            "action": action,
+            "reason": "barge_in_provisional",
+            "trigger": trigger,
+            "at": stage,
+            "session_id": self.session_id,
+        }
+        if energy_level is not None:
+            msg["energy"] = round(float(energy_level), 2)
+        try:
+            await send_session_envelope(
+                self.websocket,
+                msg,
+                session_id=self.session_id,
+                conn_id=self.conn_id,
+                event_label=f"barge_in_{action}",
+            )
+        except Exception as send_exc:  # noqa: BLE001
+            self.logger.debug(
+                "[%s] Failed to dispatch %s control message: %s",
+                self.session_id,
+                action,
+                send_exc,
+            )
+
+    def duck_playback(
+        self,
+        trigger: str,
+        stage: str,
+        *,
+        energy_level: float | None = None,
+    ) -> None:
+        """Lower client playback while a provisional barge-in awaits STT."""
+        self._schedule(
+            self._send_playback_control(
+                "audio_duck", trigger, stage, energy_level=energy_level
+            )
+        )
+
+    def resume_playback(self, trigger: str, stage: str) -> None:
+        """Restore client playback after an unconfirmed provisional barge-in."""
+        self._schedule(self._send_playback_control("audio_resume", trigger, stage))
+
     def request(
         self,
         trigger: str,
@@ -168,7 +225,9 @@ class BargeInController:
         *,
         energy_level: float | None = None,
     ) -> None:
-        coroutine = self._perform(trigger, stage, energy_level=energy_level)
+        self._schedule(self._perform(trigger, stage, energy_level=energy_level))
+
+    def _schedule(self, coroutine) -> None:
         if self._loop and self._loop.is_running():
             try:
                 run_coroutine_threadsafe(coroutine, self._loop)
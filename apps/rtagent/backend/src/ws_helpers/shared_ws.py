@@ -35,6 +35,8 @@ from apps.rtagent.backend.src.services.acs.acs_helpers import play_response_with
 from apps.rtagent.backend.src.ws_helpers.envelopes import make_status_envelope
 from apps.rtagent.backend.src.services.speech_services import SpeechSynthesizer
 from src.enums.stream_modes import StreamMode
+from src.pools.executors import Workload, run_in_workload
+from src.vad.gate import frame_levels_db
 from utils.ml_logging import get_logger
 
 logger = get_logger("shared_ws")
@@ -323,16 +325,9 @@ async def send_tts_audio(
                 rate=eff_rate,
             )
             try:
-                loop = asyncio.get_running_loop()
-                executor = getattr(ws.app.state, "speech_executor", None)
-                if executor:
-                    await asyncio.wait_for(
-                        loop.run_in_executor(executor, warm_partial), timeout=4.0
-                    )
-                else:
-                    await asyncio.wait_for(
-                        loop.run_in_executor(None, warm_partial), timeout=4.0
-                    )
+                await asyncio.wait_for(
+                    run_in_workload(Workload.TTS_SYNTHESIS, warm_partial), timeout=4.0
+                )
                 prepared_voices.add(warm_signature)
                 logger.debug(
                     "[%s] Warmed TTS voice=%s style=%s rate=%s (run=%s)",
@@ -365,8 +360,6 @@ async def send_tts_audio(
         )
 
         async def _synthesize() -> bytes:
-            loop = asyncio.get_running_loop()
-            executor = getattr(ws.app.state, "speech_executor", None)
             synth_partial = partial(
                 synth.synthesize_to_pcm,
                 text=text,
@@ -375,9 +368,7 @@ async def send_tts_audio(
                 style=style,
                 rate=eff_rate,
             )
-            if executor:
-                return await loop.run_in_executor(executor, synth_partial)
-            return await loop.run_in_executor(None, synth_partial)
+            return await run_in_workload(Workload.TTS_SYNTHESIS, synth_partial)
 
         synthesis_task = asyncio.create_task(_synthesize())
         cancel_wait: Optional[asyncio.Task[None]] = None
@@ -432,6 +423,14 @@ async def send_tts_audio(
         frames = SpeechSynthesizer.split_pcm_to_base64_frames(
             pcm_bytes, sample_rate=TTS_SAMPLE_RATE_UI
         )
+
+        # Per-frame echo reference for the local barge-in detector
+        barge_in_detector = _get_connection_metadata(ws, "barge_in_detector")
+        if barge_in_detector:
+            barge_in_detector.add_playback_envelope(
+                frame_levels_db(pcm_bytes, int(0.02 * TTS_SAMPLE_RATE_UI * 2)),
+                frame_s=0.02,
+            )
         logger.debug(f"TTS frames prepared: {len(frames)} (run={run_id})")
 
         if latency_tool:
@@ -454,6 +453,8 @@ async def send_tts_audio(
                     logger.info(
                         f"🛑 UI TTS cancel detected; stopping frame send early (run={run_id})"
                     )
+                    if barge_in_detector:
+                        barge_in_detector.set_playback_level(None)
                     break
             except Exception:
                 # If metadata isn't available, proceed safely
@@ -474,6 +475,8 @@ async def send_tts_audio(
                         "is_final": i == len(frames) - 1,
                     }
                 )
+                if i == 0 and latency_tool:
+                    latency_tool.mark("first_frame_sent")
             except (WebSocketDisconnect, RuntimeError) as e:
                 message = str(e)
                 if not _ws_is_connected(ws):
@@ -496,9 +499,6 @@ async def send_tts_audio(
                 )
                 break
 
-        #  Safe stop with timer cleanup
-        if latency_tool and "tts:send_frames" in latency_tool._active_timers:
-            latency_tool._active_timers.remove("tts:send_frames")
         _lt_stop(
             latency_tool,
             "tts:send_frames",
@@ -510,9 +510,6 @@ async def send_tts_audio(
 
     except Exception as e:
         logger.error(f"TTS synthesis failed (run={run_id}): {e}")
-        # Clean up timer state on error
-        if latency_tool and "tts:synthesis" in latency_tool._active_timers:
-            latency_tool._active_timers.remove("tts:synthesis")
         _lt_stop(
             latency_tool,
             "tts:synthesis",
@@ -530,10 +527,14 @@ async def send_tts_audio(
         except Exception:
             pass
     finally:
-        # Clean up timer state
-        if latency_tool:
-            if "tts" in latency_tool._active_timers:
-                latency_tool._active_timers.remove("tts")
+        # Cancelled/aborted sends must not leave sub-stage timers running into the next turn
+        for stage in ("tts:synthesis", "tts:send_frames"):
+            _lt_stop(
+                latency_tool,
+                stage,
+                ws,
+                meta={"run_id": run_id, "mode": "browser", "interrupted": True},
+            )
         _lt_stop(
             latency_tool,
             "tts",
@@ -662,7 +663,8 @@ async def send_response_to_acs(
             if main_event_loop and playback_task:
                 main_event_loop.current_playback_task = playback_task
             try:
-                pcm_bytes = await asyncio.to_thread(
+                pcm_bytes = await run_in_workload(
+                    Workload.TTS_SYNTHESIS,
                     synth.synthesize_to_pcm,
                     text,
                     voice_to_use,
@@ -676,7 +678,8 @@ async def send_response_to_acs(
                     run_id,
                     synth_err,
                 )
-                pcm_bytes = await asyncio.to_thread(
+                pcm_bytes = await run_in_workload(
+                    Workload.TTS_SYNTHESIS,
                     synth.synthesize_to_pcm,
                     text,
                     voice_to_use,
@@ -712,6 +715,10 @@ async def send_response_to_acs(
                 estimated_duration,
             )
 
+            recorder = getattr(acs_handler, "recorder", None)
+            frame_pcm = memoryview(pcm_bytes)
+            frame_size_bytes = int(0.02 * TTS_SAMPLE_RATE_ACS * 2)
+
             sequence_id = 0
             for frame in frames:
                 if not _ws_is_connected(ws):
@@ -737,6 +744,11 @@ async def send_response_to_acs(
                             "StopAudio": None,
                         }
                     )
+                    if sequence_id == 0 and latency_tool:
+                        latency_tool.mark("first_frame_sent")
+                    if recorder is not None:
+                        offset = sequence_id * frame_size_bytes
+                        recorder.tap_outbound(frame_pcm[offset : offset + frame_size_bytes])
                     sequence_id += 1
                     await asyncio.sleep(0.02)
                 except asyncio.CancelledError:
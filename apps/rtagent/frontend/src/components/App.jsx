@@ -2109,6 +2109,7 @@ function RealTimeVoiceApp() {
         this.queue = [];
         this.readIndex = 0;
         this.samplesProcessed = 0;
+        this.gain = 1;
         this.port.onmessage = (e) => {
           if (e.data?.type === 'push') {
             // payload is Float32Array
@@ -2117,6 +2118,10 @@ function RealTimeVoiceApp() {
             // Clear all queued audio data for immediate interruption
             this.queue = [];
             this.readIndex = 0;
+            this.gain = 1;
+          } else if (e.data?.type === 'gain') {
+            // Provisional barge-in ducks playback until it is confirmed or resumed
+            this.gain = e.data.value;
           }
         };
       }
@@ -2133,6 +2138,9 @@ function RealTimeVoiceApp() {
           const remain = chunk.length - this.readIndex;
           const toCopy = Math.min(remain, out.length - i);
           out.set(chunk.subarray(this.readIndex, this.readIndex + toCopy), i);
+          if (this.gain !== 1) {
+            for (let j = i; j < i + toCopy; j++) out[j] *= this.gain;
+          }
           i += toCopy;
           this.readIndex += toCopy;
           if (this.readIndex >= chunk.length) {
@@ -3097,6 +3105,17 @@ function RealTimeVoiceApp() {
           return;
         }
 
+        if (action === "audio_duck" || action === "audio_resume") {
+          // Local barge-in is provisional: duck now, resume unless STT confirms it
+          if (pcmSinkRef.current) {
+            pcmSinkRef.current.port.postMessage({
+              type: "gain",
+              value: action === "audio_duck" ? 0.2 : 1,
+            });
+          }
+          return;
+        }
+
         logger.debug("🎮 Unknown control action:", action);
         return;
       }
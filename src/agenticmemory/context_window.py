@@ -0,0 +1,235 @@
+"""
+Token-budgeted context window for per-agent chat histories.
+
+``MemoManager`` keeps every message of a call. Sending all of them on every
+turn makes prompt tokens (and TTFB) grow linearly with call length, so
+:class:`ContextWindow` selects what is actually sent:
+
+- the agent's system prompt (``history[0]``);
+- a pinned system message carrying a rolling summary of the turns that fell
+  out of the window, plus the current slots and last tool outputs;
+- the most recent whole turns (a user message and everything after it, so tool
+  calls are never separated from their responses) that fit both
+  ``max_turns`` and ``max_tokens``.
+
+The stored history is never modified. Summaries are produced in the
+background with the caller's Azure OpenAI client and written to core memory
+under ``context_summaries``; the live turn never waits for them. Until a
+summary catches up, the dropped turns are simply absent from the prompt.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.agenticmemory.prompts.prompt_gpt_summarize import SYSTEM as SUMMARY_SYSTEM_PROMPT
+from src.pools.executors import Workload, run_in_workload
+from utils.ml_logging import get_logger
+
+logger = get_logger("agenticmemory.context_window")
+
+JSONDict = Dict[str, Any]
+
+SUMMARIES_KEY = "context_summaries"
+
+# Rough chat-format overhead per message (role, separators).
+_MESSAGE_OVERHEAD_TOKENS = 4
+_CHARS_PER_TOKEN = 4
+_TOOL_TRANSCRIPT_CHARS = 500
+
+
+def estimate_tokens(message: JSONDict) -> int:
+    """Cheap token estimate (~4 characters per token) for one chat message."""
+    chars = len(message.get("content") or "")
+    for call in message.get("tool_calls") or ():
+        fn = call.get("function") or {}
+        chars += len(fn.get("name") or "") + len(fn.get("arguments") or "")
+    return _MESSAGE_OVERHEAD_TOKENS + (chars + _CHARS_PER_TOKEN - 1) // _CHARS_PER_TOKEN
+
+
+def _format_transcript(messages: List[JSONDict]) -> str:
+    lines = []
+    for msg in messages:
+        role = msg.get("role")
+        content = msg.get("content") or ""
+        if role == "tool":
+            lines.append(f"tool({msg.get('name', 'tool')}): {content[:_TOOL_TRANSCRIPT_CHARS]}")
+        elif msg.get("tool_calls"):
+            for call in msg["tool_calls"]:
+                fn = call.get("function") or {}
+                lines.append(f"assistant called {fn.get('name')}({fn.get('arguments', '')})")
+        elif content:
+            lines.append(f"{role}: {content}")
+    return "\n".join(lines)
+
+
+class ContextWindow:
+    """Selects the messages sent to the model for one agent turn."""
+
+    def __init__(
+        self,
+        max_tokens: int = 6000,
+        max_turns: int = 12,
+        summary_max_tokens: int = 300,
+        enabled: bool = True,
+    ) -> None:
+        self.max_tokens = max_tokens
+        self.max_turns = max_turns
+        self.summary_max_tokens = summary_max_tokens
+        self.enabled = enabled
+        self._inflight: Dict[Tuple[str, str], asyncio.Task] = {}
+
+    # ------------------------------------------------------------------
+    # Window selection
+    # ------------------------------------------------------------------
+    def _pinned_message(self, cm: Any, summary: str) -> Optional[JSONDict]:
+        parts = []
+        if summary:
+            parts.append(f"Summary of the earlier conversation:\n{summary}")
+        slots = cm.get_context("slots", {})
+        if slots:
+            parts.append(f"Known details: {json.dumps(slots, default=str)}")
+        tool_outputs = cm.get_context("tool_outputs", {})
+        if tool_outputs:
+            parts.append(f"Latest tool results: {json.dumps(tool_outputs, default=str)}")
+        if not parts:
+            return None
+        return {"role": "system", "content": "\n\n".join(parts)}
+
+    def select(self, cm: Any, agent_name: str) -> Tuple[List[JSONDict], int]:
+        """
+        Return the messages to send and the history index where the window starts.
+
+        The full history is returned unchanged while it fits the budget.
+        """
+        history: List[JSONDict] = cm.get_history(agent_name)
+        if not self.enabled or not history:
+            return history, 0
+
+        head = 1 if history[0].get("role") == "system" else 0
+        state = cm.get_context(SUMMARIES_KEY, {}).get(agent_name) or {}
+        pinned = self._pinned_message(cm, state.get("text", ""))
+        budget = (
+            self.max_tokens
+            - sum(estimate_tokens(m) for m in history[:head])
+            - (estimate_tokens(pinned) if pinned else 0)
+        )
+
+        # Walk whole turns backwards from the newest; only the window is scanned.
+        start, used, kept = len(history), 0, 0
+        while start > head:
+            turn_start = start - 1
+            while turn_start > head and history[turn_start].get("role") != "user":
+                turn_start -= 1
+            cost = sum(estimate_tokens(m) for m in history[turn_start:start])
+            if kept and (kept >= self.max_turns or used + cost > budget):
+                break
+            used += cost
+            kept += 1
+            start = turn_start
+        if start <= head:
+            return history, head
+
+        window = list(history[:head])
+        if pinned:
+            window.append(pinned)
+        window.extend(history[start:])
+        return window, start
+
+    # ------------------------------------------------------------------
+    # Background summarization
+    # ------------------------------------------------------------------
+    def schedule_summary(
+        self,
+        cm: Any,
+        agent_name: str,
+        window_start: int,
+        client: Any,
+        model: str,
+    ) -> Optional[asyncio.Task]:
+        """
+        Fold turns that left the window into the rolling summary, off the hot path.
+
+        At most one summary runs per session and agent; later turns pick up
+        whatever is still unsummarized when it finishes.
+        """
+        history = cm.get_history(agent_name)
+        summaries = cm.get_context(SUMMARIES_KEY, {})
+        state = summaries.get(agent_name) or {}
+        upto = int(state.get("upto", 0))
+        if upto > len(history):  # history was cleared; start over
+            upto, state = 0, {}
+            summaries.pop(agent_name, None)
+            cm.set_context(SUMMARIES_KEY, summaries)
+        head = 1 if history and history[0].get("role") == "system" else 0
+        upto = max(upto, head)
+        if window_start <= upto:
+            return None
+
+        key = (getattr(cm, "session_id", None) or str(id(cm)), agent_name)
+        if key in self._inflight:
+            return None
+
+        dropped = list(history[upto:window_start])
+        task = asyncio.create_task(
+            self._summarize(cm, agent_name, state.get("text", ""), dropped, upto, window_start, client, model)
+        )
+        self._inflight[key] = task
+        task.add_done_callback(lambda _t: self._inflight.pop(key, None))
+        return task
+
+    async def _summarize(
+        self,
+        cm: Any,
+        agent_name: str,
+        previous: str,
+        messages: List[JSONDict],
+        upto: int,
+        new_upto: int,
+        client: Any,
+        model: str,
+    ) -> None:
+        transcript = _format_transcript(messages)
+        if previous:
+            transcript = f"--- Previous Summary ---\n{previous}\n\n--- New Messages ---\n{transcript}"
+        try:
+            response = await run_in_workload(
+                Workload.MISC,
+                client.chat.completions.create,
+                model=model,
+                messages=[
+                    {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+                    {"role": "user", "content": transcript},
+                ],
+                max_completion_tokens=self.summary_max_tokens,
+            )
+            text = (response.choices[0].message.content or "").strip()
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(
+                "Context summary failed for agent %s: %s",
+                agent_name,
+                exc,
+                extra={"agent_name": agent_name, "event_type": "context_summary_error"},
+            )
+            return
+        if not text:
+            return
+
+        summaries = cm.get_context(SUMMARIES_KEY, {})
+        current = summaries.get(agent_name) or {}
+        if current and int(current.get("upto", 0)) != upto:
+            return  # superseded (e.g. history was cleared meanwhile)
+        summaries[agent_name] = {"text": text, "upto": new_upto}
+        cm.set_context(SUMMARIES_KEY, summaries)
+        logger.info(
+            "Context summary updated for agent %s: %d messages folded",
+            agent_name,
+            new_upto - upto,
+            extra={
+                "agent_name": agent_name,
+                "summarized_messages": new_upto,
+                "event_type": "context_summary_updated",
+            },
+        )
@@ -6,13 +6,15 @@ applications. It exposes four public classes:
 
 1. **CoreMemory** – A type‑safe, lightweight key‑value store for shared state.
 2. **ChatHistory** – An ordered list of user/assistant messages (single thread).
+   Each thread is a **MessageThread** that tracks tool-call integrity as
+   messages are appended.
                         a TTS playback queue, latency tracking, and live-refresh utilities.
 3. **EphemeralMemoManager** – An in‑memory variant of MemoManager for App‑layer
                               components that *must not* persist to Redis.
 """
 
 import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from utils.ml_logging import get_logger
 
@@ -86,6 +88,124 @@ class CoreMemory:
         return f"CoreMemory(keys={len(self._store)})"
 
 
+class MessageThread(list):
+    """A list of chat messages that tracks tool-call integrity incrementally.
+
+    Appending an assistant message with ``tool_calls`` opens those call ids;
+    appending the matching ``tool`` message closes them. Validation is then a
+    lookup instead of a walk over the whole history. Any mutation other than
+    appending at the tail (insert, delete, slice assignment, …) triggers a
+    full rescan, which is rare.
+
+    Messages are tracked when added; mutating a message dict in place after
+    appending it is not observed.
+    """
+
+    def __init__(self, messages: Iterable[Dict[str, Any]] = ()) -> None:
+        super().__init__(messages)
+        self._rescan()
+
+    # ------------------------------------------------------------------
+    # Integrity state
+    # ------------------------------------------------------------------
+    @property
+    def is_valid(self) -> bool:
+        """``True`` when every tool call has a tool response."""
+        return not self._open
+
+    @property
+    def open_tool_calls(self) -> List[str]:
+        """Ids of tool calls still waiting for a tool response, oldest first."""
+        return list(self._open)
+
+    @property
+    def last_role(self) -> Optional[str]:
+        return self._last_role
+
+    def repair(self) -> int:
+        """Close open tool calls with synthetic error responses at the tail.
+
+        Returns:
+            The number of synthetic tool responses appended.
+        """
+        pending = list(self._open.items())
+        for tool_call_id, tool_call in pending:
+            self.append(
+                {
+                    "tool_call_id": tool_call_id,
+                    "role": "tool",
+                    "name": (tool_call.get("function") or {}).get("name", "unknown_tool"),
+                    "content": json.dumps(
+                        {
+                            "error": "Tool execution was interrupted",
+                            "message": "The previous tool execution was interrupted. Please try again.",
+                            "synthetic_response": True,
+                        }
+                    ),
+                }
+            )
+        return len(pending)
+
+    def _track(self, msg: Dict[str, Any]) -> None:
+        role = msg.get("role")
+        self._last_role = role
+        if role == "assistant":
+            for tool_call in msg.get("tool_calls") or ():
+                if isinstance(tool_call, dict) and "id" in tool_call:
+                    self._open[tool_call["id"]] = tool_call
+        elif role == "tool":
+            self._open.pop(msg.get("tool_call_id"), None)
+
+    def _rescan(self) -> None:
+        self._open: Dict[str, Dict[str, Any]] = {}
+        self._last_role: Optional[str] = None
+        for msg in self:
+            self._track(msg)
+
+    # ------------------------------------------------------------------
+    # list overrides
+    # ------------------------------------------------------------------
+    def append(self, msg: Dict[str, Any]) -> None:
+        super().append(msg)
+        self._track(msg)
+
+    def extend(self, messages: Iterable[Dict[str, Any]]) -> None:
+        for msg in messages:
+            self.append(msg)
+
+    def __iadd__(self, messages: Iterable[Dict[str, Any]]) -> "MessageThread":
+        self.extend(messages)
+        return self
+
+    def __setitem__(self, index, value) -> None:
+        super().__setitem__(index, value)
+        self._rescan()
+
+    def __delitem__(self, index) -> None:
+        super().__delitem__(index)
+        self._rescan()
+
+    def insert(self, index, msg: Dict[str, Any]) -> None:
+        super().insert(index, msg)
+        self._rescan()
+
+    def pop(self, index: int = -1) -> Dict[str, Any]:
+        msg = super().pop(index)
+        self._rescan()
+        return msg
+
+    def remove(self, msg: Dict[str, Any]) -> None:
+        super().remove(msg)
+        self._rescan()
+
+    def clear(self) -> None:
+        super().clear()
+        self._rescan()
+
+    def __reduce_ex__(self, protocol):
+        return (MessageThread, (list(self),))
+
+
 class ChatHistory:
     """Ordered, append‑only list of chat messages *per agent*.
 
@@ -95,7 +215,7 @@ class ChatHistory:
     """
 
     def __init__(self) -> None:  # noqa: D401
-        self._threads: Dict[str, List[Dict[str, str]]] = {}
+        self._threads: Dict[str, MessageThread] = {}
         logger.debug("ChatHistory initialised with empty mapping.")
 
     # ------------------------------------------------------------------
@@ -103,7 +223,7 @@ class ChatHistory:
     # ------------------------------------------------------------------
     def append(self, role: str, content: str, agent: str = "default") -> None:
         """Append a message to *agent*'s timeline."""
-        self._threads.setdefault(agent, []).append({"role": role, "content": content})
+        self.get_agent(agent).append({"role": role, "content": content})
         logger.debug(
             "ChatHistory.append – agent=%s, role=%s, len=%d",
             agent,
@@ -111,9 +231,13 @@ class ChatHistory:
             len(self._threads[agent]),
         )
 
-    def get_agent(self, agent: str = "default") -> List[Dict[str, str]]:  # noqa: D401
+    def get_agent(self, agent: str = "default") -> MessageThread:  # noqa: D401
         """Return the turn list for *agent* (creates if missing)."""
-        return self._threads.setdefault(agent, [])
+        thread = self._threads.get(agent)
+        if not isinstance(thread, MessageThread):
+            # Threads loaded from JSON or assigned directly are plain lists.
+            thread = self._threads[agent] = MessageThread(thread or ())
+        return thread
 
     def get_all(self) -> Dict[str, List[Dict[str, str]]]:  # noqa: D401
         """Return the full mapping *shallow* copy."""
@@ -125,7 +249,7 @@ class ChatHistory:
             self._threads.clear()
             logger.debug("ChatHistory.clear – all agents cleared")
         else:
-            self._threads[agent] = []
+            self._threads[agent] = MessageThread()
             logger.debug("ChatHistory.clear – agent=%s", agent)
 
     # ------------------------------------------------------------------
@@ -6,6 +6,7 @@ import asyncio
 from datetime import datetime, timezone
 from typing import Any, Callable, Optional
 
+from src.pools.executors import Workload, run_in_workload
 from utils.ml_logging import get_logger
 
 from .client import create_azure_openai_client
@@ -52,7 +53,7 @@ class AoaiClientManager:
         return self._client
 
     async def _build_client(self, *, reason: str = "initial", session_id: Optional[str] = None) -> Any:
-        """Invoke factory in a worker thread and capture refresh diagnostics."""
+        """Invoke factory on the misc executor and capture refresh diagnostics."""
         logger.info(
             "Building Azure OpenAI client",
             extra={
@@ -61,7 +62,7 @@ class AoaiClientManager:
                 "refresh_count": self._refresh_count,
             },
         )
-        client = await asyncio.to_thread(self._factory)
+        client = await run_in_workload(Workload.MISC, self._factory)
         self._last_refresh_at = datetime.now(timezone.utc)
         self._refresh_count += 1
         logger.info(
@@ -0,0 +1,184 @@
+"""
+In-process semantic response cache.
+
+Agents that answer many near-identical FAQ questions ("do I have roadside
+assistance?") can skip the completion round trip (and any grounding tool calls)
+when a previous answer for a semantically equivalent question is still fresh.
+
+Entries are partitioned by *scope*: the agent name plus the values of the
+slots the answer depends on (e.g. ``policy_id``), so an answer is never served
+across policies. Within a scope, lookups are a cosine-similarity search over
+L2-normalised embeddings held in a NumPy matrix; scopes hold at most a few
+hundred entries, so brute force is faster than maintaining an ANN index.
+
+Entries expire after ``ttl_seconds`` and the least recently used entry is
+evicted once ``max_entries`` is reached. The cache is thread-safe.
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+Scope = Tuple[Hashable, ...]
+
+
+@dataclass
+class CacheEntry:
+    """One cached answer."""
+
+    entry_id: int
+    scope: Scope
+    vector: np.ndarray
+    question: str
+    answer: str
+    created_at: float
+    hits: int = 0
+
+
+@dataclass
+class _ScopeIndex:
+    ids: List[int] = field(default_factory=list)
+    matrix: Optional[np.ndarray] = None
+    dirty: bool = True
+
+
+def _normalise(embedding: Sequence[float]) -> Optional[np.ndarray]:
+    vector = np.asarray(embedding, dtype=np.float32).ravel()
+    norm = float(np.linalg.norm(vector))
+    if not vector.size or norm == 0.0:
+        return None
+    return vector / norm
+
+
+class SemanticResponseCache:
+    """Scoped, TTL + LRU bounded nearest-neighbour cache of assistant answers."""
+
+    def __init__(
+        self,
+        similarity_threshold: float = 0.92,
+        ttl_seconds: float = 3600.0,
+        max_entries: int = 512,
+        min_question_words: int = 3,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.similarity_threshold = similarity_threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.min_question_words = min_question_words
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[int, CacheEntry]" = OrderedDict()  # LRU order
+        self._scopes: Dict[Scope, _ScopeIndex] = {}
+        self._ids = itertools.count(1)
+
+        self.lookups = 0
+        self.hits = 0
+        self.stores = 0
+        self.evictions = 0
+        self.saved_ms = 0.0
+
+    # ------------------------------------------------------------------
+    def accepts(self, question: str) -> bool:
+        """Short replies ("yes", "that one") only make sense in context; never cache them."""
+        return len((question or "").split()) >= self.min_question_words
+
+    def lookup(self, scope: Scope, embedding: Sequence[float]) -> Optional[Tuple[CacheEntry, float]]:
+        """Return the best fresh entry in ``scope`` at or above the threshold, with its score."""
+        query = _normalise(embedding)
+        with self._lock:
+            self.lookups += 1
+            index = self._scopes.get(scope)
+            if query is None or index is None:
+                return None
+            self._expire_locked(index)
+            matrix = self._matrix_locked(scope, index)
+            if matrix is None or matrix.shape[1] != query.shape[0]:
+                return None
+            scores = matrix @ query
+            best = int(np.argmax(scores))
+            score = float(scores[best])
+            if score < self.similarity_threshold:
+                return None
+            entry = self._entries[index.ids[best]]
+            entry.hits += 1
+            self._entries.move_to_end(entry.entry_id)
+            self.hits += 1
+            return entry, score
+
+    def store(self, scope: Scope, embedding: Sequence[float], question: str, answer: str) -> Optional[CacheEntry]:
+        """Cache ``answer`` for ``question`` in ``scope``."""
+        vector = _normalise(embedding)
+        if vector is None or not answer:
+            return None
+        with self._lock:
+            entry = CacheEntry(
+                entry_id=next(self._ids),
+                scope=scope,
+                vector=vector,
+                question=question,
+                answer=answer,
+                created_at=self._clock(),
+            )
+            self._entries[entry.entry_id] = entry
+            index = self._scopes.setdefault(scope, _ScopeIndex())
+            index.ids.append(entry.entry_id)
+            index.dirty = True
+            self.stores += 1
+            while len(self._entries) > self.max_entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._drop_locked(evicted)
+                self.evictions += 1
+            return entry
+
+    def record_saved(self, ms: float) -> None:
+        with self._lock:
+            self.saved_ms += max(0.0, ms)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._scopes.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "scopes": len(self._scopes),
+                "lookups": self.lookups,
+                "hits": self.hits,
+                "hit_rate": round(self.hits / self.lookups, 3) if self.lookups else 0.0,
+                "stores": self.stores,
+                "evictions": self.evictions,
+                "saved_ms_total": round(self.saved_ms, 1),
+                "saved_ms_per_hit": round(self.saved_ms / self.hits, 1) if self.hits else 0.0,
+            }
+
+    # ------------------------------------------------------------------
+    def _drop_locked(self, entry: CacheEntry) -> None:
+        index = self._scopes.get(entry.scope)
+        if index is None:
+            return
+        index.ids.remove(entry.entry_id)
+        index.dirty = True
+        if not index.ids:
+            del self._scopes[entry.scope]
+
+    def _expire_locked(self, index: _ScopeIndex) -> None:
+        cutoff = self._clock() - self.ttl_seconds
+        for entry_id in [i for i in index.ids if self._entries[i].created_at < cutoff]:
+            self._drop_locked(self._entries.pop(entry_id))
+
+    def _matrix_locked(self, scope: Scope, index: _ScopeIndex) -> Optional[np.ndarray]:
+        if scope not in self._scopes:
+            return None
+        if index.dirty:
+            index.matrix = np.stack([self._entries[i].vector for i in index.ids])
+            index.dirty = False
+        return index.matrix
@@ -27,6 +27,7 @@ Security Note:
     Connection strings and account keys are used only as fallback options.
 """
 
+import json
 import logging
 import os
 from contextlib import asynccontextmanager
@@ -140,7 +141,7 @@ class AzureBlobHelper:
         try:
             # Prefer Managed Identity (secure, Azure-native)
             if not self.connection_string:
-                credential = get_credential()
+                credential = DefaultAzureCredential()
                 logger.info("Using Managed Identity authentication")
                 return credential
             else:
@@ -434,6 +435,91 @@ class AzureBlobHelper:
                 duration_ms=duration,
             )
 
+    async def save_transcript_archive(
+        self,
+        call_id: str,
+        data: bytes,
+        *,
+        codec: str,
+        container_name: Optional[str] = None,
+        metadata: Optional[Dict[str, str]] = None,
+    ) -> BlobOperationResult:
+        """
+        Save a compressed JSON Lines transcript archive (see transcript_archive).
+
+        Args:
+            call_id: Unique call identifier
+            data: Archive bytes produced by transcript_archive.encode
+            codec: Compression codec used ("zstd" or "gzip")
+            container_name: Container name (uses default if not provided)
+            metadata: Extra blob metadata
+
+        Returns:
+            BlobOperationResult indicating operation status
+        """
+        from src.blob.transcript_archive import SUFFIXES
+
+        start_time = datetime.now(timezone.utc)
+        container_name = container_name or self.container_name
+
+        try:
+            # Validate inputs
+            if not call_id or not call_id.strip():
+                raise ValueError("Call ID is required and cannot be empty")
+
+            if codec not in SUFFIXES:
+                raise ValueError(f"Unsupported archive codec: {codec}")
+
+            # Create organized blob path
+            date_str = start_time.strftime("%Y-%m-%d")
+            blob_name = f"transcripts/{date_str}/{call_id}{SUFFIXES[codec]}"
+
+            service = await self._get_blob_service()
+            blob_client = service.get_blob_client(
+                container=container_name, blob=blob_name
+            )
+
+            await blob_client.upload_blob(
+                data,
+                overwrite=True,
+                content_type="application/x-ndjson",
+                metadata={
+                    **(metadata or {}),
+                    "call_id": call_id,
+                    "created_at": start_time.isoformat(),
+                    "content_type": "transcript_archive",
+                    "compression": codec,
+                },
+            )
+
+            duration = (datetime.now(timezone.utc) - start_time).total_seconds() * 1000
+
+            logger.info(
+                f"Archived transcript for call '{call_id}' to '{blob_name}' "
+                f"({len(data)} bytes, {codec}) in {duration:.2f}ms"
+            )
+
+            return BlobOperationResult(
+                success=True,
+                operation_type=BlobOperationType.UPLOAD,
+                blob_name=blob_name,
+                container_name=container_name,
+                size_bytes=len(data),
+                duration_ms=duration,
+            )
+
+        except Exception as e:
+            duration = (datetime.now(timezone.utc) - start_time).total_seconds() * 1000
+            error_msg = f"Failed to archive transcript for call '{call_id}': {e}"
+            logger.error(error_msg, exc_info=True)
+
+            return BlobOperationResult(
+                success=False,
+                operation_type=BlobOperationType.UPLOAD,
+                error_message=error_msg,
+                duration_ms=duration,
+            )
+
     async def save_wav_to_blob(
         self, call_id: str, wav_file_path: str, container_name: Optional[str] = None
     ) -> BlobOperationResult:
@@ -589,19 +675,68 @@ class AzureBlobHelper:
                 duration_ms=duration,
             )
 
+    async def open_call_recording(
+        self,
+        call_id: str,
+        *,
+        sample_rate: int = 16000,
+        container_name: Optional[str] = None,
+        **recorder_kwargs: Any,
+    ) -> "CallRecorder":
+        """
+        Start a streaming stereo recording for a call.
+
+        Audio is staged as blocks while the call runs; ``CallRecorder.finish``
+        writes the WAV header and commits the blob.
+
+        Args:
+            call_id: Unique call identifier
+            sample_rate: PCM sample rate of the recording (the inbound channel)
+            container_name: Container name (uses default if not provided)
+            **recorder_kwargs: Other CallRecorder options (outbound_sample_rate, buffering)
+
+        Returns:
+            Started CallRecorder
+        """
+        from src.blob.call_recorder import CallRecorder
+
+        if not call_id or not call_id.strip():
+            raise ValueError("Call ID is required and cannot be empty")
+
+        container_name = container_name or self.container_name
+        date_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        blob_name = f"audio/{date_str}/{call_id}.wav"
+
+        service = await self._get_blob_service()
+        blob_client = service.get_blob_client(container=container_name, blob=blob_name)
+        logger.info(f"Recording call '{call_id}' to '{blob_name}'")
+        return CallRecorder(
+            blob_client, call_id=call_id, sample_rate=sample_rate, **recorder_kwargs
+        ).start()
+
     async def get_transcript_from_blob(
-        self, call_id: str, container_name: Optional[str] = None
+        self,
+        call_id: str,
+        container_name: Optional[str] = None,
+        blob_name: Optional[str] = None,
     ) -> BlobOperationResult:
         """
         Retrieve transcript from blob storage.
 
+        Compressed JSON Lines archives are decompressed and returned as the
+        same JSON document shape (session_id, histories, context) as plain
+        transcripts, so callers do not need to know how a call was stored.
+
         Args:
             call_id: Unique call identifier
             container_name: Container name (uses default if not provided)
+            blob_name: Exact blob to read (e.g. from an archive summary document)
 
         Returns:
             BlobOperationResult with transcript content or error details
         """
+        from src.blob import transcript_archive
+
         start_time = datetime.now(timezone.utc)
         container_name = container_name or self.container_name
 
@@ -610,71 +745,57 @@ class AzureBlobHelper:
             if not call_id or not call_id.strip():
                 raise ValueError("Call ID is required and cannot be empty")
 
-            # Try to find the transcript (search by date if needed)
             service = await self._get_blob_service()
 
-            # First, try today's date
-            date_str = start_time.strftime("%Y-%m-%d")
-            blob_name = f"transcripts/{date_str}/{call_id}.json"
-
-            blob_client = service.get_blob_client(
-                container=container_name, blob=blob_name
-            )
-
-            try:
-                stream = await blob_client.download_blob()
-                data = await stream.readall()
-                content = data.decode("utf-8")
+            if blob_name:
+                candidates = [blob_name]
+            else:
+                # Today's plain transcript, today's archives, then the legacy
+                # flat path for backwards compatibility
+                date_str = start_time.strftime("%Y-%m-%d")
+                candidates = [f"transcripts/{date_str}/{call_id}.json"]
+                candidates += [
+                    f"transcripts/{date_str}/{call_id}{suffix}"
+                    for suffix in transcript_archive.SUFFIXES.values()
+                ]
+                candidates.append(f"{call_id}.json")
+
+            for candidate in candidates:
+                blob_client = service.get_blob_client(
+                    container=container_name, blob=candidate
+                )
+                try:
+                    stream = await blob_client.download_blob()
+                    data = await stream.readall()
+                except ResourceNotFoundError:
+                    continue
+
+                codec = transcript_archive.codec_for_name(candidate)
+                if codec:
+                    content = json.dumps(transcript_archive.decode(data, codec))
+                else:
+                    content = data.decode("utf-8")
 
                 duration = (
                     datetime.now(timezone.utc) - start_time
                 ).total_seconds() * 1000
 
                 logger.info(
-                    f"Retrieved transcript for call '{call_id}' from '{blob_name}' "
+                    f"Retrieved transcript for call '{call_id}' from '{candidate}' "
                     f"({len(data)} bytes) in {duration:.2f}ms"
                 )
 
                 return BlobOperationResult(
                     success=True,
                     operation_type=BlobOperationType.DOWNLOAD,
-                    blob_name=blob_name,
+                    blob_name=candidate,
                     container_name=container_name,
                     size_bytes=len(data),
                     duration_ms=duration,
                     content=content,
                 )
 
-            except ResourceNotFoundError:
-                # If not found in today's folder, search other dates
-                # This is a fallback for backwards compatibility
-                blob_name_legacy = f"{call_id}.json"
-                blob_client_legacy = service.get_blob_client(
-                    container=container_name, blob=blob_name_legacy
-                )
-
-                stream = await blob_client_legacy.download_blob()
-                data = await stream.readall()
-                content = data.decode("utf-8")
-
-                duration = (
-                    datetime.now(timezone.utc) - start_time
-                ).total_seconds() * 1000
-
-                logger.info(
-                    f"Retrieved transcript for call '{call_id}' from legacy path "
-                    f"'{blob_name_legacy}' ({len(data)} bytes) in {duration:.2f}ms"
-                )
-
-                return BlobOperationResult(
-                    success=True,
-                    operation_type=BlobOperationType.DOWNLOAD,
-                    blob_name=blob_name_legacy,
-                    container_name=container_name,
-                    size_bytes=len(data),
-                    duration_ms=duration,
-                    content=content,
-                )
+            raise ResourceNotFoundError(f"No transcript found for call '{call_id}'")
 
         except Exception as e:
             duration = (datetime.now(timezone.utc) - start_time).total_seconds() * 1000
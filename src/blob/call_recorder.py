@@ -0,0 +1,270 @@
+"""
+Streaming dual-channel call recorder.
+
+Taps the caller's inbound ACS audio (left channel) and the agent's outbound TTS
+frames (right channel) and uploads the interleaved 16-bit stereo PCM to a block
+blob while the call is running:
+
+- Taps are synchronous ``bytearray`` appends on the event loop; no I/O, no
+  locks, no base64 work. Interleaving happens once per block with NumPy.
+- Inbound audio is the clock: ACS delivers a frame every 20 ms (silent frames
+  included), and each inbound frame consumes the same number of bytes of
+  pending outbound audio, padding with silence when the agent is quiet.
+- The recording runs at the inbound rate. Outbound frames produced at a
+  different rate (``outbound_sample_rate``) are resampled as they are tapped
+  so both channels share one timeline.
+- Full blocks go through a bounded queue to a single uploader task that calls
+  ``stage_block``. Memory therefore stays at roughly
+  ``block_bytes * (max_pending_blocks + 1)`` regardless of call length; if
+  storage falls behind, whole blocks are dropped (and counted) rather than
+  buffered without limit.
+- The 44-byte WAV header is staged last, once the data size is known, and
+  listed first in ``commit_block_list``.
+
+The blob client is duck-typed (``stage_block`` / ``commit_block_list``), so any
+``azure.storage.blob.aio.BlobClient`` works.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import struct
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from utils.ml_logging import get_logger
+
+logger = get_logger("blob.call_recorder")
+
+WAV_HEADER_BYTES = 44
+_BYTES_PER_SAMPLE = 2
+_CHANNELS = 2
+
+
+def wav_header(data_bytes: int, *, sample_rate: int, channels: int = _CHANNELS) -> bytes:
+    """Canonical PCM WAV header for ``data_bytes`` of 16-bit audio."""
+    block_align = channels * _BYTES_PER_SAMPLE
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + data_bytes,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,  # PCM
+        channels,
+        sample_rate,
+        sample_rate * block_align,
+        block_align,
+        _BYTES_PER_SAMPLE * 8,
+        b"data",
+        data_bytes,
+    )
+
+
+def _resample(pcm: bytes, src_rate: int, dst_rate: int) -> bytes:
+    """Linear-interpolation resample of 16-bit mono PCM (recording quality)."""
+    samples = np.frombuffer(pcm, dtype="<i2", count=len(pcm) // _BYTES_PER_SAMPLE)
+    n = int(round(len(samples) * dst_rate / src_rate))
+    if not n:
+        return b""
+    positions = np.arange(n) * (src_rate / dst_rate)
+    out = np.interp(positions, np.arange(len(samples)), samples.astype(np.float32))
+    return np.rint(out).astype("<i2").tobytes()
+
+
+def _block_id(seq: int) -> str:
+    # All block ids in a blob must have the same length.
+    return base64.b64encode(f"{seq:08d}".encode()).decode()
+
+
+class CallRecorder:
+    """Per-call stereo recorder that streams to a block blob."""
+
+    def __init__(
+        self,
+        blob_client: Any,
+        *,
+        call_id: str,
+        sample_rate: int = 16000,
+        outbound_sample_rate: Optional[int] = None,
+        block_bytes: int = 1 << 20,
+        max_pending_blocks: int = 4,
+        max_outbound_lag_s: float = 30.0,
+        metadata: Optional[Dict[str, str]] = None,
+    ) -> None:
+        self.blob_client = blob_client
+        self.call_id = call_id
+        self.sample_rate = sample_rate
+        self.outbound_sample_rate = outbound_sample_rate or sample_rate
+        # Whole stereo frames per block.
+        self.block_bytes = max(4, block_bytes - block_bytes % 4)
+        self._max_outbound_lag = int(max_outbound_lag_s * sample_rate) * _BYTES_PER_SAMPLE
+        self._metadata = dict(metadata or {})
+
+        self._left = bytearray()
+        self._right = bytearray()
+        self._outbound = bytearray()
+        self._queue: "asyncio.Queue[Optional[bytes]]" = asyncio.Queue(maxsize=max_pending_blocks)
+        self._uploader: Optional[asyncio.Task] = None
+        self._block_ids: List[str] = []
+        self._closed = False
+
+        self.bytes_recorded = 0
+        self.bytes_uploaded = 0
+        self.dropped_blocks = 0
+        self.dropped_outbound_bytes = 0
+        self.upload_errors = 0
+
+    # ------------------------------------------------------------------ #
+    # Hot path (event loop, once per 20 ms frame)
+    # ------------------------------------------------------------------ #
+    def tap_inbound(self, pcm: bytes) -> None:
+        """Record one inbound (caller) frame and advance the recording clock."""
+        if self._closed:
+            return
+        n = len(pcm) & ~1
+        if not n:
+            return
+        self._left += memoryview(pcm)[:n]
+        out = self._outbound
+        if len(out) >= n:
+            self._right += out[:n]
+            del out[:n]
+        else:
+            self._right += out
+            self._right += bytes(n - len(out))
+            out.clear()
+        if len(self._left) * 2 >= self.block_bytes:
+            block = self._take_block(self.block_bytes // 2)
+            try:
+                self._queue.put_nowait(block)
+            except asyncio.QueueFull:
+                self.dropped_blocks += 1
+                logger.warning(
+                    f"Call recording for {self.call_id} fell behind storage; dropped {len(block)} bytes"
+                )
+
+    def tap_outbound(self, pcm: bytes) -> None:
+        """Queue one outbound (agent) frame; it is mixed as inbound time passes."""
+        if self._closed:
+            return
+        if self.outbound_sample_rate != self.sample_rate:
+            pcm = _resample(pcm, self.outbound_sample_rate, self.sample_rate)
+        self._outbound += memoryview(pcm)[: len(pcm) & ~1]
+        excess = len(self._outbound) - self._max_outbound_lag
+        if excess > 0:
+            del self._outbound[:excess]
+            self.dropped_outbound_bytes += excess
+
+    def clear_outbound(self) -> None:
+        """Forget agent audio that was queued but not played (barge-in)."""
+        self._outbound.clear()
+
+    # ------------------------------------------------------------------ #
+    # Lifecycle
+    # ------------------------------------------------------------------ #
+    def start(self) -> "CallRecorder":
+        if self._uploader is None:
+            self._uploader = asyncio.create_task(self._upload_loop())
+        return self
+
+    async def finish(self) -> Dict[str, Any]:
+        """Upload what is buffered, stage the header and commit the blob."""
+        if self._closed:
+            return self.stats()
+        self._closed = True
+        self.start()
+        # Agent audio still queued at hang-up plays out against caller silence.
+        if self._outbound:
+            tail = bytes(self._outbound)
+            self._outbound.clear()
+            self._left += bytes(len(tail))
+            self._right += tail
+        while self._left:
+            await self._queue.put(self._take_block(min(len(self._left), self.block_bytes // 2)))
+        await self._queue.put(None)
+        await self._uploader
+
+        committed = False
+        if self._block_ids:
+            try:
+                header_id = _block_id(0)
+                header = wav_header(self.bytes_uploaded, sample_rate=self.sample_rate)
+                await self.blob_client.stage_block(header_id, header, length=len(header))
+                metadata = {
+                    **self._metadata,
+                    "call_id": self.call_id,
+                    "created_at": datetime.now(timezone.utc).isoformat(),
+                    "content_type": "audio_recording",
+                    "channels": "caller,agent",
+                    "dropped_blocks": str(self.dropped_blocks),
+                }
+                await self.blob_client.commit_block_list(
+                    [header_id, *self._block_ids],
+                    content_settings=_wav_content_settings(),
+                    metadata=metadata,
+                )
+                committed = True
+            except Exception as e:
+                self.upload_errors += 1
+                logger.error(f"Call recording commit failed for {self.call_id}: {e}")
+        stats = self.stats()
+        stats["committed"] = committed
+        logger.info("Call recording finished", extra={"call_recording": stats})
+        return stats
+
+    def stats(self) -> Dict[str, Any]:
+        bytes_per_second = self.sample_rate * _BYTES_PER_SAMPLE * _CHANNELS
+        return {
+            "call_id": self.call_id,
+            "blocks": len(self._block_ids),
+            "bytes_recorded": self.bytes_recorded,
+            "bytes_uploaded": self.bytes_uploaded,
+            "duration_s": round(self.bytes_uploaded / bytes_per_second, 2),
+            "dropped_blocks": self.dropped_blocks,
+            "dropped_outbound_bytes": self.dropped_outbound_bytes,
+            "upload_errors": self.upload_errors,
+            "buffered_bytes": len(self._left) + len(self._right) + len(self._outbound),
+            "pending_blocks": self._queue.qsize(),
+        }
+
+    # ------------------------------------------------------------------ #
+    # Internals
+    # ------------------------------------------------------------------ #
+    def _take_block(self, channel_bytes: int) -> bytes:
+        samples = channel_bytes // _BYTES_PER_SAMPLE
+        stereo = np.empty((samples, _CHANNELS), dtype="<i2")
+        stereo[:, 0] = np.frombuffer(self._left, dtype="<i2", count=samples)
+        stereo[:, 1] = np.frombuffer(self._right, dtype="<i2", count=samples)
+        del self._left[: samples * _BYTES_PER_SAMPLE]
+        del self._right[: samples * _BYTES_PER_SAMPLE]
+        block = stereo.tobytes()
+        self.bytes_recorded += len(block)
+        return block
+
+    async def _upload_loop(self) -> None:
+        seq = 1  # 0 is reserved for the header
+        while True:
+            block = await self._queue.get()
+            if block is None:
+                return
+            block_id = _block_id(seq)
+            seq += 1
+            try:
+                await self.blob_client.stage_block(block_id, block, length=len(block))
+            except Exception as e:
+                self.upload_errors += 1
+                logger.error(f"Call recording block upload failed for {self.call_id}: {e}")
+                continue
+            self._block_ids.append(block_id)
+            self.bytes_uploaded += len(block)
+
+
+def _wav_content_settings():
+    from azure.storage.blob import ContentSettings
+
+    return ContentSettings(content_type="audio/wav")
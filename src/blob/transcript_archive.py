@@ -0,0 +1,102 @@
+"""
+Compressed JSON Lines format for archived call transcripts.
+
+One archive holds a whole session:
+
+    {"type": "session", "session_id": ..., "timestamp": ..., "agents": [...]}
+    {"type": "message", "agent": "AuthAgent", "seq": 0, "message": {...}}
+    ...
+    {"type": "context", "context": {...}}
+
+Line-oriented records compress well and can be scanned without loading the
+whole call. Archives are zstd-compressed when the optional ``zstandard``
+package is installed and gzip-compressed otherwise; the codec is recorded in
+the blob name suffix (``.jsonl.zst`` / ``.jsonl.gz``) so readers never guess.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+from typing import Any, Dict, Iterator, List
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+GZIP = "gzip"
+ZSTD = "zstd"
+SUFFIXES = {ZSTD: ".jsonl.zst", GZIP: ".jsonl.gz"}
+
+
+def resolve_codec(preferred: str = ZSTD) -> str:
+    """``preferred`` if it is usable here, else gzip."""
+    if preferred == ZSTD and zstandard is not None:
+        return ZSTD
+    return GZIP
+
+
+def codec_for_name(blob_name: str) -> str | None:
+    for codec, suffix in SUFFIXES.items():
+        if blob_name.endswith(suffix):
+            return codec
+    return None
+
+
+def _lines(document: Dict[str, Any]) -> Iterator[str]:
+    histories: Dict[str, List[Dict[str, Any]]] = document.get("histories") or {}
+    yield json.dumps(
+        {
+            "type": "session",
+            "session_id": document.get("session_id"),
+            "timestamp": document.get("timestamp"),
+            "agents": list(histories),
+        },
+        default=str,
+    )
+    for agent, messages in histories.items():
+        for seq, message in enumerate(messages):
+            yield json.dumps(
+                {"type": "message", "agent": agent, "seq": seq, "message": message},
+                default=str,
+            )
+    yield json.dumps({"type": "context", "context": document.get("context") or {}}, default=str)
+
+
+def encode(document: Dict[str, Any], codec: str = GZIP) -> bytes:
+    """Serialize ``{session_id, timestamp, histories, context}`` to compressed JSON Lines."""
+    raw = ("\n".join(_lines(document)) + "\n").encode("utf-8")
+    if codec == ZSTD:
+        if zstandard is None:
+            raise RuntimeError("zstandard is not installed")
+        return zstandard.ZstdCompressor(level=6).compress(raw)
+    return gzip.compress(raw, compresslevel=6)
+
+
+def decode(data: bytes, codec: str) -> Dict[str, Any]:
+    """Inverse of :func:`encode`."""
+    if codec == ZSTD:
+        if zstandard is None:
+            raise RuntimeError("zstandard is not installed")
+        raw = zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    else:
+        raw = gzip.decompress(data)
+
+    document: Dict[str, Any] = {"histories": {}, "context": {}}
+    for line in raw.decode("utf-8").splitlines():
+        if not line:
+            continue
+        record = json.loads(line)
+        kind = record.get("type")
+        if kind == "session":
+            document["session_id"] = record.get("session_id")
+            document["timestamp"] = record.get("timestamp")
+            document["agents"] = record.get("agents") or []
+            for agent in document["agents"]:
+                document["histories"].setdefault(agent, [])
+        elif kind == "message":
+            document["histories"].setdefault(record["agent"], []).append(record["message"])
+        elif kind == "context":
+            document["context"] = record.get("context") or {}
+    return document
@@ -1,16 +1,23 @@
+import base64
 import logging
 import os
 import re
 import warnings
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import pymongo
 import yaml
+from bson import json_util
 from utils.azure_auth import get_credential
 from dotenv import load_dotenv
 from pymongo.auth_oidc import OIDCCallback, OIDCCallbackContext, OIDCCallbackResult
-from pymongo.errors import DuplicateKeyError, NetworkTimeout, PyMongoError
+from pymongo.errors import (
+    ConnectionFailure,
+    DuplicateKeyError,
+    NetworkTimeout,
+    PyMongoError,
+)
 
 # Initialize logging
 logger = logging.getLogger(__name__)
@@ -34,6 +41,54 @@ def _extract_cluster_host(connection_string: Optional[str]) -> Optional[str]:
     return host
 
 
+# call_id lookups, status filters, and newest-first listing (optionally by status).
+DEFAULT_INDEXES: List[List[Tuple[str, int]]] = [
+    [("call_id", pymongo.ASCENDING)],
+    [("status", pymongo.ASCENDING)],
+    [("timestamp", pymongo.DESCENDING), ("_id", pymongo.DESCENDING)],
+    [("status", pymongo.ASCENDING), ("timestamp", pymongo.DESCENDING), ("_id", pymongo.DESCENDING)],
+]
+
+
+def _encode_continuation(value: Any, doc_id: Any) -> str:
+    raw = json_util.dumps([value, doc_id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def _decode_continuation(token: str) -> Tuple[Any, Any]:
+    try:
+        value, doc_id = json_util.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid continuation token: {token!r}") from e
+    return value, doc_id
+
+
+def _keyset_filter(field: str, value: Any, doc_id: Any, descending: bool) -> Dict[str, Any]:
+    """Match documents ordered strictly after ``(value, doc_id)``."""
+    op = "$lt" if descending else "$gt"
+    same_value = {field: value, "_id": {op: doc_id}}
+    if value is None:
+        # Missing values sort lowest: last in descending order, first in ascending.
+        if descending:
+            return same_value
+        return {"$or": [same_value, {field: {"$ne": None}}]}
+    clauses = [same_value, {field: {op: value}}]
+    if descending:
+        clauses.append({field: None})
+    return {"$or": clauses}
+
+
+def _with_fields(
+    projection: Union[Dict[str, Any], Sequence[str]], fields: Sequence[str]
+) -> Union[Dict[str, Any], List[str]]:
+    if isinstance(projection, dict):
+        if projection and all(not v for v in projection.values()):
+            # Exclusion projection: just make sure the keys are not excluded.
+            return {k: v for k, v in projection.items() if k not in fields}
+        return {**projection, **{f: 1 for f in fields}}
+    return list(dict.fromkeys([*projection, *fields]))
+
+
 class AzureIdentityTokenCallback(OIDCCallback):
     def __init__(self, credential):
         self.credential = credential
@@ -177,20 +232,126 @@ class CosmosDBMongoCoreManager:
             logger.error(f"Failed to read document: {e}")
             return None
 
-    def query_documents(self, query: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def query_documents(
+        self,
+        query: Dict[str, Any],
+        projection: Optional[Union[Dict[str, Any], Sequence[str]]] = None,
+        sort: Optional[List[Tuple[str, int]]] = None,
+        skip: int = 0,
+        limit: int = 0,
+    ) -> List[Dict[str, Any]]:
         """
         Query multiple documents from the collection based on a query.
         :param query: The query to match documents.
+        :param projection: Fields to return (dict or list of field names); all fields when None.
+        :param sort: List of (field, direction) pairs applied server-side.
+        :param skip: Number of matching documents to skip.
+        :param limit: Maximum number of documents to return (0 = no limit).
         :return: A list of matching documents.
         """
         try:
-            documents = list(self.collection.find(query))
+            cursor = self.collection.find(query, projection)
+            if sort:
+                cursor = cursor.sort(sort)
+            if skip:
+                cursor = cursor.skip(skip)
+            if limit:
+                cursor = cursor.limit(limit)
+            documents = list(cursor)
             logger.info(f"Found {len(documents)} documents matching the query.")
             return documents
         except PyMongoError as e:
             logger.error(f"Failed to query documents: {e}")
             return []
 
+    def query_page(
+        self,
+        query: Dict[str, Any],
+        limit: int,
+        sort_field: str = "timestamp",
+        descending: bool = True,
+        projection: Optional[Union[Dict[str, Any], Sequence[str]]] = None,
+        continuation_token: Optional[str] = None,
+        skip: int = 0,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Fetch one page of documents using keyset (cursor) pagination.
+
+        Documents are ordered by ``(sort_field, _id)`` so ties are stable, and the
+        next page starts strictly after the last document of this one. Unlike
+        ``skip``, the cost of a page does not grow with its depth when
+        ``sort_field`` is indexed.
+
+        :param query: The query to match documents.
+        :param limit: Maximum number of documents in the page.
+        :param sort_field: Field to order by; ``_id`` breaks ties.
+        :param descending: Newest/largest first when True.
+        :param projection: Fields to return; ``sort_field`` and ``_id`` are always included.
+        :param continuation_token: Token returned by the previous page, or None for the first page.
+        :param skip: Offset applied when no token is given (page-number access); prefer tokens.
+        :return: The page of documents and the token for the next page (None when exhausted).
+        :raises ValueError: If the continuation token is malformed.
+        """
+        direction = pymongo.DESCENDING if descending else pymongo.ASCENDING
+        page_query = query
+        if continuation_token:
+            skip = 0
+            last_value, last_id = _decode_continuation(continuation_token)
+            page_query = {
+                "$and": [query, _keyset_filter(sort_field, last_value, last_id, descending)]
+            }
+        if projection is not None:
+            projection = _with_fields(projection, (sort_field, "_id"))
+
+        try:
+            cursor = self.collection.find(page_query, projection).sort(
+                [(sort_field, direction), ("_id", direction)]
+            )
+            if skip:
+                cursor = cursor.skip(skip)
+            documents = list(cursor.limit(limit + 1))
+        except PyMongoError as e:
+            logger.error(f"Failed to query page: {e}")
+            return [], None
+
+        if len(documents) <= limit:
+            return documents, None
+        documents = documents[:limit]
+        last = documents[-1]
+        return documents, _encode_continuation(last.get(sort_field), last["_id"])
+
+    def count_documents(self, query: Dict[str, Any]) -> int:
+        """
+        Count documents matching a query on the server.
+        :param query: The query to match documents.
+        :return: Number of matching documents, or 0 if an error occurred.
+        """
+        try:
+            return self.collection.count_documents(query)
+        except PyMongoError as e:
+            logger.error(f"Failed to count documents: {e}")
+            return 0
+
+    def ensure_indexes(
+        self, indexes: Optional[List[List[Tuple[str, int]]]] = None
+    ) -> List[str]:
+        """
+        Create indexes backing call listing and lookups. Creation is idempotent.
+        :param indexes: Index key lists; defaults to ``DEFAULT_INDEXES``.
+        :return: Names of the indexes that exist after the call.
+        """
+        names = []
+        for keys in indexes or DEFAULT_INDEXES:
+            try:
+                names.append(self.collection.create_index(keys))
+            except ConnectionFailure as e:
+                logger.warning(f"Skipping index creation, Cosmos DB unreachable: {e}")
+                break
+            except PyMongoError as e:
+                logger.warning(f"Failed to create index {keys}: {e}")
+        logger.info(f"Cosmos indexes ensured: {names}")
+        return names
+
     def document_exists(self, query: Dict[str, Any]) -> bool:
         """
         Check if a document exists in the collection based on a query.
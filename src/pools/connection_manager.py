@@ -5,9 +5,10 @@ Clean WebSocket Connection Manager
 Simple, production-ready WebSocket connection management following FastAPI best practices.
 
 Features:
-- Thread-safe connection registry with async locks
+- Lock-free registry: synchronous writes and copy-on-write indexes
 - Per-connection send queues to prevent concurrent write issues
 - Simple broadcast by session, call, topic, or all connections
+- Optional cross-worker fan-out and call ownership via a Redis session bus
 - Clean lifecycle management with proper resource cleanup
 - Production logging and error handling
 """
@@ -16,14 +17,29 @@ import asyncio
 import json
 import time
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, Awaitable, Callable, Dict, Optional, Set, Literal
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Literal,
+    Optional,
+    Set,
+)
 
 from fastapi import WebSocket
 from fastapi.websockets import WebSocketState
 
 from utils.ml_logging import get_logger
 
+from .striped import CopyOnWriteIndex
+
+if TYPE_CHECKING:
+    from src.redis.session_bus import RedisSessionBus
+
 logger = get_logger(__name__)
 
 ClientType = Literal["dashboard", "conversation", "media", "other"]
@@ -205,6 +221,17 @@ class ThreadSafeConnectionManager:
     - Connection limit enforcement (200 max by default)
     - Connection queue for overflow handling
     - Automatic rejection of excess connections
+
+    Concurrency model: every registry mutation is synchronous, so it cannot
+    interleave with another coroutine on the loop. Index values are immutable
+    frozensets that are swapped on write, which lets broadcasts and lookups
+    read without a lock, and register/unregister need none either. That only
+    holds while all mutations run on one event loop thread: the manager binds
+    to the first loop that mutates it and ``_assert_owner_loop`` rejects any
+    other (worker threads must hop back with ``run_coroutine_threadsafe``
+    onto that loop). Handler
+    teardown and socket close run after the connection has left the registry,
+    so a slow ``handler.stop()`` no longer stalls unrelated sessions.
     """
 
     def __init__(
@@ -212,14 +239,20 @@ class ThreadSafeConnectionManager:
         max_connections: int = 200,
         queue_size: int = 50,
         enable_connection_limits: bool = True,
+        sweep_batch_size: int = 256,
     ):
-        self._lock = asyncio.Lock()
         self._conns: Dict[str, _Connection] = {}
 
-        # Simple indexes for efficient broadcast
-        self._by_session: Dict[str, Set[str]] = {}
-        self._by_call: Dict[str, Set[str]] = {}
-        self._by_topic: Dict[str, Set[str]] = {}
+        # Copy-on-write indexes for lock-free broadcast lookups
+        self._by_session = CopyOnWriteIndex()
+        self._by_call = CopyOnWriteIndex()
+        self._by_topic = CopyOnWriteIndex()
+        self._by_websocket: Dict[int, str] = {}
+
+        # Round-robin order for incremental stale-connection sweeps; entries
+        # leave on unregister, so it never outgrows the registry.
+        self._sweep_order: "OrderedDict[str, None]" = OrderedDict()
+        self.sweep_batch_size = max(sweep_batch_size, 1)
 
         # Connection limit management
         self.max_connections = max_connections
@@ -232,22 +265,52 @@ class ThreadSafeConnectionManager:
         # Example: { call_id: { "lva_agent": <agent>, "pool": <pool>, "session_id": str, ... } }
         self._call_context: Dict[str, Any] = {}
 
+        # Optional Redis bus for multi-worker deployments (see attach_bus)
+        self._bus: Optional["RedisSessionBus"] = None
+
+        # Loop that owns the registry; see _assert_owner_loop
+        self._owner_loop: Optional[asyncio.AbstractEventLoop] = None
+
         logger.info(
             f"ConnectionManager initialized: max_connections={max_connections}, "
             f"queue_size={queue_size}, limits_enabled={enable_connection_limits}"
         )
 
+    def attach_bus(self, bus: "RedisSessionBus") -> None:
+        """
+        Enable distributed mode.
+
+        Broadcasts are also published to Redis so that other workers deliver
+        them to their own sockets, and calls are registered to this node.
+        """
+        self._bus = bus
+        bus.set_listener(self._deliver_remote)
+
+    @property
+    def node_id(self) -> Optional[str]:
+        return self._bus.node_id if self._bus else None
+
+    def _assert_owner_loop(self) -> None:
+        """Registry mutations take no lock, so they must stay on one loop."""
+        loop = asyncio.get_running_loop()
+        if self._owner_loop is None:
+            self._owner_loop = loop
+        assert loop is self._owner_loop, (
+            "ConnectionManager registry mutated from a second event loop; "
+            "schedule the call on the owning loop instead"
+        )
+
     async def stop(self) -> None:
         """Stop manager and close all connections."""
-        async with self._lock:
-            close_tasks = [conn.close() for conn in self._conns.values()]
-        await asyncio.gather(*close_tasks, return_exceptions=True)
-
-        async with self._lock:
-            self._conns.clear()
-            self._by_session.clear()
-            self._by_call.clear()
-            self._by_topic.clear()
+        self._assert_owner_loop()
+        conns = list(self._conns.values())
+        self._conns.clear()
+        self._by_session.clear()
+        self._by_call.clear()
+        self._by_topic.clear()
+        self._by_websocket.clear()
+        self._sweep_order.clear()
+        await asyncio.gather(*(conn.close() for conn in conns), return_exceptions=True)
 
     async def register(
         self,
@@ -282,8 +345,7 @@ class ThreadSafeConnectionManager:
         """
         # Phase 1: Check connection limits before accepting
         if self.enable_limits:
-            async with self._lock:
-                current_count = len(self._conns)
+            current_count = len(self._conns)
 
             if current_count >= self.max_connections:
                 # Try to queue the connection
@@ -346,14 +408,13 @@ class ThreadSafeConnectionManager:
             on_send_failure=_on_send_failure,
         )
 
-        async with self._lock:
-            self._conns[conn_id] = conn
-            if session_id:
-                self._by_session.setdefault(session_id, set()).add(conn_id)
-            if call_id:
-                self._by_call.setdefault(call_id, set()).add(conn_id)
-            for topic in meta.topics:
-                self._by_topic.setdefault(topic, set()).add(conn_id)
+        self._assert_owner_loop()
+        self._conns[conn_id] = conn
+        self._by_websocket[id(websocket)] = conn_id
+        self._index(meta)
+        self._sweep_order[conn_id] = None
+
+        await self._bus_track(meta)
 
         logger.info(
             f"WebSocket registered: {conn_id} ({client_type}) "
@@ -390,64 +451,75 @@ class ThreadSafeConnectionManager:
 
     async def unregister(self, connection_id: str) -> None:
         """Remove connection and cleanup resources."""
-        async with self._lock:
-            conn = self._conns.pop(connection_id, None)
-            if not conn:
-                return
-
-            # Cleanup handler if present
-            if conn.meta.handler:
-                try:
-                    if hasattr(conn.meta.handler, "stop") and callable(
-                        conn.meta.handler.stop
-                    ):
-                        await conn.meta.handler.stop()
-                except Exception as e:
-                    logger.error(
-                        f"Error stopping handler: {e}", extra={"conn_id": connection_id}
-                    )
-
-            # Remove from indexes
-            if conn.meta.session_id:
-                self._by_session.get(conn.meta.session_id, set()).discard(connection_id)
-            if conn.meta.call_id:
-                self._by_call.get(conn.meta.call_id, set()).discard(connection_id)
-            for topic in conn.meta.topics:
-                self._by_topic.get(topic, set()).discard(connection_id)
+        self._assert_owner_loop()
+        conn = self._conns.pop(connection_id, None)
+        if not conn:
+            return
+        self._by_websocket.pop(id(conn.ws), None)
+        self._sweep_order.pop(connection_id, None)
+        self._unindex(conn.meta)
 
+        # The connection is already unreachable through the registry.
+        await self._stop_handler(conn)
+        await self._bus_untrack(conn.meta)
         await conn.close()
         logger.info(f"WebSocket unregistered: {connection_id}")
 
+    def _index(self, meta: ConnectionMeta) -> None:
+        conn_id = meta.connection_id
+        if meta.session_id:
+            self._by_session.add(meta.session_id, conn_id)
+        if meta.call_id:
+            self._by_call.add(meta.call_id, conn_id)
+        for topic in meta.topics:
+            self._by_topic.add(topic, conn_id)
+
+    def _unindex(self, meta: ConnectionMeta) -> None:
+        conn_id = meta.connection_id
+        if meta.session_id:
+            self._by_session.discard(meta.session_id, conn_id)
+        if meta.call_id:
+            self._by_call.discard(meta.call_id, conn_id)
+        for topic in meta.topics:
+            self._by_topic.discard(topic, conn_id)
+
+    async def _stop_handler(self, conn: "_Connection") -> None:
+        handler = conn.meta.handler
+        if not handler:
+            return
+        try:
+            if hasattr(handler, "stop") and callable(handler.stop):
+                await handler.stop()
+        except Exception as e:
+            logger.error(
+                f"Error stopping handler: {e}",
+                extra={"conn_id": conn.meta.connection_id},
+            )
+
     async def unregister_by_websocket(self, websocket: WebSocket) -> None:
         """Unregister connection by WebSocket instance."""
-        target_id = None
-        async with self._lock:
-            for conn_id, conn in self._conns.items():
-                if conn.ws is websocket:
-                    target_id = conn_id
-                    break
+        target_id = await self.get_connection_by_websocket(websocket)
         if target_id:
             await self.unregister(target_id)
 
     async def stats(self) -> Dict[str, Any]:
         """Get connection statistics with Phase 1 metrics."""
-        async with self._lock:
-            return {
-                "connections": len(self._conns),
-                "max_connections": self.max_connections if self.enable_limits else None,
-                "utilization_percent": round(
-                    len(self._conns) / self.max_connections * 100, 1
-                )
-                if self.enable_limits
-                else None,
-                "rejected_count": self._rejected_count,
-                "queue_size": self._connection_queue.qsize(),
-                "queue_capacity": self.queue_size,
-                "limits_enabled": self.enable_limits,
-                "by_session": {k: len(v) for k, v in self._by_session.items()},
-                "by_call": {k: len(v) for k, v in self._by_call.items()},
-                "by_topic": {k: len(v) for k, v in self._by_topic.items()},
-            }
+        connections = len(self._conns)
+        return {
+            "connections": connections,
+            "max_connections": self.max_connections if self.enable_limits else None,
+            "utilization_percent": round(connections / self.max_connections * 100, 1)
+            if self.enable_limits
+            else None,
+            "rejected_count": self._rejected_count,
+            "queue_size": self._connection_queue.qsize(),
+            "queue_capacity": self.queue_size,
+            "limits_enabled": self.enable_limits,
+            "by_session": self._by_session.counts(),
+            "by_call": self._by_call.counts(),
+            "by_topic": self._by_topic.counts(),
+            "distributed": self._bus.stats() if self._bus else None,
+        }
 
     async def send_to_connection(
         self, connection_id: str, payload: Dict[str, Any]
@@ -458,8 +530,7 @@ class ThreadSafeConnectionManager:
         Returns:
             bool: True if sent successfully, False if connection not found
         """
-        async with self._lock:
-            conn = self._conns.get(connection_id)
+        conn = self._conns.get(connection_id)
         if conn:
             await conn.send_json(payload)
             return True
@@ -470,11 +541,18 @@ class ThreadSafeConnectionManager:
         Broadcast to all connections in a session with session-safe data filtering.
 
         This ensures the frontend can only grab data concerning that session,
-        providing proper session isolation and security.
+        providing proper session isolation and security. In distributed mode
+        the payload is also published for sockets held by other workers; the
+        return value counts local deliveries only.
         """
-        async with self._lock:
-            conn_ids = list(self._by_session.get(session_id, set()))
-            targets = [self._conns[i] for i in conn_ids if i in self._conns]
+        sent = await self._broadcast_session_local(session_id, payload)
+        await self._publish("session", session_id, payload)
+        return sent
+
+    async def _broadcast_session_local(
+        self, session_id: str, payload: Dict[str, Any]
+    ) -> int:
+        targets = self._targets(self._by_session.get(session_id))
 
         # Add session context to payload for frontend filtering
         session_payload = {
@@ -515,6 +593,10 @@ class ThreadSafeConnectionManager:
 
         return sent
 
+    def _targets(self, conn_ids) -> list["_Connection"]:
+        conns = self._conns
+        return [conns[i] for i in conn_ids if i in conns]
+
     async def _safe_send_to_connection(
         self, conn: "_Connection", payload: Dict[str, Any]
     ) -> None:
@@ -536,9 +618,12 @@ class ThreadSafeConnectionManager:
 
     async def broadcast_call(self, call_id: str, payload: Dict[str, Any]) -> int:
         """Broadcast to all connections in a call."""
-        async with self._lock:
-            conn_ids = list(self._by_call.get(call_id, set()))
-            targets = [self._conns[i] for i in conn_ids if i in self._conns]
+        sent = await self._broadcast_call_local(call_id, payload)
+        await self._publish("call", call_id, payload)
+        return sent
+
+    async def _broadcast_call_local(self, call_id: str, payload: Dict[str, Any]) -> int:
+        targets = self._targets(self._by_call.get(call_id))
 
         sent = 0
         for conn in targets:
@@ -553,9 +638,12 @@ class ThreadSafeConnectionManager:
 
     async def broadcast_topic(self, topic: str, payload: Dict[str, Any]) -> int:
         """Broadcast to all connections subscribed to a topic."""
-        async with self._lock:
-            conn_ids = list(self._by_topic.get(topic, set()))
-            targets = [self._conns[i] for i in conn_ids if i in self._conns]
+        sent = await self._broadcast_topic_local(topic, payload)
+        await self._publish("topic", topic, payload)
+        return sent
+
+    async def _broadcast_topic_local(self, topic: str, payload: Dict[str, Any]) -> int:
+        targets = self._targets(self._by_topic.get(topic))
 
         sent = 0
         for conn in targets:
@@ -570,8 +658,12 @@ class ThreadSafeConnectionManager:
 
     async def broadcast_all(self, payload: Dict[str, Any]) -> int:
         """Broadcast to all connections."""
-        async with self._lock:
-            targets = list(self._conns.values())
+        sent = await self._broadcast_all_local(payload)
+        await self._publish("all", None, payload)
+        return sent
+
+    async def _broadcast_all_local(self, payload: Dict[str, Any]) -> int:
+        targets = list(self._conns.values())
 
         sent = 0
         for conn in targets:
@@ -584,33 +676,98 @@ class ThreadSafeConnectionManager:
                 )
         return sent
 
+    # ---------------------- Distributed mode ---------------------- #
+    async def _publish(
+        self, kind: str, key: Optional[str], payload: Dict[str, Any]
+    ) -> None:
+        if self._bus is not None:
+            await self._bus.publish(kind, key, payload)
+
+    async def _deliver_remote(
+        self, kind: str, key: Optional[str], payload: Dict[str, Any]
+    ) -> int:
+        """Deliver a broadcast published by another worker to local sockets only."""
+        if kind == "session" and key:
+            return await self._broadcast_session_local(key, payload)
+        if kind == "call" and key:
+            return await self._broadcast_call_local(key, payload)
+        if kind == "topic" and key:
+            return await self._broadcast_topic_local(key, payload)
+        if kind == "all":
+            return await self._broadcast_all_local(payload)
+        logger.debug(f"Ignoring remote broadcast of kind {kind!r}")
+        return 0
+
+    async def _bus_track(self, meta: ConnectionMeta) -> None:
+        if self._bus is None:
+            return
+        try:
+            if meta.session_id:
+                await self._bus.track("session", meta.session_id)
+            if meta.call_id:
+                await self._bus.track("call", meta.call_id)
+                await self._bus.claim("call", meta.call_id)
+            for topic in meta.topics:
+                await self._bus.track("topic", topic)
+        except Exception as e:
+            logger.error(
+                f"Session bus registration failed: {e}",
+                extra={"conn_id": meta.connection_id},
+            )
+
+    async def _bus_untrack(self, meta: ConnectionMeta) -> None:
+        if self._bus is None:
+            return
+        try:
+            if meta.session_id:
+                await self._bus.untrack("session", meta.session_id)
+            if meta.call_id:
+                await self._bus.untrack("call", meta.call_id)
+                if not self._by_call.get(meta.call_id):
+                    await self._bus.release("call", meta.call_id)
+            for topic in meta.topics:
+                await self._bus.untrack("topic", topic)
+        except Exception as e:
+            logger.error(
+                f"Session bus cleanup failed: {e}",
+                extra={"conn_id": meta.connection_id},
+            )
+
+    async def get_call_owner(self, call_id: str) -> Optional[str]:
+        """
+        Return the node id that owns ``call_id``.
+
+        Local calls resolve without Redis; otherwise the bus registry is
+        consulted (cached briefly). Returns None in single-process mode when
+        the call is not local.
+        """
+        if self._by_call.get(call_id):
+            return self.node_id or "local"
+        if self._bus is None:
+            return None
+        return await self._bus.owner_of("call", call_id)
+
     async def get_connection_meta(self, connection_id: str) -> Optional[ConnectionMeta]:
         """Get connection metadata safely."""
-        async with self._lock:
-            conn = self._conns.get(connection_id)
-            return conn.meta if conn else None
+        conn = self._conns.get(connection_id)
+        return conn.meta if conn else None
 
     # ---------------------- Call Context (Out-of-band) ---------------------- #
     async def set_call_context(self, call_id: str, context: Dict[str, Any]) -> None:
         """Associate arbitrary context with a call_id (thread-safe)."""
-        async with self._lock:
-            self._call_context[call_id] = context
+        self._call_context[call_id] = context
 
     async def get_call_context(self, call_id: str) -> Optional[Dict[str, Any]]:
         """Get (without removing) context for a call_id (thread-safe)."""
-        async with self._lock:
-            return self._call_context.get(call_id)
+        return self._call_context.get(call_id)
 
     async def pop_call_context(self, call_id: str) -> Optional[Dict[str, Any]]:
         """Atomically retrieve and remove context for a call_id (thread-safe)."""
-        async with self._lock:
-            return self._call_context.pop(call_id, None)
+        return self._call_context.pop(call_id, None)
 
     async def get_connection_by_call_id(self, call_id: str) -> Optional[str]:
         """Get connection_id by call_id safely."""
-        async with self._lock:
-            conn_ids = self._by_call.get(call_id, set())
-            return next(iter(conn_ids), None) if conn_ids else None
+        return next(iter(self._by_call.get(call_id)), None)
 
     async def get_session_data_safe(
         self, session_id: str, requesting_connection_id: str
@@ -621,133 +778,119 @@ class ThreadSafeConnectionManager:
         This ensures frontend can only access data from their own session,
         providing proper session isolation and security.
         """
-        async with self._lock:
-            # Check if requesting connection belongs to this session
-            requesting_conn = self._conns.get(requesting_connection_id)
-            if not requesting_conn or requesting_conn.meta.session_id != session_id:
-                logger.warning(
-                    f"Unauthorized session data access attempt",
-                    extra={
-                        "requesting_conn_id": requesting_connection_id,
-                        "requested_session_id": session_id,
-                        "actual_session_id": requesting_conn.meta.session_id
-                        if requesting_conn
-                        else None,
-                    },
-                )
-                return None
-
-            # Get all connections in this session
-            session_conn_ids = self._by_session.get(session_id, set())
-            session_connections = [
-                {
-                    "connection_id": conn_id,
-                    "client_type": self._conns[conn_id].meta.client_type,
-                    "call_id": self._conns[conn_id].meta.call_id,
-                    "user_id": self._conns[conn_id].meta.user_id,
-                    "topics": list(self._conns[conn_id].meta.topics),
-                    "created_at": self._conns[conn_id].meta.created_at,
-                }
-                for conn_id in session_conn_ids
-                if conn_id in self._conns
-            ]
-
-            return {
-                "session_id": session_id,
-                "connections": session_connections,
-                "connection_count": len(session_connections),
-                "timestamp": time.time(),
-                "restricted_to_session": True,
+        # Check if requesting connection belongs to this session
+        requesting_conn = self._conns.get(requesting_connection_id)
+        if not requesting_conn or requesting_conn.meta.session_id != session_id:
+            logger.warning(
+                f"Unauthorized session data access attempt",
+                extra={
+                    "requesting_conn_id": requesting_connection_id,
+                    "requested_session_id": session_id,
+                    "actual_session_id": requesting_conn.meta.session_id
+                    if requesting_conn
+                    else None,
+                },
+            )
+            return None
+
+        # Get all connections in this session
+        session_conn_ids = self._by_session.get(session_id)
+        session_connections = [
+            {
+                "connection_id": conn_id,
+                "client_type": self._conns[conn_id].meta.client_type,
+                "call_id": self._conns[conn_id].meta.call_id,
+                "user_id": self._conns[conn_id].meta.user_id,
+                "topics": list(self._conns[conn_id].meta.topics),
+                "created_at": self._conns[conn_id].meta.created_at,
             }
+            for conn_id in session_conn_ids
+            if conn_id in self._conns
+        ]
+
+        return {
+            "session_id": session_id,
+            "connections": session_connections,
+            "connection_count": len(session_connections),
+            "timestamp": time.time(),
+            "restricted_to_session": True,
+        }
 
     async def get_connection_by_websocket(self, websocket: WebSocket) -> Optional[str]:
         """Get connection_id by WebSocket instance safely."""
-        async with self._lock:
-            for conn_id, conn in self._conns.items():
-                if conn.ws is websocket:
-                    return conn_id
-        return None
+        return self._by_websocket.get(id(websocket))
 
-    async def validate_and_cleanup_stale_connections(self) -> Dict[str, int]:
+    async def validate_and_cleanup_stale_connections(
+        self, batch_size: Optional[int] = None
+    ) -> Dict[str, int]:
         """
-        Validate connection states and cleanup stale connections.
+        Incrementally validate connection states and cleanup stale connections.
+
+        Each call checks at most ``batch_size`` connections (default
+        ``sweep_batch_size``) in round-robin order, so a periodic sweep costs
+        O(batch) rather than O(connections) and never blocks the registry.
 
         Returns:
             Dict with cleanup statistics
         """
-        async with self._lock:
-            stale_conn_ids = []
-            for conn_id, conn in self._conns.items():
-                # Check if WebSocket is still connected
-                if (
-                    conn.ws.client_state != WebSocketState.CONNECTED
-                    or conn.ws.application_state != WebSocketState.CONNECTED
-                ):
-                    stale_conn_ids.append(conn_id)
-
-            # Remove stale connections
-            for conn_id in stale_conn_ids:
-                await self._cleanup_connection_unsafe(conn_id)
-
-            return {
-                "removed_stale": len(stale_conn_ids),
-                "active_connections": len(self._conns),
-                "max_connections": self.max_connections if self.enable_limits else None,
-            }
-
-    async def _cleanup_connection_unsafe(self, connection_id: str) -> None:
-        """Internal cleanup without lock (assumes lock is held)."""
-        conn = self._conns.pop(connection_id, None)
-        if not conn:
-            return
-
-        # Cleanup handler if present
-        if conn.meta.handler:
-            try:
-                if hasattr(conn.meta.handler, "stop") and callable(
-                    conn.meta.handler.stop
-                ):
-                    await conn.meta.handler.stop()
-            except Exception as e:
-                logger.error(
-                    f"Error stopping handler: {e}", extra={"conn_id": connection_id}
-                )
-
-        # Remove from indexes
-        if conn.meta.session_id:
-            self._by_session.get(conn.meta.session_id, set()).discard(connection_id)
-        if conn.meta.call_id:
-            self._by_call.get(conn.meta.call_id, set()).discard(connection_id)
-        for topic in conn.meta.topics:
-            self._by_topic.get(topic, set()).discard(connection_id)
+        budget = min(batch_size or self.sweep_batch_size, len(self._sweep_order))
+        stale_conn_ids = []
+        checked = 0
+        for _ in range(budget):
+            conn_id = next(iter(self._sweep_order))
+            self._sweep_order.move_to_end(conn_id)
+            conn = self._conns[conn_id]
+            checked += 1
+            if (
+                conn.ws.client_state != WebSocketState.CONNECTED
+                or conn.ws.application_state != WebSocketState.CONNECTED
+            ):
+                stale_conn_ids.append(conn_id)
+
+        for conn_id in stale_conn_ids:
+            await self.unregister(conn_id)
 
-        await conn.close()
+        return {
+            "checked": checked,
+            "removed_stale": len(stale_conn_ids),
+            "active_connections": len(self._conns),
+            "max_connections": self.max_connections if self.enable_limits else None,
+        }
 
     # Handler management - Direct, no legacy wrappers
     async def attach_handler(self, connection_id: str, handler: Any) -> bool:
         """Attach handler directly to connection."""
-        async with self._lock:
-            conn = self._conns.get(connection_id)
-            if conn:
-                conn.meta.handler = handler
-                return True
+        conn = self._conns.get(connection_id)
+        if conn:
+            conn.meta.handler = handler
+            return True
         return False
 
     async def get_handler_by_call_id(self, call_id: str) -> Optional[Any]:
-        """Get handler for a call_id - direct access."""
-        async with self._lock:
-            conn_ids = self._by_call.get(call_id, set())
-            for conn_id in conn_ids:
-                conn = self._conns.get(conn_id)
-                if conn and conn.meta.handler:
-                    return conn.meta.handler
+        """
+        Get handler for a call_id - direct access.
+
+        Handlers are process-local; in distributed mode a miss is logged with
+        the owning node so misrouted requests are easy to spot.
+        """
+        conn_ids = self._by_call.get(call_id)
+        for conn_id in conn_ids:
+            conn = self._conns.get(conn_id)
+            if conn and conn.meta.handler:
+                return conn.meta.handler
+        if self._bus is not None:
+            owner = await self._bus.owner_of("call", call_id)
+            if owner and owner != self._bus.node_id:
+                logger.info(
+                    f"Handler for call {call_id} lives on node {owner}",
+                    extra={"call_id": call_id, "owner_node": owner},
+                )
         return None
 
     async def get_handler_by_connection_id(self, connection_id: str) -> Optional[Any]:
         """Get handler for a connection_id - direct access."""
-        async with self._lock:
-            conn = self._conns.get(connection_id)
-            return conn.meta.handler if conn else None
+        conn = self._conns.get(connection_id)
+        return conn.meta.handler if conn else None
 
     # Enhanced Session-Specific Broadcasting for Frontend Data Isolation
     async def get_session_data(self, session_id: str) -> Dict[str, Any]:
@@ -756,35 +899,34 @@ class ThreadSafeConnectionManager:
 
         Frontend can call this to get only data from their session.
         """
-        async with self._lock:
-            conn_ids = self._by_session.get(session_id, set())
-            connections = []
-
-            for conn_id in conn_ids:
-                conn = self._conns.get(conn_id)
-                if conn:
-                    connections.append(
-                        {
-                            "connection_id": conn_id,
-                            "client_type": conn.meta.client_type,
-                            "call_id": conn.meta.call_id,
-                            "user_id": conn.meta.user_id,
-                            "topics": list(conn.meta.topics),
-                            "created_at": conn.meta.created_at,
-                            "connected": (
-                                conn.ws.client_state == WebSocketState.CONNECTED
-                                and conn.ws.application_state
-                                == WebSocketState.CONNECTED
-                            ),
-                        }
-                    )
+        conn_ids = self._by_session.get(session_id)
+        connections = []
 
-            return {
-                "session_id": session_id,
-                "connections": connections,
-                "connection_count": len(connections),
-                "active_connections": sum(1 for c in connections if c["connected"]),
-            }
+        for conn_id in conn_ids:
+            conn = self._conns.get(conn_id)
+            if conn:
+                connections.append(
+                    {
+                        "connection_id": conn_id,
+                        "client_type": conn.meta.client_type,
+                        "call_id": conn.meta.call_id,
+                        "user_id": conn.meta.user_id,
+                        "topics": list(conn.meta.topics),
+                        "created_at": conn.meta.created_at,
+                        "connected": (
+                            conn.ws.client_state == WebSocketState.CONNECTED
+                            and conn.ws.application_state
+                            == WebSocketState.CONNECTED
+                        ),
+                    }
+                )
+
+        return {
+            "session_id": session_id,
+            "connections": connections,
+            "connection_count": len(connections),
+            "active_connections": sum(1 for c in connections if c["connected"]),
+        }
 
     async def broadcast_session_with_metadata(
         self, session_id: str, payload: Dict[str, Any], include_metadata: bool = True
@@ -794,9 +936,7 @@ class ThreadSafeConnectionManager:
 
         Returns detailed broadcast results for frontend consumption.
         """
-        async with self._lock:
-            conn_ids = list(self._by_session.get(session_id, set()))
-            targets = [self._conns[i] for i in conn_ids if i in self._conns]
+        targets = self._targets(self._by_session.get(session_id))
 
         sent = 0
         failed = 0
@@ -833,6 +973,8 @@ class ThreadSafeConnectionManager:
                         }
                     )
 
+        await self._publish("session", session_id, payload)
+
         return {
             "session_id": session_id,
             "sent": sent,
@@ -0,0 +1,280 @@
+"""
+Workload-isolated thread pools.
+
+Blocking work is split into named, separately sized executors so a burst in
+one subsystem (e.g. slow Redis calls) cannot starve another (e.g. audio
+writes into the Speech SDK):
+
+- ``speech-io``     – Speech SDK push-stream writes and recognizer control
+- ``tts-synthesis`` – blocking TTS synthesis calls
+- ``storage``       – Redis, Cosmos DB and Blob I/O
+- ``misc``          – ACS call automation, client construction, everything else
+
+Executors are created once per process (normally in the FastAPI lifespan)
+via :func:`configure_workload_executors`.  Call sites use
+:func:`run_in_workload`, which falls back to the loop's default executor when
+the pools have not been configured (scripts, unit tests).
+
+Each executor records queue time (submit → start) as an OpenTelemetry
+histogram and exposes utilization as an observable gauge.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from typing import Any, Callable, Dict, Mapping, Optional, TypeVar, Union
+
+from opentelemetry import metrics
+
+from utils.ml_logging import get_logger
+
+logger = get_logger("pools.executors")
+
+T = TypeVar("T")
+
+
+class Workload(str, Enum):
+    """Names of the isolated executor pools."""
+
+    SPEECH_IO = "speech-io"
+    TTS_SYNTHESIS = "tts-synthesis"
+    STORAGE = "storage"
+    MISC = "misc"
+
+
+DEFAULT_WORKLOAD_SIZES: Dict[Workload, int] = {
+    Workload.SPEECH_IO: 32,
+    Workload.TTS_SYNTHESIS: 16,
+    Workload.STORAGE: 16,
+    Workload.MISC: 8,
+}
+
+_meter = metrics.get_meter("rtagent.executors")
+_queue_time_ms = _meter.create_histogram(
+    "rtagent.executor.queue_time",
+    unit="ms",
+    description="Time a work item waited for a worker thread",
+)
+
+
+class WorkloadExecutor(ThreadPoolExecutor):
+    """``ThreadPoolExecutor`` that tracks queue time and utilization."""
+
+    def __init__(self, workload: Workload, max_workers: int) -> None:
+        super().__init__(max_workers=max_workers, thread_name_prefix=f"wl-{workload.value}")
+        self.workload = workload
+        self._stats_lock = threading.Lock()
+        self._pending = 0
+        self._active = 0
+        self._completed = 0
+        self._queue_ms_total = 0.0
+        self._queue_ms_max = 0.0
+        self._attributes = {"workload": workload.value}
+
+    def submit(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any):
+        enqueued_at = time.perf_counter()
+        with self._stats_lock:
+            self._pending += 1
+
+        def _tracked() -> T:
+            queue_ms = (time.perf_counter() - enqueued_at) * 1000
+            with self._stats_lock:
+                self._pending -= 1
+                self._active += 1
+                self._queue_ms_total += queue_ms
+                if queue_ms > self._queue_ms_max:
+                    self._queue_ms_max = queue_ms
+            _queue_time_ms.record(queue_ms, self._attributes)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self._stats_lock:
+                    self._active -= 1
+                    self._completed += 1
+
+        try:
+            return super().submit(_tracked)
+        except Exception:
+            with self._stats_lock:
+                self._pending -= 1
+            raise
+
+    @property
+    def utilization(self) -> float:
+        return self._active / self._max_workers if self._max_workers else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            completed = self._completed
+            return {
+                "max_workers": self._max_workers,
+                "active": self._active,
+                "queued": self._pending,
+                "completed": completed,
+                "utilization": round(self.utilization, 3),
+                "avg_queue_ms": round(self._queue_ms_total / completed, 3) if completed else 0.0,
+                "max_queue_ms": round(self._queue_ms_max, 3),
+            }
+
+
+_executors: Dict[Workload, WorkloadExecutor] = {}
+
+
+def _observe_utilization(_options):
+    return [
+        metrics.Observation(executor.utilization, {"workload": workload.value})
+        for workload, executor in list(_executors.items())
+    ]
+
+
+_meter.create_observable_gauge(
+    "rtagent.executor.utilization",
+    callbacks=[_observe_utilization],
+    description="Busy workers divided by pool size per workload executor",
+)
+
+
+def configure_workload_executors(
+    sizes: Optional[Mapping[Union[Workload, str], int]] = None,
+) -> Dict[Workload, WorkloadExecutor]:
+    """
+    Create the process-wide workload executors (idempotent).
+
+    :param sizes: Optional per-workload worker counts overriding
+        :data:`DEFAULT_WORKLOAD_SIZES`.
+    :return: Mapping of workload to executor.
+    """
+    resolved = dict(DEFAULT_WORKLOAD_SIZES)
+    for name, size in (sizes or {}).items():
+        resolved[Workload(name)] = max(int(size), 1)
+
+    for workload, size in resolved.items():
+        if workload not in _executors:
+            _executors[workload] = WorkloadExecutor(workload, size)
+
+    logger.info(
+        "workload executors ready",
+        extra={"sizes": {w.value: e._max_workers for w, e in _executors.items()}},
+    )
+    return dict(_executors)
+
+
+def get_workload_executor(workload: Union[Workload, str]) -> Optional[WorkloadExecutor]:
+    """Return the executor for ``workload`` or ``None`` if not configured."""
+    return _executors.get(Workload(workload))
+
+
+def workload_stats() -> Dict[str, Dict[str, Any]]:
+    """Per-workload occupancy and queue-time summary."""
+    return {workload.value: executor.stats() for workload, executor in _executors.items()}
+
+
+async def run_in_workload(
+    workload: Union[Workload, str],
+    func: Callable[..., T],
+    /,
+    *args: Any,
+    **kwargs: Any,
+) -> T:
+    """
+    Run ``func`` on the workload's executor without blocking the event loop.
+
+    Context variables (including the active OpenTelemetry span) are copied
+    into the worker, matching :func:`asyncio.to_thread`.
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, func, *args, **kwargs)
+    return await loop.run_in_executor(get_workload_executor(workload), call)
+
+
+class OrderedWorkloadWriter:
+    """
+    Feeds ``func`` from a bounded queue drained by a single task.
+
+    Each call still runs on the workload's executor, but never more than one
+    at a time, so items reach ``func`` in submission order - unlike
+    independent :func:`run_in_workload` calls, which race for pool threads.
+    :meth:`submit` never blocks; when the queue is full the new item is
+    dropped and counted. Must be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        workload: Union[Workload, str],
+        func: Callable[[Any], Any],
+        *,
+        maxsize: int = 50,
+        name: str = "writer",
+    ) -> None:
+        self.workload = Workload(workload)
+        self.func = func
+        self.name = name
+        self._queue: "asyncio.Queue[Any]" = asyncio.Queue(maxsize)
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+        self.written = 0
+        self.dropped = 0
+        self.errors = 0
+
+    def submit(self, item: Any) -> bool:
+        """Queue ``item``; returns False if the writer is closed or full."""
+        if self._closed:
+            return False
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._drain())
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            return False
+        return True
+
+    async def close(self, timeout: float = 1.0) -> None:
+        """Write what is queued (up to ``timeout``), then stop the drain task."""
+        self._closed = True
+        task, self._task = self._task, None
+        if task is None:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("%s: closed with %d items unwritten", self.name, self._queue.qsize())
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "written": self.written,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "queued": self._queue.qsize(),
+        }
+
+    async def _drain(self) -> None:
+        while True:
+            item = await self._queue.get()
+            try:
+                await run_in_workload(self.workload, self.func, item)
+                self.written += 1
+            except Exception as exc:
+                self.errors += 1
+                logger.error("%s: write failed: %s", self.name, exc)
+            finally:
+                self._queue.task_done()
+
+
+def shutdown_workload_executors(wait: bool = False) -> None:
+    """Shut down all workload executors; queued work is cancelled."""
+    for executor in _executors.values():
+        executor.shutdown(wait=wait, cancel_futures=True)
+    _executors.clear()
@@ -6,14 +6,20 @@ to prevent race conditions during concurrent session add/remove operations.
 """
 
 import asyncio
+import heapq
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from fastapi import WebSocket
 
 from utils.ml_logging import get_logger
 
+from .striped import LockStripes
+
+if TYPE_CHECKING:
+    from src.redis.session_bus import RedisSessionBus
+
 logger = get_logger(__name__)
 
 
@@ -84,13 +90,28 @@ class ThreadSafeSessionManager:
     """
     Thread-safe manager for active conversation sessions.
 
-    Uses asyncio.Lock to protect concurrent access to session tracking,
-    preventing race conditions during concurrent session management.
+    Writes take a lock stripe chosen by session id, so concurrent add/remove
+    of different sessions rarely contend; reads are lock-free dictionary
+    lookups. Stale-session cleanup pops from a start-time heap and costs
+    O(expired) instead of scanning every session. When a session bus is
+    attached, ownership of each session is also recorded in Redis so other
+    workers can tell which node serves it.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        bus: Optional["RedisSessionBus"] = None,
+        lock_stripes: int = 16,
+    ):
         self._sessions: Dict[str, SessionContext] = {}
-        self._lock = asyncio.Lock()
+        self._stripes = LockStripes(lock_stripes)
+        # (start timestamp, session_id); entries for removed sessions are skipped lazily
+        self._expiry: List[Tuple[float, str]] = []
+        self._bus = bus
+
+    def attach_bus(self, bus: "RedisSessionBus") -> None:
+        """Record session ownership in Redis for multi-worker deployments."""
+        self._bus = bus
 
     async def add_session(
         self,
@@ -118,17 +139,25 @@ class ThreadSafeSessionManager:
         if metadata:
             context._metadata.update(metadata)
 
-        async with self._lock:
+        async with self._stripes.for_key(session_id):
+            if self._sessions.get(session_id) is not context:
+                heapq.heappush(
+                    self._expiry, (context.start_time.timestamp(), session_id)
+                )
             self._sessions[session_id] = context
+            self._compact_expiry()
             logger.info(
                 "Added conversation session %s. Total sessions: %s",
                 session_id,
                 len(self._sessions),
             )
 
+        if self._bus is not None:
+            await self._bus.claim("session", session_id)
+
     async def remove_session(self, session_id: str) -> bool:
         """Remove a conversation session thread-safely. Returns True if removed."""
-        async with self._lock:
+        async with self._stripes.for_key(session_id):
             context = self._sessions.pop(session_id, None)
             if context:
                 try:
@@ -141,8 +170,25 @@ class ThreadSafeSessionManager:
                     session_id,
                     len(self._sessions),
                 )
-                return True
-            return False
+            else:
+                return False
+
+        if self._bus is not None:
+            await self._bus.release("session", session_id)
+        return True
+
+    async def get_session_owner(self, session_id: str) -> Optional[str]:
+        """
+        Return the node id serving ``session_id``.
+
+        Local sessions resolve without Redis. Without a bus, unknown sessions
+        return None.
+        """
+        if session_id in self._sessions:
+            return self._bus.node_id if self._bus else "local"
+        if self._bus is None:
+            return None
+        return await self._bus.owner_of("session", session_id)
 
     async def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Get session data thread-safely. Deprecated: prefer get_session_context."""
@@ -158,18 +204,15 @@ class ThreadSafeSessionManager:
 
     async def get_session_context(self, session_id: str) -> Optional[SessionContext]:
         """Return the SessionContext for an active session."""
-        async with self._lock:
-            return self._sessions.get(session_id)
+        return self._sessions.get(session_id)
 
     async def get_session_count(self) -> int:
         """Get current session count thread-safely."""
-        async with self._lock:
-            return len(self._sessions)
+        return len(self._sessions)
 
     async def get_all_sessions_snapshot(self) -> Dict[str, Dict[str, Any]]:
         """Get a thread-safe snapshot of all sessions."""
-        async with self._lock:
-            sessions = list(self._sessions.items())
+        sessions = list(self._sessions.items())
 
         snapshot: Dict[str, Dict[str, Any]] = {}
         for session_id, context in sessions:
@@ -182,29 +225,41 @@ class ThreadSafeSessionManager:
 
     async def cleanup_stale_sessions(self, max_age_hours: int = 24) -> int:
         """Remove sessions older than max_age_hours and return count of removed sessions."""
-        removed_count = 0
-        cutoff_time = datetime.now() - timedelta(hours=max_age_hours)
-
-        async with self._lock:
-            stale_sessions = [
-                session_id
-                for session_id, session_context in self._sessions.items()
-                if session_context.start_time < cutoff_time
-            ]
+        cutoff = (datetime.now() - timedelta(hours=max_age_hours)).timestamp()
+        stale_sessions = []
+
+        while self._expiry and self._expiry[0][0] < cutoff:
+            started_at, session_id = heapq.heappop(self._expiry)
+            async with self._stripes.for_key(session_id):
+                context = self._sessions.get(session_id)
+                if context and context.start_time.timestamp() == started_at:
+                    del self._sessions[session_id]
+                    stale_sessions.append(session_id)
+
+        removed_count = len(stale_sessions)
+        if removed_count > 0:
+            logger.info(
+                "🧹 Cleaned up %s stale sessions. Remaining: %s",
+                removed_count,
+                len(self._sessions),
+            )
 
+        if self._bus is not None:
             for session_id in stale_sessions:
-                del self._sessions[session_id]
-                removed_count += 1
-
-            if removed_count > 0:
-                logger.info(
-                    "🧹 Cleaned up %s stale sessions. Remaining: %s",
-                    removed_count,
-                    len(self._sessions),
-                )
+                await self._bus.release("session", session_id)
 
         return removed_count
 
+    def _compact_expiry(self) -> None:
+        """Drop heap entries for removed sessions once they dominate the heap."""
+        if len(self._expiry) <= 2 * len(self._sessions) + 64:
+            return
+        self._expiry = [
+            (context.start_time.timestamp(), session_id)
+            for session_id, context in self._sessions.items()
+        ]
+        heapq.heapify(self._expiry)
+
     async def get_metadata(self, session_id: str, key: str, default: Any = None) -> Any:
         """Fetch a metadata value for a session if it exists."""
         context = await self.get_session_context(session_id)
@@ -0,0 +1,77 @@
+"""
+Concurrency primitives for the connection and session registries.
+
+``CopyOnWriteIndex`` maps a key to an immutable ``frozenset`` of ids. Writers
+replace the set instead of mutating it, so readers can iterate what they
+fetched while other coroutines register or unregister. No lock is needed.
+
+``LockStripes`` is a fixed pool of ``asyncio.Lock`` objects picked by key hash.
+Writes for different keys rarely share a lock, and a slow write only stalls
+keys on its own stripe.
+"""
+
+import asyncio
+from typing import Dict, FrozenSet, Hashable, Iterator, Tuple
+
+_EMPTY: FrozenSet[str] = frozenset()
+
+
+class CopyOnWriteIndex:
+    """Key → frozenset of ids; values are immutable snapshots."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self) -> None:
+        self._data: Dict[str, FrozenSet[str]] = {}
+
+    def get(self, key: str) -> FrozenSet[str]:
+        return self._data.get(key, _EMPTY)
+
+    def add(self, key: str, item: str) -> None:
+        self._data[key] = self._data.get(key, _EMPTY) | {item}
+
+    def discard(self, key: str, item: str) -> None:
+        current = self._data.get(key)
+        if current is None or item not in current:
+            return
+        remaining = current - {item}
+        if remaining:
+            self._data[key] = remaining
+        else:
+            del self._data[key]
+
+    def counts(self) -> Dict[str, int]:
+        return {key: len(items) for key, items in self._data.items()}
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class LockStripes:
+    """Fixed set of asyncio locks selected by key hash."""
+
+    __slots__ = ("_locks",)
+
+    def __init__(self, stripes: int = 16) -> None:
+        self._locks: Tuple[asyncio.Lock, ...] = tuple(
+            asyncio.Lock() for _ in range(max(stripes, 1))
+        )
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+    def for_key(self, key: Hashable) -> asyncio.Lock:
+        return self._locks[hash(key) % len(self._locks)]
+
+    def held(self) -> int:
+        """Number of stripes currently locked (a contention indicator)."""
+        return sum(1 for lock in self._locks if lock.locked())
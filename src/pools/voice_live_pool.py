@@ -7,20 +7,28 @@ can start streaming immediately with near-zero connect latency.
 
 Design goals:
 - Simple, reliable, and maintainable
-- Non-blocking fast-path allocation from a warm queue
-- Safe default: single-use agents (closed on release) with background refill
-  to avoid cross-session state contamination
+- Non-blocking fast-path allocation from a warm bucket
+- Released agents are reset (response cancelled, conversation items deleted,
+  session re-configured) and returned to the pool instead of reconnecting;
+  an agent that fails its reset, health ping, max age or max uses is closed
+  and replaced in the background
+- Agents are bucketed by configuration (model, voice, agent binding) so a
+  reused connection always matches what the caller asked for
+- Agents parked for a call before its media WebSocket exists carry a lease
+  TTL; a lease nobody claims in time is reaped and recycled
 """
 
 from __future__ import annotations
 
 import asyncio
+import itertools
 import os
 import time
-import uuid
-from dataclasses import dataclass
-from typing import Optional, Tuple, Dict, Any
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Optional, Set, Tuple
 
+from src.pools.executors import Workload, run_in_workload
 from utils.ml_logging import get_logger
 from apps.rtagent.backend.src.agents.Lvagent.base import AzureLiveVoiceAgent
 from apps.rtagent.backend.src.agents.Lvagent.factory import build_lva_from_yaml
@@ -39,6 +47,18 @@ VOICE_LIVE_AGENT_YAML = os.getenv(
     "VOICE_LIVE_AGENT_YAML",
     "apps/rtagent/backend/src/agents/Lvagent/agent_store/auth_agent.yaml",
 )
+VOICE_LIVE_POOL_REUSE_ENABLED = (
+    os.getenv("VOICE_LIVE_POOL_REUSE_ENABLED", "true").lower() == "true"
+)
+# Recycle connections before the agent access token in the URL goes stale.
+VOICE_LIVE_AGENT_MAX_AGE_S = float(os.getenv("VOICE_LIVE_AGENT_MAX_AGE_S", "1800"))
+VOICE_LIVE_AGENT_MAX_USES = int(os.getenv("VOICE_LIVE_AGENT_MAX_USES", "20"))
+VOICE_LIVE_HEALTH_INTERVAL_S = float(os.getenv("VOICE_LIVE_HEALTH_INTERVAL_S", "15"))
+VOICE_LIVE_RESET_TIMEOUT_S = float(os.getenv("VOICE_LIVE_RESET_TIMEOUT_S", "3"))
+# How long an agent parked for a call may wait for its media WebSocket.
+VOICE_LIVE_LEASE_TTL_S = float(os.getenv("VOICE_LIVE_LEASE_TTL_S", "60"))
+
+PoolKey = Tuple[Any, ...]
 
 
 @dataclass
@@ -48,16 +68,33 @@ class VoiceAgentLease:
     allocated_at: float
 
 
+@dataclass
+class _PooledAgent:
+    agent: AzureLiveVoiceAgent
+    key: PoolKey
+    created_at: float = field(default_factory=time.monotonic)
+    uses: int = 0
+    lease_id: Optional[str] = None
+    # Set while parked for a call and not yet claimed by its media WebSocket.
+    lease_expires_at: Optional[float] = None
+
+    @property
+    def age_s(self) -> float:
+        return time.monotonic() - self.created_at
+
+
 class VoiceLiveAgentPool:
     """
     Warm pool of pre-connected Azure Live Voice agents.
 
     Allocation strategy:
-    1) Try warm queue (immediate)
+    1) Try the warm bucket for the requested configuration (immediate)
     2) Fall back to on-demand connect (cold)
 
-    Release strategy (safe default):
-    - Close the agent to avoid cross-session state, then refill warm pool in background
+    Release strategy:
+    - Reset the agent in the background and return it to its bucket; close it
+      instead when reuse is disabled, the reset fails, or it reached max age
+      or max uses (the default bucket is then refilled)
     """
 
     def __init__(
@@ -67,6 +104,11 @@ class VoiceLiveAgentPool:
         agent_yaml: str | None = None,
         enable_prewarming: bool | None = None,
         prewarming_batch_size: int | None = None,
+        enable_reuse: bool | None = None,
+        max_age_s: float | None = None,
+        max_uses: int | None = None,
+        health_interval_s: float | None = None,
+        lease_ttl_s: float | None = None,
     ) -> None:
         self._warm_pool_size = warm_pool_size or VOICE_LIVE_POOL_SIZE
         self._agent_yaml = agent_yaml or VOICE_LIVE_AGENT_YAML
@@ -78,10 +120,21 @@ class VoiceLiveAgentPool:
         self._prewarming_batch_size = (
             prewarming_batch_size or VOICE_LIVE_PREWARMING_BATCH_SIZE
         )
-
-        self._warm_pool: asyncio.Queue[AzureLiveVoiceAgent] = asyncio.Queue(
-            maxsize=self._warm_pool_size
+        self._enable_reuse = (
+            VOICE_LIVE_POOL_REUSE_ENABLED if enable_reuse is None else enable_reuse
         )
+        self._max_age_s = max_age_s or VOICE_LIVE_AGENT_MAX_AGE_S
+        self._max_uses = max_uses or VOICE_LIVE_AGENT_MAX_USES
+        self._health_interval_s = health_interval_s or VOICE_LIVE_HEALTH_INTERVAL_S
+        self._lease_ttl_s = lease_ttl_s or VOICE_LIVE_LEASE_TTL_S
+        self._lease_ids = itertools.count(1)
+
+        # Idle agents per configuration; agents on lease by id(agent).
+        self._buckets: Dict[PoolKey, Deque[_PooledAgent]] = {}
+        self._leased: Dict[int, _PooledAgent] = {}
+        # Learned from the first agent built from each YAML.
+        self._yaml_keys: Dict[str, PoolKey] = {}
+        self._background: Set[asyncio.Task] = set()
 
         self._allocation_lock = asyncio.Lock()
         self._is_initialized = False
@@ -90,6 +143,15 @@ class VoiceLiveAgentPool:
         self._prewarming_task: Optional[asyncio.Task] = None
         self._metrics: Dict[str, Any] = {
             "allocations": {"warm": 0, "cold": 0},
+            "reuses": 0,
+            "recycled": {
+                "max_age": 0,
+                "max_uses": 0,
+                "reset_failed": 0,
+                "unhealthy": 0,
+                "surplus": 0,
+            },
+            "leases_expired": 0,
             "pool": {"capacity": self._warm_pool_size},
             "last_updated": 0.0,
         }
@@ -99,13 +161,13 @@ class VoiceLiveAgentPool:
             return
 
         logger.info(
-            f"Initializing Voice Live pool | size={self._warm_pool_size}, prewarm={self._enable_prewarming}"
+            f"Initializing Voice Live pool | size={self._warm_pool_size}, prewarm={self._enable_prewarming}, reuse={self._enable_reuse}"
         )
 
         if self._enable_prewarming:
             if background_prewarm:
                 # Don't block startup; run the initial prewarm asynchronously
-                asyncio.create_task(self._prewarm_initial())
+                self._spawn(self._prewarm_initial())
             else:
                 await self._prewarm_initial()
 
@@ -114,38 +176,83 @@ class VoiceLiveAgentPool:
         self._metrics["last_updated"] = time.time()
         logger.info("✅ Voice Live pool initialized")
 
-    async def get_agent(self) -> Tuple[AzureLiveVoiceAgent, str]:
+    async def get_agent(
+        self, agent_yaml: str | None = None
+    ) -> Tuple[AzureLiveVoiceAgent, str]:
         """Get a connected agent. Returns (agent, tier) where tier is 'warm' or 'cold'."""
+        agent_yaml = agent_yaml or self._agent_yaml
         async with self._allocation_lock:
-            try:
-                agent = self._warm_pool.get_nowait()
+            bucket = self._buckets.get(self._yaml_keys.get(agent_yaml), ())
+            while bucket:
+                pooled = bucket.popleft()
+                if pooled.age_s >= self._max_age_s or not pooled.agent.is_connected:
+                    self._retire(pooled, "max_age" if pooled.age_s >= self._max_age_s else "unhealthy")
+                    continue
+                self._leased[id(pooled.agent)] = pooled
                 self._metrics["allocations"]["warm"] += 1
                 self._metrics["last_updated"] = time.time()
-                return agent, "warm"
-            except asyncio.QueueEmpty:
-                pass
+                return pooled.agent, "warm"
 
         # Cold path: connect on-demand (no lock held)
-        agent = await self._create_connected_agent()
+        pooled = await self._create_connected_agent(agent_yaml)
+        self._leased[id(pooled.agent)] = pooled
         self._metrics["allocations"]["cold"] += 1
         self._metrics["last_updated"] = time.time()
-        return agent, "cold"
+        return pooled.agent, "cold"
 
-    async def release_agent(self, agent: AzureLiveVoiceAgent) -> None:
+    async def park_agent(self, agent_yaml: str | None = None) -> VoiceAgentLease:
         """
-        Release agent after use. Safe default is to close and replenish.
+        Lease an agent for a call whose media WebSocket does not exist yet.
 
-        We intentionally avoid reusing the same connection across sessions to prevent
-        cross-session state bleed. Instead, close and create a fresh warm agent in
-        the background to maintain pool capacity.
+        The lease must be claimed with :meth:`claim_lease` within the lease
+        TTL; otherwise the health loop reaps it and the agent is recycled.
         """
-        try:
-            await asyncio.to_thread(agent.close)
-        except Exception as e:
-            logger.debug(f"Agent close failed (ignored): {e}")
+        agent, _ = await self.get_agent(agent_yaml)
+        pooled = self._leased[id(agent)]
+        pooled.lease_id = f"lva-{next(self._lease_ids)}"
+        pooled.lease_expires_at = time.monotonic() + self._lease_ttl_s
+        return VoiceAgentLease(agent=agent, lease_id=pooled.lease_id, allocated_at=time.time())
+
+    def claim_lease(self, lease: VoiceAgentLease) -> Optional[AzureLiveVoiceAgent]:
+        """Take over a parked agent; ``None`` if its lease was already reaped."""
+        pooled = self._leased.get(id(lease.agent))
+        if pooled is None or pooled.lease_id != lease.lease_id:
+            return None
+        pooled.lease_expires_at = None
+        return pooled.agent
+
+    async def release_agent(self, agent: AzureLiveVoiceAgent) -> None:
+        """
+        Release agent after use.
 
-        # Refill warm pool in background
-        asyncio.create_task(self._create_and_add_warm_agent(tag="refill-release"))
+        Returns immediately; the reset (or close and refill) runs in the
+        background so call teardown never waits on the service.
+        """
+        pooled = self._leased.pop(id(agent), None)
+        if pooled is None:
+            # Agent connected outside the pool (e.g. pre-initialised per call).
+            pooled = _PooledAgent(agent=agent, key=agent.pool_key)
+        pooled.uses += 1
+        pooled.lease_id = pooled.lease_expires_at = None
+        self._spawn(self._recycle(pooled))
+
+    def reap_expired_leases(self) -> int:
+        """Recycle parked agents whose media WebSocket never claimed them."""
+        now = time.monotonic()
+        expired = [
+            pooled
+            for pooled in self._leased.values()
+            if pooled.lease_expires_at is not None and pooled.lease_expires_at <= now
+        ]
+        for pooled in expired:
+            logger.warning(
+                "Voice Live lease %s expired unclaimed; recycling agent", pooled.lease_id
+            )
+            self._metrics["leases_expired"] += 1
+            self._leased.pop(id(pooled.agent), None)
+            pooled.lease_id = pooled.lease_expires_at = None
+            self._spawn(self._recycle(pooled))
+        return len(expired)
 
     async def shutdown(self) -> None:
         if self._is_shutting_down:
@@ -159,31 +266,93 @@ class VoiceLiveAgentPool:
                 await self._prewarming_task
             except asyncio.CancelledError:
                 pass
+        for task in list(self._background):
+            task.cancel()
+        await asyncio.gather(*self._background, return_exceptions=True)
 
         # Drain and close any warm agents
-        while not self._warm_pool.empty():
+        idle = [pooled for bucket in self._buckets.values() for pooled in bucket]
+        self._buckets.clear()
+        for pooled in idle:
             try:
-                agent = self._warm_pool.get_nowait()
-            except asyncio.QueueEmpty:
-                break
-            try:
-                await asyncio.to_thread(agent.close)
+                await pooled.agent.close_async()
             except Exception:
                 pass
 
         logger.info("✅ Voice Live pool shutdown complete")
 
     # ---------------------------- internals ---------------------------- #
-    async def _create_connected_agent(self) -> AzureLiveVoiceAgent:
-        agent = build_lva_from_yaml(self._agent_yaml, enable_audio_io=False)
-        await asyncio.to_thread(agent.connect)
+    def _spawn(self, coro) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+        return task
+
+    def _warm_count(self, key: Optional[PoolKey]) -> int:
+        return len(self._buckets.get(key, ())) if key is not None else 0
+
+    def _add_warm(self, pooled: _PooledAgent) -> bool:
+        bucket = self._buckets.setdefault(pooled.key, deque())
+        if self._is_shutting_down or len(bucket) >= self._warm_pool_size:
+            return False
+        bucket.append(pooled)
+        return True
+
+    def _retire(self, pooled: _PooledAgent, reason: str) -> None:
+        self._metrics["recycled"][reason] += 1
+        logger.debug(
+            "Retiring Voice Live agent (%s, age=%.0fs, uses=%d)", reason, pooled.age_s, pooled.uses
+        )
+        self._spawn(pooled.agent.close_async())
+
+    async def _recycle(self, pooled: _PooledAgent) -> None:
+        reason = None
+        if not self._enable_reuse or self._is_shutting_down:
+            reason = None
+        elif pooled.uses >= self._max_uses:
+            reason = "max_uses"
+        elif pooled.age_s >= self._max_age_s:
+            reason = "max_age"
+        elif await pooled.agent.reset_async(timeout_s=VOICE_LIVE_RESET_TIMEOUT_S):
+            if self._add_warm(pooled):
+                self._metrics["reuses"] += 1
+                self._metrics["last_updated"] = time.time()
+                return
+            reason = "surplus"
+        else:
+            reason = "reset_failed"
+
+        if reason is not None:
+            self._retire(pooled, reason)
+        else:
+            try:
+                await pooled.agent.close_async()
+            except Exception as e:
+                logger.debug(f"Agent close failed (ignored): {e}")
+        # Keep the default bucket full
+        if not self._is_shutting_down:
+            await self._create_and_add_warm_agent(tag="refill-release")
+
+    async def _create_connected_agent(self, agent_yaml: str | None = None) -> _PooledAgent:
+        agent_yaml = agent_yaml or self._agent_yaml
+        # Construction fetches auth tokens (blocking); the socket itself lives
+        # on the event loop, so warm agents don't each hold a thread.
+        agent = await run_in_workload(
+            Workload.MISC, build_lva_from_yaml, agent_yaml, enable_audio_io=False
+        )
+        await agent.connect_async()
+        self._yaml_keys.setdefault(agent_yaml, agent.pool_key)
         logger.debug("Connected new Voice Live agent")
-        return agent
+        return _PooledAgent(agent=agent, key=agent.pool_key)
 
     async def _create_and_add_warm_agent(self, tag: str) -> None:
+        if self._warm_count(self._yaml_keys.get(self._agent_yaml)) >= self._warm_pool_size:
+            return
         try:
-            agent = await self._create_connected_agent()
-            await self._warm_pool.put(agent)
+            pooled = await self._create_connected_agent()
+            if not self._add_warm(pooled):
+                await pooled.agent.close_async()
+                return
             logger.debug(f"Warm agent added (tag={tag})")
         except Exception as e:
             logger.error(f"Failed to add warm agent (tag={tag}): {e}")
@@ -204,27 +373,46 @@ class VoiceLiveAgentPool:
                 await asyncio.sleep(0.1)
 
         logger.info(
-            f"✅ Voice Live pre-warming complete: {self._warm_pool.qsize()}/{self._warm_pool_size} ready"
+            f"✅ Voice Live pre-warming complete: {self._warm_count(self._yaml_keys.get(self._agent_yaml))}/{self._warm_pool_size} ready"
         )
 
+    async def check_health(self) -> None:
+        """Reap unclaimed leases, ping idle agents and retire dead or expired ones."""
+        self.reap_expired_leases()
+        for bucket in self._buckets.values():
+            for pooled in list(bucket):
+                reason = None
+                if pooled.age_s >= self._max_age_s:
+                    reason = "max_age"
+                else:
+                    try:
+                        await pooled.agent.ping_async(timeout_s=5.0)
+                    except Exception:
+                        reason = "unhealthy"
+                if reason is not None and pooled in bucket:
+                    bucket.remove(pooled)
+                    self._retire(pooled, reason)
+
     async def _prewarming_loop(self) -> None:
         while not self._is_shutting_down:
             try:
-                size = self._warm_pool.qsize()
-                deficit = self._warm_pool_size - size
-                if deficit > 0:
-                    logger.debug(
-                        f"Replenishing Voice Live warm pool: {size}/{self._warm_pool_size} (+{deficit})"
-                    )
-                    for i in range(0, deficit, self._prewarming_batch_size):
-                        batch_sz = min(self._prewarming_batch_size, deficit - i)
-                        batch = [
-                            self._create_and_add_warm_agent(tag=f"repl-{i+j}")
-                            for j in range(batch_sz)
-                        ]
-                        await asyncio.gather(*batch, return_exceptions=True)
-
-                await asyncio.sleep(30)
+                await self.check_health()
+                if self._enable_prewarming:
+                    size = self._warm_count(self._yaml_keys.get(self._agent_yaml))
+                    deficit = self._warm_pool_size - size
+                    if deficit > 0:
+                        logger.debug(
+                            f"Replenishing Voice Live warm pool: {size}/{self._warm_pool_size} (+{deficit})"
+                        )
+                        for i in range(0, deficit, self._prewarming_batch_size):
+                            batch_sz = min(self._prewarming_batch_size, deficit - i)
+                            batch = [
+                                self._create_and_add_warm_agent(tag=f"repl-{i+j}")
+                                for j in range(batch_sz)
+                            ]
+                            await asyncio.gather(*batch, return_exceptions=True)
+
+                await asyncio.sleep(self._health_interval_s)
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -232,7 +420,12 @@ class VoiceLiveAgentPool:
                 await asyncio.sleep(60)
 
     async def get_metrics(self) -> Dict[str, Any]:
-        self._metrics["pool"]["warm_size"] = self._warm_pool.qsize()
+        self._metrics["pool"]["warm_size"] = sum(len(b) for b in self._buckets.values())
+        self._metrics["pool"]["buckets"] = {
+            "/".join(str(part) for part in key): len(bucket)
+            for key, bucket in self._buckets.items()
+        }
+        self._metrics["pool"]["leased"] = len(self._leased)
         self._metrics["last_updated"] = time.time()
         return self._metrics
 
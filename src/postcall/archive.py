@@ -0,0 +1,236 @@
+"""
+Post-call archival: compact summary in Cosmos, full transcript in Blob.
+
+``build_and_flush`` stores the whole ``histories`` and ``context`` of every
+call in one Cosmos document. Here the call is split instead:
+
+- the full transcript and context go to Blob Storage as a compressed JSON
+  Lines archive (:mod:`src.blob.transcript_archive`);
+- Cosmos keeps a small summary document (ids, agents, message counts,
+  outcome flags, latency summary and per-stage latency sketches) that points
+  at the archive.
+
+Archiving runs on a bounded queue drained by background workers so call
+teardown never waits on storage. Failed steps are retried with exponential
+backoff; the blob upload is not repeated when only the Cosmos write failed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from src.blob import transcript_archive
+from src.pools.executors import Workload, run_in_workload
+from src.postcall.push import latency_summary
+from src.stateful.state_managment import MemoManager
+from src.tools.latency_sketch import summarize_session_sketches
+from utils.ml_logging import get_logger
+
+logger = get_logger("postcall_archive")
+
+# Context keys copied into the summary document.
+OUTCOME_KEYS = (
+    "active_agent",
+    "authenticated",
+    "intent",
+    "escalated",
+    "handoff",
+    "call_direction",
+    "dtmf_validated",
+    "call_disconnected",
+)
+ID_KEYS = ("caller_id", "user_id", "policy_id", "claim_id", "call_connection_id")
+
+
+@dataclass
+class ArchiveJob:
+    session_id: str
+    timestamp: str
+    histories: Dict[str, List[Dict[str, Any]]]
+    context: Dict[str, Any]
+    attempts: int = 0
+    blob: Optional[Dict[str, Any]] = None
+
+
+def snapshot(cm: MemoManager) -> ArchiveJob:
+    """Copy what the archive needs; the session may be torn down afterwards."""
+    return ArchiveJob(
+        session_id=cm.session_id,
+        timestamp=datetime.datetime.utcnow().replace(microsecond=0).isoformat() + "Z",
+        histories={agent: list(messages) for agent, messages in cm.histories.items()},
+        context=dict(cm.context),
+    )
+
+
+def build_summary(job: ArchiveJob) -> Dict[str, Any]:
+    """Compact Cosmos document for an archived session."""
+    context = job.context
+    latency = context.get("latency") or {}
+    sketches = latency.get("sketches") or {}
+    return {
+        "_id": job.session_id,
+        "session_id": job.session_id,
+        "timestamp": job.timestamp,
+        "agents": list(job.histories),
+        "message_counts": {agent: len(msgs) for agent, msgs in job.histories.items()},
+        "ids": {key: context[key] for key in ID_KEYS if context.get(key) is not None},
+        "outcome": {key: context[key] for key in OUTCOME_KEYS if key in context},
+        "latency_summary": latency_summary(context.get("latency_roundtrip", {})),
+        "latency_percentiles": summarize_session_sketches(sketches),
+        "latency_sketches": sketches,
+        "transcript_blob": job.blob,
+    }
+
+
+class PostCallArchiver:
+    """Bounded background archival of finished calls."""
+
+    def __init__(
+        self,
+        blob_helper: Any,
+        cosmos: Any,
+        *,
+        codec: str = transcript_archive.ZSTD,
+        queue_size: int = 256,
+        workers: int = 2,
+        max_attempts: int = 5,
+        retry_base_s: float = 1.0,
+        retry_max_s: float = 60.0,
+    ) -> None:
+        self.blob_helper = blob_helper
+        self.cosmos = cosmos
+        self.codec = transcript_archive.resolve_codec(codec)
+        self.max_attempts = max_attempts
+        self.retry_base_s = retry_base_s
+        self.retry_max_s = retry_max_s
+        self._queue: "asyncio.Queue[ArchiveJob]" = asyncio.Queue(maxsize=queue_size)
+        self._worker_count = workers
+        self._workers: List[asyncio.Task] = []
+        self._retries: set = set()
+
+        self.submitted = 0
+        self.archived = 0
+        self.rejected = 0
+        self.retried = 0
+        self.failed = 0
+        self.archived_bytes = 0
+
+    # ------------------------------------------------------------------ #
+    def start(self) -> "PostCallArchiver":
+        if not self._workers:
+            self._workers = [
+                asyncio.create_task(self._worker(), name=f"postcall-archive-{i}")
+                for i in range(self._worker_count)
+            ]
+            logger.info(f"Post-call archiver started (codec={self.codec})")
+        return self
+
+    async def stop(self, *, drain_timeout_s: float = 10.0) -> None:
+        """Let queued jobs finish (up to ``drain_timeout_s``), then cancel workers."""
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=drain_timeout_s)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Post-call archiver stopped with {self._queue.qsize()} calls unarchived"
+            )
+        for task in [*self._workers, *self._retries]:
+            task.cancel()
+        await asyncio.gather(*self._workers, *self._retries, return_exceptions=True)
+        self._workers = []
+
+    def submit(self, cm: MemoManager) -> bool:
+        """Queue a finished call. Never blocks; returns False when the queue is full."""
+        try:
+            self._queue.put_nowait(snapshot(cm))
+        except asyncio.QueueFull:
+            self.rejected += 1
+            logger.error(f"Post-call archive queue full; session {cm.session_id} not archived")
+            return False
+        self.submitted += 1
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "codec": self.codec,
+            "queued": self._queue.qsize(),
+            "submitted": self.submitted,
+            "archived": self.archived,
+            "rejected": self.rejected,
+            "retried": self.retried,
+            "failed": self.failed,
+            "archived_bytes": self.archived_bytes,
+        }
+
+    # ------------------------------------------------------------------ #
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._process(job)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                job.attempts += 1
+                if job.attempts >= self.max_attempts:
+                    self.failed += 1
+                    logger.error(
+                        f"Giving up archiving session {job.session_id} after {job.attempts} attempts: {e}"
+                    )
+                else:
+                    self.retried += 1
+                    delay = min(self.retry_max_s, self.retry_base_s * 2 ** (job.attempts - 1))
+                    logger.warning(
+                        f"Archiving session {job.session_id} failed (attempt {job.attempts}); retrying in {delay:.1f}s: {e}"
+                    )
+                    self._schedule_retry(job, delay)
+            finally:
+                self._queue.task_done()
+
+    def _schedule_retry(self, job: ArchiveJob, delay: float) -> None:
+        async def retry() -> None:
+            await asyncio.sleep(delay)
+            try:
+                self._queue.put_nowait(job)
+            except asyncio.QueueFull:
+                self.failed += 1
+                logger.error(f"Post-call archive queue full; dropping retry for {job.session_id}")
+
+        task = asyncio.create_task(retry())
+        self._retries.add(task)
+        task.add_done_callback(self._retries.discard)
+
+    async def _process(self, job: ArchiveJob) -> None:
+        if job.blob is None:
+            document = {
+                "session_id": job.session_id,
+                "timestamp": job.timestamp,
+                "histories": job.histories,
+                "context": job.context,
+            }
+            data = await run_in_workload(
+                Workload.MISC, transcript_archive.encode, document, self.codec
+            )
+            result = await self.blob_helper.save_transcript_archive(
+                job.session_id, data, codec=self.codec
+            )
+            if not result.success:
+                raise RuntimeError(result.error_message)
+            job.blob = {
+                "container": result.container_name,
+                "name": result.blob_name,
+                "codec": self.codec,
+                "bytes": len(data),
+            }
+            self.archived_bytes += len(data)
+
+        await run_in_workload(
+            Workload.STORAGE,
+            self.cosmos.upsert_document,
+            document=build_summary(job),
+            query={"_id": job.session_id},
+        )
+        self.archived += 1
+        logger.info(f"Archived session {job.session_id} ({job.blob['bytes']} bytes, {self.codec})")
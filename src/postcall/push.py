@@ -1,7 +1,7 @@
-import asyncio
 import datetime
 
 from src.cosmosdb.manager import CosmosDBMongoCoreManager
+from src.pools.executors import Workload, run_in_workload
 from src.stateful.state_managment import MemoManager
 from utils.ml_logging import get_logger
 from pymongo.errors import NetworkTimeout
@@ -17,17 +17,8 @@ def _connectivity_hint(cosmos: CosmosDBMongoCoreManager) -> str:
     return f"nc -vz {primary_host} 10260"
 
 
-async def build_and_flush(cm: MemoManager, cosmos: CosmosDBMongoCoreManager):
-    """
-    Build analytics document from conversation manager and asynchronously upsert into
-    Cosmos DB (MongoDB API, _id = session_id). Executes the write on a worker thread to
-    avoid blocking the event loop and adds guidance when connectivity fails.
-    """
-    session_id = cm.session_id
-    histories = cm.histories
-    context = cm.context.copy()
-    raw_lat = context.pop("latency_roundtrip", {})
-
+def latency_summary(raw_lat: dict) -> dict:
+    """Per-stage count/avg/min/max of ``latency_roundtrip`` entries."""
     summary = {}
     for stage, entries in raw_lat.items():
         durations = [e.get("dur", 0.0) for e in entries if "dur" in e]
@@ -38,6 +29,21 @@ async def build_and_flush(cm: MemoManager, cosmos: CosmosDBMongoCoreManager):
             "min": min(durations) if count else 0.0,
             "max": max(durations) if count else 0.0,
         }
+    return summary
+
+
+async def build_and_flush(cm: MemoManager, cosmos: CosmosDBMongoCoreManager):
+    """
+    Build analytics document from conversation manager and asynchronously upsert into
+    Cosmos DB (MongoDB API, _id = session_id). Executes the write on the storage
+    executor to avoid blocking the event loop and adds guidance when connectivity fails.
+    """
+    session_id = cm.session_id
+    histories = cm.histories
+    context = cm.context.copy()
+    raw_lat = context.pop("latency_roundtrip", {})
+
+    summary = latency_summary(raw_lat)
 
     doc = {
         "_id": session_id,
@@ -51,8 +57,11 @@ async def build_and_flush(cm: MemoManager, cosmos: CosmosDBMongoCoreManager):
     }
 
     try:
-        await asyncio.to_thread(
-            cosmos.upsert_document, document=doc, query={"_id": session_id}
+        await run_in_workload(
+            Workload.STORAGE,
+            cosmos.upsert_document,
+            document=doc,
+            query={"_id": session_id},
         )
         logger.info(f"Analytics document upserted for session {session_id}")
     except NetworkTimeout as err:
@@ -9,6 +9,8 @@ from typing import Any, Callable, Dict, List, Optional, TypeVar
 from utils.azure_auth import get_credential
 
 import redis
+from redis.asyncio import Redis as AsyncRedis
+from redis.asyncio.cluster import RedisCluster as AsyncRedisCluster
 from redis.cluster import RedisCluster
 from redis.exceptions import (
     AuthenticationError,
@@ -20,8 +22,32 @@ from redis.exceptions import (
 )
 from utils.ml_logging import get_logger
 
+from src.pools.executors import Workload, run_in_workload
+
+from .session_bus import RedisSessionBus
+from .stream_multiplexer import RedisStreamMultiplexer
+
 T = TypeVar("T")
 
+# Pool size of the long-blocking stream client; the multiplexer keeps one
+# connection spare for its (serialized) tail lookup pipeline.
+STREAM_CLIENT_MAX_CONNECTIONS = 4
+
+# Applies HINCRBYFLOAT pairs once per batch marker (KEYS[2]).
+_HINCR_ONCE_SCRIPT = """
+if not redis.call('SET', KEYS[2], '1', 'NX', 'EX', ARGV[2]) then
+    return 0
+end
+for i = 3, #ARGV, 2 do
+    redis.call('HINCRBYFLOAT', KEYS[1], ARGV[i], ARGV[i + 1])
+end
+if tonumber(ARGV[1]) > 0 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return 1
+"""
+_HINCR_MARKER_TTL_S = 3600
+
 
 class AzureRedisManager:
     """
@@ -88,6 +114,7 @@ class AzureRedisManager:
         )
         self.user_name = user_name or os.getenv("REDIS_USER_NAME") or "user"
         self._auth_expires_at = 0  # For AAD token refresh tracking
+        self._stream_multiplexer: Optional[RedisStreamMultiplexer] = None
 
         # Build initial client and, if using AAD, start a refresh thread
         self.logger.info("Redis cluster mode enabled: %s", self.use_cluster)
@@ -107,8 +134,7 @@ class AzureRedisManager:
             self.logger.info(f"Validating Redis connection to {self.host}:{self.port}")
 
             # Validate connection with health check
-            loop = asyncio.get_event_loop()
-            ping_result = await loop.run_in_executor(None, self._health_check)
+            ping_result = await run_in_workload(Workload.STORAGE, self._health_check)
 
             if ping_result:
                 self.logger.info("✅ Redis connection validated successfully")
@@ -210,8 +236,8 @@ class AzureRedisManager:
             raise last_exc
         raise RedisError(f"Redis command {command_name} failed without exception")
 
-    def _create_client(self):
-        """(Re)create Redis client and record expiry for AAD if needed."""
+    def _connection_kwargs(self) -> tuple[Dict[str, Any], Dict[str, Any]]:
+        """Return (common, auth) connection kwargs shared by sync and async clients."""
         common_kwargs = {
             "host": self.host,
             "port": self.port,
@@ -225,7 +251,17 @@ class AzureRedisManager:
             "client_name": "rtagent-api",
         }
 
-        cluster_kwargs = {
+        if self.access_key:
+            auth_kwargs = {"password": self.access_key}
+        else:
+            token = self.credential.get_token(self.scope)
+            self.token_expiry = token.expires_on
+            auth_kwargs = {"username": self.user_name, "password": token.token}
+
+        return common_kwargs, auth_kwargs
+
+    def _cluster_kwargs(self, common_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        return {
             **common_kwargs,
             "require_full_coverage": False,
             "reinitialize_steps": 1,
@@ -234,12 +270,10 @@ class AzureRedisManager:
             in {"1", "true", "yes", "on"},
         }
 
-        if self.access_key:
-            auth_kwargs = {"password": self.access_key}
-        else:
-            token = self.credential.get_token(self.scope)
-            self.token_expiry = token.expires_on
-            auth_kwargs = {"username": self.user_name, "password": token.token}
+    def _create_client(self):
+        """(Re)create Redis client and record expiry for AAD if needed."""
+        common_kwargs, auth_kwargs = self._connection_kwargs()
+        cluster_kwargs = self._cluster_kwargs(common_kwargs)
 
         try:
             if self.use_cluster:
@@ -293,6 +327,98 @@ class AzureRedisManager:
                 # retry sooner if something goes wrong
                 time.sleep(5)
 
+    def _create_async_client(self):
+        """
+        Build a ``redis.asyncio`` client for long-blocking stream reads.
+
+        Socket timeouts are lifted so a multiplexed ``XREAD BLOCK`` is not cut
+        short, and the pool is kept small because a single reader task owns it.
+        """
+        common_kwargs, auth_kwargs = self._connection_kwargs()
+        common_kwargs.update(
+            {
+                "socket_timeout": None,
+                "socket_connect_timeout": 2.0,
+                "max_connections": STREAM_CLIENT_MAX_CONNECTIONS,
+                "client_name": "rtagent-api-streams",
+            }
+        )
+        if self.use_cluster:
+            cluster_kwargs = self._cluster_kwargs(common_kwargs)
+            cluster_kwargs.update(auth_kwargs)
+            cluster_kwargs.setdefault("ssl_cert_reqs", None)
+            cluster_kwargs.setdefault("ssl_check_hostname", False)
+            return AsyncRedisCluster(**cluster_kwargs)
+        return AsyncRedis(**common_kwargs, db=self.db, **auth_kwargs)
+
+    def _create_pubsub_client(self):
+        """
+        Build a standalone ``redis.asyncio`` client for pub/sub.
+
+        Classic ``PUBLISH`` is propagated to every shard, so a plain connection
+        to the configured endpoint also works when the cache runs in cluster mode.
+        """
+        common_kwargs, auth_kwargs = self._connection_kwargs()
+        common_kwargs.update(
+            {
+                "socket_timeout": None,
+                "socket_connect_timeout": 2.0,
+                "max_connections": 4,
+                "client_name": "rtagent-api-pubsub",
+            }
+        )
+        return AsyncRedis(**common_kwargs, db=self.db, **auth_kwargs)
+
+    def create_session_bus(self, **kwargs: Any) -> RedisSessionBus:
+        """Build a :class:`RedisSessionBus` bound to this cache (not started)."""
+        return RedisSessionBus(
+            client_factory=lambda: run_in_workload(
+                Workload.STORAGE, self._create_async_client
+            ),
+            pubsub_client_factory=lambda: run_in_workload(
+                Workload.STORAGE, self._create_pubsub_client
+            ),
+            **kwargs,
+        )
+
+    @property
+    def stream_multiplexer(self) -> RedisStreamMultiplexer:
+        """Process-wide multiplexer for blocking stream waits (created lazily)."""
+        if self._stream_multiplexer is None:
+            self._stream_multiplexer = RedisStreamMultiplexer(
+                client_factory=lambda: run_in_workload(
+                    Workload.STORAGE, self._create_async_client
+                ),
+                block_ms=int(os.getenv("REDIS_STREAM_MUX_BLOCK_MS", "200")),
+                cluster_mode=self.use_cluster,
+                max_concurrent_reads=STREAM_CLIENT_MAX_CONNECTIONS - 1,
+            )
+        return self._stream_multiplexer
+
+    async def wait_for_stream_event_async(
+        self,
+        stream_key: str,
+        last_id: str = "$",
+        timeout_ms: int = 30000,
+        count: int = 1,
+    ) -> Optional[List[Any]]:
+        """
+        Wait for a new stream entry without occupying an executor thread.
+
+        Same contract as :meth:`read_events_blocking_async`, but all waiters
+        share one multiplexed ``XREAD`` issued from the event loop.
+        """
+        with self._redis_span("Redis.XREAD.multiplexed", op="XREAD"):
+            return await self.stream_multiplexer.wait_for_event(
+                stream_key, last_id=last_id, timeout_ms=timeout_ms, count=count
+            )
+
+    async def close_async(self) -> None:
+        """Release async resources (stream multiplexer) during shutdown."""
+        if self._stream_multiplexer is not None:
+            await self._stream_multiplexer.close()
+            self._stream_multiplexer = None
+
     def publish_event(self, stream_key: str, event_data: Dict[str, Any]) -> str:
         """Append an event to a Redis stream."""
         def _xadd():
@@ -324,9 +450,8 @@ class AzureRedisManager:
     async def publish_event_async(
         self, stream_key: str, event_data: Dict[str, Any]
     ) -> str:
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None, self.publish_event, stream_key, event_data
+        return await run_in_workload(
+            Workload.STORAGE, self.publish_event, stream_key, event_data
         )
 
     async def read_events_blocking_async(
@@ -336,9 +461,8 @@ class AzureRedisManager:
         block_ms: int = 30000,
         count: int = 1,
     ) -> Optional[List[Dict[str, Any]]]:
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None, self.read_events_blocking, stream_key, last_id, block_ms, count
+        return await run_in_workload(
+            Workload.STORAGE, self.read_events_blocking, stream_key, last_id, block_ms, count
         )
 
     async def ping(self) -> bool:
@@ -407,6 +531,46 @@ class AzureRedisManager:
 
         return self._execute_with_retry("DEL", _delete_operation)
 
+    def increment_hash_fields_once(
+        self,
+        key: str,
+        increments: Dict[str, float],
+        *,
+        batch_id: str,
+        ttl_seconds: Optional[int] = None,
+    ) -> bool:
+        """
+        Add to many hash fields in one script call, at most once per ``batch_id``.
+
+        Increments are not idempotent, and both this manager and the client
+        retry after a lost reply. A marker key in the same hash slot records
+        the batch, so a retried batch is skipped. Returns False when the batch
+        had already been applied.
+        """
+        marker = f"{{{key}}}:batch:{batch_id}"
+        args: List[Any] = [ttl_seconds or 0, _HINCR_MARKER_TTL_S]
+        for field, amount in increments.items():
+            args.extend((field, amount))
+
+        def _hincr_once_operation():
+            with self._redis_span("Redis.HINCRBY", op="HINCRBY"):
+                return bool(
+                    self.redis_client.eval(_HINCR_ONCE_SCRIPT, 2, key, marker, *args)
+                )
+
+        return self._execute_with_retry("HINCRBY_ONCE", _hincr_once_operation)
+
+    def get_many_hashes(self, keys: List[str]) -> List[Dict[str, str]]:
+        """HGETALL several keys in one pipelined round trip (missing keys -> {})."""
+        def _hgetall_many_operation():
+            with self._redis_span("Redis.HGETALL"):
+                pipe = self.redis_client.pipeline(transaction=False)
+                for key in keys:
+                    pipe.hgetall(key)
+                return [dict(raw or {}) for raw in pipe.execute()]
+
+        return self._execute_with_retry("HGETALL_MANY", _hgetall_many_operation)
+
     def list_connected_clients(self) -> List[Dict[str, str]]:
         """List currently connected clients."""
         def _client_list_operation():
@@ -420,9 +584,8 @@ class AzureRedisManager:
     ) -> bool:
         """Async version using thread pool executor."""
         try:
-            loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(
-                None, self.store_session_data, session_id, data
+            return await run_in_workload(
+                Workload.STORAGE, self.store_session_data, session_id, data
             )
         except asyncio.CancelledError:
             self.logger.debug(
@@ -439,8 +602,9 @@ class AzureRedisManager:
     async def get_session_data_async(self, session_id: str) -> Dict[str, str]:
         """Async version of get_session_data using thread pool executor."""
         try:
-            loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(None, self.get_session_data, session_id)
+            return await run_in_workload(
+                Workload.STORAGE, self.get_session_data, session_id
+            )
         except asyncio.CancelledError:
             self.logger.debug(
                 f"get_session_data_async cancelled for session {session_id}"
@@ -457,9 +621,8 @@ class AzureRedisManager:
     ) -> bool:
         """Async version of update_session_field using thread pool executor."""
         try:
-            loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(
-                None, self.update_session_field, session_id, field, value
+            return await run_in_workload(
+                Workload.STORAGE, self.update_session_field, session_id, field, value
             )
         except asyncio.CancelledError:
             self.logger.debug(
@@ -475,8 +638,9 @@ class AzureRedisManager:
     async def delete_session_async(self, session_id: str) -> int:
         """Async version of delete_session using thread pool executor."""
         try:
-            loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(None, self.delete_session, session_id)
+            return await run_in_workload(
+                Workload.STORAGE, self.delete_session, session_id
+            )
         except asyncio.CancelledError:
             self.logger.debug(
                 f"delete_session_async cancelled for session {session_id}"
@@ -491,8 +655,7 @@ class AzureRedisManager:
     async def get_value_async(self, key: str) -> Optional[str]:
         """Async version of get_value using thread pool executor."""
         try:
-            loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(None, self.get_value, key)
+            return await run_in_workload(Workload.STORAGE, self.get_value, key)
         except asyncio.CancelledError:
             self.logger.debug(f"get_value_async cancelled for key {key}")
             raise
@@ -505,9 +668,8 @@ class AzureRedisManager:
     ) -> bool:
         """Async version of set_value using thread pool executor."""
         try:
-            loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(
-                None, self.set_value, key, value, ttl_seconds
+            return await run_in_workload(
+                Workload.STORAGE, self.set_value, key, value, ttl_seconds
             )
         except asyncio.CancelledError:
             self.logger.debug(f"set_value_async cancelled for key {key}")
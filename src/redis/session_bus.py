@@ -0,0 +1,436 @@
+"""
+Cross-worker session routing over Redis.
+
+When the API runs with several uvicorn workers or replicas, WebSockets for
+one session or call may be attached to different processes. This module lets
+those processes share two pieces of state:
+
+- **Ownership**: ``<ns>:owner:<kind>:<key>`` holds the node id that owns a
+  call or session. Each owner renews its keys with a TTL, so entries left by
+  a crashed node expire. Lookups are cached locally for a short time.
+- **Broadcasts**: every node subscribes to ``<ns>:bus:<kind>:<key>`` only
+  while it has a local socket for that session/call/topic, plus the
+  ``<ns>:bus:all`` channel. A publish therefore reaches just the nodes that
+  can deliver it, and each node writes to its own sockets.
+
+Pub/sub can use its own client: ``redis.asyncio`` cluster clients do not
+support it, while a plain connection receives ``PUBLISH`` from every shard.
+Both clients are rebuilt through their factories on authentication or
+connection errors (an expired AAD token surfaces as either), and the pub/sub
+side re-subscribes to every channel it held.
+
+Received messages go through a bounded queue to a delivery task, so a slow
+listener never stalls the pub/sub reader; when the queue is full new
+messages are dropped and counted.
+
+The connection and session managers use the bus when one is attached and
+behave exactly as before otherwise.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import socket
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from redis.exceptions import AuthenticationError
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import TimeoutError as RedisTimeoutError
+
+from utils.ml_logging import get_logger
+
+logger = get_logger("redis.session_bus")
+
+ClientFactory = Callable[[], Awaitable[Any]]
+RemoteListener = Callable[[str, Optional[str], Dict[str, Any]], Awaitable[Any]]
+
+_RECONNECT_ERRORS = (AuthenticationError, RedisConnectionError, RedisTimeoutError)
+
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+_RENEW_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+
+def default_node_id() -> str:
+    """Unique id for this worker process (host, pid and a random suffix)."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+class RedisSessionBus:
+    """Redis ownership registry and pub/sub fan-out for WebSocket broadcasts."""
+
+    def __init__(
+        self,
+        client_factory: ClientFactory,
+        *,
+        pubsub_client_factory: Optional[ClientFactory] = None,
+        node_id: Optional[str] = None,
+        namespace: str = "rtagent",
+        owner_ttl_s: int = 120,
+        cache_ttl_s: float = 5.0,
+        delivery_queue_size: int = 1000,
+    ) -> None:
+        self._client_factory = client_factory
+        self._pubsub_client_factory = pubsub_client_factory
+        self.node_id = node_id or default_node_id()
+        self.namespace = namespace
+        self.owner_ttl_s = max(int(owner_ttl_s), 5)
+        self.cache_ttl_s = cache_ttl_s
+
+        self._client: Any = None
+        self._pubsub_client: Any = None
+        self._pubsub: Any = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._renew_task: Optional[asyncio.Task] = None
+        self._delivery_task: Optional[asyncio.Task] = None
+        self._inbox: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=max(delivery_queue_size, 1))
+        self._listener: Optional[RemoteListener] = None
+        self._sub_lock = asyncio.Lock()
+        self._reconnect_lock = asyncio.Lock()
+
+        self._subscriptions: Dict[str, int] = {}
+        self._owned: Dict[str, Tuple[str, str]] = {}
+        self._owner_cache: Dict[str, Tuple[Optional[str], float]] = {}
+
+        self._published = 0
+        self._delivered = 0
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._dropped = 0
+        self._reconnects = 0
+        self._ownership_lost = 0
+
+    # ------------------------------------------------------------------ #
+    # Lifecycle
+    # ------------------------------------------------------------------ #
+    @property
+    def running(self) -> bool:
+        return self._reader_task is not None and not self._reader_task.done()
+
+    def set_listener(self, listener: RemoteListener) -> None:
+        """Register the coroutine that delivers remote messages to local sockets."""
+        self._listener = listener
+
+    async def start(self) -> None:
+        """Connect, subscribe to the node-wide channels and start background tasks."""
+        if self.running:
+            return
+        self._client = await self._client_factory()
+        self._pubsub_client = (
+            await self._pubsub_client_factory()
+            if self._pubsub_client_factory is not None
+            else self._client
+        )
+        self._pubsub = self._pubsub_client.pubsub()
+        await self._pubsub.subscribe(self._channel("all"), self._channel("node", self.node_id))
+        self._reader_task = asyncio.create_task(
+            self._read_loop(), name="redis-session-bus-reader"
+        )
+        self._delivery_task = asyncio.create_task(
+            self._delivery_loop(), name="redis-session-bus-delivery"
+        )
+        self._renew_task = asyncio.create_task(
+            self._renew_loop(), name="redis-session-bus-renew"
+        )
+        logger.info(
+            "session bus started",
+            extra={"node_id": self.node_id, "namespace": self.namespace},
+        )
+
+    async def stop(self) -> None:
+        """Release owned keys, unsubscribe and close the client."""
+        for task in (self._reader_task, self._delivery_task, self._renew_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._reader_task = None
+        self._delivery_task = None
+        self._renew_task = None
+        while not self._inbox.empty():
+            self._inbox.get_nowait()
+
+        for kind, key in list(self._owned.values()):
+            await self.release(kind, key)
+
+        for resource in (self._pubsub, self._pubsub_client, self._client):
+            if resource is None or (
+                resource is self._pubsub_client and resource is self._client
+            ):
+                continue
+            await _close_quietly(resource)
+        self._pubsub = None
+        self._pubsub_client = None
+        self._client = None
+        self._subscriptions.clear()
+        self._owner_cache.clear()
+
+    # ------------------------------------------------------------------ #
+    # Ownership registry
+    # ------------------------------------------------------------------ #
+    async def claim(self, kind: str, key: str) -> None:
+        """Record this node as owner of ``kind``/``key`` (renewed until released)."""
+        owner_key = self._owner_key(kind, key)
+        self._owned[owner_key] = (kind, key)
+        self._owner_cache[owner_key] = (self.node_id, time.monotonic())
+        try:
+            await self._command(
+                lambda client: client.set(owner_key, self.node_id, ex=self.owner_ttl_s)
+            )
+        except Exception as exc:
+            logger.warning("failed to claim %s: %s", owner_key, exc)
+
+    async def release(self, kind: str, key: str) -> None:
+        """Drop ownership if this node still holds it."""
+        owner_key = self._owner_key(kind, key)
+        self._owned.pop(owner_key, None)
+        self._owner_cache.pop(owner_key, None)
+        try:
+            await self._command(
+                lambda client: client.eval(_RELEASE_SCRIPT, 1, owner_key, self.node_id)
+            )
+        except Exception as exc:
+            logger.debug("failed to release %s: %s", owner_key, exc)
+
+    async def owner_of(self, kind: str, key: str) -> Optional[str]:
+        """Return the owning node id (locally cached for ``cache_ttl_s``)."""
+        owner_key = self._owner_key(kind, key)
+        if owner_key in self._owned:
+            return self.node_id
+
+        cached = self._owner_cache.get(owner_key)
+        now = time.monotonic()
+        if cached and now - cached[1] < self.cache_ttl_s:
+            self._cache_hits += 1
+            return cached[0]
+
+        self._cache_misses += 1
+        try:
+            owner = await self._command(lambda client: client.get(owner_key))
+        except Exception as exc:
+            logger.warning("owner lookup failed for %s: %s", owner_key, exc)
+            return cached[0] if cached else None
+        self._owner_cache[owner_key] = (owner, now)
+        return owner
+
+    async def is_local(self, kind: str, key: str) -> bool:
+        return await self.owner_of(kind, key) == self.node_id
+
+    # ------------------------------------------------------------------ #
+    # Pub/sub fan-out
+    # ------------------------------------------------------------------ #
+    async def track(self, kind: str, key: str) -> None:
+        """Subscribe to ``kind``/``key`` broadcasts while a local socket needs them."""
+        channel = self._channel(kind, key)
+        async with self._sub_lock:
+            count = self._subscriptions.get(channel, 0)
+            self._subscriptions[channel] = count + 1
+            if count == 0 and self._pubsub is not None:
+                await self._pubsub.subscribe(channel)
+
+    async def untrack(self, kind: str, key: str) -> None:
+        """Drop one local interest in ``kind``/``key``; unsubscribes on the last one."""
+        channel = self._channel(kind, key)
+        async with self._sub_lock:
+            count = self._subscriptions.get(channel, 0) - 1
+            if count > 0:
+                self._subscriptions[channel] = count
+                return
+            self._subscriptions.pop(channel, None)
+            if count == 0 and self._pubsub is not None:
+                await self._pubsub.unsubscribe(channel)
+
+    async def publish(
+        self, kind: str, key: Optional[str], payload: Dict[str, Any]
+    ) -> int:
+        """
+        Publish a broadcast for other nodes.
+
+        :return: Number of subscribers Redis delivered to (includes this node
+            when it is subscribed; the reader skips its own messages).
+        """
+        if self._pubsub_client is None:
+            return 0
+        message = json.dumps(
+            {"origin": self.node_id, "kind": kind, "key": key, "payload": payload},
+            default=str,
+        )
+        channel = self._channel("all") if kind == "all" else self._channel(kind, key)
+        client = self._pubsub_client
+        try:
+            receivers = await client.publish(channel, message)
+        except _RECONNECT_ERRORS as exc:
+            logger.warning("session bus publish to %s failed, reconnecting: %s", channel, exc)
+            await self._reconnect_pubsub(client)
+            return 0
+        except Exception as exc:
+            logger.warning("session bus publish to %s failed: %s", channel, exc)
+            return 0
+        self._published += 1
+        return int(receivers or 0)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "node_id": self.node_id,
+            "running": self.running,
+            "subscriptions": len(self._subscriptions),
+            "owned": len(self._owned),
+            "published": self._published,
+            "delivered": self._delivered,
+            "owner_cache_hits": self._cache_hits,
+            "owner_cache_misses": self._cache_misses,
+            "delivery_queue": self._inbox.qsize(),
+            "dropped": self._dropped,
+            "reconnects": self._reconnects,
+            "ownership_lost": self._ownership_lost,
+        }
+
+    # ------------------------------------------------------------------ #
+    # Internals
+    # ------------------------------------------------------------------ #
+    def _channel(self, kind: str, key: Optional[str] = None) -> str:
+        if key is None:
+            return f"{self.namespace}:bus:{kind}"
+        return f"{self.namespace}:bus:{kind}:{key}"
+
+    def _owner_key(self, kind: str, key: str) -> str:
+        return f"{self.namespace}:owner:{kind}:{key}"
+
+    async def _command(self, operation: Callable[[Any], Awaitable[Any]]) -> Any:
+        """Run ``operation`` on the client, rebuilding it once on auth/connection errors."""
+        client = self._client
+        try:
+            return await operation(client)
+        except _RECONNECT_ERRORS as exc:
+            logger.info("session bus client error, reconnecting: %s", exc)
+            await self._reconnect_client(client)
+            return await operation(self._client)
+
+    async def _reconnect_client(self, failed: Any) -> None:
+        async with self._reconnect_lock:
+            if self._client is not failed:
+                return  # another caller already rebuilt it
+            self._client = await self._client_factory()
+            self._reconnects += 1
+            if failed is not None and failed is not self._pubsub_client:
+                await _close_quietly(failed)
+
+    async def _reconnect_pubsub(self, failed: Any) -> None:
+        """Rebuild the pub/sub client and restore every subscription."""
+        async with self._reconnect_lock:
+            if self._pubsub_client is not failed:
+                return
+            factory = self._pubsub_client_factory or self._client_factory
+            old_pubsub = self._pubsub
+            self._pubsub_client = await factory()
+            self._reconnects += 1
+            async with self._sub_lock:
+                self._pubsub = self._pubsub_client.pubsub()
+                await self._pubsub.subscribe(
+                    self._channel("all"),
+                    self._channel("node", self.node_id),
+                    *self._subscriptions,
+                )
+            if old_pubsub is not None:
+                await _close_quietly(old_pubsub)
+            if failed is not None and failed is not self._client:
+                await _close_quietly(failed)
+
+    async def _read_loop(self) -> None:
+        while True:
+            pubsub_client = self._pubsub_client
+            try:
+                message = await self._pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=1.0
+                )
+            except asyncio.CancelledError:
+                raise
+            except _RECONNECT_ERRORS as exc:
+                logger.warning("session bus connection lost, reconnecting: %s", exc)
+                try:
+                    await self._reconnect_pubsub(pubsub_client)
+                except Exception as reconnect_exc:
+                    logger.warning("session bus reconnect failed: %s", reconnect_exc)
+                    await asyncio.sleep(1.0)
+                continue
+            except Exception as exc:
+                logger.warning("session bus read failed: %s", exc)
+                await asyncio.sleep(1.0)
+                continue
+            if not message or message.get("type") != "message":
+                continue
+            try:
+                self._inbox.put_nowait(message.get("data"))
+            except asyncio.QueueFull:
+                self._dropped += 1
+                logger.warning("session bus delivery queue full; dropping message")
+
+    async def _delivery_loop(self) -> None:
+        while True:
+            raw = await self._inbox.get()
+            await self._dispatch(raw)
+
+    async def _dispatch(self, raw: Any) -> None:
+        try:
+            envelope = json.loads(raw)
+        except (TypeError, ValueError):
+            logger.debug("session bus dropped malformed message")
+            return
+        if envelope.get("origin") == self.node_id or self._listener is None:
+            return
+        try:
+            await self._listener(
+                envelope.get("kind"), envelope.get("key"), envelope.get("payload") or {}
+            )
+            self._delivered += 1
+        except Exception as exc:
+            logger.error("session bus delivery failed: %s", exc)
+
+    async def _renew_loop(self) -> None:
+        interval = max(self.owner_ttl_s / 3, 1.0)
+        while True:
+            await asyncio.sleep(interval)
+            await self._renew_owned()
+
+    async def _renew_owned(self) -> None:
+        """Extend the TTL of every owned key that still names this node."""
+        ttl_ms = self.owner_ttl_s * 1000
+        for owner_key in list(self._owned):
+            try:
+                renewed = await self._command(
+                    lambda client: client.eval(
+                        _RENEW_SCRIPT, 1, owner_key, self.node_id, ttl_ms
+                    )
+                )
+            except Exception as exc:
+                logger.warning("failed to renew %s: %s", owner_key, exc)
+                continue
+            if not renewed and self._owned.pop(owner_key, None) is not None:
+                # Expired or claimed by another node: never take it back.
+                self._ownership_lost += 1
+                self._owner_cache.pop(owner_key, None)
+                logger.warning("ownership of %s lost; no longer renewing", owner_key)
+
+
+async def _close_quietly(resource: Any) -> None:
+    try:
+        close = getattr(resource, "aclose", None) or getattr(resource, "close")
+        await close()
+    except Exception as exc:  # pragma: no cover - best effort
+        logger.debug("session bus close failed: %s", exc)
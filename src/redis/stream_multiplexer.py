@@ -0,0 +1,355 @@
+"""
+Redis Stream Multiplexer
+========================
+
+Fan-in reader for many concurrent blocking waits on Redis streams.
+
+``read_events_blocking_async`` parks one executor thread per waiter on a
+blocking ``XREAD``.  The multiplexer replaces that with a single asyncio
+task that issues one ``XREAD`` over every awaited stream key and resolves a
+per-waiter future when an entry newer than the waiter's cursor arrives.
+Waiting on a thousand streams therefore costs one reader connection and no
+threads.
+
+In cluster mode keys are grouped by hash slot (``XREAD`` is single-slot).
+At most ``max_concurrent_reads`` groups are read at once so the reads never
+outnumber the client's connection pool: when every group fits, each one
+blocks concurrently; otherwise the groups are polled without ``BLOCK`` in
+bounded batches, pausing ``poll_interval_ms`` after an idle sweep.
+
+A newly watched stream joins the read set on the next cycle, so ``block_ms``
+is kept short; the in-flight ``XREAD`` is never cancelled (that would discard
+a pooled connection per new call). Nothing is missed meanwhile because each
+waiter's ``$`` is resolved to the stream's current tail id up front. Those
+lookups are coalesced: concurrent waits share one pipelined ``XREVRANGE``
+round trip at a time, so a burst of calls needs a single spare connection.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from redis.crc import key_slot
+from redis.exceptions import AuthenticationError
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import RedisError
+from redis.exceptions import TimeoutError as RedisTimeoutError
+
+from utils.ml_logging import get_logger
+
+logger = get_logger("redis.stream_multiplexer")
+
+StreamEntries = List[Tuple[str, Dict[str, Any]]]
+AsyncClientFactory = Callable[[], Awaitable[Any]]
+
+
+def _parse_stream_id(stream_id: str) -> Tuple[int, int]:
+    """Parse a ``<ms>-<seq>`` stream id into a comparable tuple."""
+    ms, _, seq = str(stream_id).partition("-")
+    return int(ms or 0), int(seq or 0)
+
+
+@dataclass(eq=False)
+class _Waiter:
+    stream_key: str
+    cursor: Tuple[int, int]
+    cursor_id: str
+    count: int
+    future: asyncio.Future = field(repr=False)
+
+
+class RedisStreamMultiplexer:
+    """
+    Single-connection reader serving many ``XREAD``-style waits.
+
+    Callers await :meth:`wait_for_event`; the background reader task is
+    started lazily on the running loop and stops when :meth:`close` is
+    called.  Results mirror ``redis.xread`` output
+    (``[[stream_key, [(entry_id, fields), ...]]]``) so existing call sites
+    can switch without reshaping data.
+    """
+
+    def __init__(
+        self,
+        client_factory: AsyncClientFactory,
+        *,
+        block_ms: int = 200,
+        read_count: int = 100,
+        cluster_mode: bool = False,
+        max_concurrent_reads: int = 3,
+        poll_interval_ms: int = 50,
+    ) -> None:
+        """
+        :param client_factory: Coroutine returning a ``redis.asyncio`` client.
+        :param block_ms: Upper bound for one multiplexed ``XREAD`` block, and
+            so for how long a newly watched stream waits to join the read set.
+        :param read_count: Maximum entries fetched per stream per cycle.
+        :param cluster_mode: Group keys by hash slot before reading.
+        :param max_concurrent_reads: Cluster-mode cap on simultaneous
+            ``XREAD`` calls; keep it below the client's ``max_connections``
+            so the tail lookup pipeline still finds a free connection.
+        :param poll_interval_ms: Cluster-mode pause after a non-blocking
+            sweep that returned nothing.
+        """
+        self._client_factory = client_factory
+        self._block_ms = max(int(block_ms), 1)
+        self._read_count = max(int(read_count), 1)
+        self._cluster_mode = cluster_mode
+        self._max_concurrent_reads = max(int(max_concurrent_reads), 1)
+        self._poll_interval_s = max(int(poll_interval_ms), 1) / 1000
+
+        self._client: Any = None
+        self._waiters: Dict[str, List[_Waiter]] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._client_lock = asyncio.Lock()
+        self._tail_pending: Dict[str, asyncio.Future] = {}
+        self._tail_lock = asyncio.Lock()
+        self._closed = False
+
+        self._reads = 0
+        self._delivered = 0
+        self._timeouts = 0
+        self._errors = 0
+        self._tail_lookups = 0
+
+    # ------------------------------------------------------------------ #
+    # Public API
+    # ------------------------------------------------------------------ #
+    async def wait_for_event(
+        self,
+        stream_key: str,
+        last_id: str = "$",
+        timeout_ms: int = 30000,
+        count: int = 1,
+    ) -> Optional[List[List[Any]]]:
+        """
+        Wait until ``stream_key`` receives an entry newer than ``last_id``.
+
+        :param stream_key: Stream to watch.
+        :param last_id: Exclusive starting id; ``"$"`` means "only entries
+            added after this call".
+        :param timeout_ms: Maximum wait in milliseconds.
+        :param count: Maximum entries returned.
+        :return: ``xread``-shaped result, or ``None`` on timeout.
+        """
+        if self._closed:
+            raise RuntimeError("RedisStreamMultiplexer is closed")
+
+        await self._ensure_started()
+        if last_id == "$":
+            last_id = await self._resolve_tail_id(stream_key)
+
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(
+            stream_key=stream_key,
+            cursor=_parse_stream_id(last_id),
+            cursor_id=last_id,
+            count=max(int(count), 1),
+            future=loop.create_future(),
+        )
+        self._waiters.setdefault(stream_key, []).append(waiter)
+        self._wakeup.set()
+
+        try:
+            return await asyncio.wait_for(waiter.future, timeout=timeout_ms / 1000)
+        except asyncio.TimeoutError:
+            self._timeouts += 1
+            return None
+        finally:
+            self._remove_waiter(waiter)
+
+    async def close(self) -> None:
+        """Stop the reader task, fail pending waiters and close the client."""
+        self._closed = True
+        for waiter in list(itertools.chain.from_iterable(self._waiters.values())):
+            if not waiter.future.done():
+                waiter.future.cancel()
+        self._waiters.clear()
+
+        if self._reader_task and not self._reader_task.done():
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+        self._reader_task = None
+        await self._close_client()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return counters for health endpoints and debugging."""
+        return {
+            "running": bool(self._reader_task and not self._reader_task.done()),
+            "streams": len(self._waiters),
+            "waiters": sum(len(w) for w in self._waiters.values()),
+            "reads": self._reads,
+            "delivered": self._delivered,
+            "timeouts": self._timeouts,
+            "errors": self._errors,
+            "tail_lookups": self._tail_lookups,
+        }
+
+    # ------------------------------------------------------------------ #
+    # Reader internals
+    # ------------------------------------------------------------------ #
+    async def _ensure_client(self) -> Any:
+        async with self._client_lock:
+            if self._client is None:
+                self._client = await self._client_factory()
+            return self._client
+
+    async def _ensure_started(self) -> None:
+        await self._ensure_client()
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        if self._reader_task is None or self._reader_task.done():
+            self._reader_task = asyncio.create_task(
+                self._reader_loop(), name="redis-stream-multiplexer"
+            )
+
+    async def _resolve_tail_id(self, stream_key: str) -> str:
+        """Translate ``$`` into a concrete id so late registration loses nothing."""
+        future = self._tail_pending.get(stream_key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._tail_pending[stream_key] = future
+        async with self._tail_lock:
+            if not future.done():
+                await self._lookup_pending_tails()
+        return future.result()
+
+    async def _lookup_pending_tails(self) -> None:
+        """Resolve every queued tail lookup in one pipelined round trip."""
+        batch, self._tail_pending = self._tail_pending, {}
+        try:
+            client = await self._ensure_client()
+            pipe = client.pipeline(transaction=False)
+            for stream_key in batch:
+                pipe.xrevrange(stream_key, "+", "-", count=1)
+            results = await pipe.execute()
+            self._tail_lookups += 1
+            for future, entries in zip(batch.values(), results):
+                future.set_result(entries[0][0] if entries else "0-0")
+        except BaseException as exc:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(
+                        exc if isinstance(exc, Exception) else RedisConnectionError(str(exc))
+                    )
+            raise
+
+    async def _reader_loop(self) -> None:
+        backoff = 0.1
+        while not self._closed:
+            if not self._waiters:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            try:
+                await self._ensure_client()
+                response = await self._read_once(self._build_read_set())
+                self._reads += 1
+                backoff = 0.1
+            except asyncio.CancelledError:
+                raise
+            except (AuthenticationError, RedisConnectionError, RedisTimeoutError) as exc:
+                self._errors += 1
+                logger.warning("Stream multiplexer connection error, reconnecting: %s", exc)
+                await self._close_client()
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 5.0)
+                continue
+            except RedisError as exc:
+                self._errors += 1
+                logger.error("Stream multiplexer XREAD failed: %s", exc)
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 5.0)
+                continue
+
+            for stream_key, entries in response or []:
+                self._dispatch(stream_key, entries)
+
+    def _build_read_set(self) -> Dict[str, str]:
+        """Each stream is read from the oldest cursor among its waiters."""
+        read_set: Dict[str, str] = {}
+        for stream_key, waiters in self._waiters.items():
+            oldest = min(waiters, key=lambda w: w.cursor)
+            read_set[stream_key] = oldest.cursor_id
+        return read_set
+
+    async def _read_once(self, read_set: Dict[str, str]) -> List[List[Any]]:
+        if not read_set:
+            return []
+        if not self._cluster_mode:
+            return await self._client.xread(
+                read_set, block=self._block_ms, count=self._read_count
+            )
+
+        groups: Dict[int, Dict[str, str]] = {}
+        for stream_key, cursor in read_set.items():
+            groups.setdefault(key_slot(stream_key.encode()), {})[stream_key] = cursor
+
+        batches = list(groups.values())
+        if len(batches) <= self._max_concurrent_reads:
+            results = await asyncio.gather(
+                *(
+                    self._client.xread(group, block=self._block_ms, count=self._read_count)
+                    for group in batches
+                )
+            )
+        else:
+            results = []
+            step = self._max_concurrent_reads
+            for start in range(0, len(batches), step):
+                results.extend(
+                    await asyncio.gather(
+                        *(
+                            self._client.xread(group, count=self._read_count)
+                            for group in batches[start : start + step]
+                        )
+                    )
+                )
+            if not any(results):
+                await asyncio.sleep(self._poll_interval_s)
+        return [stream for result in results if result for stream in result]
+
+    def _dispatch(self, stream_key: str, entries: StreamEntries) -> None:
+        waiters = self._waiters.get(stream_key)
+        if not waiters or not entries:
+            return
+
+        parsed = [(_parse_stream_id(entry_id), (entry_id, data)) for entry_id, data in entries]
+        for waiter in list(waiters):
+            if waiter.future.done():
+                continue
+            fresh = [entry for entry_id, entry in parsed if entry_id > waiter.cursor]
+            if not fresh:
+                continue
+            waiter.future.set_result([[stream_key, fresh[: waiter.count]]])
+            self._delivered += 1
+            self._remove_waiter(waiter)
+
+    def _remove_waiter(self, waiter: _Waiter) -> None:
+        waiters = self._waiters.get(waiter.stream_key)
+        if not waiters:
+            return
+        try:
+            waiters.remove(waiter)
+        except ValueError:
+            return
+        if not waiters:
+            self._waiters.pop(waiter.stream_key, None)
+
+    async def _close_client(self) -> None:
+        client, self._client = self._client, None
+        if client is None:
+            return
+        try:
+            close = getattr(client, "aclose", None) or getattr(client, "close")
+            await close()
+        except Exception as exc:  # pragma: no cover - best effort
+            logger.debug("Error closing stream multiplexer client: %s", exc)
@@ -3,27 +3,60 @@
 Provides a shared token manager that wraps the repo's credential helper and
 applies Azure AD tokens to Speech SDK configurations with proper refresh and
 thread-safety. This centralises AAD token handling for both TTS and STT flows.
+
+Configs and recognizers the token was applied to are remembered (weakly), and
+a single background refresher per process renews the token ``lead_seconds``
+before it expires and pushes it to all of them, so synthesis and recognition
+read a cached token and never wait on the credential.
 """
 from __future__ import annotations
 
 import os
 import threading
 import time
+import weakref
 from functools import lru_cache
-from typing import Optional
+from typing import Any, Dict, Optional
 
-import azure.cognitiveservices.speech as speechsdk
 from azure.core.credentials import AccessToken, TokenCredential
+from opentelemetry import metrics
 
 from utils.azure_auth import get_credential
+from utils.lazy_import import lazy_import
 from utils.ml_logging import get_logger
 
 logger = get_logger(__name__)
 
+speechsdk = lazy_import("azure.cognitiveservices.speech")
+
 # Speech service scope for Azure AD tokens
 _SPEECH_SCOPE = "https://cognitiveservices.azure.com/.default"
 # Refresh the cached token a little before it actually expires
 _REFRESH_SKEW_SECONDS = 120
+# Background refresher: renew this long before expiry (must exceed the skew
+# above so the hot path never refreshes while the refresher is running).
+DEFAULT_REFRESH_LEAD_SECONDS = 300
+# Pause between attempts when the credential fails or hands back the same
+# token; doubles per consecutive miss up to the cap below.
+_REFRESH_RETRY_SECONDS = 5
+_REFRESH_RETRY_MAX_SECONDS = 60
+# Upper bound on one refresher sleep, so clock jumps are picked up
+_MAX_SLEEP_SECONDS = 300
+
+_meter = metrics.get_meter("rtagent.speech.auth")
+_token_refreshes = _meter.create_counter(
+    "rtagent.speech.token_refreshes",
+    description="Azure Speech AAD token acquisitions by trigger (proactive/on_demand/forced)",
+)
+_refresh_lead = _meter.create_histogram(
+    "rtagent.speech.token_refresh_lead",
+    unit="s",
+    description="Remaining lifetime of the previous token when it was replaced",
+)
+_retries_avoided = _meter.create_counter(
+    "rtagent.speech.auth_retries_avoided",
+    description="Live Speech configs/recognizers renewed before expiry (each would otherwise 401 and retry)",
+)
 
 
 class SpeechTokenManager:
@@ -39,32 +72,100 @@ class SpeechTokenManager:
         self._token_lock = threading.Lock()
         self._cached_token: Optional[AccessToken] = None
 
+        # Speech configs / recognizers that receive renewed tokens.
+        self._targets: "weakref.WeakSet[Any]" = weakref.WeakSet()
+        self._targets_lock = threading.Lock()
+        self._refresher: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+        self.refreshes: Dict[str, int] = {"proactive": 0, "on_demand": 0, "forced": 0}
+        # Credential calls that returned the token already cached.
+        self.unchanged_refreshes = 0
+        self.retries_avoided = 0
+        self.last_refresh_lead_s: Optional[float] = None
+
     @property
     def resource_id(self) -> str:
         return self._resource_id
 
-    def _needs_refresh(self) -> bool:
-        if not self._cached_token:
+    def _needs_refresh(self, token: Optional[AccessToken] = None) -> bool:
+        token = token or self._cached_token
+        if not token:
             return True
-        expiry_buffer = self._cached_token.expires_on - _REFRESH_SKEW_SECONDS
+        expiry_buffer = token.expires_on - _REFRESH_SKEW_SECONDS
         return time.time() >= expiry_buffer
 
     def get_token(self, force_refresh: bool = False) -> AccessToken:
-        """Return a valid Azure AD token, refreshing if required."""
+        """Return a valid Azure AD token, refreshing if required.
+
+        A fresh cached token is returned without locking. Refreshes are
+        single-flight: callers that queued behind another refresh reuse its
+        token instead of calling the credential again (e.g. a burst of 401s).
+        """
+        token = self._cached_token
+        if not force_refresh and not self._needs_refresh(token):
+            return token
+        return self._refresh(token, trigger="forced" if force_refresh else "on_demand")
+
+    def _refresh(self, seen: Optional[AccessToken], *, trigger: str) -> AccessToken:
         with self._token_lock:
-            if force_refresh or self._needs_refresh():
-                logger.debug("Fetching new Azure Speech AAD token")
-                token = self._credential.get_token(_SPEECH_SCOPE)
-                self._cached_token = token
-            token = self._cached_token
+            current = self._cached_token
+            if current is not None and current is not seen and not self._needs_refresh(current):
+                return current  # renewed while we waited for the lock
+            logger.debug("Fetching new Azure Speech AAD token (%s)", trigger)
+            token = self._credential.get_token(_SPEECH_SCOPE)
             if token is None:
                 raise RuntimeError("Failed to obtain Azure Speech token")
-            return token
+            renewed = current is None or token.expires_on > current.expires_on
+            changed = (
+                current is None
+                or token.token != current.token
+                or token.expires_on != current.expires_on
+            )
+            if renewed and current is not None:
+                self.last_refresh_lead_s = current.expires_on - time.time()
+                _refresh_lead.record(self.last_refresh_lead_s, {"trigger": trigger})
+            if changed:
+                self.refreshes[trigger] += 1
+                _token_refreshes.add(1, {"trigger": trigger})
+            else:
+                self.unchanged_refreshes += 1
+            self._cached_token = token
+        if renewed:
+            self._push(token)
+        return token
+
+    # ------------------------------------------------------------------
+    # Targets
+    # ------------------------------------------------------------------
+    def register(self, target: Any) -> None:
+        """Push future tokens to ``target`` (anything with ``authorization_token``)."""
+        try:
+            with self._targets_lock:
+                self._targets.add(target)
+        except TypeError:
+            logger.debug("Speech auth target %r does not support weak references", target)
+
+    def _push(self, token: AccessToken) -> int:
+        with self._targets_lock:
+            targets = list(self._targets)
+        pushed = 0
+        for target in targets:
+            try:
+                target.authorization_token = token.token
+                pushed += 1
+            except Exception as exc:  # noqa: BLE001
+                logger.debug("Failed to push Speech token to %r: %s", target, exc)
+        return pushed
 
     def apply_to_config(
         self, speech_config: speechsdk.SpeechConfig, *, force_refresh: bool = False
     ) -> None:
         """Attach the latest AAD token to the provided speech configuration."""
+        if not force_refresh and speech_config in self._targets:
+            # Already registered: renewals are pushed, only check freshness.
+            self.get_token()
+            return
         token = self.get_token(force_refresh=force_refresh)
         speech_config.authorization_token = token.token
         try:
@@ -84,6 +185,87 @@ class SpeechTokenManager:
             logger.warning(
                 "Failed to set SpeechServiceConnection_AzureResourceId: %s", exc
             )
+        self.register(speech_config)
+
+    # ------------------------------------------------------------------
+    # Background refresher
+    # ------------------------------------------------------------------
+    def start_refresher(self, lead_seconds: float = DEFAULT_REFRESH_LEAD_SECONDS) -> None:
+        """Start the process-wide refresher thread (idempotent)."""
+        if self._refresher is not None and self._refresher.is_alive():
+            return
+        self._stop.clear()
+        self._refresher = threading.Thread(
+            target=self._refresh_loop,
+            args=(max(lead_seconds, _REFRESH_SKEW_SECONDS + _REFRESH_RETRY_SECONDS),),
+            name="speech-token-refresher",
+            daemon=True,
+        )
+        self._refresher.start()
+        logger.info("Speech token refresher started (lead=%ss)", lead_seconds)
+
+    def stop_refresher(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        thread, self._refresher = self._refresher, None
+        if thread is not None:
+            thread.join(timeout)
+
+    def _refresh_loop(self, lead_seconds: float) -> None:
+        misses = 0
+        while not self._stop.is_set():
+            token = self._cached_token
+            if token is not None:
+                delay = token.expires_on - lead_seconds - time.time()
+                if delay > 0:
+                    self._stop.wait(min(delay, _MAX_SLEEP_SECONDS))
+                    continue
+            try:
+                renewed = self.refresh_now(token)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Proactive Speech token refresh failed: %s", exc)
+                renewed = False
+            if renewed:
+                misses = 0
+                continue
+            # Credential error, or the credential's own cache returned the
+            # same token; back off, but stay ahead of on-demand refreshes.
+            misses += 1
+            self._stop.wait(self._retry_delay(misses))
+
+    def _retry_delay(self, misses: int) -> float:
+        """Backoff after ``misses`` consecutive proactive refreshes that renewed nothing."""
+        delay = min(_REFRESH_RETRY_MAX_SECONDS, _REFRESH_RETRY_SECONDS * 2 ** (misses - 1))
+        token = self._cached_token
+        if token is not None:
+            until_on_demand = token.expires_on - _REFRESH_SKEW_SECONDS - time.time()
+            delay = min(delay, max(_REFRESH_RETRY_SECONDS, until_on_demand))
+        return delay
+
+    def refresh_now(self, seen: Optional[AccessToken] = None) -> bool:
+        """Run one proactive refresh; returns ``True`` if the token was renewed."""
+        seen = seen if seen is not None else self._cached_token
+        token = self._refresh(seen, trigger="proactive")
+        if seen is not None and token.expires_on <= seen.expires_on:
+            return False
+        if seen is not None:
+            live = len(self._targets)
+            self.retries_avoided += live
+            _retries_avoided.add(live)
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        token = self._cached_token
+        return {
+            "refresher_running": self._refresher is not None and self._refresher.is_alive(),
+            "expires_in_s": round(token.expires_on - time.time(), 1) if token else None,
+            "targets": len(self._targets),
+            "refreshes": dict(self.refreshes),
+            "unchanged_refreshes": self.unchanged_refreshes,
+            "retries_avoided": self.retries_avoided,
+            "last_refresh_lead_s": (
+                round(self.last_refresh_lead_s, 1) if self.last_refresh_lead_s is not None else None
+            ),
+        }
 
 
 @lru_cache(maxsize=1)
@@ -8,11 +8,12 @@ neural audio processing for optimal voice agent performance.
 It integrates with OpenTelemetry for observability, enabling detailed tracing and monitoring of the speech recognition process.
 """
 
+from __future__ import annotations
+
 import json
 import os
 from typing import Callable, List, Optional, Final
 
-import azure.cognitiveservices.speech as speechsdk
 from dotenv import load_dotenv
 
 # OpenTelemetry imports for tracing
@@ -22,7 +23,12 @@ from opentelemetry.trace import SpanKind, Status, StatusCode
 # Import centralized span attributes enum
 from src.enums.monitoring import SpanAttr
 from src.speech.auth_manager import SpeechTokenManager, get_speech_token_manager
+from utils.lazy_import import lazy_import
 from utils.ml_logging import get_logger
+from utils.telemetry_policy import record_span_event
+
+# Loaded on first use: the SDK native library is slow to load at startup.
+speechsdk = lazy_import("azure.cognitiveservices.speech")
 
 # Set up logger
 logger = get_logger(__name__)
@@ -366,7 +372,7 @@ class StreamingSpeechRecognizerFromBytes:
             # Set the authorization token
             try:
                 token_manager = get_speech_token_manager()
-                token_manager.apply_to_config(speech_config, force_refresh=True)
+                token_manager.apply_to_config(speech_config)
                 self._token_manager = token_manager
                 logger.debug(
                     "Successfully applied Azure AD token to SpeechConfig"
@@ -477,7 +483,9 @@ class StreamingSpeechRecognizerFromBytes:
             logger.info("Speech recognition restarted successfully with refreshed authentication")
             
             if self._session_span:
-                self._session_span.add_event(
+                record_span_event(
+                    self._session_span,
+                    "speech_recognizer",
                     "recognition_restarted_after_auth_refresh",
                     {"restart_success": True}
                 )
@@ -488,7 +496,9 @@ class StreamingSpeechRecognizerFromBytes:
             logger.error(f"Failed to restart speech recognition after auth refresh: {e}")
             
             if self._session_span:
-                self._session_span.add_event(
+                record_span_event(
+                    self._session_span,
+                    "speech_recognizer",
                     "recognition_restart_failed",
                     {"restart_success": False, "error": str(e)}
                 )
@@ -760,7 +770,9 @@ class StreamingSpeechRecognizerFromBytes:
 
         logger.info("Recognition started.")
         if self._session_span:
-            self._session_span.add_event("speech_recognition_started")
+            record_span_event(
+                self._session_span, "speech_recognizer", "speech_recognition_started"
+            )
 
     def prepare_start(self) -> None:
         """
@@ -893,6 +905,10 @@ class StreamingSpeechRecognizerFromBytes:
             audio_config=audio_config,
             auto_detect_source_language_config=lid_cfg,
         )
+        if self._token_manager:
+            # Long-lived recognizers keep the token they were built with;
+            # the shared refresher renews it in place.
+            self._token_manager.register(self.speech_recognizer)
 
         if not self.use_semantic:
             self.speech_recognizer.properties.set_property(
@@ -959,10 +975,11 @@ class StreamingSpeechRecognizerFromBytes:
             ```
 
         Tracing:
-            Adds lightweight events to the session span including:
-            - Audio chunk size for throughput monitoring
-            - Stream health indicators
-            - No per-chunk spans to maintain performance
+            Reports each chunk through the hot-path telemetry policy
+            (``utils.telemetry_policy``). By default chunk sizes are folded
+            into the ``rtagent.speech.audio_chunk.size`` histogram rather than
+            stored as session span events, so span memory stays flat for
+            long calls. No per-chunk spans are created.
 
         Logging:
             - Debug logs for chunk size and stream status
@@ -978,13 +995,14 @@ class StreamingSpeechRecognizerFromBytes:
             f"write_bytes called: {len(audio_chunk)} bytes, has_push_stream={self.push_stream is not None}"
         )
         if self.push_stream:
-            if self.enable_tracing and self._session_span:
-                try:
-                    self._session_span.add_event(
-                        "audio_chunk", {"size": len(audio_chunk)}
-                    )
-                except Exception:
-                    pass
+            if self.enable_tracing:
+                # Folded into a size histogram by default; see utils.telemetry_policy.
+                record_span_event(
+                    self._session_span,
+                    "speech_recognizer",
+                    "audio_chunk",
+                    {"size": len(audio_chunk)},
+                )
             self.push_stream.write(audio_chunk)
             logger.debug(f"✅ Audio chunk written to push_stream")
         else:
@@ -1040,7 +1058,9 @@ class StreamingSpeechRecognizerFromBytes:
         if self.speech_recognizer:
             # Add event to session span before stopping
             if self._session_span:
-                self._session_span.add_event("speech_recognition_stopping")
+                record_span_event(
+                    self._session_span, "speech_recognizer", "speech_recognition_stopping"
+                )
 
             # Stop recognition asynchronously without blocking
             future = self.speech_recognizer.stop_continuous_recognition_async()
@@ -1051,7 +1071,9 @@ class StreamingSpeechRecognizerFromBytes:
 
             # Finish session span if it's still active
             if self._session_span:
-                self._session_span.add_event("speech_recognition_stopped")
+                record_span_event(
+                    self._session_span, "speech_recognizer", "speech_recognition_stopped"
+                )
                 self._session_span.set_status(Status(StatusCode.OK))
                 self._session_span.end()
                 self._session_span = None
@@ -1106,13 +1128,17 @@ class StreamingSpeechRecognizerFromBytes:
         if self.push_stream:
             # Add event to session span before closing
             if self._session_span:
-                self._session_span.add_event("audio_stream_closing")
+                record_span_event(
+                    self._session_span, "speech_recognizer", "audio_stream_closing"
+                )
 
             self.push_stream.close()
 
             # Final cleanup of session span if still active
             if self._session_span:
-                self._session_span.add_event("audio_stream_closed")
+                record_span_event(
+                    self._session_span, "speech_recognizer", "audio_stream_closed"
+                )
                 self._session_span.end()
                 self._session_span = None
 
@@ -1292,7 +1318,9 @@ class StreamingSpeechRecognizerFromBytes:
 
                     # Add event to session span
                     if self._session_span:
-                        self._session_span.add_event(
+                        record_span_event(
+                            self._session_span,
+                            "speech_recognizer",
                             "partial_recognition_received",
                             {"text_length": len(txt), "detected_language": detected},
                         )
@@ -1391,7 +1419,9 @@ class StreamingSpeechRecognizerFromBytes:
                 ) as span:
                     # Add event to session span
                     if self._session_span:
-                        self._session_span.add_event(
+                        record_span_event(
+                            self._session_span,
+                            "speech_recognizer",
                             "final_recognition_received",
                             {
                                 "text_length": len(evt.result.text),
@@ -1486,8 +1516,11 @@ class StreamingSpeechRecognizerFromBytes:
             self._session_span.set_status(
                 Status(StatusCode.ERROR, "Recognition canceled")
             )
-            self._session_span.add_event(
-                "recognition_canceled", {"event_details": str(evt)}
+            record_span_event(
+                self._session_span,
+                "speech_recognizer",
+                "recognition_canceled",
+                {"event_details": str(evt)},
             )
 
         if evt.result and evt.result.cancellation_details:
@@ -1499,7 +1532,9 @@ class StreamingSpeechRecognizerFromBytes:
                 logger.warning(f"Authentication error detected in speech recognition: {details.error_details}")
                 
                 if self._session_span:
-                    self._session_span.add_event(
+                    record_span_event(
+                        self._session_span,
+                        "speech_recognizer",
                         "recognition_authentication_error",
                         {"error_details": details.error_details}
                     )
@@ -1509,7 +1544,9 @@ class StreamingSpeechRecognizerFromBytes:
                     logger.info("Authentication refreshed successfully for speech recognition")
                     
                     if self._session_span:
-                        self._session_span.add_event(
+                        record_span_event(
+                            self._session_span,
+                            "speech_recognizer",
                             "recognition_authentication_refreshed",
                             {"refresh_success": True}
                         )
@@ -1524,7 +1561,9 @@ class StreamingSpeechRecognizerFromBytes:
                     logger.error("Failed to refresh authentication for speech recognition")
                     
                     if self._session_span:
-                        self._session_span.add_event(
+                        record_span_event(
+                            self._session_span,
+                            "speech_recognizer",
                             "recognition_authentication_refresh_failed",
                             {"refresh_success": False}
                         )
@@ -1533,7 +1572,9 @@ class StreamingSpeechRecognizerFromBytes:
 
             # Add detailed error information to span
             if self._session_span:
-                self._session_span.add_event(
+                record_span_event(
+                    self._session_span,
+                    "speech_recognizer",
                     "cancellation_details",
                     {
                         "cancellation_reason": str(details.reason),
@@ -1598,7 +1639,9 @@ class StreamingSpeechRecognizerFromBytes:
 
         # Add event to session span and finish it
         if self._session_span:
-            self._session_span.add_event("speech_session_stopped")
+            record_span_event(
+                self._session_span, "speech_recognizer", "speech_session_stopped"
+            )
             self._session_span.set_status(Status(StatusCode.OK))
             self._session_span.end()
             self._session_span = None
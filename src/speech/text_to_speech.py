@@ -6,6 +6,8 @@ modes optimized for different use cases including real-time streaming, local pla
 and frame-based audio processing.
 """
 
+from __future__ import annotations
+
 import html
 import os
 import re
@@ -13,9 +15,7 @@ import asyncio
 import time
 from typing import Callable, Dict, List, Optional
 
-import azure.cognitiveservices.speech as speechsdk
 from dotenv import load_dotenv
-from langdetect import LangDetectException, detect
 
 # OpenTelemetry imports for tracing
 from opentelemetry import trace
@@ -24,7 +24,12 @@ from opentelemetry.trace import SpanKind, Status, StatusCode
 # Import centralized span attributes enum
 from src.enums.monitoring import SpanAttr
 from src.speech.auth_manager import SpeechTokenManager, get_speech_token_manager
+from utils.lazy_import import lazy_import
 from utils.ml_logging import get_logger
+from utils.telemetry_policy import record_span_event
+
+# Loaded on first use: the SDK native library is slow to load at startup.
+speechsdk = lazy_import("azure.cognitiveservices.speech")
 
 # Load environment variables from a .env file if present
 load_dotenv()
@@ -256,6 +261,8 @@ def ssml_voice_wrap(
         For monolingual voices, language switching may not work as expected.
         Always validate voice capabilities for your specific use case.
     """
+    from langdetect import LangDetectException, detect
+
     body = []
     for seg in sentences:
         try:
@@ -486,7 +493,7 @@ class SpeechSynthesizer:
         region: str = None,
         language: str = "en-US",
         voice: str = "en-US-JennyMultilingualNeural",
-        format: speechsdk.SpeechSynthesisOutputFormat = speechsdk.SpeechSynthesisOutputFormat.Riff24Khz16BitMonoPcm,
+        format: Optional[speechsdk.SpeechSynthesisOutputFormat] = None,
         playback: str = "auto",  # "auto" | "always" | "never"
         call_connection_id: Optional[str] = None,
         enable_tracing: bool = True,
@@ -522,6 +529,7 @@ class SpeechSynthesizer:
                     - Riff16Khz16BitMonoPcm: Standard quality, smaller size
                     - Riff24Khz16BitMonoPcm: High quality, balanced size
                     - Riff48Khz16BitMonoPcm: Highest quality, larger size
+                    Defaults to Riff24Khz16BitMonoPcm when omitted.
             playback: Audio playback behavior control:
                       - "auto": Enable playback only when audio hardware detected
                       - "always": Force playback attempt, use null sink if headless
@@ -602,7 +610,11 @@ class SpeechSynthesizer:
         self.region = region or os.getenv("AZURE_SPEECH_REGION")
         self.language = language
         self.voice = voice
-        self.format = format
+        self.format = (
+            format
+            if format is not None
+            else speechsdk.SpeechSynthesisOutputFormat.Riff24Khz16BitMonoPcm
+        )
         self.playback = playback
         self.enable_tracing = enable_tracing
         self.call_connection_id = call_connection_id or "unknown"
@@ -794,7 +806,7 @@ class SpeechSynthesizer:
 
             try:
                 token_manager = get_speech_token_manager()
-                token_manager.apply_to_config(speech_config, force_refresh=True)
+                token_manager.apply_to_config(speech_config)
                 self._token_manager = token_manager
                 logger.debug("Successfully applied Azure AD token to SpeechConfig")
             except Exception as e:
@@ -1177,7 +1189,9 @@ class SpeechSynthesizer:
         try:
             # Add event for speaker synthesis start
             if self._session_span:
-                self._session_span.add_event(
+                record_span_event(
+                    self._session_span,
+                    "text_to_speech",
                     "tts_speaker_synthesis_started",
                     {"text_length": len(text), "voice": voice},
                 )
@@ -1185,8 +1199,11 @@ class SpeechSynthesizer:
             speaker = self._create_speaker_synthesizer()
             if speaker is None:
                 if self._session_span:
-                    self._session_span.add_event(
-                        "tts_speaker_unavailable", {"reason": "headless_environment"}
+                    record_span_event(
+                        self._session_span,
+                        "text_to_speech",
+                        "tts_speaker_unavailable",
+                        {"reason": "headless_environment"},
                     )
 
                 logger.warning(
@@ -1195,7 +1212,9 @@ class SpeechSynthesizer:
                 return
 
             if self._session_span:
-                self._session_span.add_event("tts_speaker_synthesizer_created")
+                record_span_event(
+                    self._session_span, "text_to_speech", "tts_speaker_synthesizer_created"
+                )
 
             logger.info(
                 "Starting streaming speech synthesis for text: %s",
@@ -1219,7 +1238,9 @@ class SpeechSynthesizer:
                 </speak>"""
 
             if self._session_span:
-                self._session_span.add_event("tts_speaker_ssml_created")
+                record_span_event(
+                    self._session_span, "text_to_speech", "tts_speaker_ssml_created"
+                )
 
             # Perform synthesis and check result for authentication errors
             result = speaker.speak_ssml_async(ssml).get()
@@ -1234,7 +1255,9 @@ class SpeechSynthesizer:
                     logger.info("Retrying speaker synthesis with refreshed authentication")
                     
                     if self._session_span:
-                        self._session_span.add_event(
+                        record_span_event(
+                            self._session_span,
+                            "text_to_speech",
                             "tts_speaker_authentication_refreshed",
                             {"retry_attempt": True}
                         )
@@ -1245,21 +1268,27 @@ class SpeechSynthesizer:
                     if speaker:
                         result = speaker.speak_ssml_async(ssml).get()
                         if self._session_span:
-                            self._session_span.add_event("tts_speaker_synthesis_retry_completed")
+                            record_span_event(
+                                self._session_span, "text_to_speech", "tts_speaker_synthesis_retry_completed"
+                            )
                     else:
                         logger.error("Failed to recreate speaker after authentication refresh")
                 else:
                     logger.error("Failed to refresh authentication for speaker synthesis")
 
             if self._session_span:
-                self._session_span.add_event("tts_speaker_synthesis_initiated")
+                record_span_event(
+                    self._session_span, "text_to_speech", "tts_speaker_synthesis_initiated"
+                )
                 self._session_span.set_status(Status(StatusCode.OK))
 
         except Exception as exc:
             error_msg = f"TTS playback not available in this environment: {exc}"
 
             if self._session_span:
-                self._session_span.add_event(
+                record_span_event(
+                    self._session_span,
+                    "text_to_speech",
                     "tts_speaker_synthesis_error",
                     {"error_type": type(exc).__name__, "error_message": str(exc)},
                 )
@@ -1331,7 +1360,9 @@ class SpeechSynthesizer:
         try:
             # Add event for synthesis start
             if self._session_span:
-                self._session_span.add_event(
+                record_span_event(
+                    self._session_span,
+                    "text_to_speech",
                     "tts_synthesis_started",
                     {"text_length": len(text), "voice": voice},
                 )
@@ -1345,7 +1376,9 @@ class SpeechSynthesizer:
             )
 
             if self._session_span:
-                self._session_span.add_event("tts_config_created")
+                record_span_event(
+                    self._session_span, "text_to_speech", "tts_config_created"
+                )
 
             # Use None for audio_config to synthesize to memory
             synthesizer = speechsdk.SpeechSynthesizer(
@@ -1353,7 +1386,9 @@ class SpeechSynthesizer:
             )
 
             if self._session_span:
-                self._session_span.add_event("tts_synthesizer_created")
+                record_span_event(
+                    self._session_span, "text_to_speech", "tts_synthesizer_created"
+                )
 
             # Build SSML if style or rate are specified, otherwise use plain text
             if style or rate:
@@ -1377,14 +1412,19 @@ class SpeechSynthesizer:
 
             if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
                 if self._session_span:
-                    self._session_span.add_event("tts_synthesis_completed")
+                    record_span_event(
+                        self._session_span, "text_to_speech", "tts_synthesis_completed"
+                    )
 
                 audio_data_stream = speechsdk.AudioDataStream(result)
                 wav_bytes = audio_data_stream.read_data()
 
                 if self._session_span:
-                    self._session_span.add_event(
-                        "tts_audio_data_extracted", {"audio_size_bytes": len(wav_bytes)}
+                    record_span_event(
+                        self._session_span,
+                        "text_to_speech",
+                        "tts_audio_data_extracted",
+                        {"audio_size_bytes": len(wav_bytes)},
                     )
                     self._session_span.set_status(Status(StatusCode.OK))
                     self._session_span.end()
@@ -1402,7 +1442,9 @@ class SpeechSynthesizer:
                         logger.info("Retrying speech synthesis with refreshed authentication")
                         
                         if self._session_span:
-                            self._session_span.add_event(
+                            record_span_event(
+                                self._session_span,
+                                "text_to_speech",
                                 "tts_authentication_refreshed",
                                 {"retry_attempt": True}
                             )
@@ -1422,8 +1464,11 @@ class SpeechSynthesizer:
                         if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
                             wav_bytes = result.audio_data
                             if self._session_span:
-                                self._session_span.add_event(
-                                    "tts_audio_data_extracted_retry", {"audio_size_bytes": len(wav_bytes)}
+                                record_span_event(
+                                    self._session_span,
+                                    "text_to_speech",
+                                    "tts_audio_data_extracted_retry",
+                                    {"audio_size_bytes": len(wav_bytes)},
                                 )
                                 self._session_span.set_status(Status(StatusCode.OK))
                                 self._session_span.end()
@@ -1436,8 +1481,11 @@ class SpeechSynthesizer:
                 logger.error(error_msg)
 
                 if self._session_span:
-                    self._session_span.add_event(
-                        "tts_synthesis_failed", {"failure_reason": str(result.reason)}
+                    record_span_event(
+                        self._session_span,
+                        "text_to_speech",
+                        "tts_synthesis_failed",
+                        {"failure_reason": str(result.reason)},
                     )
                     self._session_span.set_status(Status(StatusCode.ERROR, error_msg))
                     self._session_span.end()
@@ -1448,7 +1496,9 @@ class SpeechSynthesizer:
             logger.error(error_msg)
 
             if self._session_span:
-                self._session_span.add_event(
+                record_span_event(
+                    self._session_span,
+                    "text_to_speech",
                     "tts_synthesis_exception",
                     {"error_type": type(e).__name__, "error_message": str(e)},
                 )
@@ -1525,7 +1575,9 @@ class SpeechSynthesizer:
         try:
             # Add event for synthesis start
             if self._session_span:
-                self._session_span.add_event(
+                record_span_event(
+                    self._session_span,
+                    "text_to_speech",
                     "tts_frame_synthesis_started",
                     {
                         "text_length": len(text),
@@ -1551,7 +1603,9 @@ class SpeechSynthesizer:
             speech_config.set_speech_synthesis_output_format(sdk_format)
 
             if self._session_span:
-                self._session_span.add_event("tts_frame_config_created")
+                record_span_event(
+                    self._session_span, "text_to_speech", "tts_frame_config_created"
+                )
 
             # 2) Synthesize to memory (audio_config=None) - NO AUDIO HARDWARE NEEDED
             synth = speechsdk.SpeechSynthesizer(
@@ -1559,7 +1613,9 @@ class SpeechSynthesizer:
             )
 
             if self._session_span:
-                self._session_span.add_event("tts_frame_synthesizer_created")
+                record_span_event(
+                    self._session_span, "text_to_speech", "tts_frame_synthesizer_created"
+                )
 
             logger.debug(
                 f"Synthesizing text with Azure TTS (voice: {voice}): {text[:100]}..."
@@ -1590,7 +1646,9 @@ class SpeechSynthesizer:
                 raw_bytes = result.audio_data
 
                 if self._session_span:
-                    self._session_span.add_event(
+                    record_span_event(
+                        self._session_span,
+                        "text_to_speech",
                         "tts_frame_synthesis_completed",
                         {"audio_data_size": len(raw_bytes), "synthesis_success": True},
                     )
@@ -1605,7 +1663,9 @@ class SpeechSynthesizer:
                         logger.info("Retrying frame synthesis with refreshed authentication")
                         
                         if self._session_span:
-                            self._session_span.add_event(
+                            record_span_event(
+                                self._session_span,
+                                "text_to_speech",
                                 "tts_frame_authentication_refreshed",
                                 {"retry_attempt": True}
                             )
@@ -1630,7 +1690,9 @@ class SpeechSynthesizer:
                         if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
                             raw_bytes = result.audio_data
                             if self._session_span:
-                                self._session_span.add_event(
+                                record_span_event(
+                                    self._session_span,
+                                    "text_to_speech",
                                     "tts_frame_synthesis_completed_retry",
                                     {"audio_data_size": len(raw_bytes), "synthesis_success": True},
                                 )
@@ -1654,7 +1716,9 @@ class SpeechSynthesizer:
                         error_msg += f" Details: {result.cancellation_details.reason}"
 
                     if self._session_span:
-                        self._session_span.add_event(
+                        record_span_event(
+                            self._session_span,
+                            "text_to_speech",
                             "tts_frame_synthesis_failed",
                             {
                                 "error_reason": str(result.reason),
@@ -1680,7 +1744,9 @@ class SpeechSynthesizer:
                     base64_frames.append(b64_frame)
 
             if self._session_span:
-                self._session_span.add_event(
+                record_span_event(
+                    self._session_span,
+                    "text_to_speech",
                     "tts_frame_processing_completed",
                     {
                         "total_frames": len(base64_frames),
@@ -1693,7 +1759,9 @@ class SpeechSynthesizer:
 
         except Exception as e:
             if self._session_span:
-                self._session_span.add_event(
+                record_span_event(
+                    self._session_span,
+                    "text_to_speech",
                     "tts_frame_synthesis_error",
                     {"error_type": type(e).__name__, "error_message": str(e)},
                 )
@@ -50,6 +50,7 @@ from src.agenticmemory.types import ChatHistory, CoreMemory
 from src.agenticmemory.utils import LatencyTracker
 
 # TODO Fix this area
+from src.pools.executors import Workload, run_in_workload
 from src.redis.manager import AzureRedisManager
 from src.tools.latency_helpers import StageSample
 from src.tools.latency_helpers import PersistentLatency
@@ -447,9 +448,8 @@ class MemoManager:
             key = self.build_redis_key(self.session_id)
             await redis_mgr.store_session_data_async(key, self.to_redis_dict())
             if ttl_seconds:
-                loop = asyncio.get_event_loop()
-                await loop.run_in_executor(
-                    None, redis_mgr.redis_client.expire, key, ttl_seconds
+                await run_in_workload(
+                    Workload.STORAGE, redis_mgr.redis_client.expire, key, ttl_seconds
                 )
             logger.info(
                 f"Persisted session {self.session_id} async – "
@@ -1167,7 +1167,8 @@ class MemoManager:
             This method always updates the system prompt content on each
             call, ensuring the agent operates with the most current instructions.
         """
-        history = self.histories.setdefault(agent_name, [])
+        # ``histories`` is a shallow copy; a new thread must be created in place.
+        history = self.history.get_agent(agent_name)
 
         if not history or history[0].get("role") != "system":
             history.insert(0, {"role": "system", "content": system_prompt})
@@ -6,6 +6,13 @@ import uuid
 from dataclasses import dataclass, asdict
 from typing import Any, Dict, List, Optional, Tuple
 
+from src.tools.latency_sketch import (
+    add_to_sketch_dict,
+    fleet_latency,
+    new_sketch_dict,
+    summarize_session_sketches,
+)
+from src.tools.turn_waterfall import build_waterfall
 from utils.ml_logging import get_logger
 
 logger = get_logger("tools.latency_helpers")
@@ -55,11 +62,13 @@ class PersistentLatency:
            "samples": [
               {"stage": "stt", "start": ..., "end": ..., "dur": ..., "meta": {...}},
               ...
-           ]
+           ],
+           "marks": {"stt_final": ..., "first_frame_sent": ...}  # point events
          },
          ...
       },
-      "order": ["abc123", "def456", ...]  # recency list to enforce MAX_RUNS
+      "order": ["abc123", "def456", ...],  # recency list to enforce MAX_RUNS
+      "sketches": {"stt": {...}, ...}  # per-stage LatencySketch, never trimmed
     }
     """
 
@@ -103,11 +112,45 @@ class PersistentLatency:
         rid = run_id or self.current_run_id() or self.begin_run()
         self._inflight[(rid, stage)] = _now()
 
+    def cancel(self, stage: str) -> None:
+        """Discard an in-flight ``stage`` timer on any run without recording it."""
+        for key in [key for key in self._inflight if key[1] == stage]:
+            del self._inflight[key]
+
+    def mark(
+        self,
+        name: str,
+        *,
+        run_id: Optional[str] = None,
+        at: Optional[float] = None,
+        overwrite: bool = False,
+    ) -> Optional[float]:
+        """
+        Record a point event on a run (first occurrence wins unless ``overwrite``).
+
+        ``at`` must come from the same clock as stage timers (``perf_counter``).
+        Returns the stored timestamp.
+        """
+        rid = run_id or self.current_run_id() or self.begin_run()
+        lat = self._get_bucket()
+        run = self._ensure_run(lat, rid)
+        marks = run.setdefault("marks", {})
+        if name not in marks or overwrite:
+            marks[name] = _now() if at is None else at
+            self._set_bucket(lat)
+        return marks[name]
+
+    def waterfall(self, run_id: Optional[str] = None) -> Dict[str, Any]:
+        """Critical-path waterfall for a run (defaults to the current run)."""
+        rid = run_id or self.current_run_id()
+        run = self._get_bucket().get("runs", {}).get(rid) if rid else None
+        return build_waterfall(run or {"run_id": rid})
+
     def stop(
         self,
         stage: str,
         *,
-        redis_mgr,
+        redis_mgr=None,
         run_id: Optional[str] = None,
         meta: Optional[Dict[str, Any]] = None,
     ) -> Optional[StageSample]:
@@ -129,10 +172,11 @@ class PersistentLatency:
         )
         self._append_sample(rid, sample)
         # persist immediately for live dashboards
-        try:
-            self.cm.persist_to_redis(redis_mgr)
-        except Exception as e:
-            logger.error("Failed to persist latency to Redis: %s", e)
+        if redis_mgr is not None:
+            try:
+                self.cm.persist_to_redis(redis_mgr)
+            except Exception as e:
+                logger.error("Failed to persist latency to Redis: %s", e)
         logger.info("[Latency] %s run=%s: %.3f s", stage, rid, sample.dur)
         return sample
 
@@ -140,7 +184,10 @@ class PersistentLatency:
     def session_summary(self) -> Dict[str, Dict[str, float]]:
         """
         Aggregate across all runs, per stage.
-        Returns { stage: {count, avg, min, max, total} }
+        Returns { stage: {count, avg, min, max, total, p50, p95, p99} }
+
+        count/avg/min/max/total cover the retained runs; the percentiles come
+        from the session sketch and therefore cover every sample.
         """
         lat = self._get_bucket()
         out: Dict[str, Dict[str, float]] = {}
@@ -159,6 +206,11 @@ class PersistentLatency:
                     acc["max"] = d
         for st, acc in out.items():
             acc["avg"] = acc["total"] / acc["count"] if acc["count"] else 0.0
+        for st, pct in summarize_session_sketches(lat.get("sketches", {})).items():
+            if st in out:
+                out[st].update(
+                    {f"p{q}": pct[f"p{q}_ms"] / 1000.0 for q in (50, 95, 99)}
+                )
         return out
 
     def run_summary(self, run_id: str) -> Dict[str, Dict[str, float]]:
@@ -189,22 +241,33 @@ class PersistentLatency:
     # ---------- helpers ----------
     def _append_sample(self, run_id: str, sample: StageSample) -> None:
         lat = self._get_bucket()
-        run = lat.setdefault("runs", {}).get(run_id)
-        if not run:
-            # create missing run bucket if someone forgot begin_run()
-            run = asdict(
-                RunRecord(run_id=run_id, label="turn", created_at=_now(), samples=[])
-            )
-            lat.setdefault("runs", {})[run_id] = run
-            lat.setdefault("order", []).append(run_id)
+        run = self._ensure_run(lat, run_id)
 
         samples: List[Dict[str, Any]] = run["samples"]
         samples.append(asdict(sample))
         # cap samples to avoid unbounded growth
         if len(samples) > MAX_SAMPLES_PER_RUN:
             del samples[0 : len(samples) - MAX_SAMPLES_PER_RUN]
+
+        sketches = lat.setdefault("sketches", {})
+        sketch = sketches.get(sample.stage)
+        if sketch is None:
+            sketch = sketches[sample.stage] = new_sketch_dict()
+        add_to_sketch_dict(sketch, sample.dur * 1000.0)
+        fleet_latency.record(sample.stage, sample.dur)
         self._set_bucket(lat)
 
+    def _ensure_run(self, lat: Dict[str, Any], run_id: str) -> Dict[str, Any]:
+        run = lat.setdefault("runs", {}).get(run_id)
+        if not run:
+            # create missing run bucket if someone forgot begin_run()
+            run = asdict(
+                RunRecord(run_id=run_id, label="turn", created_at=_now(), samples=[])
+            )
+            lat["runs"][run_id] = run
+            lat.setdefault("order", []).append(run_id)
+        return run
+
     def _get_bucket(self) -> Dict[str, Any]:
         return self.cm.get_context(_CORE_KEY, {"runs": {}, "order": []})
 
@@ -0,0 +1,351 @@
+"""
+Mergeable latency histograms for fleet-wide percentiles.
+
+``compute_latency_statistics`` sorts raw durations from one session payload,
+which does not scale to p95/p99 across thousands of calls. Here every sample
+is counted into a log-bucketed histogram instead (the DDSketch mapping):
+bucket ``i`` covers ``(gamma**(i-1), gamma**i]`` milliseconds with
+``gamma = (1 + a) / (1 - a)``. Any quantile is then returned with relative
+error at most ``a``. Two histograms merge by adding bucket counts, so the
+merge is exact, associative and order-free.
+
+That property carries the fleet view:
+
+- :class:`LatencySketch` is kept per session under
+  ``CoreMemory["latency"]["sketches"]``, one per stage, in its
+  :meth:`~LatencySketch.to_dict` form; samples are added to that dict in
+  place (:func:`add_to_sketch_dict`), so it is serialized only when the
+  session is persisted;
+- :class:`FleetLatencyRecorder` buffers the same samples per replica and
+  every few seconds ``HINCRBY``-s the bucket deltas into one Redis hash per
+  minute (``latency:hist:<epoch-minute>``, fields ``<stage>|<bucket>``).
+  Concurrent increments from many replicas merge on the server. Each
+  minute's deltas carry a batch id and are applied at most once, so a
+  failed batch is re-sent on the next flush without double counting;
+- :meth:`FleetLatencyRecorder.query` reads the hashes for a time window in
+  one pipelined round trip and merges them. The cost depends on the window
+  and the number of distinct buckets, not on the number of calls.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+import uuid
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.pools.executors import Workload, run_in_workload
+from utils.ml_logging import get_logger
+
+logger = get_logger("tools.latency_sketch")
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+# Durations at or below this (ms) are counted in a dedicated zero bucket.
+MIN_TRACKED_MS = 0.01
+DEFAULT_QUANTILES: Tuple[float, ...] = (0.5, 0.9, 0.95, 0.99)
+
+_ZERO = "z"
+_COUNT = "n"
+_SUM = "sum"
+_SEP = "|"
+
+
+@lru_cache(maxsize=8)
+def _log_gamma(relative_accuracy: float) -> float:
+    return math.log((1 + relative_accuracy) / (1 - relative_accuracy))
+
+
+class LatencySketch:
+    """Log-bucketed histogram of durations in milliseconds."""
+
+    __slots__ = ("relative_accuracy", "_log_gamma", "buckets", "zero_count", "count", "total_ms")
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY) -> None:
+        if not 0.0 < relative_accuracy < 1.0:
+            raise ValueError("relative_accuracy must be in (0, 1)")
+        self.relative_accuracy = relative_accuracy
+        self._log_gamma = _log_gamma(relative_accuracy)
+        self.buckets: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.total_ms = 0.0
+
+    def bucket_index(self, value_ms: float) -> int:
+        return math.ceil(math.log(value_ms) / self._log_gamma)
+
+    def bucket_value(self, index: int) -> float:
+        """Representative value of a bucket (within ``relative_accuracy`` of any member)."""
+        gamma = math.exp(self._log_gamma)
+        return 2.0 * gamma**index / (gamma + 1.0)
+
+    def add(self, value_ms: float, count: int = 1) -> None:
+        if value_ms <= MIN_TRACKED_MS:
+            self.zero_count += count
+        else:
+            index = self.bucket_index(value_ms)
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += count
+        self.total_ms += value_ms * count
+
+    def merge(self, other: "LatencySketch") -> None:
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("cannot merge sketches with different accuracy")
+        for index, n in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + n
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.total_ms += other.total_ms
+
+    def quantile(self, q: float) -> float:
+        """Nearest-rank quantile, ``q`` in [0, 1]."""
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))
+        seen = self.zero_count
+        if seen >= rank:
+            return 0.0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return self.bucket_value(index)
+        return self.bucket_value(max(self.buckets))
+
+    def summary(self, quantiles: Iterable[float] = DEFAULT_QUANTILES) -> Dict[str, float]:
+        out: Dict[str, float] = {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 2) if self.count else 0.0,
+        }
+        for q in quantiles:
+            out[f"p{q * 100:g}_ms"] = round(self.quantile(q), 2)
+        return out
+
+    # ---------- serialization ----------
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-safe form for CoreMemory (bucket keys become strings)."""
+        return {
+            "a": self.relative_accuracy,
+            _COUNT: self.count,
+            _SUM: self.total_ms,
+            _ZERO: self.zero_count,
+            "b": {str(i): n for i, n in self.buckets.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencySketch":
+        sketch = cls(data.get("a", DEFAULT_RELATIVE_ACCURACY))
+        sketch.count = int(data.get(_COUNT, 0))
+        sketch.total_ms = float(data.get(_SUM, 0.0))
+        sketch.zero_count = int(data.get(_ZERO, 0))
+        sketch.buckets = {int(i): int(n) for i, n in (data.get("b") or {}).items()}
+        return sketch
+
+    def to_hash_fields(self, stage: str) -> Dict[str, float]:
+        """Redis hash increments for this sketch, namespaced by stage."""
+        fields: Dict[str, float] = {
+            f"{stage}{_SEP}{index}": n for index, n in self.buckets.items()
+        }
+        if self.zero_count:
+            fields[f"{stage}{_SEP}{_ZERO}"] = self.zero_count
+        fields[f"{stage}{_SEP}{_COUNT}"] = self.count
+        fields[f"{stage}{_SEP}{_SUM}"] = float(self.total_ms)
+        return fields
+
+
+def new_sketch_dict(relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY) -> Dict[str, Any]:
+    return LatencySketch(relative_accuracy).to_dict()
+
+
+def add_to_sketch_dict(data: Dict[str, Any], value_ms: float) -> None:
+    """:meth:`LatencySketch.add` applied in place to the :meth:`~LatencySketch.to_dict` form."""
+    data[_COUNT] = data.get(_COUNT, 0) + 1
+    data[_SUM] = data.get(_SUM, 0.0) + value_ms
+    if value_ms <= MIN_TRACKED_MS:
+        data[_ZERO] = data.get(_ZERO, 0) + 1
+        return
+    accuracy = data.setdefault("a", DEFAULT_RELATIVE_ACCURACY)
+    key = str(math.ceil(math.log(value_ms) / _log_gamma(accuracy)))
+    buckets = data.setdefault("b", {})
+    buckets[key] = buckets.get(key, 0) + 1
+
+
+def sketches_from_hash(
+    fields: Dict[str, str],
+    relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+    into: Optional[Dict[str, LatencySketch]] = None,
+) -> Dict[str, LatencySketch]:
+    """Parse (and optionally merge into ``into``) the per-stage sketches of one minute hash."""
+    out = into if into is not None else {}
+    for field, raw in fields.items():
+        stage, _, slot = field.rpartition(_SEP)
+        if not stage:
+            continue
+        sketch = out.get(stage)
+        if sketch is None:
+            sketch = out[stage] = LatencySketch(relative_accuracy)
+        if slot == _SUM:
+            sketch.total_ms += float(raw)
+        elif slot == _COUNT:
+            sketch.count += int(raw)
+        elif slot == _ZERO:
+            sketch.zero_count += int(raw)
+        else:
+            index = int(slot)
+            sketch.buckets[index] = sketch.buckets.get(index, 0) + int(raw)
+    return out
+
+
+class FleetLatencyRecorder:
+    """
+    Per-replica buffer of stage sketches flushed to per-minute Redis hashes.
+
+    ``record`` is thread-safe and only touches memory; Redis I/O happens in
+    ``flush`` on the storage executor. When disabled, ``record`` is a no-op.
+    """
+
+    def __init__(
+        self,
+        *,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        flush_interval_s: float = 10.0,
+        retention_minutes: int = 1440,
+        key_prefix: str = "latency:hist",
+    ) -> None:
+        self.relative_accuracy = relative_accuracy
+        self.flush_interval_s = flush_interval_s
+        self.retention_minutes = retention_minutes
+        self.key_prefix = key_prefix
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._pending: Dict[int, Dict[str, LatencySketch]] = defaultdict(dict)
+        self._redis = None
+        self._task: Optional[asyncio.Task] = None
+        # (minute, batch id, fields) that failed to flush; re-sent as-is.
+        self._unsent: List[Tuple[int, str, Dict[str, float]]] = []
+        self.flushes = 0
+        self.flush_errors = 0
+
+    def configure(self, **kwargs: Any) -> None:
+        for name, value in kwargs.items():
+            if not hasattr(self, name):
+                raise AttributeError(name)
+            setattr(self, name, value)
+
+    def key_for_minute(self, minute: int) -> str:
+        return f"{self.key_prefix}:{minute}"
+
+    def record(self, stage: str, duration_s: float, *, now: Optional[float] = None) -> None:
+        if not self.enabled:
+            return
+        minute = int((time.time() if now is None else now) // 60)
+        with self._lock:
+            bucket = self._pending[minute]
+            sketch = bucket.get(stage)
+            if sketch is None:
+                sketch = bucket[stage] = LatencySketch(self.relative_accuracy)
+            sketch.add(duration_s * 1000.0)
+
+    def flush(self, redis_mgr) -> int:
+        """Write buffered deltas to Redis; return the number of minute hashes written."""
+        with self._lock:
+            pending, self._pending = self._pending, defaultdict(dict)
+            batches, self._unsent = self._unsent, []
+        for minute, stages in sorted(pending.items()):
+            fields: Dict[str, float] = {}
+            for stage, sketch in stages.items():
+                fields.update(sketch.to_hash_fields(stage))
+            batches.append((minute, uuid.uuid4().hex, fields))
+        if not batches:
+            return 0
+
+        ttl = self.retention_minutes * 60
+        oldest = int(time.time() // 60) - self.retention_minutes
+        written = 0
+        for minute, batch_id, fields in batches:
+            try:
+                redis_mgr.increment_hash_fields_once(
+                    self.key_for_minute(minute), fields, batch_id=batch_id, ttl_seconds=ttl
+                )
+                written += 1
+            except Exception as exc:
+                self.flush_errors += 1
+                logger.warning("latency histogram flush failed for minute %s: %s", minute, exc)
+                if minute >= oldest:
+                    with self._lock:
+                        self._unsent.append((minute, batch_id, fields))
+        self.flushes += 1
+        return written
+
+    def query(
+        self,
+        redis_mgr,
+        *,
+        window_minutes: int = 15,
+        stages: Optional[Iterable[str]] = None,
+        now: Optional[float] = None,
+        quantiles: Iterable[float] = DEFAULT_QUANTILES,
+    ) -> Dict[str, Any]:
+        """Merge the last ``window_minutes`` (including the current one) across the fleet."""
+        window_minutes = max(1, min(window_minutes, self.retention_minutes))
+        last = int((time.time() if now is None else now) // 60)
+        minutes = list(range(last - window_minutes + 1, last + 1))
+        hashes = redis_mgr.get_many_hashes([self.key_for_minute(m) for m in minutes])
+
+        merged: Dict[str, LatencySketch] = {}
+        for fields in hashes:
+            sketches_from_hash(fields, self.relative_accuracy, into=merged)
+
+        wanted = set(stages) if stages else None
+        return {
+            "window_minutes": window_minutes,
+            "window_start": minutes[0] * 60,
+            "window_end": (minutes[-1] + 1) * 60,
+            "relative_accuracy": self.relative_accuracy,
+            "stages": {
+                stage: sketch.summary(quantiles)
+                for stage, sketch in sorted(merged.items())
+                if wanted is None or stage in wanted
+            },
+        }
+
+    # ---------- lifecycle ----------
+    async def start(self, redis_mgr) -> None:
+        self._redis = redis_mgr
+        self.enabled = True
+        if self._task is None:
+            self._task = asyncio.create_task(self._flush_loop(), name="latency-histogram-flush")
+
+    async def stop(self) -> None:
+        self.enabled = False
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._redis is not None:
+            await run_in_workload(Workload.STORAGE, self.flush, self._redis)
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval_s)
+            try:
+                await run_in_workload(Workload.STORAGE, self.flush, self._redis)
+            except Exception as exc:  # pragma: no cover - flush already logs
+                logger.warning("latency histogram flush loop error: %s", exc)
+
+
+fleet_latency = FleetLatencyRecorder()
+"""Process-wide recorder; started from the app lifespan when enabled."""
+
+
+def summarize_session_sketches(sketches: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    """Percentile summary of the per-stage sketches stored in a session."""
+    return {
+        stage: LatencySketch.from_dict(data).summary() for stage, data in sketches.items()
+    }
+
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from typing import Any, Dict, Optional
 
 from utils.ml_logging import get_logger
@@ -21,6 +22,8 @@ class LatencyTool:
         self._store = PersistentLatency(cm)
         # Track active timers to prevent start/stop mismatches
         self._active_timers = set()
+        # Marks observed before the turn's run exists (speech_end, stt_final)
+        self._pending_marks: Dict[str, float] = {}
 
     # Optional: set current run for this connection
     def set_current_run(self, run_id: str) -> None:
@@ -31,8 +34,31 @@ class LatencyTool:
 
     def begin_run(self, label: str = "turn") -> str:
         rid = self._store.begin_run(label=label)
+        pending, self._pending_marks = self._pending_marks, {}
+        for name, at in pending.items():
+            self._store.mark(name, run_id=rid, at=at)
         return rid
 
+    def mark(
+        self, name: str, *, next_run: bool = False, at: Optional[float] = None
+    ) -> None:
+        """
+        Record a point event for the turn waterfall.
+
+        With ``next_run`` the mark is held (latest wins) until the next
+        ``begin_run`` - used for events that precede the turn, such as the
+        caller's last voiced frame and the STT final. Otherwise it lands on
+        the current run and the first occurrence wins. ``at`` is a
+        ``time.perf_counter()`` timestamp (defaults to now).
+        """
+        if next_run:
+            self._pending_marks[name] = time.perf_counter() if at is None else at
+            return
+        self._store.mark(name, at=at)
+
+    def waterfall(self, run_id: Optional[str] = None) -> Dict[str, Any]:
+        return self._store.waterfall(run_id)
+
     def start(self, stage: str) -> None:
         # Track timer state to prevent duplicate starts
         if stage in self._active_timers:
@@ -45,7 +71,7 @@ class LatencyTool:
         self._store.start(stage)
 
     def stop(
-        self, stage: str, redis_mgr, *, meta: Optional[Dict[str, Any]] = None
+        self, stage: str, redis_mgr=None, *, meta: Optional[Dict[str, Any]] = None
     ) -> None:
         # Check timer state before stopping
         if stage not in self._active_timers:
@@ -55,6 +81,14 @@ class LatencyTool:
         self._active_timers.discard(stage)  # Remove from active set
         self._store.stop(stage, redis_mgr=redis_mgr, meta=meta)
 
+    def is_running(self, stage: str) -> bool:
+        return stage in self._active_timers
+
+    def cancel(self, stage: str) -> None:
+        """Drop a running timer without recording a sample."""
+        self._active_timers.discard(stage)
+        self._store.cancel(stage)
+
     # convenient summaries for dashboards
     def session_summary(self):
         return self._store.session_summary()
@@ -69,3 +103,4 @@ class LatencyTool:
                 f"[PERF] Cleaning up {len(self._active_timers)} active timers: {self._active_timers}"
             )
             self._active_timers.clear()
+        self._pending_marks.clear()
@@ -0,0 +1,227 @@
+"""
+Critical-path waterfall for a single conversational turn.
+
+Stage timers (``aoai:ttfb``, ``tts:synthesis``, ``tts:send_frames`` ...) and
+point marks (``speech_end``, ``stt_final``, ``first_frame_sent``) recorded by
+:class:`~src.tools.latency_helpers.PersistentLatency` share one clock
+(``time.perf_counter``). This module lays them on the timeline of the path
+the caller experiences as silence:
+
+    speech_end -> stt_final -> llm_request -> llm_first_token
+               -> tts_request -> tts_first_byte -> first_frame_sent
+
+The *dead air* of a turn runs from the caller's last voiced frame (or the STT
+final when no frame mark exists) to the first audio frame sent back. Every
+millisecond of it is attributed to exactly one label:
+
+- the innermost stage timer running at that moment (latest start wins, so
+  ``aoai:ttfb`` beats ``aoai:total``);
+- ``stt:finalize`` between ``speech_end`` and ``stt_final``;
+- ``gap:after_<milestone>`` when no timer runs. These gaps are untimed
+  work, such as queueing, orchestration or sentence buffering, and are
+  named after the last milestone reached.
+
+Time where stages of different families (``aoai:*`` vs ``tts:*``) run
+together is reported separately as parallelism.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+MILESTONES: Tuple[str, ...] = (
+    "speech_end",
+    "stt_final",
+    "llm_request",
+    "llm_first_token",
+    "tts_request",
+    "tts_first_byte",
+    "first_frame_sent",
+)
+
+# milestone -> (stage, "start" | "end") used when no explicit mark exists
+_FROM_STAGE: Dict[str, Tuple[str, str]] = {
+    "llm_request": ("aoai:ttfb", "start"),
+    "llm_first_token": ("aoai:ttfb", "end"),
+    "tts_request": ("tts:synthesis", "start"),
+    # Browser synthesis is buffered, so the first byte arrives with the last.
+    "tts_first_byte": ("tts:synthesis", "end"),
+    "first_frame_sent": ("tts:send_frames", "start"),
+}
+
+Interval = Tuple[str, float, float]
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000.0, 1)
+
+
+def _first_sample(samples: List[Dict[str, Any]], stage: str) -> Optional[Dict[str, Any]]:
+    matching = [s for s in samples if s.get("stage") == stage]
+    return min(matching, key=lambda s: s["start"]) if matching else None
+
+
+def resolve_milestones(run: Dict[str, Any]) -> Dict[str, float]:
+    """Absolute timestamps of the milestones present in a run record."""
+    marks: Dict[str, float] = dict(run.get("marks") or {})
+    samples: List[Dict[str, Any]] = run.get("samples") or []
+    out: Dict[str, float] = {}
+    for name in MILESTONES:
+        if name in marks:
+            out[name] = float(marks[name])
+            continue
+        source = _FROM_STAGE.get(name)
+        sample = _first_sample(samples, source[0]) if source else None
+        if sample is not None:
+            out[name] = float(sample[source[1]])
+
+    # Frames that kept arriving after the final belong to the next utterance.
+    if "speech_end" in out and "stt_final" in out and out["speech_end"] > out["stt_final"]:
+        del out["speech_end"]
+    return out
+
+
+def _intervals(run: Dict[str, Any], milestones: Dict[str, float]) -> List[Interval]:
+    intervals: List[Interval] = [
+        (s["stage"], float(s["start"]), float(s["end"]))
+        for s in run.get("samples") or []
+        if s.get("stage") and s.get("end", 0) > s.get("start", 0)
+    ]
+    if "speech_end" in milestones and "stt_final" in milestones:
+        intervals.append(("stt:finalize", milestones["speech_end"], milestones["stt_final"]))
+    return intervals
+
+
+def _parallel_overlaps(intervals: List[Interval], lo: float, hi: float) -> List[Dict[str, Any]]:
+    visible = [iv for iv in intervals if iv[2] > lo and iv[1] < hi]
+    out: List[Dict[str, Any]] = []
+    for i, (n1, a1, b1) in enumerate(visible):
+        for n2, a2, b2 in visible[i + 1 :]:
+            # Same family (aoai:total / aoai:ttfb) is hierarchy, not parallelism.
+            if n1.split(":", 1)[0] == n2.split(":", 1)[0]:
+                continue
+            shared = min(b1, b2, hi) - max(a1, a2, lo)
+            if shared > 0:
+                out.append({"stages": sorted((n1, n2)), "ms": _ms(shared)})
+    return out
+
+
+def build_waterfall(run: Dict[str, Any]) -> Dict[str, Any]:
+    """Critical-path breakdown of one run record (see module docstring)."""
+    milestones = resolve_milestones(run)
+    start = milestones.get("speech_end", milestones.get("stt_final"))
+    end = milestones.get("first_frame_sent")
+    result: Dict[str, Any] = {
+        "run_id": run.get("run_id"),
+        "complete": start is not None and end is not None and end >= start,
+        "milestones": {},
+        "segments": [],
+        "dead_air_ms": None,
+        "attribution": {},
+        "gaps": [],
+        "overlaps": [],
+    }
+    if start is None:
+        return result
+    if not result["complete"]:
+        # Partial turn (no audio sent yet, or barged in): analyse what exists.
+        end = max([t for t in milestones.values() if t >= start], default=start)
+
+    reached = sorted(
+        ((name, t) for name, t in milestones.items() if start <= t <= end),
+        key=lambda item: item[1],
+    )
+    result["milestones"] = {name: _ms(t - start) for name, t in reached}
+    result["segments"] = [
+        {"from": a, "to": b, "ms": _ms(tb - ta)}
+        for (a, ta), (b, tb) in zip(reached, reached[1:])
+    ]
+    result["dead_air_ms"] = _ms(end - start)
+
+    intervals = _intervals(run, milestones)
+    bounds = sorted(
+        {start, end}
+        | {t for _, a, b in intervals for t in (a, b) if start < t < end}
+        | {t for _, t in reached}
+    )
+    attribution: Dict[str, float] = defaultdict(float)
+    gaps: List[Dict[str, Any]] = []
+    for lo, hi in zip(bounds, bounds[1:]):
+        if hi <= lo:
+            continue
+        active = [iv for iv in intervals if iv[1] <= lo and iv[2] >= hi]
+        if active:
+            label = max(active, key=lambda iv: (iv[1], -(iv[2] - iv[1])))[0]
+        else:
+            last = [name for name, t in reached if t <= lo]
+            label = f"gap:after_{last[-1]}" if last else "gap:before_first_milestone"
+            if gaps and gaps[-1]["label"] == label and gaps[-1]["_end"] == lo:
+                gaps[-1]["_end"] = hi
+            else:
+                gaps.append({"label": label, "_start": lo, "_end": hi})
+        attribution[label] += hi - lo
+
+    result["attribution"] = {
+        label: _ms(sec) for label, sec in sorted(attribution.items(), key=lambda kv: -kv[1])
+    }
+    result["gaps"] = [
+        {"label": g["label"], "at_ms": _ms(g["_start"] - start), "ms": _ms(g["_end"] - g["_start"])}
+        for g in gaps
+    ]
+    result["overlaps"] = _parallel_overlaps(intervals, start, end)
+    return result
+
+
+def session_waterfalls(latency: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Waterfalls for every turn run in a ``CoreMemory["latency"]`` payload, oldest first."""
+    runs = latency.get("runs") or {}
+    order = latency.get("order") or list(runs)
+    return [
+        build_waterfall(runs[rid])
+        for rid in order
+        if rid in runs and runs[rid].get("label", "turn") == "turn"
+    ]
+
+
+def _nearest_rank(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(q * len(ordered))) - 1]
+
+
+def aggregate_waterfalls(waterfalls: Iterable[Dict[str, Any]], top: int = 10) -> Dict[str, Any]:
+    """Rank the labels that contribute most dead air across complete turns."""
+    complete = [w for w in waterfalls if w.get("complete")]
+    if not complete:
+        return {"turns": 0, "dead_air_ms": {}, "top_contributors": []}
+
+    dead_air = [w["dead_air_ms"] for w in complete]
+    per_label: Dict[str, List[float]] = defaultdict(list)
+    for w in complete:
+        for label, ms in w["attribution"].items():
+            per_label[label].append(ms)
+
+    total = sum(dead_air)
+    contributors = [
+        {
+            "label": label,
+            "total_ms": round(sum(values), 1),
+            "share_pct": round(100.0 * sum(values) / total, 1) if total else 0.0,
+            "turns": len(values),
+            "mean_ms": round(sum(values) / len(complete), 1),
+            "p95_ms": _nearest_rank(values + [0.0] * (len(complete) - len(values)), 0.95),
+        }
+        for label, values in per_label.items()
+    ]
+    contributors.sort(key=lambda c: -c["total_ms"])
+    return {
+        "turns": len(complete),
+        "dead_air_ms": {
+            "mean": round(total / len(complete), 1),
+            "p50": _nearest_rank(dead_air, 0.5),
+            "p95": _nearest_rank(dead_air, 0.95),
+            "max": max(dead_air),
+        },
+        "top_contributors": contributors[:top],
+    }
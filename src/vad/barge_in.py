@@ -0,0 +1,312 @@
+"""
+Local barge-in detection on inbound PCM audio.
+
+Waiting for a Speech SDK partial before stopping TTS adds the recognizer's
+network and decoding delay (typically several hundred milliseconds) to every
+interruption. :class:`BargeInDetector` looks at the raw caller frames while
+the bot is talking and fires after ``trigger_frames`` consecutive frames look
+like near-end speech, i.e. within one or two 20 ms frames of the caller
+starting to talk.
+
+Per frame it computes two cheap features:
+
+- **level** – RMS in dBFS;
+- **zero-crossing rate** – expressed in Hz (``crossings * rate / 2n``) so it
+  is independent of frame size and sample rate. Voiced speech sits roughly
+  between 80 Hz and a few kHz; mains hum is below that range and broadband
+  hiss above it.
+
+The level threshold is echo-aware. It is the highest of:
+
+- the absolute ``threshold_db``;
+- a running floor learned from frames that did *not* trigger, plus
+  ``floor_margin_db``. The floor is learned during playback too, so it
+  includes residual echo;
+- the current TTS playback level minus ``echo_return_loss_db``. This is the
+  loudest echo expected back from the caller's speaker. TTS audio is sent
+  faster than real time, so the sender registers a per-frame level envelope
+  (:meth:`BargeInDetector.add_playback_envelope`) and the detector looks up
+  the level for the frame being heard by elapsed time.
+
+A local trigger is provisional. :class:`ProvisionalBargeIn` ducks playback
+right away and commits the cancel only if an STT partial confirms the
+trigger within the window; otherwise playback resumes. When a partial
+arrives the caller calls :meth:`BargeInDetector.confirm`, which returns the
+detector's lead over the recognizer (the stop latency saved). A trigger that
+no partial confirms in time counts as a false positive
+(:meth:`BargeInDetector.reject`). It raises the margin for later turns, so
+noisy or echo-prone lines become more conservative on their own.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.vad.gate import frame_level_db
+
+
+def zero_crossing_hz(frame: bytes, sample_rate: int) -> float:
+    """Zero-crossing rate of a PCM16 frame, in Hz."""
+    samples = np.frombuffer(frame, dtype=np.int16)
+    if samples.size < 2:
+        return 0.0
+    signs = np.signbit(samples)
+    crossings = int(np.count_nonzero(signs[1:] != signs[:-1]))
+    return crossings * sample_rate / (2.0 * samples.size)
+
+
+class BargeInDetector:
+    """Per-connection near-end speech detector; not thread-safe."""
+
+    def __init__(
+        self,
+        *,
+        sample_rate: int = 16000,
+        threshold_db: float = -35.0,
+        floor_margin_db: float = 12.0,
+        echo_return_loss_db: float = 20.0,
+        zcr_hz_range: Tuple[float, float] = (80.0, 3500.0),
+        trigger_frames: int = 2,
+        floor_alpha: float = 0.05,
+        confirm_timeout_ms: int = 1500,
+        false_positive_step_db: float = 3.0,
+        max_penalty_db: float = 12.0,
+    ) -> None:
+        self.sample_rate = sample_rate
+        self.threshold_db = threshold_db
+        self.floor_margin_db = floor_margin_db
+        self.echo_return_loss_db = echo_return_loss_db
+        self.zcr_hz_range = zcr_hz_range
+        self.trigger_frames = max(1, trigger_frames)
+        self.floor_alpha = floor_alpha
+        self.confirm_timeout_s = confirm_timeout_ms / 1000.0
+        self.false_positive_step_db = false_positive_step_db
+        self.max_penalty_db = max_penalty_db
+
+        self.floor_db: Optional[float] = None
+        self.playback_db: Optional[float] = None
+        self.penalty_db = 0.0
+        self.last_level_db = float("-inf")
+        self._run = 0
+        self._pending_since: Optional[float] = None
+        # (start, frame_s, levels) of queued TTS audio, in playback order.
+        self._envelopes: Deque[Tuple[float, float, List[float]]] = deque()
+
+        self.triggers = 0
+        self.confirmed = 0
+        self.false_positives = 0
+        self.lead_ms_total = 0.0
+
+    @property
+    def pending(self) -> bool:
+        """True while a local trigger is waiting for STT confirmation."""
+        return self._pending_since is not None
+
+    def set_playback_level(self, level_db: Optional[float]) -> None:
+        """Set a constant playback level (``None`` when idle); drops any envelope."""
+        self._envelopes.clear()
+        self.playback_db = level_db
+
+    def add_playback_envelope(
+        self,
+        levels_db: Sequence[float],
+        *,
+        frame_s: float = 0.02,
+        now: Optional[float] = None,
+    ) -> None:
+        """Queue per-frame levels of TTS audio that starts playing after what is queued."""
+        if not levels_db:
+            return
+        now = time.monotonic() if now is None else now
+        start = now
+        if self._envelopes:
+            last_start, last_frame_s, last_levels = self._envelopes[-1]
+            start = max(now, last_start + len(last_levels) * last_frame_s)
+        self._envelopes.append((start, frame_s, list(levels_db)))
+
+    def current_threshold_db(self) -> float:
+        threshold = self.threshold_db
+        if self.floor_db is not None:
+            threshold = max(threshold, self.floor_db + self.floor_margin_db)
+        if self.playback_db is not None:
+            threshold = max(threshold, self.playback_db - self.echo_return_loss_db)
+        return threshold + self.penalty_db
+
+    def process(self, frame: bytes, *, playing: bool, now: Optional[float] = None) -> bool:
+        """Analyse one inbound frame; return True exactly when barge-in should fire."""
+        now = time.monotonic() if now is None else now
+        self._expire(now)
+        if self._envelopes:
+            self.playback_db = self._envelope_level(now)
+
+        level = frame_level_db(frame)
+        self.last_level_db = level
+        if not playing:
+            self._run = 0
+            self._learn_floor(level)
+            return False
+
+        zcr = zero_crossing_hz(frame, self.sample_rate)
+        low, high = self.zcr_hz_range
+        if level >= self.current_threshold_db() and low <= zcr <= high:
+            self._run += 1
+        else:
+            self._run = 0
+            self._learn_floor(level)
+
+        if self._run < self.trigger_frames or self.pending:
+            return False
+        self._run = 0
+        self._pending_since = now
+        self.triggers += 1
+        return True
+
+    def confirm(self, now: Optional[float] = None) -> Optional[float]:
+        """Mark the pending trigger as real speech; return the lead in seconds."""
+        if self._pending_since is None:
+            return None
+        now = time.monotonic() if now is None else now
+        lead = max(0.0, now - self._pending_since)
+        self._pending_since = None
+        self.confirmed += 1
+        self.lead_ms_total += lead * 1000.0
+        self.penalty_db /= 2.0
+        return lead
+
+    def reject(self) -> bool:
+        """Mark the pending trigger as a false positive; False if none was pending."""
+        if self._pending_since is None:
+            return False
+        self._pending_since = None
+        self.false_positives += 1
+        self.penalty_db = min(
+            self.max_penalty_db, self.penalty_db + self.false_positive_step_db
+        )
+        return True
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "triggers": self.triggers,
+            "confirmed": self.confirmed,
+            "false_positives": self.false_positives,
+            "avg_lead_ms": round(self.lead_ms_total / self.confirmed, 1)
+            if self.confirmed
+            else 0.0,
+            "threshold_db": round(self.current_threshold_db(), 1),
+            "penalty_db": self.penalty_db,
+        }
+
+    # ------------------------------------------------------------------ #
+    def _envelope_level(self, now: float) -> Optional[float]:
+        envelopes = self._envelopes
+        while envelopes:
+            start, frame_s, levels = envelopes[0]
+            index = int((now - start) / frame_s)
+            if index < 0:
+                return None
+            if index < len(levels):
+                return levels[index]
+            envelopes.popleft()
+        return None
+
+    def _expire(self, now: float) -> None:
+        if self._pending_since is None:
+            return
+        if now - self._pending_since < self.confirm_timeout_s:
+            return
+        self.reject()
+
+    def _learn_floor(self, level: float) -> None:
+        # Only quiet frames feed the floor, so talk-over never raises it.
+        if level == float("-inf") or level >= self.current_threshold_db():
+            return
+        if self.floor_db is None:
+            self.floor_db = level
+        else:
+            self.floor_db += self.floor_alpha * (level - self.floor_db)
+
+
+BargeInCallback = Callable[[Dict[str, Any]], None]
+
+
+class ProvisionalBargeIn:
+    """
+    Duck-then-commit handling of a local barge-in trigger.
+
+    :meth:`trigger` ducks playback and opens a ``confirm_window_s`` window.
+    :meth:`confirm` (an STT partial arrived) commits the cancel; if the
+    window closes first, playback is resumed. Each callback receives the
+    keyword arguments given to :meth:`trigger`. Event-loop only.
+    """
+
+    def __init__(
+        self,
+        *,
+        duck: BargeInCallback,
+        resume: BargeInCallback,
+        commit: BargeInCallback,
+        confirm_window_s: float,
+    ) -> None:
+        self._duck = duck
+        self._resume = resume
+        self._commit = commit
+        self.confirm_window_s = confirm_window_s
+        self._meta: Optional[Dict[str, Any]] = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+        self.ducked = 0
+        self.committed = 0
+        self.resumed = 0
+
+    @property
+    def active(self) -> bool:
+        """True while playback is ducked awaiting the recognizer."""
+        return self._meta is not None
+
+    def trigger(self, **meta: Any) -> bool:
+        """Duck playback; False if a trigger is already awaiting its verdict."""
+        if self._meta is not None:
+            return False
+        self._meta = meta
+        self.ducked += 1
+        self._timer = asyncio.get_running_loop().call_later(
+            self.confirm_window_s, self._expire
+        )
+        self._duck(meta)
+        return True
+
+    def confirm(self) -> bool:
+        """Commit the cancel for the ducked trigger; False if none is active."""
+        meta = self._settle()
+        if meta is None:
+            return False
+        self.committed += 1
+        self._commit(meta)
+        return True
+
+    def discard(self) -> None:
+        """Forget the active trigger (playback ended some other way)."""
+        self._settle()
+
+    def stats(self) -> Dict[str, int]:
+        return {"ducked": self.ducked, "committed": self.committed, "resumed": self.resumed}
+
+    def _settle(self) -> Optional[Dict[str, Any]]:
+        meta, self._meta = self._meta, None
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        return meta
+
+    def _expire(self) -> None:
+        self._timer = None
+        meta, self._meta = self._meta, None
+        if meta is None:
+            return
+        self.resumed += 1
+        self._resume(meta)
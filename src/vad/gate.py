@@ -0,0 +1,265 @@
+"""
+Voice-activity gate for inbound PCM audio.
+
+Browser and Voice Live sessions stream every captured frame upstream,
+including long stretches of silence that cost bandwidth, Speech SDK CPU and
+billed audio seconds. :class:`VADGate` sits between the socket and the
+recognizer and decides, frame by frame, what to forward:
+
+1. **Energy pre-gate** – RMS level per frame in dBFS (NumPy, no model).
+   Frames below ``energy_threshold_db`` are silence without further work.
+2. **Model VAD (optional)** – frames that pass the energy gate are scored by
+   a speech-probability model. Candidates are collected for ``batch_frames``
+   frames and scored with one call, so the model runs once per batch
+   instead of once per 20 ms frame.
+3. **Hangover and padding** – once speech starts, ``pad_ms`` of audio that
+   preceded it is replayed so onsets are not clipped, and the gate stays
+   open for ``hangover_ms`` after the last speech frame so the recognizer
+   still sees the trailing silence it uses for end-of-utterance detection.
+
+Outside speech the gate either drops silence (``mode="drop"``), forwards
+one frame in ``compress_keep_every`` to keep the stream's timeline moving
+(``mode="compress"``), or forwards everything and only measures
+(``mode="observe"``). :meth:`VADGate.stats` reports the suppressed fraction.
+
+Frames are mono PCM16 little-endian. Frame sizes may vary between calls.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+SpeechModel = Callable[[np.ndarray, int], Sequence[float]]
+
+GATE_MODES = ("observe", "drop", "compress")
+
+
+def frame_level_db(frame: bytes) -> float:
+    """RMS level of a PCM16 frame in dBFS (``-inf`` for digital silence)."""
+    samples = np.frombuffer(frame, dtype=np.int16)
+    if samples.size == 0:
+        return float("-inf")
+    power = np.dot(samples.astype(np.float32), samples.astype(np.float32)) / samples.size
+    if power <= 0.0:
+        return float("-inf")
+    return float(10.0 * np.log10(power / (32768.0 * 32768.0)))
+
+
+def frame_levels_db(pcm: bytes, frame_bytes: int) -> List[float]:
+    """RMS level in dBFS of each ``frame_bytes`` slice of ``pcm`` (last one zero-padded)."""
+    frame_samples = max(frame_bytes // 2, 1)
+    samples = np.frombuffer(pcm, dtype=np.int16, count=len(pcm) // 2)
+    if samples.size == 0:
+        return []
+    frames = -(-samples.size // frame_samples)
+    padded = np.zeros(frames * frame_samples, dtype=np.float32)
+    padded[: samples.size] = samples
+    power = np.mean(np.square(padded.reshape(frames, frame_samples)), axis=1)
+    with np.errstate(divide="ignore"):
+        levels = 10.0 * np.log10(power / (32768.0 * 32768.0))
+    return levels.tolist()
+
+
+def torch_speech_model(model) -> SpeechModel:
+    """Adapt a Silero-style torch VAD model to the batched :data:`SpeechModel` API.
+
+    torch is imported on first use so that energy-only gates never load it.
+    """
+
+    def _score(batch: np.ndarray, sample_rate: int) -> Sequence[float]:
+        import torch
+
+        with torch.no_grad():
+            probs = model(torch.from_numpy(batch), sample_rate)
+        return probs.reshape(-1).tolist()
+
+    return _score
+
+
+class VADGate:
+    """Per-stream speech gate; not thread-safe (one instance per connection)."""
+
+    def __init__(
+        self,
+        *,
+        sample_rate: int = 16000,
+        mode: str = "drop",
+        energy_threshold_db: float = -45.0,
+        model: Optional[SpeechModel] = None,
+        speech_threshold: float = 0.5,
+        batch_frames: int = 4,
+        hangover_ms: int = 600,
+        pad_ms: int = 200,
+        compress_keep_every: int = 10,
+    ) -> None:
+        if mode not in GATE_MODES:
+            raise ValueError(f"mode must be one of {GATE_MODES}, got {mode!r}")
+        self.sample_rate = sample_rate
+        self.mode = mode
+        self.energy_threshold_db = energy_threshold_db
+        self.model = model
+        self.speech_threshold = speech_threshold
+        self.batch_frames = max(1, batch_frames) if model is not None else 1
+        self.hangover_samples = int(sample_rate * hangover_ms / 1000)
+        self.pad_samples = int(sample_rate * pad_ms / 1000)
+        self.compress_keep_every = max(1, compress_keep_every)
+
+        self._pending: List[Tuple[bytes, bool]] = []
+        self._preroll: Deque[bytes] = deque()
+        self._preroll_samples = 0
+        self._in_speech = False
+        self._hangover_left = 0
+        self._silent_run = 0
+
+        self.frames_in = 0
+        self.frames_out = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.energy_rejected = 0
+        self.model_calls = 0
+        self.speech_segments = 0
+
+    @property
+    def in_speech(self) -> bool:
+        return self._in_speech
+
+    def process(self, frame: bytes) -> List[bytes]:
+        """Feed one inbound frame; return the frames to forward (possibly none)."""
+        self.frames_in += 1
+        self.bytes_in += len(frame)
+        loud = frame_level_db(frame) >= self.energy_threshold_db
+        if not loud:
+            self.energy_rejected += 1
+        self._pending.append((frame, loud))
+        if len(self._pending) < self.batch_frames:
+            return []
+        return self._drain()
+
+    def flush(self) -> List[bytes]:
+        """Decide any frames still waiting for a model batch."""
+        return self._drain() if self._pending else []
+
+    def stats(self) -> Dict[str, float]:
+        suppressed = 1.0 - (self.bytes_out / self.bytes_in) if self.bytes_in else 0.0
+        return {
+            "mode": self.mode,
+            "frames_in": self.frames_in,
+            "frames_out": self.frames_out,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "suppressed_ratio": round(suppressed, 4),
+            "energy_rejected": self.energy_rejected,
+            "model_calls": self.model_calls,
+            "speech_segments": self.speech_segments,
+        }
+
+    # ------------------------------------------------------------------ #
+    def _drain(self) -> List[bytes]:
+        pending, self._pending = self._pending, []
+        speech = self._classify(pending)
+        out: List[bytes] = []
+        for (frame, _), is_speech in zip(pending, speech):
+            self._step(frame, is_speech, out)
+        self.frames_out += len(out)
+        self.bytes_out += sum(len(f) for f in out)
+        return out
+
+    def _classify(self, pending: List[Tuple[bytes, bool]]) -> List[bool]:
+        speech = [loud for _, loud in pending]
+        if self.model is None:
+            return speech
+
+        # One model call per distinct frame length (np.stack needs equal shapes).
+        by_length: Dict[int, List[int]] = {}
+        for index, (frame, loud) in enumerate(pending):
+            if loud:
+                by_length.setdefault(len(frame), []).append(index)
+        for indices in by_length.values():
+            batch = np.stack(
+                [
+                    np.frombuffer(pending[i][0], dtype=np.int16).astype(np.float32) / 32768.0
+                    for i in indices
+                ]
+            )
+            probs = self.model(batch, self.sample_rate)
+            self.model_calls += 1
+            for i, prob in zip(indices, probs):
+                speech[i] = prob >= self.speech_threshold
+        return speech
+
+    def _step(self, frame: bytes, is_speech: bool, out: List[bytes]) -> None:
+        samples = len(frame) // 2
+        if is_speech:
+            if not self._in_speech:
+                self._in_speech = True
+                self.speech_segments += 1
+                out.extend(self._preroll)
+                self._preroll.clear()
+                self._preroll_samples = 0
+            self._hangover_left = self.hangover_samples
+            self._silent_run = 0
+            out.append(frame)
+            return
+
+        if self._in_speech and self._hangover_left > 0:
+            self._hangover_left -= samples
+            out.append(frame)
+            if self._hangover_left <= 0:
+                self._in_speech = False
+            return
+        self._in_speech = False
+
+        if self.mode == "observe":
+            out.append(frame)
+            return
+
+        self._silent_run += 1
+        if self.mode == "compress" and self._silent_run % self.compress_keep_every == 0:
+            out.append(frame)
+            return
+
+        self._preroll.append(frame)
+        self._preroll_samples += samples
+        while self._preroll and self._preroll_samples - len(self._preroll[0]) // 2 >= self.pad_samples:
+            self._preroll_samples -= len(self._preroll.popleft()) // 2
+
+
+class SpeechEndTracker:
+    """Finds the caller's last voiced frame before each pause.
+
+    :meth:`process` returns the ``time.perf_counter()`` timestamp of the last
+    frame at or above ``energy_threshold_db`` once ``hangover_ms`` of
+    quieter audio has followed it - once per voiced-to-silence transition,
+    not on every loud frame. Frames passed with ``ignore=True`` (the agent's
+    own playback leaking back in) neither start nor end a segment.
+    """
+
+    def __init__(self, *, energy_threshold_db: float = -45.0, hangover_ms: int = 200) -> None:
+        self.energy_threshold_db = energy_threshold_db
+        self.hangover_s = hangover_ms / 1000
+        self._last_voiced: Optional[float] = None
+        self.segments = 0
+
+    @property
+    def in_speech(self) -> bool:
+        return self._last_voiced is not None
+
+    def process(
+        self, level_db: float, *, ignore: bool = False, now: Optional[float] = None
+    ) -> Optional[float]:
+        now = time.perf_counter() if now is None else now
+        if ignore:
+            self._last_voiced = None
+            return None
+        if level_db >= self.energy_threshold_db:
+            self._last_voiced = now
+            return None
+        if self._last_voiced is not None and now - self._last_voiced >= self.hangover_s:
+            ended, self._last_voiced = self._last_voiced, None
+            self.segments += 1
+            return ended
+        return None
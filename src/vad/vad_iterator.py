@@ -1,4 +1,3 @@
-import copy
 import numpy as np
 import torch
 
@@ -67,7 +66,8 @@ class VADIteratorWithDenoiseAndToggle:
 
         if (speech_prob >= self.threshold) and not self.triggered:
             self.triggered = True
-            self.buffer = copy.deepcopy(self.start_pad_buffer)
+            # Tensors in the pad buffer are never mutated; a shallow copy is enough.
+            self.buffer = list(self.start_pad_buffer)
             self.buffer.append(audio_tensor)
             return None
 
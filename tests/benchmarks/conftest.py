@@ -0,0 +1,126 @@
+"""
+Fixtures sized like a real call for the hot-path benchmarks.
+
+A 30-minute call is modelled as one caller/assistant exchange every 10 s
+(~180 exchanges), with a tool round-trip every tenth exchange. Audio
+fixtures are 10 s of 16 kHz PCM16 mono speech-like signal.
+"""
+
+import math
+import struct
+from typing import Any, Dict, List
+
+import pytest
+
+SAMPLE_RATE = 16000
+CALL_MINUTES = 30
+SECONDS_PER_EXCHANGE = 10
+EXCHANGES = CALL_MINUTES * 60 // SECONDS_PER_EXCHANGE
+
+USER_TURN = "I need to check the status of my claim, the one I filed last Tuesday for the water damage."
+ASSISTANT_TURN = (
+    "Thanks, I found your claim. It is under review and an adjuster will call you "
+    "within two business days! Is there anything else I can help with? "
+    "You can also upload photos in the mobile app."
+)
+
+
+class _DictRedis:
+    """Just enough of AzureRedisManager for MemoManager.from_redis."""
+
+    def __init__(self) -> None:
+        self.data: Dict[str, Dict[str, str]] = {}
+
+    def store_session_data(self, key: str, data: Dict[str, str]) -> bool:
+        self.data[key] = dict(data)
+        return True
+
+    def get_session_data(self, key: str) -> Dict[str, str]:
+        return self.data.get(key, {})
+
+
+@pytest.fixture(scope="session")
+def call_history() -> List[Dict[str, Any]]:
+    """OpenAI-format message list for a 30-minute call, tool calls included."""
+    history: List[Dict[str, Any]] = [{"role": "system", "content": "You are a claims assistant."}]
+    for i in range(EXCHANGES):
+        history.append({"role": "user", "content": USER_TURN})
+        if i % 10 == 0:
+            call_id = f"call_{i}"
+            history.append(
+                {
+                    "role": "assistant",
+                    "content": None,
+                    "tool_calls": [
+                        {
+                            "id": call_id,
+                            "type": "function",
+                            "function": {"name": "lookup_claim", "arguments": '{"claim_id": "CLM-1234"}'},
+                        }
+                    ],
+                }
+            )
+            history.append({"role": "tool", "tool_call_id": call_id, "content": '{"status": "under_review"}'})
+        history.append({"role": "assistant", "content": ASSISTANT_TURN})
+    return history
+
+
+@pytest.fixture(scope="session")
+def memo_manager(call_history):
+    from src.stateful.state_managment import MemoManager
+
+    mm = MemoManager(session_id="bench0001")
+    for key, value in {
+        "caller_name": "Alice Smith",
+        "policy_id": "POL-998877",
+        "authenticated": True,
+        "intent": "claim_status",
+    }.items():
+        mm.set_context(key, value)
+    for msg in call_history:
+        if msg.get("content"):
+            mm.append_to_history("AuthAgent", msg["role"], msg["content"])
+    return mm
+
+
+@pytest.fixture(scope="session")
+def redis_with_session(memo_manager) -> _DictRedis:
+    redis = _DictRedis()
+    redis.store_session_data(memo_manager.build_redis_key(memo_manager.session_id), memo_manager.to_redis_dict())
+    return redis
+
+
+@pytest.fixture(scope="session")
+def pcm_10s() -> bytes:
+    """10 s of a 220 Hz tone with harmonics and a syllable-rate envelope."""
+    samples = []
+    for n in range(SAMPLE_RATE * 10):
+        t = n / SAMPLE_RATE
+        envelope = 0.5 + 0.5 * math.sin(2 * math.pi * 4 * t)
+        value = sum(math.sin(2 * math.pi * 220 * k * t) / k for k in (1, 2, 3))
+        samples.append(int(6000 * envelope * value))
+    return struct.pack(f"<{len(samples)}h", *samples)
+
+
+@pytest.fixture(scope="session")
+def assistant_reply() -> str:
+    """A long assistant reply, as streamed into TTS over a turn."""
+    return " ".join([ASSISTANT_TURN] * 4)
+
+
+@pytest.fixture(scope="session")
+def latency_payload() -> Dict[str, Any]:
+    """Latency payload for a 30-minute call, shaped like PersistentLatency output."""
+    runs: Dict[str, Any] = {}
+    for i in range(EXCHANGES):
+        samples = [
+            {"stage": "stt:recognition", "dur": 0.35 + (i % 7) * 0.01},
+            {"stage": "auth_agent", "dur": 0.9 + (i % 5) * 0.05},
+            {"stage": "tts:synthesis", "dur": 0.4 + (i % 3) * 0.02, "meta": {"voice": "en-US-AvaNeural"}},
+            {"stage": "tts:send_frames", "dur": 0.05},
+            {"stage": "tts", "dur": 0.5 + (i % 4) * 0.03},
+        ]
+        if i == 0:
+            samples.append({"stage": "greeting_ttfb", "dur": 1.2})
+        runs[f"run-{i:04d}"] = {"samples": samples}
+    return {"runs": runs, "order": list(runs)}
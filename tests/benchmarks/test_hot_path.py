@@ -0,0 +1,171 @@
+"""
+Micro-benchmarks for code that runs on every audio frame, sentence or turn.
+
+Requires pytest-benchmark (dev extra); the module is skipped without it.
+Record a baseline and compare against it with::
+
+    make run_benchmarks          # saves a run under .benchmarks/
+    make compare_benchmarks      # fails if any mean regresses > 15%
+"""
+
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from fastapi.websockets import WebSocketState  # noqa: E402
+
+from apps.rtagent.backend.src.orchestration.artagent.gpt_flow import (  # noqa: E402
+    _validate_conversation_history,
+)
+from apps.rtagent.backend.src.ws_helpers.envelopes import make_envelope  # noqa: E402
+from src.agenticmemory.context_window import ContextWindow  # noqa: E402
+from src.agenticmemory.types import MessageThread  # noqa: E402
+from src.pools.connection_manager import ConnectionMeta, _Connection  # noqa: E402
+from src.speech.text_to_speech import (  # noqa: E402
+    SpeechSynthesizer,
+    split_sentences,
+    ssml_voice_wrap,
+)
+from src.stateful.state_managment import MemoManager  # noqa: E402
+from src.tools.latency_analytics import compute_latency_statistics  # noqa: E402
+
+from .conftest import SAMPLE_RATE  # noqa: E402
+
+FRAME_BYTES = SAMPLE_RATE * 2 // 50  # 20 ms PCM16
+
+
+class _NullWebSocket:
+    client_state = WebSocketState.CONNECTED
+    application_state = WebSocketState.CONNECTED
+
+    async def send_text(self, message: str) -> None:
+        return None
+
+
+# --------------------------------------------------------------------------- #
+# Per frame
+# --------------------------------------------------------------------------- #
+@pytest.mark.benchmark(group="frame")
+def test_pcm16le_rms_per_frame(benchmark, pcm_10s):
+    # realtime.py pulls in the full app (and PortAudio via the Voice Live agent),
+    # so import it here rather than at collection time.
+    from apps.rtagent.backend.api.v1.endpoints.realtime import _pcm16le_rms
+
+    frames = [pcm_10s[i : i + FRAME_BYTES] for i in range(0, len(pcm_10s), FRAME_BYTES)]
+
+    def run():
+        for frame in frames:
+            _pcm16le_rms(frame)
+
+    benchmark(run)
+
+
+@pytest.mark.benchmark(group="frame")
+def test_split_pcm_to_base64_frames_10s(benchmark, pcm_10s):
+    frames = benchmark(SpeechSynthesizer.split_pcm_to_base64_frames, pcm_10s, SAMPLE_RATE)
+    assert len(frames) == 500
+
+
+@pytest.mark.benchmark(group="frame")
+def test_make_envelope(benchmark):
+    envelope = benchmark(
+        make_envelope,
+        etype="event",
+        sender="Assistant",
+        payload={"message": "Thanks, I found your claim.", "streaming": True},
+        topic="session",
+        session_id="bench0001",
+    )
+    assert envelope["session_id"] == "bench0001"
+
+
+@pytest.mark.benchmark(group="frame")
+def test_connection_send_json_burst(benchmark):
+    """Queue 100 envelopes (one per streamed token) on a live connection."""
+    loop = asyncio.new_event_loop()
+    payload = make_envelope(
+        etype="event",
+        sender="Assistant",
+        payload={"message": "token", "streaming": True},
+        topic="session",
+        session_id="bench0001",
+    )
+
+    async def _open():
+        return _Connection(_NullWebSocket(), ConnectionMeta(connection_id="bench"))
+
+    async def _burst():
+        for _ in range(100):
+            await conn.send_json(payload)
+
+    conn = loop.run_until_complete(_open())
+    try:
+        benchmark(lambda: loop.run_until_complete(_burst()))
+    finally:
+        loop.run_until_complete(conn.close())
+        loop.close()
+
+
+# --------------------------------------------------------------------------- #
+# Per sentence
+# --------------------------------------------------------------------------- #
+@pytest.mark.benchmark(group="sentence")
+def test_split_sentences(benchmark, assistant_reply):
+    sentences = benchmark(split_sentences, assistant_reply)
+    assert len(sentences) > 1
+
+
+@pytest.mark.benchmark(group="sentence")
+def test_ssml_voice_wrap(benchmark, assistant_reply):
+    sentences = split_sentences(assistant_reply)
+    ssml = benchmark(
+        ssml_voice_wrap,
+        voice="en-US-AvaNeural",
+        language="en-US",
+        sentences=sentences,
+        sanitizer=SpeechSynthesizer._sanitize,
+    )
+    assert ssml.startswith("<speak")
+
+
+# --------------------------------------------------------------------------- #
+# Per turn, on a 30-minute call
+# --------------------------------------------------------------------------- #
+@pytest.mark.benchmark(group="turn")
+def test_validate_conversation_history_30min(benchmark, call_history):
+    assert benchmark(_validate_conversation_history, call_history, "AuthAgent") == (True, None)
+
+
+@pytest.mark.benchmark(group="turn")
+def test_validate_tracked_conversation_history_30min(benchmark, call_history):
+    # Same history as above, held the way MemoManager stores it.
+    thread = MessageThread(call_history)
+    assert benchmark(_validate_conversation_history, thread, "AuthAgent") == (True, None)
+
+
+@pytest.mark.benchmark(group="turn")
+def test_context_window_select_30min(benchmark, memo_manager):
+    window = ContextWindow(max_tokens=6000, max_turns=12)
+    messages, start = benchmark(window.select, memo_manager, "AuthAgent")
+    assert start > 0 and len(messages) < len(memo_manager.get_history("AuthAgent"))
+
+
+@pytest.mark.benchmark(group="turn")
+def test_memo_to_redis_dict_30min(benchmark, memo_manager):
+    data = benchmark(memo_manager.to_redis_dict)
+    assert len(json.loads(data["chat_history"])["AuthAgent"]) > 300
+
+
+@pytest.mark.benchmark(group="turn")
+def test_memo_from_redis_30min(benchmark, memo_manager, redis_with_session):
+    restored = benchmark(MemoManager.from_redis, memo_manager.session_id, redis_with_session)
+    assert restored.get_context("policy_id") == "POL-998877"
+
+
+@pytest.mark.benchmark(group="turn")
+def test_compute_latency_statistics_30min(benchmark, latency_payload):
+    stats = benchmark(compute_latency_statistics, latency_payload)
+    assert stats
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Logging Pipeline Benchmark
+==========================
+
+Measures log calls per second on the calling thread for the synchronous
+pipeline and the queue pipeline (``LOG_PIPELINE=queue``), with and without
+hot-path rate limiting. Records are emitted inside a recording OpenTelemetry
+span with correlation attributes, as they are during a call. Output goes to
+os.devnull.
+
+Usage:
+    python tests/load/bench_logging_pipeline.py
+    python tests/load/bench_logging_pipeline.py --calls 200000 --json
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+os.environ.setdefault("DISABLE_CLOUD_TELEMETRY", "false")
+# Large enough that the queue run measures caller cost, not drop-on-full.
+os.environ.setdefault("LOG_QUEUE_SIZE", "1000000")
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from opentelemetry.sdk.trace import TracerProvider  # noqa: E402
+from opentelemetry.trace import use_span  # noqa: E402
+
+from utils import ml_logging  # noqa: E402
+
+
+def _run(name: str, calls: int, **logger_kwargs) -> dict:
+    logger = ml_logging.get_logger(f"bench.{name}", **logger_kwargs)
+    logger.propagate = False
+    tracer = TracerProvider().get_tracer("bench")
+
+    with tracer.start_as_current_span("turn") as span:
+        span.set_attribute("session.id", "session-123")
+        span.set_attribute("call.connection.id", "call-456")
+        span.set_attribute("agent.name", "AuthAgent")
+        with use_span(span):
+            started = time.perf_counter()
+            for i in range(calls):
+                logger.info("partial transcript %d: %s", i, "hello world")
+            emit_s = time.perf_counter() - started
+
+    drained_s = emit_s
+    pipeline = ml_logging._pipeline
+    if pipeline is not None:
+        while pipeline[0].queue.qsize():
+            time.sleep(0.001)
+        drained_s = time.perf_counter() - started
+
+    return {
+        "scenario": name,
+        "calls_per_sec": round(calls / emit_s),
+        "caller_us_per_call": round(emit_s / calls * 1e6, 2),
+        "drained_s": round(drained_s, 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--calls", type=int, default=50000)
+    parser.add_argument("--json", action="store_true", help="use the production JSON formatter")
+    parser.add_argument("--rate-limit", type=float, default=200.0, help="records/sec for the hot-path run")
+    args = parser.parse_args()
+
+    if args.json:
+        os.environ["ENV"] = "prod"
+
+    # Handlers bind sys.stderr when created; point it at /dev/null while running.
+    real_stderr = sys.stderr
+    sys.stderr = open(os.devnull, "w")
+    try:
+        results = [
+            _run("sync", args.calls, pipeline="sync"),
+            _run("sync+rate-limit", args.calls, pipeline="sync", rate_limit_per_sec=args.rate_limit),
+            _run("queue", args.calls, pipeline="queue"),
+            _run("queue+rate-limit", args.calls, pipeline="queue", rate_limit_per_sec=args.rate_limit),
+        ]
+        stats = ml_logging.logging_stats()
+        ml_logging.shutdown_logging()
+    finally:
+        sys.stderr.close()
+        sys.stderr = real_stderr
+
+    print(f"\n{'scenario':<20} {'calls/s':>10} {'us/call':>9} {'drained_s':>10}")
+    for row in results:
+        print(
+            f"{row['scenario']:<20} {row['calls_per_sec']:>10} "
+            f"{row['caller_us_per_call']:>9} {row['drained_s']:>10}"
+        )
+    print(f"\nqueue full drops: {stats['dropped_queue_full']}  rate limited: {stats['rate_limited']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Registry Contention Benchmark
+=============================
+
+Drives ``ThreadSafeConnectionManager`` and ``ThreadSafeSessionManager`` with
+thousands of simulated connections and reports per-operation latency while
+connections with slow handler teardown are being unregistered concurrently.
+
+No network or Azure services are used; WebSockets are in-memory fakes.
+
+Usage:
+    python tests/load/bench_registry_contention.py
+    python tests/load/bench_registry_contention.py --connections 10000 --handler-stop-ms 20
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Dict, List
+
+from fastapi.websockets import WebSocketState
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.pools.connection_manager import ThreadSafeConnectionManager  # noqa: E402
+from src.pools.session_manager import ThreadSafeSessionManager  # noqa: E402
+
+
+class _FakeWebSocket:
+    client_state = WebSocketState.CONNECTED
+    application_state = WebSocketState.CONNECTED
+
+    def __init__(self) -> None:
+        self.state = type("State", (), {})()
+
+    async def send_text(self, message: str) -> None:
+        return None
+
+    async def close(self) -> None:
+        return None
+
+
+class _SlowHandler:
+    def __init__(self, stop_ms: float) -> None:
+        self._stop_s = stop_ms / 1000
+
+    async def stop(self) -> None:
+        await asyncio.sleep(self._stop_s)
+
+
+def _summary(samples: List[float]) -> Dict[str, float]:
+    if not samples:
+        return {"n": 0}
+    ordered = sorted(samples)
+    return {
+        "n": len(ordered),
+        "p50_ms": round(statistics.median(ordered) * 1000, 3),
+        "p99_ms": round(ordered[min(int(len(ordered) * 0.99), len(ordered) - 1)] * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }
+
+
+async def _timed(samples: List[float], coro, limit: asyncio.Semaphore = None) -> None:
+    """Time ``coro``; with ``limit`` the clock starts once a slot is free."""
+    if limit is None:
+        started = time.perf_counter()
+        await coro
+        samples.append(time.perf_counter() - started)
+        return
+    async with limit:
+        started = time.perf_counter()
+        await coro
+        samples.append(time.perf_counter() - started)
+
+
+async def bench_connections(args: argparse.Namespace) -> Dict[str, Dict[str, float]]:
+    manager = ThreadSafeConnectionManager(enable_connection_limits=False)
+    results: Dict[str, Dict[str, float]] = {}
+
+    register_lat: List[float] = []
+    conn_ids: List[str] = []
+
+    async def _register(i: int) -> None:
+        started = time.perf_counter()
+        conn_id = await manager.register(
+            _FakeWebSocket(),
+            client_type="media",
+            session_id=f"s{i % args.sessions}",
+            call_id=f"c{i}",
+            topics={"dashboard"} if i % 10 == 0 else None,
+            handler=_SlowHandler(args.handler_stop_ms),
+        )
+        register_lat.append(time.perf_counter() - started)
+        conn_ids.append(conn_id)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(_register(i) for i in range(args.connections)))
+    results["register"] = {
+        **_summary(register_lat),
+        "wall_s": round(time.perf_counter() - started, 3),
+    }
+
+    # Mixed phase: churn (slow teardown) concurrent with broadcasts and lookups
+    random.seed(7)
+    churn = random.sample(conn_ids, int(len(conn_ids) * args.churn))
+    broadcast_lat: List[float] = []
+    lookup_lat: List[float] = []
+    unregister_lat: List[float] = []
+    limit = asyncio.Semaphore(args.concurrency)
+
+    ops = [
+        _timed(unregister_lat, manager.unregister(conn_id), limit) for conn_id in churn
+    ]
+    ops += [
+        _timed(
+            broadcast_lat,
+            manager.broadcast_session(
+                f"s{random.randrange(args.sessions)}", {"type": "bench"}
+            ),
+            limit,
+        )
+        for _ in range(args.operations)
+    ]
+    ops += [
+        _timed(
+            lookup_lat,
+            manager.get_handler_by_call_id(f"c{random.randrange(args.connections)}"),
+            limit,
+        )
+        for _ in range(args.operations)
+    ]
+    random.shuffle(ops)
+
+    started = time.perf_counter()
+    await asyncio.gather(*ops)
+    mixed_wall = round(time.perf_counter() - started, 3)
+    results["unregister(slow handler)"] = _summary(unregister_lat)
+    results["broadcast_session"] = {**_summary(broadcast_lat), "wall_s": mixed_wall}
+    results["get_handler_by_call_id"] = _summary(lookup_lat)
+
+    stats_lat: List[float] = []
+    for _ in range(20):
+        await _timed(stats_lat, manager.stats())
+    results["stats"] = _summary(stats_lat)
+
+    sweep_lat: List[float] = []
+    for _ in range(20):
+        await _timed(sweep_lat, manager.validate_and_cleanup_stale_connections())
+    results["stale_sweep"] = _summary(sweep_lat)
+
+    started = time.perf_counter()
+    await manager.stop()
+    results["stop"] = {"wall_s": round(time.perf_counter() - started, 3)}
+    return results
+
+
+async def bench_sessions(args: argparse.Namespace) -> Dict[str, Dict[str, float]]:
+    manager = ThreadSafeSessionManager()
+    results: Dict[str, Dict[str, float]] = {}
+
+    add_lat: List[float] = []
+    await asyncio.gather(
+        *(
+            _timed(add_lat, manager.add_session(f"s{i}", None, _FakeWebSocket()))
+            for i in range(args.connections)
+        )
+    )
+    results["add_session"] = _summary(add_lat)
+
+    read_lat: List[float] = []
+    await asyncio.gather(
+        *(
+            _timed(read_lat, manager.get_session_context(f"s{random.randrange(args.connections)}"))
+            for _ in range(args.operations)
+        )
+    )
+    results["get_session_context"] = _summary(read_lat)
+
+    cleanup_lat: List[float] = []
+    for _ in range(20):
+        await _timed(cleanup_lat, manager.cleanup_stale_sessions(max_age_hours=24))
+    results["cleanup_stale_sessions(no expiry)"] = _summary(cleanup_lat)
+    return results
+
+
+def _print(title: str, results: Dict[str, Dict[str, float]]) -> None:
+    print(f"\n{title}")
+    print("-" * len(title))
+    for name, row in results.items():
+        fields = "  ".join(f"{k}={v}" for k, v in row.items())
+        print(f"{name:<36} {fields}")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--connections", type=int, default=5000)
+    parser.add_argument("--sessions", type=int, default=500)
+    parser.add_argument("--operations", type=int, default=5000)
+    parser.add_argument("--churn", type=float, default=0.2, help="fraction unregistered")
+    parser.add_argument("--handler-stop-ms", type=float, default=5.0)
+    parser.add_argument(
+        "--concurrency", type=int, default=64, help="operations in flight during the mixed phase"
+    )
+    args = parser.parse_args()
+
+    _print("Connection registry", await bench_connections(args))
+    _print("Session registry", await bench_sessions(args))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
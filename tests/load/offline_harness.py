@@ -0,0 +1,534 @@
+#!/usr/bin/env python3
+"""
+Offline End-to-End Load Harness
+===============================
+
+Runs the real backend under load with no Azure resources. It measures the
+server's own overhead, separate from Speech and OpenAI latency.
+
+The harness starts three pieces:
+
+1. A **mock Azure OpenAI** server in this process. It streams chat
+   completions with a configurable TTFB and tokens/s.
+2. The **backend** in a child process (``--serve``). Its startup factories
+   are pointed at the stand-ins in ``offline_stubs``: fake Speech recognizer
+   and synthesizer (served through the regular on-demand pools), in-memory
+   Redis, and a no-op Cosmos/ACS. The child also exposes
+   ``/__harness/stats`` and ``/__harness/reset``.
+3. **Fake clients** that stream 16 kHz PCM at real-time pace. ACS clients
+   use the ``/api/v1/media/stream`` JSON protocol; browser clients send
+   binary frames to ``/api/v1/realtime/conversation``.
+
+For each concurrency stage it reports:
+
+- server-side p50/p95/p99 for every ``LatencyTool`` stage;
+- event-loop lag in the server process;
+- server CPU seconds and RSS growth per call;
+- client-observed turn latency, from the end of the caller's audio to the
+  first bot audio frame.
+
+Usage:
+    python tests/load/offline_harness.py
+    python tests/load/offline_harness.py --stages 10,25,50 --turns 3 --paths acs
+    python tests/load/offline_harness.py --aoai-ttfb-ms 800 --aoai-tokens-per-s 40 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "apps" / "rtagent" / "backend"))
+
+import httpx  # noqa: E402
+import uvicorn  # noqa: E402
+import websockets  # noqa: E402
+
+from tests.load.offline_stubs import (  # noqa: E402
+    MockAoaiConfig,
+    StageRecorder,
+    StubConfig,
+    create_mock_aoai_app,
+    install_offline_stubs,
+    summarize,
+    tone_pcm,
+)
+
+SAMPLE_RATE = 16000
+FRAME_MS = 20
+FRAME_BYTES = SAMPLE_RATE * FRAME_MS // 1000 * 2
+AUDIO_CACHE = Path(__file__).resolve().parent / "audio_cache"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _load_utterances(limit: int = 8) -> List[bytes]:
+    """Cached 16 kHz prompts from ``audio_cache``; a synthetic tone if there are none."""
+    clips = []
+    for path in sorted(AUDIO_CACHE.glob("*.pcm"))[:limit]:
+        meta_path = path.with_suffix(".json")
+        if meta_path.exists():
+            meta = json.loads(meta_path.read_text())
+            if int(meta.get("sample_rate", SAMPLE_RATE)) != SAMPLE_RATE:
+                continue
+        clips.append(path.read_bytes())
+    return clips or [tone_pcm(1.8, SAMPLE_RATE, freq=180.0)]
+
+
+def _frames(pcm: bytes) -> List[bytes]:
+    frames = [pcm[i : i + FRAME_BYTES] for i in range(0, len(pcm), FRAME_BYTES)]
+    if frames and len(frames[-1]) < FRAME_BYTES:
+        frames[-1] = frames[-1] + b"\x00" * (FRAME_BYTES - len(frames[-1]))
+    return frames
+
+
+# --------------------------------------------------------------------------- #
+# Server process (--serve)
+# --------------------------------------------------------------------------- #
+class _LoopLagSampler:
+    """Samples scheduling delay of the server loop every ``interval_s``."""
+
+    def __init__(self, interval_s: float = 0.05) -> None:
+        self.interval_s = interval_s
+        self.samples: List[float] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def ensure_started(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="harness-loop-lag")
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            scheduled = loop.time()
+            await asyncio.sleep(self.interval_s)
+            self.samples.append(max(0.0, loop.time() - scheduled - self.interval_s) * 1000)
+
+
+def _process_usage() -> Dict[str, float]:
+    try:
+        import psutil
+
+        proc = psutil.Process()
+        cpu = proc.cpu_times()
+        return {
+            "cpu_s": cpu.user + cpu.system,
+            "rss_mb": proc.memory_info().rss / 1e6,
+            "threads": proc.num_threads(),
+        }
+    except ImportError:
+        import resource
+
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        return {
+            "cpu_s": usage.ru_utime + usage.ru_stime,
+            "rss_mb": usage.ru_maxrss / 1e3,  # peak, KiB on Linux
+            "threads": threading.active_count(),
+        }
+
+
+def serve(args: argparse.Namespace) -> None:
+    """Run the backend with offline stand-ins (child process entry point)."""
+    os.environ.update(
+        {
+            "AZURE_OPENAI_ENDPOINT": args.aoai_url,
+            "AZURE_OPENAI_KEY": "offline-harness",
+            "ACS_STREAMING_MODE": "media",
+            "ENABLE_AUTH_VALIDATION": "false",
+            "ENABLE_DISTRIBUTED_SESSIONS": "false",
+            "ENABLE_READINESS_PROBER": "false",
+            "DISABLE_CLOUD_TELEMETRY": "true",
+        }
+    )
+    for key, value in {
+        "AZURE_SPEECH_REGION": "offline",
+        "AZURE_SPEECH_KEY": "offline-harness",
+        "REDIS_HOST": "offline",
+    }.items():
+        os.environ.setdefault(key, value)
+
+    from apps.rtagent.backend import main as backend_main
+
+    install_offline_stubs(
+        backend_main,
+        StubConfig(
+            tts_first_byte_ms=args.tts_first_byte_ms,
+            stt_final_delay_ms=args.stt_final_delay_ms,
+            stt_partial_delay_ms=args.stt_partial_delay_ms,
+        ),
+    )
+    recorder = StageRecorder()
+    recorder.install()
+    lag = _LoopLagSampler()
+    app = backend_main.app
+    baseline: Dict[str, float] = {}
+
+    @app.post("/__harness/reset", include_in_schema=False)
+    async def harness_reset():
+        lag.ensure_started()
+        recorder.reset()
+        lag.samples.clear()
+        baseline.clear()
+        baseline.update(_process_usage())
+        return {"ok": True}
+
+    @app.get("/__harness/stats", include_in_schema=False)
+    async def harness_stats():
+        usage = _process_usage()
+        return {
+            "stages": recorder.summary(),
+            "loop_lag": summarize(list(lag.samples)),
+            "cpu_s": round(usage["cpu_s"] - baseline.get("cpu_s", 0.0), 3),
+            "rss_mb": round(usage["rss_mb"], 1),
+            "rss_growth_mb": round(usage["rss_mb"] - baseline.get("rss_mb", usage["rss_mb"]), 1),
+            "threads": usage["threads"],
+        }
+
+    uvicorn.run(app, host="127.0.0.1", port=args.port, log_level="warning", ws_max_size=2**22)
+
+
+# --------------------------------------------------------------------------- #
+# Fake clients
+# --------------------------------------------------------------------------- #
+class _Call:
+    """One simulated caller: greeting, then ``turns`` utterances paced in real time."""
+
+    quiet_ms = 500  # bot audio gap that ends a reply
+
+    def __init__(self, base_ws: str, utterances: List[bytes], turns: int, timeout_s: float):
+        self.base_ws = base_ws
+        self.utterances = utterances
+        self.turns = turns
+        self.timeout_s = timeout_s
+        self.call_id = uuid.uuid4().hex[:12]
+        self.turn_latencies_ms: List[float] = []
+        self.errors: List[str] = []
+        self._outbox: asyncio.Queue = asyncio.Queue()
+        self._last_bot_audio = 0.0
+        self._first_bot_audio_after: Optional[float] = None
+        self._bot_audio = asyncio.Event()
+
+    # protocol hooks ------------------------------------------------------ #
+    def url(self) -> str:
+        raise NotImplementedError
+
+    async def on_open(self, ws) -> None:
+        return None
+
+    def encode(self, frame: bytes, speech: bool):
+        raise NotImplementedError
+
+    def is_bot_audio(self, message) -> bool:
+        raise NotImplementedError
+
+    # driver -------------------------------------------------------------- #
+    async def run(self) -> None:
+        try:
+            async with websockets.connect(self.url(), max_size=2**22, open_timeout=30) as ws:
+                await self.on_open(ws)
+                sender = asyncio.create_task(self._send_loop(ws))
+                receiver = asyncio.create_task(self._receive_loop(ws))
+                try:
+                    await self._wait_reply_done()  # greeting
+                    for turn in range(self.turns):
+                        await self._turn(self.utterances[turn % len(self.utterances)])
+                finally:
+                    sender.cancel()
+                    receiver.cancel()
+                    await asyncio.gather(sender, receiver, return_exceptions=True)
+        except Exception as exc:  # noqa: BLE001
+            self.errors.append(f"{type(exc).__name__}: {exc}")
+
+    async def _turn(self, pcm: bytes) -> None:
+        utterance_sent = asyncio.Event()
+        for frame in _frames(pcm):
+            self._outbox.put_nowait((frame, True))
+        self._outbox.put_nowait((None, utterance_sent))
+        await utterance_sent.wait()
+        sent_at = time.perf_counter()
+        self._first_bot_audio_after = sent_at
+        self._bot_audio.clear()
+        try:
+            await asyncio.wait_for(self._bot_audio.wait(), self.timeout_s)
+        except asyncio.TimeoutError:
+            self.errors.append("turn timed out waiting for bot audio")
+            return
+        self.turn_latencies_ms.append((self._last_bot_audio - sent_at) * 1000)
+        await self._wait_reply_done()
+
+    async def _wait_reply_done(self) -> None:
+        deadline = time.perf_counter() + self.timeout_s
+        while time.perf_counter() < deadline:
+            await asyncio.sleep(self.quiet_ms / 1000)
+            if self._last_bot_audio and time.perf_counter() - self._last_bot_audio >= self.quiet_ms / 1000:
+                return
+
+    async def _send_loop(self, ws) -> None:
+        """Stream one frame every 20 ms; quiet noise when there is nothing to say."""
+        quiet = (b"\x01\x00\xff\xff" * (FRAME_BYTES // 4))
+        next_at = time.perf_counter()
+        while True:
+            try:
+                frame, marker = self._outbox.get_nowait()
+            except asyncio.QueueEmpty:
+                frame, marker = quiet, False
+            if frame is None:
+                marker.set()
+                continue
+            await ws.send(self.encode(frame, speech=marker is True))
+            next_at += FRAME_MS / 1000
+            await asyncio.sleep(max(0.0, next_at - time.perf_counter()))
+
+    async def _receive_loop(self, ws) -> None:
+        async for message in ws:
+            if self.is_bot_audio(message):
+                now = time.perf_counter()
+                self._last_bot_audio = now
+                if self._first_bot_audio_after is not None and now >= self._first_bot_audio_after:
+                    self._first_bot_audio_after = None
+                    self._bot_audio.set()
+
+
+class AcsMediaCall(_Call):
+    """ACS media-streaming client (JSON ``AudioMetadata``/``AudioData`` frames)."""
+
+    def url(self) -> str:
+        return f"{self.base_ws}/api/v1/media/stream?call_connection_id={self.call_id}"
+
+    async def on_open(self, ws) -> None:
+        await ws.send(
+            json.dumps(
+                {
+                    "kind": "AudioMetadata",
+                    "audioMetadata": {
+                        "subscriptionId": self.call_id,
+                        "encoding": "PCM",
+                        "sampleRate": SAMPLE_RATE,
+                        "channels": 1,
+                        "length": FRAME_BYTES,
+                    },
+                }
+            )
+        )
+
+    def encode(self, frame: bytes, speech: bool) -> str:
+        return json.dumps(
+            {
+                "kind": "AudioData",
+                "audioData": {
+                    "data": base64.b64encode(frame).decode("ascii"),
+                    "timestamp": time.time(),
+                    "silent": False,
+                },
+            }
+        )
+
+    def is_bot_audio(self, message) -> bool:
+        return isinstance(message, str) and '"AudioData"' in message and '"data"' in message
+
+
+class RealtimeCall(_Call):
+    """Browser client for the realtime conversation socket (binary PCM up, JSON down)."""
+
+    def url(self) -> str:
+        return f"{self.base_ws}/api/v1/realtime/conversation?session_id=load-{self.call_id}"
+
+    def encode(self, frame: bytes, speech: bool) -> bytes:
+        return frame
+
+    def is_bot_audio(self, message) -> bool:
+        return isinstance(message, str) and '"audio_data"' in message
+
+
+# --------------------------------------------------------------------------- #
+# Driver
+# --------------------------------------------------------------------------- #
+def _start_mock_aoai(config: MockAoaiConfig) -> str:
+    port = _free_port()
+    server = uvicorn.Server(
+        uvicorn.Config(create_mock_aoai_app(config), host="127.0.0.1", port=port, log_level="warning")
+    )
+    threading.Thread(target=server.run, name="mock-aoai", daemon=True).start()
+    deadline = time.time() + 10
+    while not server.started and time.time() < deadline:
+        time.sleep(0.05)
+    return f"http://127.0.0.1:{port}"
+
+
+def _start_backend(args: argparse.Namespace, aoai_url: str, port: int) -> subprocess.Popen:
+    cmd = [
+        sys.executable,
+        __file__,
+        "--serve",
+        "--port",
+        str(port),
+        "--aoai-url",
+        aoai_url,
+        "--tts-first-byte-ms",
+        str(args.tts_first_byte_ms),
+        "--stt-partial-delay-ms",
+        str(args.stt_partial_delay_ms),
+        "--stt-final-delay-ms",
+        str(args.stt_final_delay_ms),
+    ]
+    log = open(args.server_log, "w")
+    return subprocess.Popen(cmd, cwd=str(ROOT), stdout=log, stderr=subprocess.STDOUT)
+
+
+async def _wait_ready(client: httpx.AsyncClient, proc: subprocess.Popen, timeout_s: float) -> None:
+    deadline = time.time() + timeout_s
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(
+                f"backend exited during startup (code {proc.returncode}); see --server-log"
+            )
+        try:
+            if (await client.get("/api/v1/health")).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        await asyncio.sleep(0.25)
+    raise TimeoutError("backend did not become healthy")
+
+
+async def _run_stage(
+    client: httpx.AsyncClient,
+    base_ws: str,
+    concurrency: int,
+    args: argparse.Namespace,
+    utterances: List[bytes],
+) -> Dict[str, Any]:
+    await client.post("/__harness/reset")
+    kinds = [AcsMediaCall if path == "acs" else RealtimeCall for path in args.paths.split(",")]
+    calls = [
+        kinds[i % len(kinds)](base_ws, utterances, args.turns, args.turn_timeout_s)
+        for i in range(concurrency)
+    ]
+    started = time.perf_counter()
+    tasks = []
+    for call in calls:
+        tasks.append(asyncio.create_task(call.run()))
+        await asyncio.sleep(1.0 / args.spawn_rate)
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - started
+    await asyncio.sleep(1.0)  # let post-call cleanup record its samples
+    stats = (await client.get("/__harness/stats")).json()
+
+    by_path: Dict[str, List[float]] = {}
+    for call in calls:
+        by_path.setdefault(type(call).__name__, []).extend(call.turn_latencies_ms)
+    errors = [error for call in calls for error in call.errors]
+    return {
+        "concurrency": concurrency,
+        "elapsed_s": round(elapsed, 1),
+        "turn_latency": {name: summarize(values) for name, values in by_path.items()},
+        "errors": len(errors),
+        "error_samples": sorted(set(errors))[:5],
+        "server_stages": stats["stages"],
+        "loop_lag": stats["loop_lag"],
+        "cpu_s_per_call": round(stats["cpu_s"] / concurrency, 3),
+        "rss_mb": stats["rss_mb"],
+        "rss_growth_mb_per_call": round(stats["rss_growth_mb"] / concurrency, 2),
+        "threads": stats["threads"],
+    }
+
+
+def _print_stage(result: Dict[str, Any]) -> None:
+    print(f"\n=== {result['concurrency']} concurrent calls ({result['elapsed_s']}s) ===")
+    print(
+        f"errors={result['errors']}  cpu/call={result['cpu_s_per_call']}s  "
+        f"rss={result['rss_mb']}MB (+{result['rss_growth_mb_per_call']}MB/call)  "
+        f"threads={result['threads']}"
+    )
+    lag = result["loop_lag"]
+    if lag.get("n"):
+        print(f"loop lag: p50={lag['p50_ms']}ms p95={lag['p95_ms']}ms p99={lag['p99_ms']}ms max={lag['max_ms']}ms")
+    for name, summary in result["turn_latency"].items():
+        if summary.get("n"):
+            print(f"{name} turn latency: p50={summary['p50_ms']}ms p95={summary['p95_ms']}ms p99={summary['p99_ms']}ms")
+    print(f"{'stage':<28}{'n':>6}{'p50':>10}{'p95':>10}{'p99':>10}")
+    for stage, summary in result["server_stages"].items():
+        print(
+            f"{stage:<28}{summary['n']:>6}{summary['p50_ms']:>10}{summary['p95_ms']:>10}{summary['p99_ms']:>10}"
+        )
+    for sample in result["error_samples"]:
+        print(f"  error: {sample}")
+
+
+async def drive(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    aoai_url = _start_mock_aoai(
+        MockAoaiConfig(ttfb_ms=args.aoai_ttfb_ms, tokens_per_s=args.aoai_tokens_per_s)
+    )
+    port = _free_port()
+    proc = _start_backend(args, aoai_url, port)
+    results = []
+    try:
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", timeout=30) as client:
+            await _wait_ready(client, proc, args.startup_timeout_s)
+            utterances = _load_utterances()
+            for concurrency in (int(s) for s in args.stages.split(",")):
+                result = await _run_stage(client, f"ws://127.0.0.1:{port}", concurrency, args, utterances)
+                results.append(result)
+                if not args.json:
+                    _print_stage(result)
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--stages", default="5,10,20", help="comma-separated concurrent call counts")
+    parser.add_argument("--turns", type=int, default=3, help="caller turns per call after the greeting")
+    parser.add_argument("--paths", default="acs,realtime", help="acs, realtime or both (alternating)")
+    parser.add_argument("--spawn-rate", type=float, default=10.0, help="calls started per second")
+    parser.add_argument("--turn-timeout-s", type=float, default=20.0)
+    parser.add_argument("--startup-timeout-s", type=float, default=120.0)
+    parser.add_argument("--aoai-ttfb-ms", type=float, default=350.0)
+    parser.add_argument("--aoai-tokens-per-s", type=float, default=60.0)
+    parser.add_argument("--tts-first-byte-ms", type=float, default=120.0)
+    parser.add_argument("--stt-partial-delay-ms", type=int, default=150)
+    parser.add_argument("--stt-final-delay-ms", type=int, default=200)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument(
+        "--server-log",
+        default=str(Path(tempfile.gettempdir()) / "offline_harness_server.log"),
+        help="file receiving the backend's stdout/stderr",
+    )
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, default=0, help=argparse.SUPPRESS)
+    parser.add_argument("--aoai-url", default="", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args)
+        return
+    results = asyncio.run(drive(args))
+    if args.json:
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,560 @@
+"""
+Offline Stand-ins for the Load Harness
+======================================
+
+Local replacements for the external services the backend talks to, so the
+real FastAPI app can run under load on a laptop or CI runner with no Azure
+resources:
+
+- ``FakeSpeechRecognizer``: drop-in for ``StreamingSpeechRecognizerFromBytes``.
+  It detects utterances from frame energy and fires partial and final
+  callbacks from timer threads, as the Speech SDK does.
+- ``FakeSpeechSynthesizer``: drop-in for ``SpeechSynthesizer``. It sleeps for
+  a configurable synthesis time and returns a tone whose length follows the
+  text length.
+- ``InMemoryRedisManager``: the subset of ``AzureRedisManager`` used on the
+  call paths, backed by dicts. Its async methods still go through the
+  storage executor, like the real manager's.
+- ``FakeCosmosManager``: accepts post-call upserts.
+- ``create_mock_aoai_app``: an Azure OpenAI compatible chat-completions
+  endpoint. It streams SSE chunks with configurable time-to-first-byte and
+  tokens/s, and reports usage with AOAI-style prompt-prefix cache hits. It is
+  meant to be served by uvicorn.
+- ``install_offline_stubs``: points the backend's ``main`` module at the
+  fakes. The lifespan then builds the regular on-demand pools, executors,
+  connection manager and agents around them.
+- ``StageRecorder``: collects every ``LatencyTool`` sample recorded inside
+  the server process.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import math
+import os
+import threading
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from src.pools.executors import Workload, run_in_workload
+from src.vad.gate import frame_level_db
+
+USER_UTTERANCES = (
+    "Hi, I need some help with a claim I filed last week.",
+    "My policy number is one two three four five.",
+    "The car was rear-ended at a stop light.",
+    "Can you tell me when an adjuster will call me?",
+    "Thanks, that is everything for today.",
+)
+
+BOT_REPLY = (
+    "Thanks for the details. I have pulled up your policy and I can see the claim. "
+    "An adjuster will review it and call you back within one business day. "
+    "Is there anything else I can help you with today?"
+)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of ``values`` (``pct`` in 0..100)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    """Count and p50/p95/p99/max of millisecond samples."""
+    if not values:
+        return {"n": 0}
+    return {
+        "n": len(values),
+        "p50_ms": round(percentile(values, 50), 1),
+        "p95_ms": round(percentile(values, 95), 1),
+        "p99_ms": round(percentile(values, 99), 1),
+        "max_ms": round(max(values), 1),
+    }
+
+
+_TONE_CACHE: Dict[int, bytes] = {}
+
+
+def tone_pcm(duration_s: float, sample_rate: int = 16000, freq: float = 220.0) -> bytes:
+    """PCM16 mono tone at about -20 dBFS, tiled from a cached one-second buffer."""
+    second = _TONE_CACHE.get(sample_rate)
+    if second is None:
+        t = np.arange(sample_rate) / sample_rate
+        second = (3000 * np.sin(2 * np.pi * freq * t)).astype(np.int16).tobytes()
+        _TONE_CACHE[sample_rate] = second
+    total = int(duration_s * sample_rate) * 2
+    repeats = total // len(second) + 1
+    return (second * repeats)[:total]
+
+
+# --------------------------------------------------------------------------- #
+# Speech
+# --------------------------------------------------------------------------- #
+class FakeSpeechRecognizer:
+    """Energy-driven stand-in for ``StreamingSpeechRecognizerFromBytes``.
+
+    An utterance starts when a frame exceeds ``speech_threshold_db``. A
+    partial fires ``partial_delay_ms`` after ``partial_after_ms`` of speech.
+    The final fires ``final_delay_ms`` after ``silence_ms`` of trailing
+    quiet. The delays stand in for the Speech service round-trip.
+    Transcripts cycle through ``utterances``.
+    """
+
+    def __init__(
+        self,
+        *,
+        sample_rate: int = 16000,
+        speech_threshold_db: float = -40.0,
+        partial_after_ms: int = 300,
+        partial_delay_ms: int = 150,
+        silence_ms: int = 600,
+        final_delay_ms: int = 200,
+        utterances=USER_UTTERANCES,
+    ) -> None:
+        self.sample_rate = sample_rate
+        self.speech_threshold_db = speech_threshold_db
+        self.partial_after_samples = int(sample_rate * partial_after_ms / 1000)
+        self.partial_delay_s = partial_delay_ms / 1000
+        self.silence_samples = int(sample_rate * silence_ms / 1000)
+        self.final_delay_s = final_delay_ms / 1000
+        self._utterances = itertools.cycle(utterances)
+
+        self.push_stream: Optional[object] = None
+        self.partial_callback: Optional[Callable[..., None]] = None
+        self.final_callback: Optional[Callable[..., None]] = None
+        self.cancel_callback: Optional[Callable[..., None]] = None
+        self.call_connection_id: Optional[str] = None
+
+        self._lock = threading.Lock()
+        self._timers: set = set()
+        self._running = False
+        self._in_utterance = False
+        self._partial_sent = False
+        self._speech = 0
+        self._silence = 0
+        self._text = ""
+        self.bytes_written = 0
+
+    def set_partial_result_callback(self, callback: Callable[..., None]) -> None:
+        self.partial_callback = callback
+
+    def set_final_result_callback(self, callback: Callable[..., None]) -> None:
+        self.final_callback = callback
+
+    def set_cancel_callback(self, callback: Callable[..., None]) -> None:
+        self.cancel_callback = callback
+
+    def set_call_connection_id(self, call_connection_id: str) -> None:
+        self.call_connection_id = call_connection_id
+
+    def create_push_stream(self) -> None:
+        if self.push_stream is None:
+            self.push_stream = object()
+
+    prepare_stream = create_push_stream
+    prepare_start = create_push_stream
+
+    def start(self) -> None:
+        self.create_push_stream()
+        self._running = True
+
+    def stop(self) -> None:
+        self._running = False
+        with self._lock:
+            timers, self._timers = self._timers, set()
+            self._in_utterance = False
+            self._partial_sent = False
+            self._speech = self._silence = 0
+        for timer in timers:
+            timer.cancel()
+        self.push_stream = None
+
+    def write_bytes(self, audio_chunk: bytes) -> None:
+        if not self._running or not audio_chunk:
+            return
+        self.bytes_written += len(audio_chunk)
+        samples = len(audio_chunk) // 2
+        loud = frame_level_db(audio_chunk) >= self.speech_threshold_db
+        with self._lock:
+            if loud:
+                if not self._in_utterance:
+                    self._in_utterance = True
+                    self._partial_sent = False
+                    self._speech = 0
+                    self._text = next(self._utterances)
+                self._speech += samples
+                self._silence = 0
+                if not self._partial_sent and self._speech >= self.partial_after_samples:
+                    self._partial_sent = True
+                    words = self._text.split()
+                    partial = " ".join(words[: max(2, len(words) // 2)])
+                    self._schedule(self.partial_delay_s, self.partial_callback, partial)
+            elif self._in_utterance:
+                self._silence += samples
+                if self._silence >= self.silence_samples:
+                    self._in_utterance = False
+                    self._schedule(self.final_delay_s, self.final_callback, self._text)
+
+    def _schedule(self, delay_s: float, callback, text: str) -> None:
+        if callback is None:
+            return
+
+        def _fire() -> None:
+            with self._lock:
+                self._timers.discard(timer)
+            if self._running:
+                callback(text, "en-US", None)
+
+        timer = threading.Timer(delay_s, _fire)
+        timer.daemon = True
+        self._timers.add(timer)
+        timer.start()
+
+
+class FakeSpeechSynthesizer:
+    """Stand-in for ``SpeechSynthesizer``; sleeps like the service and returns a tone."""
+
+    def __init__(
+        self,
+        *,
+        first_byte_ms: float = 120.0,
+        realtime_factor: float = 0.05,
+        ms_per_char: float = 60.0,
+        **_: Any,
+    ) -> None:
+        self.first_byte_s = first_byte_ms / 1000
+        self.realtime_factor = realtime_factor
+        self.ms_per_char = ms_per_char
+        self.stop_calls = 0
+
+    def synthesize_to_pcm(
+        self,
+        text: str,
+        voice: Optional[str] = None,
+        sample_rate: int = 16000,
+        style: Optional[str] = None,
+        rate: Optional[str] = None,
+    ) -> bytes:
+        duration_s = max(0.2, len(text.strip()) * self.ms_per_char / 1000)
+        time.sleep(self.first_byte_s + duration_s * self.realtime_factor)
+        return tone_pcm(duration_s, sample_rate)
+
+    def stop_speaking(self) -> None:
+        self.stop_calls += 1
+
+
+# --------------------------------------------------------------------------- #
+# Storage
+# --------------------------------------------------------------------------- #
+class _NullRedisClient:
+    def expire(self, key: str, ttl_seconds: int) -> bool:
+        return True
+
+    def ping(self) -> bool:
+        return True
+
+
+class InMemoryRedisManager:
+    """Dict-backed subset of ``AzureRedisManager`` used on the call paths."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._hashes: Dict[str, Dict[str, Any]] = {}
+        self._values: Dict[str, str] = {}
+        self._hash_batches: set = set()
+        self._streams: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.redis_client = _NullRedisClient()
+
+    def is_connected(self) -> bool:
+        return True
+
+    async def ping(self) -> bool:
+        return True
+
+    def store_session_data(self, session_id: str, data: Dict[str, Any]) -> bool:
+        with self._lock:
+            self._hashes.setdefault(session_id, {}).update(data)
+        return True
+
+    def get_session_data(self, session_id: str) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._hashes.get(session_id, {}))
+
+    def update_session_field(self, session_id: str, field: str, value: str) -> bool:
+        return self.store_session_data(session_id, {field: value})
+
+    def delete_session(self, session_id: str) -> int:
+        with self._lock:
+            return 1 if self._hashes.pop(session_id, None) is not None else 0
+
+    def set_value(self, key: str, value: str, ttl_seconds: Optional[int] = None) -> bool:
+        with self._lock:
+            self._values[key] = value
+        return True
+
+    def get_value(self, key: str) -> Optional[str]:
+        with self._lock:
+            return self._values.get(key)
+
+    def increment_hash_fields_once(
+        self,
+        key: str,
+        increments: Dict[str, float],
+        *,
+        batch_id: str,
+        ttl_seconds: Optional[int] = None,
+    ) -> bool:
+        with self._lock:
+            if (key, batch_id) in self._hash_batches:
+                return False
+            self._hash_batches.add((key, batch_id))
+            bucket = self._hashes.setdefault(key, {})
+            for field, amount in increments.items():
+                current = bucket.get(field, "0")
+                if isinstance(amount, int):
+                    bucket[field] = str(int(current) + amount)
+                else:
+                    bucket[field] = str(float(current) + amount)
+            return True
+
+    def get_many_hashes(self, keys: List[str]) -> List[Dict[str, str]]:
+        with self._lock:
+            return [dict(self._hashes.get(key, {})) for key in keys]
+
+    def publish_event(self, stream_key: str, event_data: Dict[str, Any]) -> str:
+        entry_id = f"{int(time.time() * 1000)}-{uuid.uuid4().hex[:6]}"
+        with self._lock:
+            self._streams[stream_key].append({"id": entry_id, **event_data})
+        return entry_id
+
+    async def store_session_data_async(self, session_id: str, data: Dict[str, Any]) -> bool:
+        return await run_in_workload(Workload.STORAGE, self.store_session_data, session_id, data)
+
+    async def get_session_data_async(self, session_id: str) -> Dict[str, Any]:
+        return await run_in_workload(Workload.STORAGE, self.get_session_data, session_id)
+
+    async def update_session_field_async(self, session_id: str, field: str, value: str) -> bool:
+        return await run_in_workload(
+            Workload.STORAGE, self.update_session_field, session_id, field, value
+        )
+
+    async def delete_session_async(self, session_id: str) -> int:
+        return await run_in_workload(Workload.STORAGE, self.delete_session, session_id)
+
+    async def set_value_async(
+        self, key: str, value: str, ttl_seconds: Optional[int] = None
+    ) -> bool:
+        return await run_in_workload(Workload.STORAGE, self.set_value, key, value, ttl_seconds)
+
+    async def get_value_async(self, key: str) -> Optional[str]:
+        return await run_in_workload(Workload.STORAGE, self.get_value, key)
+
+    async def publish_event_async(self, stream_key: str, event_data: Dict[str, Any]) -> str:
+        return self.publish_event(stream_key, event_data)
+
+    async def wait_for_stream_event_async(
+        self, stream_key: str, last_id: str = "$", timeout_ms: int = 30000, count: int = 1
+    ) -> Optional[List[Any]]:
+        await asyncio.sleep(timeout_ms / 1000)
+        return None
+
+    async def close_async(self) -> None:
+        return None
+
+
+class FakeCosmosManager:
+    """Accepts post-call documents without a database."""
+
+    def __init__(self, *_: Any, **__: Any) -> None:
+        self.documents: Dict[str, Dict[str, Any]] = {}
+
+    def upsert_document(self, document: Dict[str, Any], query: Optional[Dict[str, Any]] = None):
+        key = str(document.get("_id") or document.get("session_id") or uuid.uuid4().hex)
+        self.documents[key] = document
+        return key
+
+    def ensure_indexes(self, *_: Any) -> List[str]:
+        return []
+
+
+# --------------------------------------------------------------------------- #
+# Azure OpenAI
+# --------------------------------------------------------------------------- #
+@dataclass
+class MockAoaiConfig:
+    ttfb_ms: float = 350.0
+    tokens_per_s: float = 60.0
+    reply: str = BOT_REPLY
+
+
+def create_mock_aoai_app(config: Optional[MockAoaiConfig] = None) -> FastAPI:
+    """Azure OpenAI compatible ``chat/completions`` endpoint with scripted replies."""
+    config = config or MockAoaiConfig()
+    app = FastAPI(title="mock-aoai")
+    app.state.requests = 0
+    app.state.last_prompt = {}
+
+    def _usage(deployment: str, body: Dict[str, Any], completion_tokens: int) -> Dict[str, Any]:
+        # ~4 chars per token; cache hits mimic AOAI (>= 1024 tokens, 128-token steps)
+        prompt = json.dumps([body.get("tools") or [], body.get("messages") or []])
+        previous = app.state.last_prompt.get(deployment, "")
+        app.state.last_prompt[deployment] = prompt
+        shared = len(os.path.commonprefix([prompt, previous])) // 4
+        cached = shared // 128 * 128 if shared >= 1024 else 0
+        prompt_tokens = len(prompt) // 4
+        return {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+            "prompt_tokens_details": {"cached_tokens": cached},
+        }
+
+    def _chunk(completion_id: str, model: str, delta: Dict[str, Any], finish=None) -> str:
+        payload = {
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish}],
+        }
+        return f"data: {json.dumps(payload)}\n\n"
+
+    @app.post("/openai/deployments/{deployment}/chat/completions")
+    async def chat_completions(deployment: str, request: Request):
+        body = await request.json()
+        app.state.requests += 1
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+        # Word-sized tokens keep the stream shape close to real deltas.
+        tokens = [word + " " for word in config.reply.split()]
+
+        if not body.get("stream"):
+            await asyncio.sleep(config.ttfb_ms / 1000 + len(tokens) / config.tokens_per_s)
+            return JSONResponse(
+                {
+                    "id": completion_id,
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": deployment,
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {"role": "assistant", "content": config.reply},
+                            "finish_reason": "stop",
+                        }
+                    ],
+                    "usage": _usage(deployment, body, len(tokens)),
+                }
+            )
+
+        async def _stream():
+            await asyncio.sleep(config.ttfb_ms / 1000)
+            yield _chunk(completion_id, deployment, {"role": "assistant", "content": ""})
+            interval = 1.0 / config.tokens_per_s
+            for token in tokens:
+                yield _chunk(completion_id, deployment, {"content": token})
+                await asyncio.sleep(interval)
+            yield _chunk(completion_id, deployment, {}, finish="stop")
+            if (body.get("stream_options") or {}).get("include_usage"):
+                payload = {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": int(time.time()),
+                    "model": deployment,
+                    "choices": [],
+                    "usage": _usage(deployment, body, len(tokens)),
+                }
+                yield f"data: {json.dumps(payload)}\n\n"
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(_stream(), media_type="text/event-stream")
+
+    return app
+
+
+# --------------------------------------------------------------------------- #
+# Server-side measurement and wiring
+# --------------------------------------------------------------------------- #
+class StageRecorder:
+    """Collects ``LatencyTool`` stage durations recorded inside the server."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._samples: Dict[str, List[float]] = defaultdict(list)
+
+    def record(self, stage: str, duration_s: float) -> None:
+        with self._lock:
+            self._samples[stage].append(duration_s * 1000)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples.clear()
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {stage: summarize(values) for stage, values in sorted(self._samples.items())}
+
+    def install(self) -> None:
+        """Wrap ``PersistentLatency._append_sample`` so every sample is also recorded here."""
+        from src.tools.latency_helpers import PersistentLatency
+
+        original = PersistentLatency._append_sample
+        recorder = self
+
+        def _append_sample(store, run_id, sample):
+            recorder.record(sample.stage, sample.dur)
+            return original(store, run_id, sample)
+
+        PersistentLatency._append_sample = _append_sample
+
+
+@dataclass
+class StubConfig:
+    tts_first_byte_ms: float = 120.0
+    tts_realtime_factor: float = 0.05
+    stt_partial_delay_ms: int = 150
+    stt_final_delay_ms: int = 200
+    stt_silence_ms: int = 600
+
+
+def install_offline_stubs(main_module, config: Optional[StubConfig] = None) -> InMemoryRedisManager:
+    """Point the backend's startup factories at the offline stand-ins.
+
+    Must run before the app's lifespan starts. Pools, executors and agents
+    are still built by the real startup graph; only the external clients are
+    replaced. Returns the shared in-memory Redis stand-in.
+    """
+    config = config or StubConfig()
+    redis = InMemoryRedisManager()
+
+    def make_synthesizer(*_: Any, **__: Any) -> FakeSpeechSynthesizer:
+        return FakeSpeechSynthesizer(
+            first_byte_ms=config.tts_first_byte_ms,
+            realtime_factor=config.tts_realtime_factor,
+        )
+
+    def make_recognizer(*_: Any, **__: Any) -> FakeSpeechRecognizer:
+        return FakeSpeechRecognizer(
+            partial_delay_ms=config.stt_partial_delay_ms,
+            final_delay_ms=config.stt_final_delay_ms,
+            silence_ms=config.stt_silence_ms,
+        )
+
+    main_module.AzureRedisManager = lambda: redis
+    main_module.SpeechSynthesizer = make_synthesizer
+    main_module.StreamingSpeechRecognizerFromBytes = make_recognizer
+    main_module.CosmosDBMongoCoreManager = FakeCosmosManager
+    main_module.initialize_acs_caller_instance = lambda: None
+    return redis
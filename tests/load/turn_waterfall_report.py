@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Turn Waterfall Report
+=====================
+
+Aggregates per-turn critical-path waterfalls across sessions and ranks the
+stages and untimed gaps that contribute most dead air (the silence between the
+caller's last voiced frame and the first audio frame sent back).
+
+Sessions are read either from JSON files or directly from Redis:
+
+- JSON: a ``CoreMemory`` dump (``{"latency": {...}}``), a bare latency payload
+  (``{"runs": ..., "order": ...}``), a Redis session hash
+  (``{"corememory": "<json>"}``) or a list of any of these;
+- Redis: every ``session:*`` hash, using the backend's ``REDIS_*``/Azure
+  environment.
+
+Usage:
+    python tests/load/turn_waterfall_report.py sessions/*.json
+    python tests/load/turn_waterfall_report.py --redis --limit 500 --top 15
+    python tests/load/turn_waterfall_report.py dump.json --json
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import Any, Dict, Iterable, Iterator, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.tools.turn_waterfall import aggregate_waterfalls, session_waterfalls  # noqa: E402
+
+
+def _latency_payloads(obj: Any) -> Iterator[Dict[str, Any]]:
+    if isinstance(obj, list):
+        for item in obj:
+            yield from _latency_payloads(item)
+    elif isinstance(obj, dict):
+        if "runs" in obj:
+            yield obj
+        elif isinstance(obj.get("latency"), dict):
+            yield obj["latency"]
+        elif isinstance(obj.get("corememory"), str):
+            yield from _latency_payloads(json.loads(obj["corememory"]))
+
+
+def _from_files(paths: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    for path in paths:
+        with open(path, encoding="utf-8") as fh:
+            yield from _latency_payloads(json.load(fh))
+
+
+def _from_redis(pattern: str, limit: int) -> Iterator[Dict[str, Any]]:
+    from src.redis.manager import AzureRedisManager
+
+    redis_mgr = AzureRedisManager()
+    for n, key in enumerate(redis_mgr.redis_client.scan_iter(match=pattern, count=500)):
+        if limit and n >= limit:
+            break
+        data = redis_mgr.get_session_data(key)
+        if data.get("corememory"):
+            yield from _latency_payloads(data)
+
+
+def build_report(payloads: Iterable[Dict[str, Any]], top: int) -> Dict[str, Any]:
+    sessions = 0
+    turns: List[Dict[str, Any]] = []
+    for latency in payloads:
+        sessions += 1
+        turns.extend(session_waterfalls(latency))
+    report = aggregate_waterfalls(turns, top=top)
+    report["sessions"] = sessions
+    report["incomplete_turns"] = sum(1 for t in turns if not t["complete"])
+    return report
+
+
+def _print_report(report: Dict[str, Any]) -> None:
+    print(
+        f"sessions={report['sessions']} complete_turns={report['turns']} "
+        f"incomplete_turns={report['incomplete_turns']}"
+    )
+    if not report["turns"]:
+        return
+    dead_air = report["dead_air_ms"]
+    print(
+        "dead air ms: mean={mean} p50={p50} p95={p95} max={max}".format(**dead_air)
+    )
+    print()
+    print(f"{'contributor':<34}{'share':>8}{'mean ms':>10}{'p95 ms':>10}{'turns':>8}")
+    for c in report["top_contributors"]:
+        print(
+            f"{c['label']:<34}{c['share_pct']:>7.1f}%{c['mean_ms']:>10.1f}"
+            f"{c['p95_ms']:>10.1f}{c['turns']:>8}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("files", nargs="*", help="JSON session dumps")
+    parser.add_argument("--redis", action="store_true", help="scan session hashes in Redis")
+    parser.add_argument("--pattern", default="session:*")
+    parser.add_argument("--limit", type=int, default=0, help="max sessions from Redis (0 = all)")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    if not args.files and not args.redis:
+        parser.error("pass JSON files and/or --redis")
+
+    payloads: List[Dict[str, Any]] = list(_from_files(args.files))
+    if args.redis:
+        payloads.extend(_from_redis(args.pattern, args.limit))
+
+    report = build_report(payloads, args.top)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        _print_report(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from src.vad.barge_in import BargeInDetector, ProvisionalBargeIn, zero_crossing_hz
+
+RATE = 16000
+FRAME = RATE // 50  # 20 ms
+
+
+def _tone(freq=300.0, amplitude=8000):
+    t = np.arange(FRAME) / RATE
+    return (amplitude * np.sin(2 * np.pi * freq * t)).astype(np.int16).tobytes()
+
+
+def _noise(amplitude=8000, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.integers(-amplitude, amplitude, FRAME, dtype=np.int16).tobytes()
+
+
+def test_zero_crossing_rate_tracks_frequency():
+    assert zero_crossing_hz(_tone(440.0), RATE) == pytest.approx(440.0, rel=0.1)
+    assert zero_crossing_hz(_noise(), RATE) > 3500.0
+
+
+def test_triggers_within_two_frames_only_while_playing():
+    detector = BargeInDetector(sample_rate=RATE, trigger_frames=2)
+
+    assert not any(detector.process(_tone(), playing=False, now=0.0) for _ in range(5))
+
+    fired = [detector.process(_tone(), playing=True, now=0.02 * i) for i in range(4)]
+    assert fired == [False, True, False, False]  # once, on the second frame
+    assert detector.pending
+
+
+def test_echo_and_non_speech_frames_do_not_trigger():
+    detector = BargeInDetector(sample_rate=RATE, echo_return_loss_db=20.0)
+    detector.set_playback_level(-3.0)
+
+    echo = _tone(amplitude=1500)  # ~-30 dBFS, below playback - ERL
+    hum = _tone(freq=50.0)
+    hiss = _noise()
+    for frame in (echo, hum, hiss):
+        assert not any(detector.process(frame, playing=True) for _ in range(10))
+
+    assert any(detector.process(_tone(amplitude=20000), playing=True) for _ in range(2))
+
+
+def test_confirm_reports_lead_and_timeouts_raise_margin():
+    detector = BargeInDetector(sample_rate=RATE, confirm_timeout_ms=1000)
+    base_threshold = detector.current_threshold_db()
+
+    detector.process(_tone(), playing=True, now=0.00)
+    assert detector.process(_tone(), playing=True, now=0.02)
+    assert detector.confirm(now=0.42) == pytest.approx(0.40)
+    assert detector.confirm(now=0.50) is None
+
+    detector.process(_tone(), playing=True, now=1.00)
+    assert detector.process(_tone(), playing=True, now=1.02)
+    detector.process(b"\x00" * (FRAME * 2), playing=False, now=2.50)  # no partial came
+
+    stats = detector.stats()
+    assert stats["confirmed"] == 1
+    assert stats["false_positives"] == 1
+    assert stats["avg_lead_ms"] == pytest.approx(400.0)
+    assert detector.current_threshold_db() == base_threshold + 3.0
+
+
+def test_playback_envelope_tracks_the_frame_being_heard():
+    detector = BargeInDetector(sample_rate=RATE, echo_return_loss_db=20.0)
+    detector.add_playback_envelope([-40.0, -3.0], frame_s=0.02, now=0.0)
+    detector.add_playback_envelope([-10.0], frame_s=0.02, now=0.0)  # queued behind
+
+    detector.process(_tone(amplitude=100), playing=True, now=0.01)
+    assert detector.playback_db == -40.0
+    detector.process(_tone(amplitude=100), playing=True, now=0.03)
+    assert detector.playback_db == -3.0
+    detector.process(_tone(amplitude=100), playing=True, now=0.05)
+    assert detector.playback_db == -10.0
+    detector.process(_tone(amplitude=100), playing=True, now=0.07)
+    assert detector.playback_db is None
+
+    detector.add_playback_envelope([-3.0], frame_s=0.02, now=1.0)
+    detector.set_playback_level(None)  # barge-in discards queued audio
+    detector.process(_tone(amplitude=100), playing=True, now=1.0)
+    assert detector.playback_db is None
+
+
+def _provisional(window_s=0.05):
+    calls = []
+    provisional = ProvisionalBargeIn(
+        duck=lambda meta: calls.append(("duck", meta)),
+        resume=lambda meta: calls.append(("resume", meta)),
+        commit=lambda meta: calls.append(("commit", meta)),
+        confirm_window_s=window_s,
+    )
+    return provisional, calls
+
+
+async def test_provisional_barge_in_commits_when_partial_confirms():
+    provisional, calls = _provisional()
+
+    assert provisional.trigger(energy_level=-20.0)
+    assert not provisional.trigger(energy_level=-18.0)  # already ducked
+    assert provisional.confirm()
+    await asyncio.sleep(0.08)  # the window passes without a resume
+
+    assert calls == [("duck", {"energy_level": -20.0}), ("commit", {"energy_level": -20.0})]
+    assert not provisional.active
+    assert provisional.stats() == {"ducked": 1, "committed": 1, "resumed": 0}
+
+
+async def test_provisional_barge_in_resumes_without_partial():
+    provisional, calls = _provisional()
+    detector = BargeInDetector(sample_rate=RATE)
+    detector.process(_tone(), playing=True, now=0.0)
+    assert detector.process(_tone(), playing=True, now=0.02)
+
+    provisional.trigger(energy_level=-25.0)
+    await asyncio.sleep(0.08)  # cough: no partial arrives
+    assert detector.reject()
+
+    assert [name for name, _ in calls] == ["duck", "resume"]
+    assert not provisional.confirm()  # a late partial no longer commits
+    assert detector.stats()["false_positives"] == 1
+    assert not detector.pending
+    assert provisional.trigger(energy_level=-10.0)  # next trigger ducks again
+    provisional.discard()
@@ -0,0 +1,138 @@
+import asyncio
+import base64
+import io
+import json
+import wave
+from unittest.mock import Mock
+
+import numpy as np
+
+from apps.rtagent.backend.api.v1.handlers.acs_media_lifecycle import MainEventLoop
+from src.blob.call_recorder import CallRecorder, WAV_HEADER_BYTES
+
+FRAME = 640  # 20 ms of 16 kHz mono PCM16
+
+
+class _BlockBlob:
+    """In-memory stand-in for an async BlockBlob client."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.staged = {}
+        self.stage_order = []
+        self.committed = None
+        self.metadata = None
+
+    async def stage_block(self, block_id, data, length=None):
+        await asyncio.sleep(self.delay)
+        self.staged[block_id] = bytes(data)
+        self.stage_order.append(block_id)
+
+    async def commit_block_list(self, block_list, content_settings=None, metadata=None):
+        self.committed = b"".join(self.staged[b] for b in block_list)
+        self.metadata = metadata
+
+    def wav(self):
+        with wave.open(io.BytesIO(self.committed)) as w:
+            frames = np.frombuffer(w.readframes(w.getnframes()), dtype="<i2")
+            return w.getnchannels(), w.getframerate(), frames.reshape(-1, 2)
+
+
+def _frame(value):
+    return np.full(FRAME // 2, value, dtype="<i2").tobytes()
+
+
+async def test_caller_and_agent_are_interleaved_in_time():
+    blob = _BlockBlob()
+    recorder = CallRecorder(blob, call_id="c1", block_bytes=4 * FRAME).start()
+
+    recorder.tap_inbound(_frame(1))
+    recorder.tap_outbound(_frame(7))  # agent starts speaking
+    recorder.tap_outbound(_frame(8))
+    for value in (2, 3, 4):
+        recorder.tap_inbound(_frame(value))
+    stats = await recorder.finish()
+
+    channels, rate, frames = blob.wav()
+    assert (channels, rate) == (2, 16000)
+    per_frame = FRAME // 2
+    assert list(frames[::per_frame, 0]) == [1, 2, 3, 4]  # caller, left
+    assert list(frames[::per_frame, 1]) == [0, 7, 8, 0]  # agent, right
+    assert stats["committed"] and stats["duration_s"] == 0.08
+    assert blob.metadata["call_id"] == "c1" and blob.metadata["dropped_blocks"] == "0"
+
+
+async def test_outbound_at_another_rate_is_resampled_to_the_inbound_clock():
+    blob = _BlockBlob()
+    recorder = CallRecorder(
+        blob, call_id="c3", sample_rate=16000, outbound_sample_rate=24000, block_bytes=4 * FRAME
+    ).start()
+
+    recorder.tap_inbound(_frame(1))
+    recorder.tap_outbound(np.full(480, 9, dtype="<i2").tobytes())  # 20 ms at 24 kHz
+    recorder.tap_inbound(_frame(2))
+    recorder.tap_inbound(_frame(3))
+    await recorder.finish()
+
+    channels, rate, frames = blob.wav()
+    assert (channels, rate) == (2, 16000)
+    per_frame = FRAME // 2
+    assert len(frames) == 3 * per_frame
+    assert set(frames[per_frame : 2 * per_frame, 1]) == {9}  # one 16 kHz frame
+    assert set(frames[2 * per_frame :, 1]) == {0}
+
+
+async def test_header_is_staged_last_and_memory_stays_bounded():
+    blob = _BlockBlob()
+    recorder = CallRecorder(blob, call_id="c2", block_bytes=8 * FRAME).start()
+
+    peak = 0
+    for i in range(500):  # 10 s of audio
+        recorder.tap_inbound(_frame(i % 100))
+        if i % 3 == 0:
+            recorder.tap_outbound(_frame(-1))
+        peak = max(peak, recorder.stats()["buffered_bytes"])
+        await asyncio.sleep(0)
+    await recorder.finish()
+
+    assert peak < 8 * FRAME
+    assert len(blob.stage_order) > 50
+    assert blob.stage_order[-1] == base64.b64encode(b"00000000").decode()
+    assert len(blob.committed) == WAV_HEADER_BYTES + 500 * FRAME * 2
+    assert blob.wav()[2].shape == (500 * FRAME // 2, 2)
+
+
+async def test_slow_storage_drops_blocks_instead_of_buffering():
+    blob = _BlockBlob(delay=0.05)
+    recorder = CallRecorder(
+        blob, call_id="c3", block_bytes=FRAME * 2, max_pending_blocks=2, max_outbound_lag_s=0.1
+    ).start()
+
+    for _ in range(40):
+        recorder.tap_inbound(_frame(5))  # never awaits: the tap cannot stall the loop
+    recorder.tap_outbound(_frame(9) * 10)  # 200 ms queued against a 100 ms cap
+    assert recorder.stats()["pending_blocks"] == 2
+    assert recorder.dropped_blocks > 10
+    assert recorder.dropped_outbound_bytes == 5 * FRAME
+
+    recorder.clear_outbound()  # barge-in
+    stats = await recorder.finish()
+    assert stats["committed"] and stats["dropped_blocks"] == recorder.dropped_blocks
+    assert blob.metadata["dropped_blocks"] == str(recorder.dropped_blocks)
+
+
+async def test_media_loop_records_silent_and_voiced_inbound_frames():
+    websocket = Mock()
+    loop = MainEventLoop(websocket, "call-4", route_turn_thread=Mock())
+    recorder = CallRecorder(_BlockBlob(), call_id="call-4")
+    acs_handler = Mock(recorder=recorder)
+
+    for silent, value in ((True, 0), (False, 3)):
+        payload = {
+            "kind": "AudioData",
+            "audioData": {"data": base64.b64encode(_frame(value)).decode(), "silent": silent},
+        }
+        await loop.handle_media_message(json.dumps(payload), None, acs_handler)
+
+    assert recorder.stats()["buffered_bytes"] == 4 * FRAME  # two frames, both channels
+    await recorder.finish()
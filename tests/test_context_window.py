@@ -0,0 +1,118 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+from src.agenticmemory.context_window import SUMMARIES_KEY, ContextWindow, estimate_tokens
+from src.stateful.state_managment import MemoManager
+
+AGENT = "ClaimIntake"
+
+
+def _call(exchanges, tool_every=5):
+    """A call of `exchanges` user/assistant pairs with a tool round-trip every few turns."""
+    cm = MemoManager(session_id="ctx-test")
+    cm.ensure_system_prompt(AGENT, "You are a claims assistant. " * 40)
+    history = cm.get_history(AGENT)
+    for i in range(exchanges):
+        history.append({"role": "user", "content": f"caller utterance {i} " + "details " * 20})
+        if i % tool_every == 0:
+            history.append(
+                {
+                    "role": "assistant",
+                    "content": None,
+                    "tool_calls": [
+                        {"id": f"t{i}", "type": "function", "function": {"name": "lookup", "arguments": "{}"}}
+                    ],
+                }
+            )
+            history.append({"role": "tool", "tool_call_id": f"t{i}", "name": "lookup", "content": "{}"})
+            history.append({"role": "user", "content": ""})  # tool follow-up
+        history.append({"role": "assistant", "content": f"agent reply {i} " + "words " * 25})
+    return cm
+
+
+class _FakeClient:
+    def __init__(self, reply="caller filed claim", fail=False):
+        self.requests = []
+        self.reply = reply
+        self.fail = fail
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, **kwargs):
+        self.requests.append(kwargs)
+        if self.fail:
+            raise RuntimeError("aoai down")
+        message = SimpleNamespace(content=f"{self.reply} #{len(self.requests)}")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def test_short_history_is_sent_unchanged():
+    cm = _call(3)
+    window = ContextWindow(max_tokens=6000, max_turns=12)
+
+    messages, start = window.select(cm, AGENT)
+
+    assert messages is cm.get_history(AGENT)
+    assert start == 1
+
+
+def test_long_call_window_stays_flat_and_keeps_tool_pairs():
+    window = ContextWindow(max_tokens=2000, max_turns=12)
+    sizes = []
+    for exchanges in (60, 180):
+        cm = _call(exchanges)
+        cm.update_slots({"policy_id": "P-42"})
+        messages, start = window.select(cm, AGENT)
+        tokens = sum(estimate_tokens(m) for m in messages)
+        sizes.append(tokens)
+
+        assert tokens <= 2000
+        assert messages[0]["role"] == "system" and "claims assistant" in messages[0]["content"]
+        assert messages[1]["role"] == "system" and "P-42" in messages[1]["content"]
+        assert messages[2]["role"] == "user" and cm.get_history(AGENT)[start] is messages[2]
+        assert messages[-1] is cm.get_history(AGENT)[-1]
+        ids = {c["id"] for m in messages for c in m.get("tool_calls") or ()}
+        assert ids == {m["tool_call_id"] for m in messages if m["role"] == "tool"}
+
+    assert abs(sizes[0] - sizes[1]) < 300
+
+
+async def test_background_summary_rolls_forward_and_is_pinned():
+    cm = _call(40)
+    client = _FakeClient()
+    window = ContextWindow(max_tokens=1500, max_turns=6)
+
+    _, start = window.select(cm, AGENT)
+    task = window.schedule_summary(cm, AGENT, start, client, "gpt-4o")
+    assert window.schedule_summary(cm, AGENT, start, client, "gpt-4o") is None  # in flight
+    await task
+
+    state = cm.get_context(SUMMARIES_KEY)[AGENT]
+    assert state == {"text": "caller filed claim #1", "upto": start}
+    assert "caller utterance 0" in client.requests[0]["messages"][1]["content"]
+
+    history = cm.get_history(AGENT)
+    history.extend([{"role": "user", "content": "more"}, {"role": "assistant", "content": "ok"}] * 10)
+    messages, new_start = window.select(cm, AGENT)
+    assert "caller filed claim #1" in messages[1]["content"]
+
+    await window.schedule_summary(cm, AGENT, new_start, client, "gpt-4o")
+    prompt = client.requests[1]["messages"][1]["content"]
+    assert "Previous Summary" in prompt and "caller utterance 0 " not in prompt
+    assert cm.get_context(SUMMARIES_KEY)[AGENT]["upto"] == new_start
+
+
+async def test_failed_summary_keeps_state_and_cleared_history_resets():
+    cm = _call(40)
+    window = ContextWindow(max_tokens=1500, max_turns=6)
+    _, start = window.select(cm, AGENT)
+
+    await window.schedule_summary(cm, AGENT, start, _FakeClient(fail=True), "gpt-4o")
+    assert AGENT not in cm.get_context(SUMMARIES_KEY, {})
+
+    cm.set_context(SUMMARIES_KEY, {AGENT: {"text": "stale", "upto": 10_000}})
+    await window.schedule_summary(cm, AGENT, start, _FakeClient(), "gpt-4o")
+    assert cm.get_context(SUMMARIES_KEY)[AGENT]["upto"] == start
+    assert json.dumps(cm.get_context(SUMMARIES_KEY))  # persists with core memory
+    await asyncio.sleep(0)
+    assert not window._inflight
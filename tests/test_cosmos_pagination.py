@@ -0,0 +1,154 @@
+import pymongo
+import pytest
+
+from src.cosmosdb.manager import DEFAULT_INDEXES, CosmosDBMongoCoreManager
+
+
+def _matches(doc, query):
+    for key, cond in query.items():
+        if key == "$and":
+            if not all(_matches(doc, q) for q in cond):
+                return False
+        elif key == "$or":
+            if not any(_matches(doc, q) for q in cond):
+                return False
+        elif isinstance(cond, dict):
+            value = doc.get(key)
+            for op, arg in cond.items():
+                if op == "$exists" and (key in doc) != arg:
+                    return False
+                if op == "$ne" and value == arg:
+                    return False
+                if op in ("$lt", "$gt"):
+                    if value is None or type(value) is not type(arg):
+                        return False
+                    if (value >= arg) if op == "$lt" else (value <= arg):
+                        return False
+        elif doc.get(key) != cond:
+            return False
+    return True
+
+
+class _Cursor:
+    def __init__(self, docs, calls):
+        self.docs = docs
+        self.calls = calls
+
+    def sort(self, keys):
+        self.calls.append(("sort", keys))
+        for field, direction in reversed(keys):
+            self.docs.sort(
+                key=lambda d: (d.get(field) is not None, d.get(field) or ""),
+                reverse=direction == pymongo.DESCENDING,
+            )
+        return self
+
+    def skip(self, n):
+        self.calls.append(("skip", n))
+        self.docs = self.docs[n:]
+        return self
+
+    def limit(self, n):
+        self.calls.append(("limit", n))
+        self.docs = self.docs[:n]
+        return self
+
+    def __iter__(self):
+        return iter(self.docs)
+
+
+class _Collection:
+    """Enough of a pymongo collection to exercise filters, ordering and indexes."""
+
+    def __init__(self, docs):
+        self.docs = docs
+        self.calls = []
+        self.indexes = []
+
+    def find(self, query, projection=None):
+        self.calls = [("find", query, projection)]
+        found = [dict(d) for d in self.docs if _matches(d, query)]
+        if projection is not None:
+            found = [{k: v for k, v in d.items() if k in projection or k == "_id"} for d in found]
+        return _Cursor(found, self.calls)
+
+    def count_documents(self, query):
+        return sum(1 for d in self.docs if _matches(d, query))
+
+    def create_index(self, keys):
+        self.indexes.append(keys)
+        return "_".join(f"{f}_{d}" for f, d in keys)
+
+
+def _manager(docs):
+    mgr = CosmosDBMongoCoreManager.__new__(CosmosDBMongoCoreManager)
+    mgr.collection = _Collection(docs)
+    return mgr
+
+
+def _calls(n, status_of=lambda i: "connected"):
+    # Pairs of calls share a timestamp so ties must be broken by _id.
+    return [
+        {
+            "_id": f"call_{i:03d}",
+            "call_id": f"call_{i:03d}",
+            "status": status_of(i),
+            "timestamp": f"2025-01-01T00:{i // 2:02d}:00Z",
+            "events": ["x"] * 50,
+        }
+        for i in range(n)
+    ]
+
+
+def test_keyset_pages_cover_every_call_once_newest_first():
+    docs = _calls(23) + [{"_id": "analytics", "session_id": "s1"}]
+    docs.append({"_id": "call_legacy", "call_id": "call_legacy", "status": "connected"})
+    mgr = _manager(docs)
+    query = {"call_id": {"$exists": True}}
+
+    seen, token, pages = [], None, 0
+    while True:
+        page, token = mgr.query_page(query, 5, continuation_token=token)
+        seen.extend(d["_id"] for d in page)
+        pages += 1
+        if token is None:
+            break
+
+    expected = [f"call_{i:03d}" for i in reversed(range(23))] + ["call_legacy"]
+    assert seen == expected
+    assert pages == 5
+    assert mgr.count_documents(query) == 24
+
+
+def test_query_page_pushes_projection_sort_and_limit_to_server():
+    mgr = _manager(_calls(12, status_of=lambda i: "failed" if i % 3 else "connected"))
+
+    page, token = mgr.query_page(
+        {"status": "failed"}, 3, projection=["call_id", "status"], skip=3
+    )
+
+    find, sort, skip, limit = mgr.collection.calls
+    assert find[2] == ["call_id", "status", "timestamp", "_id"]
+    assert sort == ("sort", [("timestamp", pymongo.DESCENDING), ("_id", pymongo.DESCENDING)])
+    assert skip == ("skip", 3) and limit == ("limit", 4)
+    assert [d["_id"] for d in page] == ["call_007", "call_005", "call_004"]
+    assert "events" not in page[0]
+
+    nxt, _ = mgr.query_page({"status": "failed"}, 3, continuation_token=token, skip=3)
+    assert [d["_id"] for d in nxt] == ["call_002", "call_001"]
+    assert ("skip", 3) not in mgr.collection.calls  # the token replaces the offset
+
+
+def test_malformed_continuation_token_is_rejected():
+    mgr = _manager(_calls(3))
+    with pytest.raises(ValueError):
+        mgr.query_page({}, 2, continuation_token="not-a-token")
+
+
+def test_ensure_indexes_creates_listing_indexes():
+    mgr = _manager([])
+    names = mgr.ensure_indexes()
+
+    assert mgr.collection.indexes == DEFAULT_INDEXES
+    assert "call_id_1" in names
+    assert "status_1_timestamp_-1__id_-1" in names
@@ -0,0 +1,79 @@
+import copy
+import json
+import pickle
+
+from apps.rtagent.backend.src.orchestration.artagent.gpt_flow import (
+    _repair_conversation_history,
+    _validate_conversation_history,
+)
+from src.agenticmemory.types import ChatHistory, MessageThread
+from src.stateful.state_managment import MemoManager
+
+
+def _tool_call(call_id, name="lookup"):
+    return {
+        "role": "assistant",
+        "content": None,
+        "tool_calls": [{"id": call_id, "type": "function", "function": {"name": name, "arguments": "{}"}}],
+    }
+
+
+def _tool_result(call_id):
+    return {"role": "tool", "tool_call_id": call_id, "name": "lookup", "content": "{}"}
+
+
+def test_thread_tracks_open_tool_calls_on_append():
+    thread = MessageThread([{"role": "system", "content": "sys"}])
+    thread.append({"role": "user", "content": "hi"})
+    thread.append(_tool_call("t1"))
+    assert not thread.is_valid and thread.open_tool_calls == ["t1"]
+
+    thread.extend([_tool_result("t1"), {"role": "assistant", "content": "done"}])
+    assert thread.is_valid and thread.last_role == "assistant"
+
+    thread += [_tool_call("t2")]
+    del thread[-1]  # non-tail mutations rescan
+    assert thread.is_valid
+    thread.insert(1, _tool_call("t3"))
+    assert thread.open_tool_calls == ["t3"]
+
+
+def test_validate_and_repair_touch_only_the_tail():
+    cm = MemoManager(session_id="integrity")
+    history = cm.get_history("AuthAgent")
+    assert isinstance(history, MessageThread)
+    history.extend([{"role": "user", "content": "hi"}, _tool_call("t1", name="authenticate_caller")])
+
+    valid, error = _validate_conversation_history(history, "AuthAgent")
+    assert not valid and "t1" in error
+
+    repaired = _repair_conversation_history(history, "AuthAgent")
+    assert repaired is history and len(history) == 3
+    assert history[-1]["tool_call_id"] == "t1" and history[-1]["name"] == "authenticate_caller"
+    assert json.loads(history[-1]["content"])["synthetic_response"] is True
+    assert _validate_conversation_history(history, "AuthAgent") == (True, None)
+
+
+def test_plain_lists_are_validated_and_repaired_as_copies():
+    plain = [{"role": "user", "content": "hi"}, _tool_call("t1"), _tool_call("t2"), _tool_result("t2")]
+    assert _validate_conversation_history(plain, "a") == (False, "Orphaned tool calls detected: ['t1']")
+
+    repaired = _repair_conversation_history(plain, "a")
+    assert len(plain) == 4 and len(repaired) == 5
+    assert _validate_conversation_history(repaired, "a") == (True, None)
+
+
+def test_threads_survive_json_copy_and_pickle_round_trips():
+    history = ChatHistory()
+    history.get_agent("ClaimIntake").append(_tool_call("t9"))
+    restored = ChatHistory()
+    restored.from_json(history.to_json())
+    assert restored.get_agent("ClaimIntake").open_tool_calls == ["t9"]
+
+    thread = history.get_agent("ClaimIntake")
+    for clone in (copy.deepcopy(thread), pickle.loads(pickle.dumps(thread))):
+        assert isinstance(clone, MessageThread) and clone.open_tool_calls == ["t9"]
+        assert clone == thread
+
+    history.clear("ClaimIntake")
+    assert history.get_agent("ClaimIntake").is_valid
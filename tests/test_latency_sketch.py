@@ -0,0 +1,147 @@
+import math
+import random
+
+import pytest
+
+from src.tools.latency_sketch import (
+    FleetLatencyRecorder,
+    LatencySketch,
+    add_to_sketch_dict,
+    new_sketch_dict,
+)
+
+
+class _HashRedis:
+    """Dict-backed stand-in for the two AzureRedisManager hash helpers."""
+
+    def __init__(self):
+        self.hashes = {}
+        self.ttls = {}
+        self.batches = set()
+        self.fail = False
+        self.lose_reply = False
+
+    def increment_hash_fields_once(self, key, increments, *, batch_id, ttl_seconds=None):
+        if self.fail:
+            raise ConnectionError("redis down")
+        if (key, batch_id) in self.batches:
+            return False
+        self.batches.add((key, batch_id))
+        bucket = self.hashes.setdefault(key, {})
+        for field, amount in increments.items():
+            bucket[field] = str(type(amount)(bucket.get(field, 0)) + amount)
+        self.ttls[key] = ttl_seconds
+        if self.lose_reply:
+            raise TimeoutError("reply lost")
+        return True
+
+    def get_many_hashes(self, keys):
+        return [dict(self.hashes.get(key, {})) for key in keys]
+
+
+def _exact(values, q):
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(q * len(ordered))) - 1]
+
+
+def test_quantiles_within_relative_accuracy():
+    rng = random.Random(7)
+    values = [rng.lognormvariate(math.log(400), 0.6) for _ in range(20000)]
+    sketch = LatencySketch(relative_accuracy=0.01)
+    for v in values:
+        sketch.add(v)
+
+    for q in (0.5, 0.9, 0.95, 0.99):
+        assert sketch.quantile(q) == pytest.approx(_exact(values, q), rel=0.01)
+    assert sketch.count == len(values)
+    assert len(sketch.buckets) < 400
+
+
+def test_merge_is_exact_and_survives_serialization():
+    rng = random.Random(1)
+    a, b, union = LatencySketch(), LatencySketch(), LatencySketch()
+    for i in range(5000):
+        v = rng.uniform(0, 3000)
+        (a if i % 2 else b).add(v)
+        union.add(v)
+
+    merged = LatencySketch.from_dict(a.to_dict())
+    merged.merge(LatencySketch.from_dict(b.to_dict()))
+
+    assert merged.buckets == union.buckets
+    assert merged.zero_count == union.zero_count
+    assert merged.count == union.count
+    assert merged.total_ms == pytest.approx(union.total_ms)
+    with pytest.raises(ValueError):
+        merged.merge(LatencySketch(relative_accuracy=0.05))
+
+
+def test_replicas_merge_in_redis_and_query_respects_window():
+    redis = _HashRedis()
+    replicas = [FleetLatencyRecorder(retention_minutes=60) for _ in range(2)]
+    now = 1_000_000 * 60.0
+    union = LatencySketch()
+    for n, recorder in enumerate(replicas):
+        recorder.enabled = True
+        for i in range(1, 501):
+            recorder.record("tts", (i + n) / 1000, now=now)
+            union.add(float(i + n))
+        recorder.record("stt", 5.0, now=now - 30 * 60)  # outside a 15 min window
+        assert recorder.flush(redis) == 2
+
+    result = replicas[0].query(redis, window_minutes=15, now=now)
+
+    assert set(result["stages"]) == {"tts"}
+    tts = result["stages"]["tts"]
+    assert tts["count"] == 1000
+    assert tts["p99_ms"] == pytest.approx(union.quantile(0.99), abs=0.01)
+    assert tts["avg_ms"] == pytest.approx(251.0, rel=1e-3)
+    assert set(redis.ttls.values()) == {3600}
+
+    wide = replicas[0].query(redis, window_minutes=60, now=now, stages=["stt"])
+    assert wide["stages"]["stt"]["count"] == 2
+
+
+def test_recorder_is_noop_when_disabled_and_requeues_on_failure():
+    redis = _HashRedis()
+    recorder = FleetLatencyRecorder()
+    recorder.record("tts", 0.2)
+    assert recorder.flush(redis) == 0
+
+    recorder.enabled = True
+    recorder.record("tts", 0.2)
+    redis.fail = True
+    assert recorder.flush(redis) == 0
+    assert recorder.flush_errors == 1
+
+    redis.fail = False
+    assert recorder.flush(redis) == 1
+    assert recorder.query(redis, window_minutes=5)["stages"]["tts"]["count"] == 1
+
+
+def test_recorder_resend_after_lost_reply_is_not_double_counted():
+    redis = _HashRedis()
+    recorder = FleetLatencyRecorder()
+    recorder.enabled = True
+    recorder.record("stt", 0.1)
+    recorder.record("stt", 0.3)
+
+    redis.lose_reply = True
+    assert recorder.flush(redis) == 0
+    assert recorder.flush_errors == 1
+
+    redis.lose_reply = False
+    assert recorder.flush(redis) == 1
+    stt = recorder.query(redis, window_minutes=5)["stages"]["stt"]
+    assert stt["count"] == 2
+    assert stt["avg_ms"] == pytest.approx(200.0, rel=1e-3)
+
+
+def test_in_place_dict_updates_match_sketch():
+    values = [0.0, 0.4, 12.5, 250.0, 251.0, 4000.0]
+    sketch = LatencySketch()
+    data = new_sketch_dict()
+    for v in values:
+        sketch.add(v)
+        add_to_sketch_dict(data, v)
+    assert LatencySketch.from_dict(data).to_dict() == sketch.to_dict()
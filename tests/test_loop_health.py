@@ -0,0 +1,68 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from utils.loop_health import EventLoopHealthMonitor, executor_stats
+
+
+def test_executor_stats_reports_active_and_queued():
+    executor = ThreadPoolExecutor(max_workers=1)
+    started = []
+    gate = threading.Event()
+
+    def _block():
+        started.append(True)
+        gate.wait(2)
+
+    executor.submit(_block)
+    executor.submit(_block)
+    while not started:
+        time.sleep(0.005)
+
+    stats = executor_stats(executor)
+    gate.set()
+    executor.shutdown(wait=True)
+
+    assert stats["max_workers"] == 1
+    assert stats["active"] == 1
+    assert stats["queued"] == 1
+
+
+def test_executor_stats_ignores_non_thread_pools():
+    assert executor_stats(None) is None
+
+
+@pytest.mark.asyncio
+async def test_monitor_detects_blocking_callback():
+    monitor = EventLoopHealthMonitor(interval_ms=20, slow_callback_ms=50)
+    await monitor.start()
+    await asyncio.sleep(0.1)
+
+    time.sleep(0.2)  # block the loop on purpose
+    await asyncio.sleep(0.15)
+
+    snapshot = monitor.snapshot()
+    await monitor.stop()
+
+    assert snapshot["slow_callbacks"] >= 1
+    stall = snapshot["recent_stalls"][-1]
+    assert stall["duration_ms"] >= 50
+    assert any("test_monitor_detects_blocking_callback" in line for line in stall["stack"])
+    assert snapshot["lag"]["max_ms"] >= 100
+    assert "default" in snapshot["executors"]
+
+
+@pytest.mark.asyncio
+async def test_disabled_monitor_starts_nothing():
+    monitor = EventLoopHealthMonitor(enabled=False)
+    await monitor.start()
+
+    snapshot = monitor.snapshot()
+    await monitor.stop()
+
+    assert snapshot["enabled"] is False
+    assert snapshot["running"] is False
+    assert snapshot["lag"]["samples"] == 0
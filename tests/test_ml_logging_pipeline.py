@@ -0,0 +1,124 @@
+import json
+import logging
+
+from utils import ml_logging
+from utils.ml_logging import HotPathFilter, JsonFormatter
+
+
+class _Capture(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def _record(level=logging.INFO, msg="hello %s", args=("world",)):
+    return logging.LogRecord("bench", level, __file__, 1, msg, args, None)
+
+
+def test_hot_path_filter_rate_limits_info_but_not_warnings():
+    hot_path = HotPathFilter(rate_per_sec=0.001, burst=2)
+
+    passed = [hot_path.filter(_record()) for _ in range(5)]
+
+    assert passed == [True, True, False, False, False]
+    assert hot_path.dropped == 3
+    assert hot_path.filter(_record(level=logging.WARNING))
+
+
+def test_hot_path_filter_sampling_zero_drops_everything_below_warning():
+    hot_path = HotPathFilter(sample_rate=0.0)
+
+    assert not hot_path.filter(_record(level=logging.DEBUG))
+    assert not hot_path.filter(_record())
+    assert hot_path.filter(_record(level=logging.ERROR))
+
+
+def test_json_formatter_includes_span_extras_from_record_dict():
+    record = _record()
+    record.agent_name = "AuthAgent"
+    record.call_connection_id = "call-1"
+    record.unrelated = "ignored"
+
+    payload = json.loads(JsonFormatter().format(record))
+
+    assert payload["message"] == "hello world"
+    assert payload["agent_name"] == "AuthAgent"
+    assert payload["call_connection_id"] == "call-1"
+    assert "unrelated" not in payload
+
+
+def test_queue_pipeline_delivers_formatted_records_off_thread():
+    logger = ml_logging.get_logger("test.queue_pipeline", pipeline="queue")
+    logger.propagate = False
+    capture = _Capture()
+    _, listener = ml_logging._pipeline
+    listener.handlers = (capture,)
+
+    args = ["mutable"]
+    logger.info("value=%s", args)
+    args.append("changed-after-log")
+    ml_logging.shutdown_logging()
+
+    assert len(capture.records) == 1
+    record = capture.records[0]
+    assert record.getMessage() == "value=['mutable']"
+    assert record.trace_id == "-"
+    assert ml_logging.logging_stats()["pipeline"] == "sync"
+
+    logger.handlers.clear()
+    logger.filters.clear()
+
+
+def test_queue_pipeline_without_stream_handler_still_reaches_azure(monkeypatch):
+    class _AzureHandler(_Capture):
+        instances = []
+
+        def __init__(self, level=logging.NOTSET):
+            super().__init__()
+            self.setLevel(level)
+            _AzureHandler.instances.append(self)
+
+    monkeypatch.setattr(ml_logging, "_telemetry_disabled", False)
+    monkeypatch.setattr(ml_logging, "LoggingHandler", _AzureHandler)
+    monkeypatch.setattr(ml_logging, "is_azure_monitor_configured", lambda: True)
+    ml_logging.shutdown_logging()
+
+    logger = ml_logging.get_logger(
+        "test.queue_telemetry_only", pipeline="queue", include_stream_handler=False
+    )
+    logger.propagate = False
+    _, listener = ml_logging._pipeline
+    console = listener.handlers[0]
+    printed = _Capture()
+    console.emit = printed.emit
+
+    logger.info("to azure only")
+    ml_logging.shutdown_logging()
+
+    (azure,) = _AzureHandler.instances
+    assert [r.getMessage() for r in azure.records] == ["to azure only"]
+    assert printed.records == []
+
+    logger.handlers.clear()
+    logger.filters.clear()
+
+
+def test_full_queue_drops_and_counts_without_logging_errors(capsys):
+    import queue
+
+    handler = ml_logging._FastQueueHandler(queue.Queue(maxsize=2))
+    logger = logging.getLogger("test.queue_full")
+    logger.propagate = False
+    logger.addHandler(handler)
+    try:
+        for i in range(5):
+            logger.warning("record %d", i)
+    finally:
+        logger.removeHandler(handler)
+
+    assert handler.queue.qsize() == 2
+    assert handler.dropped == 3
+    assert "Logging error" not in capsys.readouterr().err
@@ -0,0 +1,115 @@
+import threading
+
+import httpx
+import pytest
+from openai import AsyncAzureOpenAI
+
+from tests.load.offline_stubs import (
+    FakeSpeechRecognizer,
+    FakeSpeechSynthesizer,
+    InMemoryRedisManager,
+    MockAoaiConfig,
+    StageRecorder,
+    create_mock_aoai_app,
+    summarize,
+    tone_pcm,
+)
+
+FRAME = 640  # 20 ms at 16 kHz
+
+
+def _frames(pcm):
+    return [pcm[i : i + FRAME] for i in range(0, len(pcm), FRAME)]
+
+
+def test_fake_recognizer_emits_partial_then_final_from_timer_threads():
+    events = []
+    done = threading.Event()
+    recognizer = FakeSpeechRecognizer(
+        partial_after_ms=100, partial_delay_ms=10, silence_ms=200, final_delay_ms=100
+    )
+    recognizer.set_partial_result_callback(
+        lambda text, lang, speaker: events.append(("partial", text, threading.current_thread()))
+    )
+
+    def on_final(text, lang, speaker):
+        events.append(("final", text, threading.current_thread()))
+        done.set()
+
+    recognizer.set_final_result_callback(on_final)
+    recognizer.start()
+
+    for frame in _frames(tone_pcm(0.5)) + [b"\x00" * FRAME] * 15:
+        recognizer.write_bytes(frame)
+
+    assert done.wait(2.0)
+    recognizer.stop()
+    assert [kind for kind, _, _ in events] == ["partial", "final"]
+    assert events[1][1].startswith(events[0][1])
+    assert all(thread is not threading.main_thread() for _, _, thread in events)
+
+
+def test_fake_synthesizer_duration_tracks_text():
+    synth = FakeSpeechSynthesizer(first_byte_ms=0, realtime_factor=0, ms_per_char=50)
+    pcm = synth.synthesize_to_pcm("x" * 20, sample_rate=16000)
+    assert len(pcm) == 16000 * 2  # 20 chars * 50 ms = 1 s of 16 kHz PCM16
+
+
+@pytest.mark.asyncio
+async def test_mock_aoai_streams_through_openai_sdk():
+    app = create_mock_aoai_app(MockAoaiConfig(ttfb_ms=0, tokens_per_s=10000, reply="hello there world"))
+    client = AsyncAzureOpenAI(
+        azure_endpoint="http://mock-aoai",
+        api_key="offline",
+        api_version="2025-01-01-preview",
+        http_client=httpx.AsyncClient(transport=httpx.ASGITransport(app=app)),
+    )
+
+    stream = await client.chat.completions.create(
+        model="gpt-4o", messages=[{"role": "user", "content": "hi"}], stream=True
+    )
+    text = "".join([chunk.choices[0].delta.content or "" async for chunk in stream if chunk.choices])
+
+    assert text.strip() == "hello there world"
+    assert app.state.requests == 1
+
+
+@pytest.mark.asyncio
+async def test_mock_aoai_reports_prompt_cache_hits_on_a_shared_prefix():
+    app = create_mock_aoai_app(MockAoaiConfig(ttfb_ms=0, tokens_per_s=10000, reply="ok"))
+    client = AsyncAzureOpenAI(
+        azure_endpoint="http://mock-aoai",
+        api_key="offline",
+        api_version="2025-01-01-preview",
+        http_client=httpx.AsyncClient(transport=httpx.ASGITransport(app=app)),
+    )
+    system = {"role": "system", "content": "static instructions " * 400}
+
+    usages = []
+    for turn in ("first question", "second question"):
+        stream = await client.chat.completions.create(
+            model="gpt-4o",
+            messages=[system, {"role": "user", "content": turn}],
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+        usages.extend([chunk.usage async for chunk in stream if chunk.usage])
+
+    assert [u.prompt_tokens_details.cached_tokens for u in usages] == [0, 1920]
+    assert usages[1].prompt_tokens > 1920
+
+
+@pytest.mark.asyncio
+async def test_in_memory_redis_and_stage_recorder():
+    redis = InMemoryRedisManager()
+    await redis.store_session_data_async("s1", {"corememory": "{}"})
+    await redis.set_value_async("call_session_map:c1", "s1")
+    assert await redis.get_session_data_async("s1") == {"corememory": "{}"}
+    assert await redis.get_value_async("call_session_map:c1") == "s1"
+
+    recorder = StageRecorder()
+    for ms in range(1, 101):
+        recorder.record("tts", ms / 1000)
+    summary = recorder.summary()["tts"]
+    assert summary == summarize([float(ms) for ms in range(1, 101)])
+    assert (summary["p50_ms"], summary["p95_ms"], summary["p99_ms"]) == (50.0, 95.0, 99.0)
@@ -0,0 +1,154 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+from azure.core.exceptions import ResourceNotFoundError
+
+from src.blob import transcript_archive
+from src.blob.blob_helper import AzureBlobHelper, BlobOperationResult, BlobOperationType
+from src.postcall.archive import PostCallArchiver, build_summary, snapshot
+from src.stateful.state_managment import MemoManager
+from src.tools.latency_sketch import LatencySketch
+
+
+def _call(session_id="sess-1", turns=40):
+    cm = MemoManager(session_id=session_id)
+    for i in range(turns):
+        cm.append_to_history("AuthAgent", "user", f"my policy number is POL-A1000{i % 3}")
+        cm.append_to_history("AuthAgent", "assistant", "Thanks, let me look that up for you.")
+    cm.append_to_history("ClaimIntake", "user", "I'd like to file a claim")
+    sketch = LatencySketch()
+    for ms in (120, 180, 950):
+        sketch.add(ms)
+    cm.set_context("caller_id", "+15550100")
+    cm.set_context("authenticated", True)
+    cm.set_context("active_agent", "ClaimIntake")
+    cm.set_context("latency", {"runs": {"r1": {"samples": [{"dur": 0.1}] * 50}}, "sketches": {"llm": sketch.to_dict()}})
+    cm.set_context("latency_roundtrip", {"tts": [{"dur": 0.25}, {"dur": 0.35}]})
+    return cm
+
+
+class _Blob:
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.uploads = []
+
+    async def save_transcript_archive(self, call_id, data, *, codec):
+        if self.failures:
+            self.failures -= 1
+            return BlobOperationResult(False, BlobOperationType.UPLOAD, error_message="503")
+        name = f"transcripts/2026-10-18/{call_id}{transcript_archive.SUFFIXES[codec]}"
+        self.uploads.append((name, data))
+        return BlobOperationResult(True, BlobOperationType.UPLOAD, blob_name=name, container_name="acs")
+
+
+class _Cosmos:
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.docs = {}
+
+    def upsert_document(self, document, query):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("cosmos unavailable")
+        self.docs[query["_id"]] = document
+
+
+async def _drain(archiver):
+    while archiver._queue.qsize() or archiver._queue._unfinished_tasks or archiver._retries:
+        await asyncio.sleep(0.01)
+
+
+def test_archive_round_trips_and_compresses(monkeypatch):
+    job = snapshot(_call())
+    document = {"session_id": job.session_id, "timestamp": job.timestamp, "histories": job.histories, "context": job.context}
+    data = transcript_archive.encode(document, transcript_archive.GZIP)
+
+    assert len(data) * 5 < len(json.dumps(document))
+    expected = {**json.loads(json.dumps(document)), "agents": ["AuthAgent", "ClaimIntake"]}
+    assert transcript_archive.decode(data, transcript_archive.GZIP) == expected
+    assert transcript_archive.codec_for_name("transcripts/d/s.jsonl.gz") == "gzip"
+    assert transcript_archive.codec_for_name("transcripts/d/s.json") is None
+
+    monkeypatch.setattr(transcript_archive, "zstandard", None)
+    assert transcript_archive.resolve_codec("zstd") == "gzip"  # optional dependency missing
+
+
+async def test_cosmos_keeps_a_compact_summary_pointing_at_the_blob():
+    blob, cosmos = _Blob(), _Cosmos()
+    archiver = PostCallArchiver(blob, cosmos, codec="gzip").start()
+    cm = _call()
+    assert archiver.submit(cm)
+    cm.histories.clear()  # session torn down right after submit
+    await _drain(archiver)
+    await archiver.stop()
+
+    summary = cosmos.docs["sess-1"]
+    assert "histories" not in summary and "context" not in summary
+    assert summary["agents"] == ["AuthAgent", "ClaimIntake"]
+    assert summary["message_counts"] == {"AuthAgent": 80, "ClaimIntake": 1}
+    assert summary["ids"] == {"caller_id": "+15550100"}
+    assert summary["outcome"] == {"authenticated": True, "active_agent": "ClaimIntake"}
+    assert summary["latency_summary"]["tts"]["count"] == 2
+    assert summary["latency_percentiles"]["llm"]["count"] == 3
+    assert summary["transcript_blob"]["name"] == blob.uploads[0][0]
+    assert len(json.dumps(summary)) < len(blob.uploads[0][1]) * 4
+    assert archiver.stats()["archived"] == 1
+
+
+async def test_failures_are_retried_without_reuploading_and_queue_is_bounded():
+    blob, cosmos = _Blob(failures=1), _Cosmos(failures=2)
+    archiver = PostCallArchiver(blob, cosmos, codec="gzip", retry_base_s=0.01, queue_size=2).start()
+    archiver.submit(_call("a"))
+    await _drain(archiver)
+    assert "a" in cosmos.docs and len(blob.uploads) == 1
+    assert archiver.stats()["retried"] == 3
+
+    cosmos.failures = 10
+    archiver.max_attempts = 2
+    archiver.submit(_call("b"))
+    await _drain(archiver)
+    assert archiver.stats()["failed"] == 1 and "b" not in cosmos.docs
+    await archiver.stop()
+
+    idle = PostCallArchiver(blob, cosmos, queue_size=1)  # workers not started
+    assert idle.submit(_call("c")) and not idle.submit(_call("d"))
+    assert idle.stats()["rejected"] == 1
+
+
+async def test_get_transcript_from_blob_reads_archives_transparently():
+    job = snapshot(_call(turns=2))
+    document = {"session_id": job.session_id, "timestamp": job.timestamp, "histories": job.histories, "context": job.context}
+    blobs = {}
+    requested = []
+
+    def get_blob_client(container, blob):
+        async def download_blob():
+            requested.append(blob)
+            if blob not in blobs:
+                raise ResourceNotFoundError("missing")
+            return SimpleNamespace(readall=lambda: asyncio.sleep(0, result=blobs[blob]))
+
+        return SimpleNamespace(download_blob=download_blob)
+
+    helper = object.__new__(AzureBlobHelper)
+    helper.container_name = "acs"
+    helper._blob_service = SimpleNamespace(get_blob_client=get_blob_client)
+
+    name = "transcripts/2026-01-02/sess-1.jsonl.gz"
+    blobs[name] = transcript_archive.encode(document, "gzip")
+    result = await helper.get_transcript_from_blob("sess-1", blob_name=name)
+    assert result.success and json.loads(result.content)["histories"] == json.loads(json.dumps(job.histories))
+
+    blobs["sess-1.json"] = b'{"legacy": true}'
+    result = await helper.get_transcript_from_blob("sess-1")
+    assert json.loads(result.content) == {"legacy": True}
+    # today's plain transcript, both archive codecs, then the legacy flat path
+    assert [b.split("/")[-1] for b in requested[1:]] == [
+        "sess-1.json",
+        "sess-1.jsonl.zst",
+        "sess-1.jsonl.gz",
+        "sess-1.json",
+    ]
+    assert requested[-1] == "sess-1.json"
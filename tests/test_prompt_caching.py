@@ -0,0 +1,52 @@
+from types import SimpleNamespace
+
+import pytest
+
+from apps.rtagent.backend.src.agents.artagent.prompt_store.prompt_manager import PromptManager
+from apps.rtagent.backend.src.orchestration.artagent.gpt_flow import _record_prompt_usage
+
+CALLER_TEMPLATES = ("fnol_intake_agent.jinja", "voice_agent_general_info.jinja")
+
+
+def test_templates_compiled_up_front_and_renders_memoized():
+    pm = PromptManager(render_cache_size=2)
+    assert set(CALLER_TEMPLATES) <= set(pm._templates)
+
+    first = pm.get_prompt("voice_agent_general_info.jinja", caller_name="Ana Ruiz", policy_id="P1")
+    again = pm.get_prompt("voice_agent_general_info.jinja", policy_id="P1", caller_name="Ana Ruiz")
+    assert again is first
+    assert (pm.render_hits, pm.render_misses) == (1, 1)
+
+    pm.get_prompt("voice_agent_general_info.jinja", caller_name="Bo Chen", policy_id="P2")
+    pm.get_prompt("voice_agent_general_info.jinja", caller_name="Cy Diaz", policy_id="P3")
+    assert len(pm._renders) == 2  # bounded; the oldest render was evicted
+    pm.get_prompt("voice_agent_general_info.jinja", caller_name="Ana Ruiz", policy_id="P1")
+    assert pm.render_misses == 4
+
+    with pytest.raises(ValueError):
+        pm.get_prompt("missing.jinja")
+
+
+@pytest.mark.parametrize("template", CALLER_TEMPLATES)
+def test_caller_context_is_a_suffix_after_a_byte_stable_prefix(template):
+    pm = PromptManager()
+    a = pm.get_prompt(template, caller_name="Ana Ruiz", policy_id="P-1", topic="billing")
+    b = pm.get_prompt(template, caller_name=None, policy_id="P-2")
+
+    marker = a.index("# CALLER CONTEXT")
+    assert a[:marker] == b[:marker]
+    assert "Ana Ruiz" in a[marker:] and "Ana Ruiz" not in a[:marker]
+    assert "P-2" in b[marker:]
+
+
+def test_record_prompt_usage_reports_cached_tokens():
+    attrs = {}
+    span = SimpleNamespace(set_attribute=attrs.__setitem__)
+    usage = SimpleNamespace(
+        prompt_tokens=2048, prompt_tokens_details=SimpleNamespace(cached_tokens=1536)
+    )
+
+    assert _record_prompt_usage(usage, model_id="gpt-4o", agent_name="AuthAgent", span=span) == (2048, 1536)
+    assert attrs["aoai.usage.cache_hit_ratio"] == 0.75
+    assert _record_prompt_usage(SimpleNamespace(prompt_tokens=10), model_id="m", agent_name="a") == (10, 0)
+    assert _record_prompt_usage(None, model_id="m", agent_name="a") is None
@@ -0,0 +1,96 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from utils.readiness import ReadinessProber
+
+
+def _check(status="healthy", calls=None, delay=0.0):
+    async def check():
+        if calls is not None:
+            calls.append(status)
+        await asyncio.sleep(delay)
+        return SimpleNamespace(status=status, error=None if status == "healthy" else "down")
+
+    return check
+
+
+@pytest.mark.asyncio
+async def test_snapshot_is_served_from_cache_between_probes():
+    calls = []
+    prober = ReadinessProber(interval_s=60)
+    prober.register("redis", _check(calls=calls))
+
+    await prober.start()
+    for _ in range(100):
+        snapshot = prober.snapshot()
+
+    assert calls == ["healthy"]
+    assert snapshot["redis"].healthy
+    assert snapshot["redis"].age_s() < 1
+    assert not prober.is_stale("redis")
+
+    prober.request_refresh("redis")
+    await asyncio.sleep(0.05)
+    assert len(calls) == 2
+    await prober.stop()
+
+
+@pytest.mark.asyncio
+async def test_failures_back_off_exponentially_with_cap():
+    prober = ReadinessProber(interval_s=1, max_backoff_s=5, jitter=0.0)
+    prober.register("acs", _check("unhealthy"))
+
+    delays = []
+    for _ in range(4):
+        await prober._probe(prober._components["acs"])
+        delays.append(prober.next_delay("acs"))
+
+    assert delays == [2, 4, 5, 5]
+    result = prober.snapshot()["acs"]
+    assert result.consecutive_failures == 4
+    assert result.error == "down"
+
+
+@pytest.mark.asyncio
+async def test_timeouts_count_as_failures_and_jitter_stays_in_bounds():
+    prober = ReadinessProber(interval_s=10, timeout_s=0.01, jitter=0.2)
+    prober.register("aoai", _check(delay=1.0))
+
+    await prober._probe(prober._components["aoai"])
+    result = prober.snapshot()["aoai"]
+
+    assert not result.healthy
+    assert "timed out" in result.error
+    delays = [prober.next_delay("aoai") for _ in range(200)]
+    assert all(16 <= d <= 24 for d in delays)  # 2x backoff, +/- 20%
+    assert len(set(delays)) > 1
+
+
+def test_unprobed_and_overdue_results_are_stale():
+    prober = ReadinessProber(interval_s=10, timeout_s=1)
+    prober.register("speech", _check())
+
+    assert prober.is_stale("speech")
+
+    result = prober.snapshot()["speech"]
+    result.checked_at = 100.0
+    result.next_probe_in_s = 10.0
+    assert not prober.is_stale("speech", now=115.0)
+    assert prober.is_stale("speech", now=122.0)
+
+
+async def test_inline_readiness_checks_report_redis_health():
+    from apps.rtagent.backend.api.v1.endpoints import health
+
+    async def ping():
+        return True
+
+    state = SimpleNamespace(redis=SimpleNamespace(ping=ping))
+    checks = await health._run_readiness_checks(SimpleNamespace(state=state), 0.0)
+    by_component = {c.component: c for c in checks}
+
+    assert set(by_component) == set(health._readiness_checks(SimpleNamespace(state=state)))
+    assert by_component["redis"].status == "healthy"
+    assert by_component["azure_openai"].status == "unhealthy"  # not initialized
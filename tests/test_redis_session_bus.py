@@ -0,0 +1,263 @@
+import asyncio
+import json
+
+import pytest
+from fastapi.websockets import WebSocketState
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from src.pools.connection_manager import ThreadSafeConnectionManager
+from src.pools.session_manager import ThreadSafeSessionManager
+from src.redis.session_bus import RedisSessionBus
+
+
+class _FakeBroker:
+    """Shared in-memory stand-in for Redis keys and pub/sub channels."""
+
+    def __init__(self):
+        self.keys = {}
+        self.subscribers = {}
+        self.gets = 0
+
+
+class _FakePubSub:
+    def __init__(self, broker):
+        self._broker = broker
+        self._queue = asyncio.Queue()
+
+    async def subscribe(self, *channels):
+        for channel in channels:
+            self._broker.subscribers.setdefault(channel, set()).add(self)
+
+    async def unsubscribe(self, *channels):
+        for channel in channels:
+            self._broker.subscribers.get(channel, set()).discard(self)
+
+    async def get_message(self, ignore_subscribe_messages=True, timeout=1.0):
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def aclose(self):
+        for subscribers in self._broker.subscribers.values():
+            subscribers.discard(self)
+
+
+class _FakeClient:
+    def __init__(self, broker):
+        self._broker = broker
+
+    def pubsub(self):
+        return _FakePubSub(self._broker)
+
+    async def set(self, key, value, ex=None):
+        self._broker.keys[key] = value
+
+    async def get(self, key):
+        self._broker.gets += 1
+        return self._broker.keys.get(key)
+
+    async def eval(self, script, numkeys, key, expected, *args):
+        if self._broker.keys.get(key) != expected:
+            return 0
+        if "pexpire" not in script:
+            del self._broker.keys[key]
+        return 1
+
+    async def publish(self, channel, message):
+        subscribers = list(self._broker.subscribers.get(channel, ()))
+        for pubsub in subscribers:
+            pubsub._queue.put_nowait({"type": "message", "channel": channel, "data": message})
+        return len(subscribers)
+
+    async def aclose(self):
+        pass
+
+
+class _FakeWebSocket:
+    client_state = WebSocketState.CONNECTED
+    application_state = WebSocketState.CONNECTED
+
+    def __init__(self):
+        self.sent = []
+
+    async def send_text(self, message):
+        self.sent.append(json.loads(message))
+
+    async def close(self):
+        pass
+
+
+def _bus(broker, node_id):
+    async def _factory():
+        return _FakeClient(broker)
+
+    return RedisSessionBus(_factory, node_id=node_id, cache_ttl_s=60)
+
+
+async def _until(predicate, timeout=1.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_session_broadcast_reaches_socket_on_other_worker():
+    broker = _FakeBroker()
+    bus_a, bus_b = _bus(broker, "node-a"), _bus(broker, "node-b")
+    await bus_a.start()
+    await bus_b.start()
+    worker_a = ThreadSafeConnectionManager()
+    worker_b = ThreadSafeConnectionManager()
+    worker_a.attach_bus(bus_a)
+    worker_b.attach_bus(bus_b)
+
+    dashboard = _FakeWebSocket()
+    await worker_a.register(dashboard, client_type="dashboard", session_id="s1")
+
+    local = await worker_b.broadcast_session("s1", {"type": "status", "message": "hi"})
+    await _until(lambda: dashboard.sent)
+
+    assert local == 0
+    assert dashboard.sent[0]["message"] == "hi"
+    assert dashboard.sent[0]["session_context"]["session_id"] == "s1"
+    # worker A published nothing back to itself
+    assert len(dashboard.sent) == 1
+
+    await worker_a.stop()
+    await worker_b.stop()
+    await bus_a.stop()
+    await bus_b.stop()
+
+
+@pytest.mark.asyncio
+async def test_call_ownership_is_registered_cached_and_released():
+    broker = _FakeBroker()
+    bus_a, bus_b = _bus(broker, "node-a"), _bus(broker, "node-b")
+    await bus_a.start()
+    await bus_b.start()
+    worker_a = ThreadSafeConnectionManager()
+    worker_b = ThreadSafeConnectionManager()
+    worker_a.attach_bus(bus_a)
+    worker_b.attach_bus(bus_b)
+
+    conn_id = await worker_a.register(_FakeWebSocket(), client_type="media", call_id="c1")
+
+    assert await worker_b.get_call_owner("c1") == "node-a"
+    assert await worker_b.get_call_owner("c1") == "node-a"
+    assert broker.gets == 1  # second lookup served from the local cache
+    assert await worker_b.get_handler_by_call_id("c1") is None
+
+    await worker_a.unregister(conn_id)
+    assert "rtagent:owner:call:c1" not in broker.keys
+    assert "rtagent:bus:call:c1" not in bus_a._subscriptions
+
+    await bus_a.stop()
+    await bus_b.stop()
+
+
+@pytest.mark.asyncio
+async def test_session_manager_records_owner():
+    broker = _FakeBroker()
+    bus = _bus(broker, "node-a")
+    await bus.start()
+    sessions = ThreadSafeSessionManager(bus=bus)
+
+    class _State:
+        pass
+
+    websocket = _FakeWebSocket()
+    websocket.state = _State()
+    await sessions.add_session("s1", memory_manager=None, websocket=websocket)
+
+    assert broker.keys["rtagent:owner:session:s1"] == "node-a"
+    assert await sessions.get_session_owner("s1") == "node-a"
+
+    await sessions.remove_session("s1")
+    assert "rtagent:owner:session:s1" not in broker.keys
+    await bus.stop()
+
+
+@pytest.mark.asyncio
+async def test_manager_without_bus_is_unchanged():
+    manager = ThreadSafeConnectionManager()
+    websocket = _FakeWebSocket()
+    await manager.register(websocket, session_id="s1", call_id="c1")
+
+    assert await manager.broadcast_session("s1", {"type": "x"}) == 1
+    assert await manager.get_call_owner("c1") == "local"
+    assert await manager.get_call_owner("other") is None
+    assert (await manager.stats())["distributed"] is None
+    await manager.stop()
+
+
+@pytest.mark.asyncio
+async def test_renew_does_not_reclaim_key_taken_by_another_node():
+    broker = _FakeBroker()
+    bus = _bus(broker, "node-a")
+    await bus.start()
+    await bus.claim("call", "c1")
+    await bus.claim("call", "c2")
+    broker.keys["rtagent:owner:call:c1"] = "node-b"
+
+    await bus._renew_owned()
+
+    assert broker.keys["rtagent:owner:call:c1"] == "node-b"
+    assert broker.keys["rtagent:owner:call:c2"] == "node-a"
+    assert bus.stats()["ownership_lost"] == 1
+    assert bus.stats()["owned"] == 1
+    await bus.stop()
+
+
+@pytest.mark.asyncio
+async def test_client_is_rebuilt_after_connection_error():
+    broker = _FakeBroker()
+    created = []
+
+    class _FlakyClient(_FakeClient):
+        async def get(self, key):
+            if len(created) == 1:
+                raise RedisConnectionError("connection reset")
+            return await super().get(key)
+
+    async def factory():
+        created.append(_FlakyClient(broker))
+        return created[-1]
+
+    bus = RedisSessionBus(factory, node_id="node-a", cache_ttl_s=0)
+    await bus.start()
+    broker.keys["rtagent:owner:call:c9"] = "node-b"
+
+    assert await bus.owner_of("call", "c9") == "node-b"
+    assert len(created) == 2
+    assert bus._client is created[1]
+    await bus.stop()
+
+
+@pytest.mark.asyncio
+async def test_slow_listener_does_not_stall_pubsub_reader():
+    broker = _FakeBroker()
+    bus_a, bus_b = _bus(broker, "node-a"), _bus(broker, "node-b")
+    release = asyncio.Event()
+    received = []
+
+    async def slow_listener(kind, key, payload):
+        await release.wait()
+        received.append(payload["n"])
+
+    bus_a.set_listener(slow_listener)
+    await bus_a.start()
+    await bus_b.start()
+
+    for n in range(3):
+        await bus_b.publish("all", None, {"n": n})
+    await _until(lambda: bus_a._pubsub._queue.empty() and bus_a._inbox.qsize() == 2)
+
+    release.set()
+    await _until(lambda: len(received) == 3)
+    assert received == [0, 1, 2]
+    await bus_a.stop()
+    await bus_b.stop()
+
@@ -0,0 +1,248 @@
+import asyncio
+
+import pytest
+
+from src.redis.stream_multiplexer import RedisStreamMultiplexer
+
+
+class _FakeAsyncStreams:
+    """Minimal in-memory stand-in for the redis.asyncio stream commands."""
+
+    def __init__(self) -> None:
+        self.streams: dict[str, list[tuple[str, dict]]] = {}
+        self.xread_calls: list[dict[str, str]] = []
+        self._seq = 0
+        self._changed = asyncio.Event()
+        self.pipelines = 0
+        self.cancelled_reads = 0
+
+    def add(self, key: str, fields: dict) -> str:
+        self._seq += 1
+        entry_id = f"{self._seq}-0"
+        self.streams.setdefault(key, []).append((entry_id, fields))
+        self._changed.set()
+        return entry_id
+
+    async def xrevrange(self, key, max_id, min_id, count=None):
+        entries = self.streams.get(key, [])
+        return list(reversed(entries))[:count]
+
+    async def xread(self, streams, block=None, count=None):
+        self.xread_calls.append(dict(streams))
+        deadline = asyncio.get_running_loop().time() + (block or 0) / 1000
+        while True:
+            result = []
+            for key, last_id in streams.items():
+                after = tuple(int(p) for p in last_id.split("-"))
+                fresh = [
+                    (entry_id, data)
+                    for entry_id, data in self.streams.get(key, [])
+                    if tuple(int(p) for p in entry_id.split("-")) > after
+                ]
+                if fresh:
+                    result.append([key, fresh[:count]])
+            remaining = deadline - asyncio.get_running_loop().time()
+            if result or remaining <= 0:
+                return result
+            self._changed.clear()
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                pass
+            except asyncio.CancelledError:
+                self.cancelled_reads += 1
+                raise
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    async def aclose(self):
+        pass
+
+
+class _FakePipeline:
+    def __init__(self, client) -> None:
+        self.client = client
+        self.commands = []
+
+    def xrevrange(self, key, max_id, min_id, count=None):
+        self.commands.append((key, max_id, min_id, count))
+
+    async def execute(self):
+        self.client.pipelines += 1
+        await asyncio.sleep(0.001)  # one round trip
+        return [
+            list(reversed(self.client.streams.get(key, [])))[:count]
+            for key, _, _, count in self.commands
+        ]
+
+
+@pytest.mark.asyncio
+async def test_many_waiters_share_single_xread():
+    fake = _FakeAsyncStreams()
+
+    async def factory():
+        return fake
+
+    mux = RedisStreamMultiplexer(factory, block_ms=50)
+    keys = [f"dtmf_validation:call-{i}" for i in range(200)]
+    waits = [asyncio.create_task(mux.wait_for_event(k, timeout_ms=2000)) for k in keys]
+
+    await asyncio.sleep(0.1)
+    for key in keys:
+        fake.add(key, {"validation_status": "completed"})
+
+    results = await asyncio.gather(*waits)
+    await mux.close()
+
+    assert all(r and r[0][0] == k for r, k in zip(results, keys))
+    # Each XREAD covers every pending stream rather than one call per waiter.
+    assert max(len(call) for call in fake.xread_calls) == len(keys)
+    assert len(fake.xread_calls) < len(keys)
+
+
+@pytest.mark.asyncio
+async def test_dollar_ignores_entries_written_before_wait():
+    fake = _FakeAsyncStreams()
+    fake.add("stream-a", {"old": "1"})
+
+    async def factory():
+        return fake
+
+    mux = RedisStreamMultiplexer(factory, block_ms=20)
+    wait = asyncio.create_task(mux.wait_for_event("stream-a", timeout_ms=1000))
+    await asyncio.sleep(0.05)
+    new_id = fake.add("stream-a", {"new": "1"})
+
+    result = await wait
+    await mux.close()
+
+    assert result == [["stream-a", [(new_id, {"new": "1"})]]]
+
+
+@pytest.mark.asyncio
+async def test_timeout_returns_none_and_drops_waiter():
+    fake = _FakeAsyncStreams()
+
+    async def factory():
+        return fake
+
+    mux = RedisStreamMultiplexer(factory, block_ms=10)
+    result = await mux.wait_for_event("stream-b", timeout_ms=50)
+    stats = mux.stats()
+    await mux.close()
+
+    assert result is None
+    assert stats["waiters"] == 0
+    assert stats["timeouts"] == 1
+
+
+class _BoundedPoolStreams(_FakeAsyncStreams):
+    """Fails like a non-blocking connection pool when commands outnumber connections."""
+
+    def __init__(self, max_connections: int) -> None:
+        super().__init__()
+        self.max_connections = max_connections
+        self.in_flight = 0
+        self.peak = 0
+
+    async def _checkout(self, operation):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            if self.in_flight > self.max_connections:
+                raise RuntimeError("Too many connections")
+            return await operation
+        finally:
+            self.in_flight -= 1
+
+    async def xrevrange(self, key, max_id, min_id, count=None):
+        return await self._checkout(super().xrevrange(key, max_id, min_id, count))
+
+    async def xread(self, streams, block=None, count=None):
+        return await self._checkout(super().xread(streams, block=block, count=count))
+
+    def pipeline(self, transaction=True):
+        pipe = super().pipeline(transaction)
+        execute = pipe.execute
+        pipe.execute = lambda: self._checkout(execute())
+        return pipe
+
+
+@pytest.mark.asyncio
+async def test_cluster_reads_never_exceed_connection_budget():
+    fake = _BoundedPoolStreams(max_connections=4)
+
+    async def factory():
+        return fake
+
+    mux = RedisStreamMultiplexer(
+        factory, block_ms=50, cluster_mode=True, max_concurrent_reads=3, poll_interval_ms=5
+    )
+    keys = [f"dtmf_validation:call-{i}" for i in range(40)]
+    waits = [asyncio.create_task(mux.wait_for_event(k, timeout_ms=2000)) for k in keys]
+
+    await asyncio.sleep(0.05)
+    for key in keys:
+        fake.add(key, {"validation_status": "completed"})
+
+    results = await asyncio.gather(*waits)
+    stats = mux.stats()
+    await mux.close()
+
+    assert all(r and r[0][0] == k for r, k in zip(results, keys))
+    assert fake.peak <= 4
+    assert stats["errors"] == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_waiters_share_tail_lookups_within_pool():
+    fake = _BoundedPoolStreams(max_connections=4)
+    for i in range(50):
+        fake.add(f"dtmf_validation:call-{i}", {"validation_status": "pending"})
+
+    async def factory():
+        return fake
+
+    mux = RedisStreamMultiplexer(factory, block_ms=50, max_concurrent_reads=3)
+    keys = [f"dtmf_validation:call-{i}" for i in range(50)]
+    waits = [asyncio.create_task(mux.wait_for_event(k, timeout_ms=2000)) for k in keys]
+
+    await asyncio.sleep(0.05)
+    new_ids = [fake.add(key, {"validation_status": "completed"}) for key in keys]
+
+    results = await asyncio.gather(*waits)
+    stats = mux.stats()
+    await mux.close()
+
+    # Entries written before the waits started are never returned.
+    assert [r[0][1] for r in results] == [
+        [(entry_id, {"validation_status": "completed"})] for entry_id in new_ids
+    ]
+    assert fake.peak <= 2  # the reader plus one tail lookup pipeline
+    assert stats["tail_lookups"] < 50
+    assert stats["errors"] == 0
+
+
+@pytest.mark.asyncio
+async def test_new_key_joins_next_read_without_cancelling_it():
+    fake = _FakeAsyncStreams()
+
+    async def factory():
+        return fake
+
+    mux = RedisStreamMultiplexer(factory, block_ms=100)
+    first = asyncio.create_task(mux.wait_for_event("stream-a", timeout_ms=5000))
+    await asyncio.sleep(0.05)
+
+    second = asyncio.create_task(mux.wait_for_event("stream-b", timeout_ms=5000))
+    await asyncio.sleep(0.01)
+    entry_id = fake.add("stream-b", {"ok": "1"})  # before stream-b is in any read
+
+    result = await asyncio.wait_for(second, timeout=1.0)
+    first.cancel()
+    await mux.close()
+
+    assert result == [["stream-b", [(entry_id, {"ok": "1"})]]]
+    assert fake.cancelled_reads <= 1  # only the read stopped by close()
+    assert any("stream-b" in call for call in fake.xread_calls)
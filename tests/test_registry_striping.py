@@ -0,0 +1,127 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.websockets import WebSocketState
+
+from src.pools.connection_manager import ThreadSafeConnectionManager
+from src.pools.session_manager import SessionContext, ThreadSafeSessionManager
+from src.pools.striped import CopyOnWriteIndex
+
+
+class _FakeWebSocket:
+    def __init__(self):
+        self.client_state = WebSocketState.CONNECTED
+        self.application_state = WebSocketState.CONNECTED
+        self.state = type("State", (), {})()
+
+    async def send_text(self, message):
+        pass
+
+    async def close(self):
+        pass
+
+
+class _BlockingHandler:
+    def __init__(self):
+        self.release = asyncio.Event()
+
+    async def stop(self):
+        await self.release.wait()
+
+
+def test_copy_on_write_index_keeps_reader_snapshot():
+    index = CopyOnWriteIndex()
+    index.add("s1", "a")
+    index.add("s1", "b")
+    snapshot = index.get("s1")
+
+    index.discard("s1", "a")
+    index.discard("s1", "b")
+
+    assert snapshot == {"a", "b"}
+    assert "s1" not in index  # empty keys are dropped
+    assert index.get("s1") == frozenset()
+
+
+@pytest.mark.asyncio
+async def test_slow_handler_teardown_does_not_block_registry():
+    manager = ThreadSafeConnectionManager()
+    handler = _BlockingHandler()
+    slow_id = await manager.register(_FakeWebSocket(), session_id="s1", handler=handler)
+    await manager.register(_FakeWebSocket(), session_id="s2", call_id="c2")
+
+    teardown = asyncio.create_task(manager.unregister(slow_id))
+    await asyncio.sleep(0)
+
+    assert await asyncio.wait_for(manager.broadcast_session("s2", {"type": "x"}), 0.5) == 1
+    assert await asyncio.wait_for(manager.get_connection_by_call_id("c2"), 0.5)
+    assert await manager.get_connection_meta(slow_id) is None
+
+    handler.release.set()
+    await teardown
+    await manager.stop()
+
+
+@pytest.mark.asyncio
+async def test_stale_sweep_is_incremental():
+    manager = ThreadSafeConnectionManager(sweep_batch_size=2)
+    sockets = [_FakeWebSocket() for _ in range(5)]
+    for websocket in sockets:
+        await manager.register(websocket)
+    sockets[4].client_state = WebSocketState.DISCONNECTED
+
+    first = await manager.validate_and_cleanup_stale_connections()
+    assert first["checked"] == 2
+    assert first["removed_stale"] == 0
+
+    removed = 0
+    for _ in range(3):
+        removed += (await manager.validate_and_cleanup_stale_connections())["removed_stale"]
+
+    assert removed == 1
+    assert (await manager.stats())["connections"] == 4
+    await manager.stop()
+
+
+@pytest.mark.asyncio
+async def test_cleanup_stale_sessions_expires_oldest_only():
+    manager = ThreadSafeSessionManager()
+    old_socket = _FakeWebSocket()
+    old_socket.state.session_context = SessionContext(
+        session_id="old",
+        memory_manager=None,
+        websocket=old_socket,
+        start_time=datetime.now() - timedelta(hours=48),
+    )
+    await manager.add_session("old", None, old_socket)
+    await manager.add_session("new", None, _FakeWebSocket())
+    await manager.add_session("gone", None, _FakeWebSocket())
+    await manager.remove_session("gone")
+
+    assert await manager.cleanup_stale_sessions(max_age_hours=24) == 1
+    assert await manager.get_session_context("old") is None
+    assert await manager.get_session_count() == 1
+
+
+@pytest.mark.asyncio
+async def test_unregister_drops_connection_from_sweep_order():
+    manager = ThreadSafeConnectionManager()
+    for _ in range(50):
+        conn_id = await manager.register(_FakeWebSocket())
+        await manager.unregister(conn_id)
+    survivor = await manager.register(_FakeWebSocket())
+
+    assert list(manager._sweep_order) == [survivor]
+    result = await manager.validate_and_cleanup_stale_connections()
+    assert result["checked"] == 1
+    await manager.stop()
+
+
+def test_registry_rejects_mutation_from_a_second_loop():
+    manager = ThreadSafeConnectionManager()
+    conn_id = asyncio.run(manager.register(_FakeWebSocket()))
+
+    with pytest.raises(AssertionError, match="second event loop"):
+        asyncio.run(manager.unregister(conn_id))
+    assert conn_id in manager._conns
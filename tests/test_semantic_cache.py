@@ -0,0 +1,223 @@
+import asyncio
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+from apps.rtagent.backend.src.agents.artagent import base
+from apps.rtagent.backend.src.agents.artagent.base import ARTAgent
+from src.aoai.semantic_cache import SemanticResponseCache
+from src.stateful.state_managment import MemoManager
+
+GENERAL_INFO_YAML = (
+    Path(base.__file__).parent / "agent_store" / "general_info_agent.yaml"
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _vec(*values):
+    return np.asarray(values, dtype=np.float32)
+
+
+def test_lookup_respects_threshold_and_scope():
+    cache = SemanticResponseCache(similarity_threshold=0.9)
+    scope = ("GeneralInfoAgent", "POL-A10001")
+    cache.store(scope, _vec(1, 0, 0), "is roadside assistance included", "Yes, it is.")
+
+    entry, score = cache.lookup(scope, _vec(0.95, 0.1, 0))
+    assert entry.answer == "Yes, it is." and score > 0.9
+    assert cache.lookup(scope, _vec(0.5, 0.5, 0.5)) is None  # not similar enough
+    assert cache.lookup(("GeneralInfoAgent", "POL-B20417"), _vec(1, 0, 0)) is None
+    assert cache.lookup(scope, _vec(1, 0)) is None  # embedding dimension changed
+    assert cache.store(scope, _vec(0, 0, 0), "q", "a") is None
+
+
+def test_entries_expire_and_lru_evicts_oldest():
+    clock = _Clock()
+    cache = SemanticResponseCache(ttl_seconds=60, max_entries=2, clock=clock)
+    scope = ("agent",)
+    cache.store(scope, _vec(1, 0, 0), "first question here", "one")
+    cache.store(scope, _vec(0, 1, 0), "second question here", "two")
+    assert cache.lookup(scope, _vec(1, 0, 0))[0].answer == "one"  # now most recent
+
+    cache.store(scope, _vec(0, 0, 1), "third question here", "three")
+    assert cache.lookup(scope, _vec(0, 1, 0)) is None  # "two" was least recently used
+    assert cache.stats()["evictions"] == 1
+
+    clock.now = 61
+    assert cache.lookup(scope, _vec(1, 0, 0)) is None
+    assert cache.stats()["entries"] == 0 and cache.stats()["scopes"] == 0
+
+
+def test_stats_report_hit_rate_and_saved_time():
+    cache = SemanticResponseCache(min_question_words=3)
+    assert not cache.accepts("yes please")
+    assert cache.accepts("what is my deductible")
+
+    cache.store(("a",), _vec(1, 0), "what is my deductible", "$500.")
+    cache.lookup(("a",), _vec(1, 0))
+    cache.lookup(("a",), _vec(0, 1))
+    cache.record_saved(900.0)
+
+    stats = cache.stats()
+    assert stats["lookups"] == 2 and stats["hits"] == 1 and stats["hit_rate"] == 0.5
+    assert stats["saved_ms_per_hit"] == 900.0
+    cache.clear()
+    assert cache.stats()["entries"] == 0
+
+
+async def test_agent_serves_repeat_question_from_cache(monkeypatch):
+    agent = ARTAgent(config_path=GENERAL_INFO_YAML)
+    assert agent.cache_scope_slots == ["policy_id"]
+    agent.semantic_cache = SemanticResponseCache()
+
+    embeddings = {"does my policy cover towing": [1.0, 0.0], "could you transfer me": [0.0, 1.0]}
+    client = SimpleNamespace(
+        embeddings=SimpleNamespace(
+            create=lambda input, model: SimpleNamespace(
+                data=[SimpleNamespace(embedding=embeddings[input])]
+            )
+        )
+    )
+    ws = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(aoai_client=client)))
+    completions, replays = [], []
+
+    async def fake_process(cm, user_prompt, ws, *, agent_name, **kwargs):
+        completions.append(user_prompt)
+        history = cm.get_history(agent_name)
+        history.append({"role": "user", "content": user_prompt})
+        if user_prompt.startswith("could"):
+            history.append(
+                {
+                    "role": "assistant",
+                    "content": None,
+                    "tool_calls": [{"id": "t1", "function": {"name": "escalate_human"}}],
+                }
+            )
+        history.append({"role": "assistant", "content": f"answer to {user_prompt}"})
+
+    async def fake_replay(cm, user_prompt, answer, ws, **kwargs):
+        replays.append(answer)
+
+    monkeypatch.setattr(base, "process_gpt_response", fake_process)
+    monkeypatch.setattr(base, "replay_cached_response", fake_replay)
+
+    cm = MemoManager(session_id="cache-test")
+    cm.set_context("policy_id", "POL-A10001")
+    for prompt in ["does my policy cover towing", "does my policy cover towing"]:
+        await agent.respond(cm, prompt, ws, caller_name="Ana", policy_id="POL-A10001")
+    assert completions == ["does my policy cover towing"]
+    assert replays == ["answer to does my policy cover towing"]
+
+    cm.set_context("policy_id", "POL-B20417")  # another policy never shares answers
+    await agent.respond(cm, "does my policy cover towing", ws, policy_id="POL-B20417")
+    for _ in range(2):  # turns that call non-cacheable tools are not stored
+        await agent.respond(cm, "could you transfer me", ws, policy_id="POL-B20417")
+    assert len(completions) == 4
+    assert agent.semantic_cache.stats()["hits"] == 1
+
+
+async def test_agent_bypasses_cache_while_scope_slot_is_unset(monkeypatch):
+    agent = ARTAgent(config_path=GENERAL_INFO_YAML)
+    agent.semantic_cache = SemanticResponseCache()
+    embeds = []
+
+    async def fake_embed(ws, text, session_id):
+        embeds.append(text)
+        return [1.0, 0.0]
+
+    async def fake_process(cm, user_prompt, ws, *, agent_name, **kwargs):
+        history = cm.get_history(agent_name)
+        history.append({"role": "user", "content": user_prompt})
+        history.append({"role": "assistant", "content": f"answer to {user_prompt}"})
+
+    monkeypatch.setattr(agent, "_embed", fake_embed)
+    monkeypatch.setattr(base, "process_gpt_response", fake_process)
+
+    cm = MemoManager(session_id="cache-unscoped")
+    assert agent._cache_scope(cm) is None
+    for _ in range(2):
+        await agent.respond(cm, "does my policy cover towing", None)
+
+    assert embeds == []
+    assert agent.semantic_cache.stats()["entries"] == 0
+
+
+async def test_slow_embedding_does_not_delay_the_completion(monkeypatch):
+    agent = ARTAgent(config_path=GENERAL_INFO_YAML)
+    agent.semantic_cache = SemanticResponseCache()
+    monkeypatch.setattr(base, "SEMANTIC_CACHE_LOOKUP_BUDGET_S", 0.02)
+    timeline = []
+
+    async def slow_embed(ws, text, session_id):
+        await asyncio.sleep(0.2)
+        timeline.append("embedded")
+        return [1.0, 0.0]
+
+    async def fake_process(cm, user_prompt, ws, *, agent_name, **kwargs):
+        timeline.append("completion")
+        history = cm.get_history(agent_name)
+        history.append({"role": "user", "content": user_prompt})
+        history.append({"role": "assistant", "content": f"answer to {user_prompt}"})
+
+    monkeypatch.setattr(agent, "_embed", slow_embed)
+    monkeypatch.setattr(base, "process_gpt_response", fake_process)
+
+    cm = MemoManager(session_id="cache-slow-embed")
+    cm.set_context("policy_id", "POL-A10001")
+    started = time.perf_counter()
+    await agent.respond(cm, "does my policy cover towing", None)
+
+    # The completion started within the lookup budget; the late embedding
+    # still stored the answer for the next caller.
+    assert timeline == ["completion", "embedded"]
+    assert time.perf_counter() - started < 0.35
+    assert agent.semantic_cache.stats()["entries"] == 1
+
+
+async def test_unprofitable_lookups_are_skipped_between_probes(monkeypatch):
+    agent = ARTAgent(config_path=GENERAL_INFO_YAML)
+    agent._lookups = base._CACHE_WARMUP_LOOKUPS
+    agent._miss_ms_ewma = 800.0
+    agent._embed_ms_ewma = 120.0
+    agent._hit_rate_ewma = 0.05  # expected saving 40 ms < 120 ms cost
+
+    waits = [agent._should_wait_for_lookup() for _ in range(base._CACHE_PROBE_EVERY)]
+    assert waits == [False] * (base._CACHE_PROBE_EVERY - 1) + [True]
+
+    agent._hit_rate_ewma = 0.5
+    assert agent._should_wait_for_lookup()
+
+
+async def test_reply_to_agent_question_is_not_cached(monkeypatch):
+    agent = ARTAgent(config_path=GENERAL_INFO_YAML)
+    agent.semantic_cache = SemanticResponseCache()
+    embeds = []
+
+    async def fake_embed(ws, text, session_id):
+        embeds.append(text)
+        return [1.0, 0.0]
+
+    async def fake_process(cm, user_prompt, ws, *, agent_name, **kwargs):
+        history = cm.get_history(agent_name)
+        history.append({"role": "user", "content": user_prompt})
+        history.append({"role": "assistant", "content": "Shall I file the towing claim now?"})
+
+    monkeypatch.setattr(agent, "_embed", fake_embed)
+    monkeypatch.setattr(base, "process_gpt_response", fake_process)
+
+    cm = MemoManager(session_id="cache-follow-up")
+    cm.set_context("policy_id", "POL-A10001")
+    await agent.respond(cm, "does my policy cover towing", None)
+    await agent.respond(cm, "yes please do that now", None)
+
+    assert embeds == ["does my policy cover towing"]
+    assert agent.semantic_cache.stats()["entries"] == 1  # only the standalone question
@@ -0,0 +1,159 @@
+import gc
+import threading
+import time
+
+from azure.core.credentials import AccessToken
+
+from src.speech import auth_manager
+from src.speech.auth_manager import SpeechTokenManager
+
+
+class _Credential:
+    def __init__(self, lifetime=3600.0, delay=0.0):
+        self.calls = 0
+        self.lifetime = lifetime
+        self.delay = delay
+        self._lock = threading.Lock()
+
+    def get_token(self, scope):
+        time.sleep(self.delay)
+        with self._lock:
+            self.calls += 1
+            n = self.calls
+        return AccessToken(f"token-{n}", int(time.time() + self.lifetime) + n)
+
+
+class _Target:
+    """Stands in for a SpeechConfig or SpeechRecognizer."""
+
+    def __init__(self):
+        self.authorization_token = None
+        self.properties = {}
+
+    def set_property_by_name(self, name, value):
+        self.properties[name] = value
+
+
+def test_fresh_token_is_served_without_calling_the_credential():
+    credential = _Credential()
+    manager = SpeechTokenManager(credential, "/subscriptions/x/speech")
+    config = _Target()
+
+    manager.apply_to_config(config)
+    assert config.authorization_token == "token-1"
+    assert config.properties["SpeechServiceConnection_AuthorizationType"] == "aad"
+
+    config.properties.clear()
+    for _ in range(100):
+        manager.apply_to_config(config)  # per-synthesis call on the hot path
+        manager.get_token()
+    assert credential.calls == 1
+    assert not config.properties  # registered configs are not reconfigured
+
+
+def test_concurrent_forced_refreshes_are_single_flight():
+    credential = _Credential(delay=0.05)
+    manager = SpeechTokenManager(credential, "rid")
+    manager.get_token()
+
+    seen = manager.get_token()
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(manager._refresh(seen, trigger="forced")))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert credential.calls == 2  # initial token + one refresh for the 401 burst
+    assert {r.token for r in results} == {"token-2"}
+    assert manager.refreshes["forced"] == 1
+
+
+def test_refresh_pushes_to_live_targets_and_records_lead():
+    manager = SpeechTokenManager(_Credential(), "rid")
+    config, recognizer, dropped = _Target(), _Target(), _Target()
+    manager.apply_to_config(config)
+    manager.register(recognizer)
+    manager.register(dropped)
+    del dropped
+    gc.collect()
+
+    assert manager.refresh_now() is True
+    assert config.authorization_token == recognizer.authorization_token == "token-2"
+    stats = manager.stats()
+    assert stats["targets"] == 2 and stats["retries_avoided"] == 2
+    assert stats["refreshes"]["proactive"] == 1
+    assert 3500 < stats["last_refresh_lead_s"] <= 3601
+
+
+def test_background_refresher_renews_before_expiry(monkeypatch):
+    monkeypatch.setattr(auth_manager, "_REFRESH_SKEW_SECONDS", 0.05)
+    monkeypatch.setattr(auth_manager, "_REFRESH_RETRY_SECONDS", 0.05)
+    credential = _Credential(lifetime=0)
+    manager = SpeechTokenManager(credential, "rid")
+    recognizer = _Target()
+    manager.register(recognizer)
+    manager._cached_token = AccessToken("token-0", time.time() + 0.4)
+
+    credential.lifetime = 3600
+    manager.start_refresher(lead_seconds=0.3)
+    try:
+        deadline = time.time() + 3
+        while recognizer.authorization_token is None and time.time() < deadline:
+            time.sleep(0.02)
+    finally:
+        manager.stop_refresher()
+
+    assert recognizer.authorization_token == "token-1"
+    assert manager.last_refresh_lead_s > 0  # renewed while the old token was still valid
+    assert credential.calls == 1
+    assert not manager.stats()["refresher_running"]
+
+
+class _CachingCredential(_Credential):
+    """Returns the same token until ``rotate`` is set, like azure-identity's cache."""
+
+    def __init__(self):
+        super().__init__()
+        self.rotate = False
+        self._token = None
+
+    def get_token(self, scope):
+        if self._token is None or self.rotate:
+            self.rotate = False
+            self._token = super().get_token(scope)
+        else:
+            self.calls += 1
+        return self._token
+
+
+def test_unchanged_token_is_not_counted_as_refresh():
+    credential = _CachingCredential()
+    manager = SpeechTokenManager(credential, "rid")
+    manager.get_token()
+
+    assert manager.refresh_now() is False
+    assert manager.refresh_now() is False
+    stats = manager.stats()
+    assert stats["refreshes"]["proactive"] == 0
+    assert stats["unchanged_refreshes"] == 2
+
+    credential.rotate = True
+    assert manager.refresh_now() is True
+    assert manager.stats()["refreshes"]["proactive"] == 1
+
+
+def test_retry_delay_backs_off_and_stays_ahead_of_expiry():
+    manager = SpeechTokenManager(_Credential(), "rid")
+    manager._cached_token = AccessToken("t", time.time() + 3600)
+    delays = [manager._retry_delay(n) for n in range(1, 7)]
+    assert delays == [5, 10, 20, 40, 60, 60]
+
+    # Close to the on-demand threshold the wait shrinks to the base retry.
+    manager._cached_token = AccessToken("t", time.time() + auth_manager._REFRESH_SKEW_SECONDS + 12)
+    assert 5 <= manager._retry_delay(4) <= 12
+    manager._cached_token = AccessToken("t", time.time() + 1)
+    assert manager._retry_delay(4) == 5
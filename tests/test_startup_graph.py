@@ -0,0 +1,119 @@
+import asyncio
+import builtins
+import sys
+import time
+
+import pytest
+
+from utils.lazy_import import lazy_import
+from utils.startup import ImportProfiler, StartupGraph
+
+
+def _recording_step(log, name, delay=0.0, fail=False):
+    async def start():
+        log.append(f"start:{name}")
+        await asyncio.sleep(delay)
+        if fail:
+            raise RuntimeError(f"{name} failed")
+        log.append(f"ready:{name}")
+
+    async def stop():
+        log.append(f"stop:{name}")
+
+    return start, stop
+
+
+@pytest.mark.asyncio
+async def test_independent_steps_overlap_and_dependents_wait():
+    log = []
+    graph = StartupGraph()
+    graph.add("executors", *_recording_step(log, "executors"))
+    graph.add("redis", *_recording_step(log, "redis", 0.05), depends_on=("executors",))
+    graph.add("cosmos", *_recording_step(log, "cosmos", 0.05), depends_on=("executors",))
+    graph.add("aoai", *_recording_step(log, "aoai"), depends_on=("redis",))
+
+    started = time.perf_counter()
+    await graph.start()
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.09  # redis and cosmos ran concurrently
+    assert log.index("ready:redis") < log.index("start:aoai")
+    assert [name for name, _ in graph.results][0] == "executors"
+    assert "sequential" in graph.profile_lines()[-1]
+
+    log.clear()
+    await graph.shutdown()
+    assert log.index("stop:aoai") < log.index("stop:redis") < log.index("stop:executors")
+
+
+@pytest.mark.asyncio
+async def test_failure_cancels_running_steps_and_keeps_completed_for_shutdown():
+    log = []
+    graph = StartupGraph()
+    graph.add("core", *_recording_step(log, "core"))
+    graph.add("slow", *_recording_step(log, "slow", 1.0), depends_on=("core",))
+    graph.add("broken", *_recording_step(log, "broken", 0.01, fail=True), depends_on=("core",))
+
+    with pytest.raises(RuntimeError, match="broken failed"):
+        await asyncio.wait_for(graph.start(), 0.5)
+
+    assert [step.name for step in graph.executed] == ["core"]
+    assert "ready:slow" not in log
+    await graph.shutdown()
+    assert log[-1] == "stop:core"
+
+
+def test_unknown_dependency_and_cycles_are_rejected():
+    async def noop():
+        return None
+
+    graph = StartupGraph()
+    graph.add("a", noop, depends_on=("b",))
+    graph.add("b", noop, depends_on=("a",))
+    with pytest.raises(ValueError, match="cycle"):
+        graph.validate()
+
+    graph = StartupGraph()
+    graph.add("a", noop, depends_on=("missing",))
+    with pytest.raises(ValueError, match="unknown"):
+        graph.validate()
+
+
+def _write_package(root, name):
+    package = root / name
+    package.mkdir()
+    (package / "__init__.py").write_text(
+        "import sys, time\ntime.sleep(0.02)\nsys.modules[__name__].loaded = True\n"
+    )
+
+
+def test_import_profiler_attributes_self_time_to_package(tmp_path, monkeypatch):
+    _write_package(tmp_path, "slowpkg_profiled")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    profiler = ImportProfiler.install()
+    try:
+        import slowpkg_profiled  # noqa: F401
+    finally:
+        profiler.stop()
+        sys.modules.pop("slowpkg_profiled", None)
+
+    assert builtins.__import__ != profiler._import
+    assert dict(profiler.top())["slowpkg_profiled"] >= 0.02
+
+
+def test_lazy_import_defers_module_body(tmp_path, monkeypatch):
+    _write_package(tmp_path, "slowpkg_lazy")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    try:
+        started = time.perf_counter()
+        module = lazy_import("slowpkg_lazy")
+        assert time.perf_counter() - started < 0.02
+        assert module.loaded  # first attribute access runs the module body
+        assert lazy_import("slowpkg_lazy") is module
+    finally:
+        sys.modules.pop("slowpkg_lazy", None)
+
+    with pytest.raises(ModuleNotFoundError):
+        lazy_import("slowpkg_does_not_exist")
@@ -0,0 +1,96 @@
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from opentelemetry.sdk.trace import TracerProvider
+
+from utils import telemetry_policy
+from utils.telemetry_policy import EventRule, TelemetryPolicy
+
+
+def _span():
+    return TracerProvider().get_tracer("test").start_span("session")
+
+
+def test_every_nth_event_is_kept_per_span():
+    policy = TelemetryPolicy({"stt.partial": EventRule(every_n=3)})
+    span = _span()
+
+    kept = [policy.record(span, "stt", "partial", {"i": i}) for i in range(7)]
+
+    assert kept == [True, False, False, True, False, False, True]
+    assert [e.attributes["i"] for e in span.events] == [0, 3, 6]
+
+
+def test_events_per_span_are_capped_and_counted():
+    policy = TelemetryPolicy({}, max_events_per_span=2)
+    span = _span()
+
+    for _ in range(5):
+        policy.record(span, "tts", "synthesis_completed")
+
+    assert len(span.events) == 2
+    assert span.attributes["telemetry.events_dropped"] == 3
+    assert policy.stats()["capped"] == 3
+    # A fresh span gets its own budget.
+    assert policy.record(_span(), "tts", "synthesis_completed")
+
+
+def test_error_events_are_attached_after_the_cap():
+    policy = TelemetryPolicy({"stt.*": EventRule(sample_rate=0.0)}, max_events_per_span=1)
+    span = _span()
+
+    policy.record(span, "tts", "synthesis_completed")
+    policy.record(span, "tts", "synthesis_completed")
+    assert policy.record(span, "tts", "tts_synthesis_failed", {"reason": "timeout"})
+    assert policy.record(span, "stt", "recognition_canceled")
+
+    assert [e.name for e in span.events] == [
+        "synthesis_completed",
+        "tts_synthesis_failed",
+        "recognition_canceled",
+    ]
+    assert span.attributes["telemetry.events_dropped"] == 1
+    assert span.attributes["telemetry.events_exempt"] == 2
+    assert policy.stats()["exempt"] == 2
+
+
+def test_folded_events_reach_metrics_without_touching_span():
+    reader = InMemoryMetricReader()
+    policy = TelemetryPolicy(
+        {
+            "stt.audio_chunk": EventRule(
+                sample_rate=0.0, metric="test.audio_chunk.size", value_attribute="size"
+            ),
+            "stt.*": EventRule(sample_rate=0.0, metric="test.stt.events"),
+        },
+        meter=MeterProvider(metric_readers=[reader]).get_meter("test"),
+    )
+    span = _span()
+
+    for size in (640, 640, 320):
+        assert not policy.record(span, "stt", "audio_chunk", {"size": size})
+    policy.record(span, "stt", "keepalive")
+
+    assert span.events == ()
+    points = {
+        m.name: m.data.data_points[0]
+        for rm in reader.get_metrics_data().resource_metrics
+        for sm in rm.scope_metrics
+        for m in sm.metrics
+    }
+    assert points["test.audio_chunk.size"].count == 3
+    assert points["test.audio_chunk.size"].sum == 1600
+    assert points["test.stt.events"].value == 1
+
+
+def test_env_rules_extend_defaults(monkeypatch):
+    monkeypatch.setenv(
+        "TELEMETRY_EVENT_POLICY", '{"text_to_speech.*": {"sample_rate": 0.0}}'
+    )
+    policy = TelemetryPolicy.from_env()
+
+    assert policy.rule_for("text_to_speech", "tts_synthesis_completed").sample_rate == 0.0
+    assert policy.rule_for("speech_recognizer", "audio_chunk").value_attribute == "size"
+    assert policy.rule_for("other", "event") == EventRule()
+
+    monkeypatch.setenv("TELEMETRY_EVENT_POLICY", '{"x.y": {"bogus": 1}}')
+    assert TelemetryPolicy.from_env().rules == telemetry_policy.DEFAULT_RULES
@@ -0,0 +1,139 @@
+import pytest
+
+from src.tools.latency_tool import LatencyTool
+from src.tools.turn_waterfall import aggregate_waterfalls, build_waterfall, session_waterfalls
+
+
+def _sample(stage, start, end):
+    return {"stage": stage, "start": start, "end": end, "dur": end - start, "meta": {}}
+
+
+def _run(run_id="r1", offset=0.0, tts_ms=300.0):
+    """speech_end at 0; STT final +0.5 s; LLM 0.7-1.2 s; TTS synth 1.3 s-+tts_ms; frame 10 ms later."""
+    t = offset
+    synth_end = t + 1.3 + tts_ms / 1000
+    return {
+        "run_id": run_id,
+        "label": "turn",
+        "samples": [
+            _sample("aoai:total", t + 0.7, t + 2.5),
+            _sample("aoai:ttfb", t + 0.7, t + 1.2),
+            _sample("aoai:consume", t + 1.2, t + 2.5),
+            _sample("tts", t + 1.3, synth_end + 0.5),
+            _sample("tts:synthesis", t + 1.3, synth_end),
+            _sample("tts:send_frames", synth_end + 0.01, synth_end + 0.5),
+        ],
+        "marks": {
+            "speech_end": t,
+            "stt_final": t + 0.5,
+            "first_frame_sent": synth_end + 0.01,
+        },
+    }
+
+
+def test_dead_air_is_fully_attributed_to_innermost_stages_and_gaps():
+    waterfall = build_waterfall(_run())
+
+    assert waterfall["complete"]
+    assert waterfall["dead_air_ms"] == pytest.approx(1610.0)
+    assert list(waterfall["milestones"]) == [
+        "speech_end",
+        "stt_final",
+        "llm_request",
+        "llm_first_token",
+        "tts_request",
+        "tts_first_byte",
+        "first_frame_sent",
+    ]
+    attribution = waterfall["attribution"]
+    assert attribution["stt:finalize"] == pytest.approx(500.0)
+    assert attribution["aoai:ttfb"] == pytest.approx(500.0)
+    assert attribution["gap:after_stt_final"] == pytest.approx(200.0)
+    assert attribution["aoai:consume"] == pytest.approx(100.0)  # before TTS starts
+    assert attribution["tts:synthesis"] == pytest.approx(300.0)
+    assert "aoai:total" not in attribution  # fully covered by its sub-stages
+    assert sum(attribution.values()) == pytest.approx(waterfall["dead_air_ms"], abs=0.5)
+    assert {"label": "gap:after_stt_final", "at_ms": 500.0, "ms": 200.0} in waterfall["gaps"]
+    assert {"stages": ["aoai:consume", "tts:synthesis"], "ms": 300.0} in waterfall["overlaps"]
+
+
+def test_speech_end_after_final_is_ignored_and_incomplete_turns_flagged():
+    run = _run()
+    run["marks"]["speech_end"] = run["marks"]["stt_final"] + 0.2
+    del run["marks"]["first_frame_sent"]
+    run["samples"] = [s for s in run["samples"] if s["stage"].startswith("aoai")]
+
+    waterfall = build_waterfall(run)
+
+    assert not waterfall["complete"]
+    assert "speech_end" not in waterfall["milestones"]
+    assert waterfall["milestones"]["stt_final"] == 0.0
+    assert "stt:finalize" not in waterfall["attribution"]
+
+
+def test_aggregate_ranks_top_contributors():
+    latency = {
+        "runs": {f"r{i}": _run(f"r{i}", offset=10.0 * i, tts_ms=300.0 * (i + 1)) for i in range(5)},
+        "order": [f"r{i}" for i in range(5)],
+    }
+    latency["runs"]["greet"] = {**_run("greet"), "label": "greeting"}
+    latency["order"].append("greet")
+
+    turns = session_waterfalls(latency)
+    report = aggregate_waterfalls(turns, top=3)
+
+    assert len(turns) == 5
+    assert report["turns"] == 5
+    top = report["top_contributors"]
+    assert top[0]["label"] == "tts:synthesis"
+    assert {c["label"] for c in top[1:]} == {"stt:finalize", "aoai:ttfb"}
+    assert top[0]["mean_ms"] == pytest.approx(900.0)
+    assert top[0]["p95_ms"] == pytest.approx(1500.0)
+    assert report["dead_air_ms"]["max"] == pytest.approx(2810.0)
+
+
+def test_latency_tool_carries_pre_turn_marks_into_next_run():
+    class _CM:
+        def __init__(self):
+            self.ctx = {}
+
+        def get_context(self, key, default=None):
+            return self.ctx.get(key, default)
+
+        def set_context(self, key, value):
+            self.ctx[key] = value
+
+    lt = LatencyTool(_CM())
+    lt.mark("speech_end", next_run=True, at=1.0)
+    lt.mark("speech_end", next_run=True, at=2.0)  # latest voiced frame wins
+    lt.mark("stt_final", next_run=True, at=2.5)
+    rid = lt.begin_run()
+    lt.mark("first_frame_sent", at=4.0)
+    lt.mark("first_frame_sent", at=5.0)  # first frame of the turn wins
+
+    marks = lt.cm.get_context("latency")["runs"][rid]["marks"]
+    assert marks == {"speech_end": 2.0, "stt_final": 2.5, "first_frame_sent": 4.0}
+    assert lt.waterfall()["dead_air_ms"] == pytest.approx(2000.0)
+
+
+def test_latency_tool_cancel_drops_timer_without_sample():
+    class _CM:
+        def __init__(self):
+            self.ctx = {}
+
+        def get_context(self, key, default=None):
+            return self.ctx.get(key, default)
+
+        def set_context(self, key, value):
+            self.ctx[key] = value
+
+    lt = LatencyTool(_CM())
+    rid = lt.begin_run()
+    lt.start("barge_in:local_lead")
+    assert lt.is_running("barge_in:local_lead")
+
+    lt.cancel("barge_in:local_lead")
+    lt.stop("barge_in:local_lead")
+
+    assert not lt.is_running("barge_in:local_lead")
+    assert not lt.cm.get_context("latency")["runs"][rid].get("samples")
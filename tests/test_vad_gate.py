@@ -0,0 +1,114 @@
+import numpy as np
+import pytest
+
+from src.vad.gate import SpeechEndTracker, VADGate, frame_level_db, frame_levels_db
+
+RATE = 16000
+FRAME = RATE // 50  # 20 ms
+
+
+def _tone(amplitude=8000):
+    t = np.arange(FRAME) / RATE
+    return (amplitude * np.sin(2 * np.pi * 440 * t)).astype(np.int16).tobytes()
+
+
+def _silence():
+    return np.zeros(FRAME, dtype=np.int16).tobytes()
+
+
+def _feed(gate, frames):
+    out = []
+    for frame in frames:
+        out.extend(gate.process(frame))
+    out.extend(gate.flush())
+    return out
+
+
+def test_frame_level_db():
+    assert frame_level_db(_silence()) == float("-inf")
+    assert -20 < frame_level_db(_tone()) < -10
+
+
+def test_frame_levels_db_matches_per_frame_level():
+    pcm = _silence() + _tone() + _tone()[:100]
+    levels = frame_levels_db(pcm, len(_tone()))
+
+    assert len(levels) == 3
+    assert levels[0] == float("-inf")
+    assert levels[1] == pytest.approx(frame_level_db(_tone()), abs=0.01)
+    assert levels[2] < levels[1]  # zero-padded tail
+
+
+def test_drop_mode_keeps_padding_and_hangover_only():
+    gate = VADGate(sample_rate=RATE, mode="drop", hangover_ms=100, pad_ms=40)
+    speech = [_tone() for _ in range(10)]
+    frames = [_silence()] * 50 + speech + [_silence()] * 50
+
+    out = _feed(gate, frames)
+
+    # 2 frames of pre-roll + 10 speech + 5 hangover frames
+    assert len(out) == 17
+    assert out[2:12] == speech
+    stats = gate.stats()
+    assert stats["speech_segments"] == 1
+    assert stats["suppressed_ratio"] == pytest.approx(1 - 17 / 110, abs=1e-3)
+
+
+def test_compress_and_observe_modes():
+    silence = [_silence()] * 100
+
+    compress = VADGate(sample_rate=RATE, mode="compress", compress_keep_every=10)
+    assert len(_feed(compress, silence)) == 10
+
+    observe = VADGate(sample_rate=RATE, mode="observe")
+    assert len(_feed(observe, silence)) == 100
+    assert observe.stats()["suppressed_ratio"] == 0.0
+
+
+def test_model_is_called_once_per_batch_of_loud_frames():
+    calls = []
+
+    def model(batch, sample_rate):
+        calls.append(batch.shape)
+        # Treat only frames louder than ~-20 dBFS as speech.
+        return [float(np.abs(row).mean() > 0.1) for row in batch]
+
+    gate = VADGate(
+        sample_rate=RATE, mode="drop", model=model, batch_frames=4, hangover_ms=0, pad_ms=0
+    )
+    frames = [_tone(500)] * 4 + [_tone(8000)] * 4 + [_silence()] * 4
+
+    out = _feed(gate, frames)
+
+    assert calls == [(4, FRAME), (4, FRAME)]  # the silent batch never reaches the model
+    assert len(out) == 4
+    assert gate.stats()["model_calls"] == 2
+
+
+def test_invalid_mode_rejected():
+    with pytest.raises(ValueError):
+        VADGate(mode="mute")
+
+
+def test_speech_end_marks_once_per_voiced_to_silence_transition():
+    tracker = SpeechEndTracker(energy_threshold_db=-45, hangover_ms=200)
+    levels = [-20.0] * 10 + [-80.0] * 15 + [-20.0] * 5 + [-80.0] * 15
+    ends = []
+    for i, level in enumerate(levels):
+        ended = tracker.process(level, now=i * 0.02)
+        if ended is not None:
+            ends.append(round(ended, 2))
+
+    # The last voiced frame of each segment, reported after the hangover.
+    assert ends == [0.18, 0.58]
+    assert tracker.segments == 2
+
+
+def test_speech_end_ignores_agent_playback():
+    tracker = SpeechEndTracker(energy_threshold_db=-45, hangover_ms=200)
+    for i in range(10):
+        assert tracker.process(-20.0, ignore=True, now=i * 0.02) is None
+    for i in range(10, 30):
+        assert tracker.process(-80.0, now=i * 0.02) is None
+    assert tracker.segments == 0
+
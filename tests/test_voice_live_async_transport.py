@@ -0,0 +1,158 @@
+import asyncio
+import json
+import threading
+
+import pytest
+import websockets
+
+from apps.rtagent.backend.api.v1.handlers import voice_live_handler
+from apps.rtagent.backend.api.v1.handlers.voice_live_handler import VoiceLiveHandler
+from apps.rtagent.backend.src.agents.Lvagent.transport import AsyncWebSocketTransport
+from src.pools import voice_live_pool
+from src.pools.voice_live_pool import VoiceLiveAgentPool
+
+
+async def _echo_server(seen_headers, *, greeting=None):
+    async def handler(ws):
+        seen_headers.append(ws.request.headers.get("api-key"))
+        if greeting:
+            await ws.send(greeting)
+        async for message in ws:
+            event = json.loads(message)
+            if event["type"] == "close":
+                await ws.close()
+                return
+            await ws.send(json.dumps({"type": "echo", "of": event["type"]}))
+
+    return await websockets.serve(handler, "127.0.0.1", 0)
+
+
+def _url(server):
+    host, port = server.sockets[0].getsockname()[:2]
+    return f"ws://{host}:{port}/voice-live/realtime"
+
+
+async def test_send_and_receive_are_awaitable_and_iteration_ends_on_close():
+    headers = []
+    server = await _echo_server(headers, greeting='{"type": "session.created"}')
+    try:
+        ws = AsyncWebSocketTransport(_url(server), {"api-key": "k"})
+        await ws.connect()
+        assert ws.is_connected and headers == ["k"]
+
+        await ws.send_dict({"type": "session.update"})
+        await ws.send_dict({"type": "close"})
+        received = [json.loads(raw)["type"] async for raw in ws]
+
+        assert received == ["session.created", "echo"]
+        assert not ws.is_connected
+        assert await ws.recv(timeout_s=0.01) is None
+        await ws.close()
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+async def test_timeouts_and_connection_errors():
+    server = await _echo_server([])
+    url = _url(server)
+    try:
+        ws = AsyncWebSocketTransport(url)
+        with pytest.raises(RuntimeError):
+            await ws.send_dict({"type": "x"})
+        await ws.connect()
+        assert await ws.recv(timeout_s=0.05) is None  # nothing pending
+        await ws.close()
+    finally:
+        server.close()
+        await server.wait_closed()
+
+    with pytest.raises(ConnectionError):
+        await AsyncWebSocketTransport(url).connect(timeout_s=1.0)
+
+
+async def test_concurrent_sessions_share_the_event_loop():
+    server = await _echo_server([])
+    try:
+        threads_before = threading.active_count()
+        sessions = [AsyncWebSocketTransport(_url(server)) for _ in range(20)]
+        await asyncio.gather(*(s.connect() for s in sessions))
+        assert threading.active_count() == threads_before
+
+        await asyncio.gather(*(s.send_dict({"type": f"ping{i}"}) for i, s in enumerate(sessions)))
+        replies = await asyncio.gather(*(s.recv(timeout_s=2) for s in sessions))
+        assert [json.loads(r)["of"] for r in replies] == [f"ping{i}" for i in range(20)]
+        await asyncio.gather(*(s.close() for s in sessions))
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+class _FakeAgent:
+    pool_key = ("gpt-4o", "voice", "agent")
+
+    def __init__(self, events=()):
+        self.sent = []
+        self.connected = False
+        self.closed = False
+        self.resets = 0
+        self._events = list(events)
+
+    @property
+    def is_connected(self):
+        return self.connected and not self.closed
+
+    async def connect_async(self):
+        self.connected = True
+
+    async def reset_async(self, *, timeout_s):
+        self.resets += 1
+        return True
+
+    async def send_event_async(self, payload):
+        self.sent.append(payload)
+
+    async def events(self):
+        for event in self._events:
+            yield json.dumps(event)
+
+    async def close_async(self):
+        self.closed = True
+
+
+async def test_handler_and_pool_use_the_async_agent_api(monkeypatch):
+    agent = _FakeAgent(events=[{"type": "session.created"}, {"type": "response.done"}])
+    handled = []
+    handler = VoiceLiveHandler("s1", websocket=None, azure_endpoint="wss://x", lva_agent=agent)
+
+    async def record(event):
+        handled.append(event["type"])
+
+    monkeypatch.setattr(handler, "_handle_voice_live_event", record)
+    await handler.start()
+    await handler._lva_event_task
+    await handler.handle_audio_data(b"\x00\x01" * 160)
+    await asyncio.sleep(0)
+    assert handled == ["session.created", "response.done"]
+    assert agent.sent and agent.sent[-1]["type"] == "input_audio_buffer.append"
+
+    built = []
+
+    def build(path, enable_audio_io):
+        built.append(threading.current_thread().name)
+        return _FakeAgent()
+
+    monkeypatch.setattr(voice_live_pool, "build_lva_from_yaml", build)
+    monkeypatch.setattr(voice_live_handler, "build_lva_from_yaml", build)
+    pool = VoiceLiveAgentPool(warm_pool_size=1, enable_prewarming=False)
+    pooled, tier = await pool.get_agent()
+    assert tier == "cold" and pooled.connected
+    assert built[0] != threading.current_thread().name  # token fetch off the loop
+
+    handler = VoiceLiveHandler("s2", websocket=None, azure_endpoint="wss://x", lva_agent=pooled, voice_live_pool=pool)
+    await handler.start()
+    await handler.stop()
+    await asyncio.gather(*pool._background)
+    assert pooled.resets == 1 and not pooled.closed  # reset and kept warm
+    await pool.shutdown()
+    assert pooled.closed
@@ -0,0 +1,225 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import websockets
+
+from apps.rtagent.backend.src.agents.Lvagent import base
+from apps.rtagent.backend.src.agents.Lvagent.base import (
+    AzureLiveVoiceAgent,
+    LvaAgentBinding,
+    LvaModel,
+)
+from src.pools import voice_live_pool
+from src.pools.voice_live_pool import VoiceLiveAgentPool
+
+
+async def _voice_live_server(*, confirm=True):
+    """Minimal Voice Live service: answers item deletes and session updates."""
+
+    async def handler(ws):
+        async for message in ws:
+            event = json.loads(message)
+            if event["type"] == "input_audio_buffer.append":
+                await ws.send(json.dumps({"type": "conversation.item.created", "item": {"id": f"item-{len(event['audio'])}"}}))
+            elif not confirm:
+                continue
+            elif event["type"] == "conversation.item.delete":
+                await ws.send(json.dumps({"type": "conversation.item.deleted", "item_id": event["item_id"]}))
+            elif event["type"] == "session.update":
+                await ws.send(json.dumps({"type": "session.updated"}))
+            elif event["type"] == "response.cancel":
+                await ws.send(json.dumps({"type": "error", "error": {"code": "response_cancel_not_active"}}))
+
+    server = await websockets.serve(handler, "127.0.0.1", 0)
+    host, port = server.sockets[0].getsockname()[:2]
+    return server, f"ws://{host}:{port}"
+
+
+def _agent(monkeypatch, endpoint):
+    credential = SimpleNamespace(get_token=lambda scope: SimpleNamespace(token="t"))
+    monkeypatch.setattr(base, "get_credential", lambda: credential)
+    monkeypatch.setenv("AZURE_VOICE_LIVE_ENDPOINT", endpoint)
+    return AzureLiveVoiceAgent(
+        model=LvaModel(deployment_id="gpt-4o"),
+        binding=LvaAgentBinding(agent_id="a1", project_name="p"),
+        enable_audio_io=False,
+    )
+
+
+async def test_reset_deletes_conversation_items_without_reconnecting(monkeypatch):
+    server, endpoint = await _voice_live_server()
+    try:
+        agent = _agent(monkeypatch, endpoint)
+        await agent.connect_async()
+        assert await agent.recv_raw_async(timeout_s=2) == '{"type": "session.updated"}'
+        for audio in ("a", "bb"):
+            await agent.send_event_async({"type": "input_audio_buffer.append", "audio": audio})
+        async for _ in agent.events():  # previous call reads one item, leaves one unread
+            break
+
+        assert await agent.reset_async(timeout_s=2) is True
+        assert agent._item_ids == [] and agent.is_connected
+        assert agent.pool_key == ("gpt-4o", "en-US-Ava:DragonHDLatestNeural", "a1")
+        assert await agent.ping_async() >= 0
+        await agent.close_async()
+        assert await agent.reset_async() is False
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+async def test_reset_fails_when_the_service_does_not_confirm(monkeypatch):
+    server, endpoint = await _voice_live_server(confirm=False)
+    try:
+        agent = _agent(monkeypatch, endpoint)
+        await agent.connect_async()
+        await agent.send_event_async({"type": "input_audio_buffer.append", "audio": "a"})
+        assert await agent.reset_async(timeout_s=0.3) is False
+        await agent.close_async()
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+class _FakeAgent:
+    def __init__(self, key=("gpt-4o", "voice", "a1"), reset_ok=True):
+        self.pool_key = key
+        self.reset_ok = reset_ok
+        self.resets = 0
+        self.closed = False
+        self.healthy = True
+
+    @property
+    def is_connected(self):
+        return not self.closed
+
+    async def connect_async(self):
+        pass
+
+    async def reset_async(self, *, timeout_s):
+        self.resets += 1
+        return self.reset_ok
+
+    async def ping_async(self, *, timeout_s):
+        if not self.healthy:
+            raise asyncio.TimeoutError()
+        return 1.0
+
+    async def close_async(self):
+        self.closed = True
+
+
+def _pool(monkeypatch, **kwargs):
+    built = []
+
+    def build(path, enable_audio_io):
+        agent = _FakeAgent(key=("gpt-4o", "voice", path))
+        built.append(agent)
+        return agent
+
+    monkeypatch.setattr(voice_live_pool, "build_lva_from_yaml", build)
+    kwargs.setdefault("warm_pool_size", 2)
+    pool = VoiceLiveAgentPool(agent_yaml="auth.yaml", enable_prewarming=False, **kwargs)
+    return pool, built
+
+
+async def _settle(pool):
+    while pool._background:
+        await asyncio.gather(*list(pool._background))
+
+
+async def test_released_agent_is_reset_and_served_warm(monkeypatch):
+    pool, built = _pool(monkeypatch)
+    agent, tier = await pool.get_agent()
+    assert tier == "cold"
+    await pool.release_agent(agent)
+    await _settle(pool)
+
+    again, tier = await pool.get_agent()
+    assert tier == "warm" and again is agent and agent.resets == 1
+    other, tier = await pool.get_agent("claims.yaml")  # different agent binding
+    assert tier == "cold" and other is not agent
+
+    metrics = await pool.get_metrics()
+    assert metrics["reuses"] == 1 and metrics["pool"]["leased"] == 2
+    await pool.shutdown()
+
+
+async def test_agents_past_max_uses_or_failed_reset_are_replaced(monkeypatch):
+    pool, built = _pool(monkeypatch, max_uses=2)
+    agent, _ = await pool.get_agent()
+    for _ in range(2):
+        await pool.release_agent(agent)
+        await _settle(pool)
+        agent, tier = await pool.get_agent()
+    assert built[0].closed and agent is built[1] and tier == "warm"
+
+    agent.reset_ok = False
+    await pool.release_agent(agent)
+    await _settle(pool)
+    assert agent.closed and len(built) == 3
+    assert pool._metrics["recycled"] == {
+        "max_age": 0,
+        "max_uses": 1,
+        "reset_failed": 1,
+        "unhealthy": 0,
+        "surplus": 0,
+    }
+    await pool.shutdown()
+
+
+async def test_health_check_evicts_dead_and_expired_agents(monkeypatch):
+    pool, built = _pool(monkeypatch)
+    leased = [(await pool.get_agent())[0] for _ in range(2)]
+    for agent in leased:
+        await pool.release_agent(agent)
+    await _settle(pool)
+
+    leased[0].healthy = False
+    await pool.check_health()
+    await _settle(pool)
+    assert leased[0].closed and not leased[1].closed
+
+    pool._max_age_s = 0.0
+    await pool.check_health()
+    await _settle(pool)
+    assert leased[1].closed and (await pool.get_metrics())["pool"]["warm_size"] == 0
+    await pool.shutdown()
+
+
+async def test_unclaimed_parked_agent_is_reaped_and_reused(monkeypatch):
+    pool, built = _pool(monkeypatch, lease_ttl_s=30)
+    lease = await pool.park_agent()
+    claimed = await pool.park_agent()
+    assert pool.claim_lease(claimed) is claimed.agent
+
+    for pooled in pool._leased.values():
+        if pooled.lease_expires_at is not None:
+            pooled.lease_expires_at = 0.0
+    await pool.check_health()
+    await _settle(pool)
+
+    # The media WebSocket arrives late: the lease is gone and the agent is warm again.
+    assert pool.claim_lease(lease) is None
+    metrics = await pool.get_metrics()
+    assert metrics["leases_expired"] == 1
+    assert metrics["pool"]["leased"] == 1 and metrics["pool"]["warm_size"] == 1
+    again, tier = await pool.get_agent()
+    assert tier == "warm" and again is lease.agent
+    assert pool.claim_lease(lease) is None  # re-leased agent is not the old lease
+    await pool.shutdown()
+
+
+async def test_reset_agent_without_room_counts_as_surplus(monkeypatch):
+    pool, built = _pool(monkeypatch, warm_pool_size=1)
+    first, _ = await pool.get_agent()
+    second, _ = await pool.get_agent()
+    await pool.release_agent(first)
+    await _settle(pool)
+    await pool.release_agent(second)
+    await _settle(pool)
+
+    assert not first.closed and second.closed
+    assert pool._metrics["recycled"]["surplus"] == 1
+    await pool.shutdown()
@@ -0,0 +1,113 @@
+import asyncio
+import contextvars
+import threading
+import time
+
+import pytest
+
+from src.pools.executors import (
+    OrderedWorkloadWriter,
+    Workload,
+    configure_workload_executors,
+    get_workload_executor,
+    run_in_workload,
+    shutdown_workload_executors,
+    workload_stats,
+)
+
+_request_id = contextvars.ContextVar("request_id", default=None)
+
+
+@pytest.fixture
+def executors():
+    shutdown_workload_executors()
+    yield configure_workload_executors({Workload.STORAGE: 1, "misc": 2})
+    shutdown_workload_executors()
+
+
+def test_configure_applies_overrides_and_defaults(executors):
+    assert set(executors) == set(Workload)
+    assert executors[Workload.STORAGE]._max_workers == 1
+    assert executors[Workload.MISC]._max_workers == 2
+    assert executors[Workload.SPEECH_IO]._max_workers == 32
+    assert get_workload_executor("storage") is executors[Workload.STORAGE]
+
+
+@pytest.mark.asyncio
+async def test_run_in_workload_uses_named_pool_and_copies_context(executors):
+    _request_id.set("req-1")
+
+    def _work():
+        return threading.current_thread().name, _request_id.get()
+
+    thread_name, request_id = await run_in_workload(Workload.MISC, _work)
+
+    assert thread_name.startswith("wl-misc")
+    assert request_id == "req-1"
+
+
+@pytest.mark.asyncio
+async def test_saturated_pool_records_queue_time_without_starving_others(executors):
+    gate = threading.Event()
+    blocker = asyncio.ensure_future(run_in_workload(Workload.STORAGE, gate.wait, 2))
+    queued = asyncio.ensure_future(run_in_workload(Workload.STORAGE, lambda: "queued"))
+    await asyncio.sleep(0.05)
+
+    # storage is saturated, misc still runs immediately
+    assert await asyncio.wait_for(run_in_workload(Workload.MISC, lambda: "misc"), 1) == "misc"
+    stats = workload_stats()["storage"]
+    assert stats["active"] == 1
+    assert stats["queued"] == 1
+
+    gate.set()
+    assert await queued == "queued"
+    await blocker
+
+    stats = workload_stats()["storage"]
+    assert stats["completed"] == 2
+    assert stats["max_queue_ms"] >= 40
+
+
+@pytest.mark.asyncio
+async def test_run_in_workload_falls_back_to_default_executor():
+    shutdown_workload_executors()
+
+    assert get_workload_executor(Workload.STORAGE) is None
+    assert await run_in_workload(Workload.STORAGE, sum, [1, 2, 3]) == 6
+
+
+async def test_ordered_writer_keeps_submission_order_on_a_multi_thread_pool(executors):
+    written = []
+
+    def write(item):
+        # Early items are slowest: independent pool calls would finish reversed.
+        time.sleep(0.01 * (5 - item))
+        written.append(item)
+
+    writer = OrderedWorkloadWriter(Workload.MISC, write)
+    for item in range(5):
+        assert writer.submit(item)
+    await writer.close()
+
+    assert written == [0, 1, 2, 3, 4]
+    assert writer.stats()["written"] == 5
+    assert not writer.submit(5)
+
+
+async def test_ordered_writer_drops_new_items_when_full(executors):
+    gate = threading.Event()
+    written = []
+
+    def write(item):
+        gate.wait(1)
+        written.append(item)
+
+    writer = OrderedWorkloadWriter(Workload.MISC, write, maxsize=2)
+    results = [writer.submit(item) for item in range(4)]
+    gate.set()
+    await writer.close()
+
+    assert results == [True, True, False, False]
+    assert written == [0, 1]
+    assert writer.stats()["dropped"] == 2
+
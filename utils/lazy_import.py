@@ -0,0 +1,44 @@
+"""
+Deferred imports for heavy optional modules.
+
+``lazy_import("azure.cognitiveservices.speech")`` returns a module object
+whose body only executes on first attribute access, so importing a module
+that references the Speech SDK no longer pays the SDK's native-library load
+at process start. It uses :class:`importlib.util.LazyLoader` and registers
+the module in ``sys.modules``, so later ordinary imports of the same name
+get the same (lazy) module.
+
+Annotations that reference a lazy module must not be evaluated at definition
+time; modules using this helper need ``from __future__ import annotations``
+and must not use lazy attributes in default argument values.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Return ``name`` as a module that is loaded on first attribute access.
+
+    Already-imported modules are returned unchanged.
+
+    :raises ModuleNotFoundError: If ``name`` cannot be found. The lookup
+        happens eagerly so missing dependencies still fail at import time.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
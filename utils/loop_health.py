@@ -0,0 +1,290 @@
+"""
+Event-loop health monitoring.
+
+Samples event-loop lag, detects callbacks that block the loop past a
+threshold (capturing the loop thread's stack while it is still blocked),
+and reports active/queued work for registered thread-pool executors.
+
+Measurements are exposed two ways:
+
+- OpenTelemetry metrics (lag histogram, slow-callback counter and executor
+  gauges) via the globally configured meter provider.
+- :meth:`EventLoopHealthMonitor.snapshot` for the ``/api/v1/health/loop``
+  endpoint.
+
+When the monitor is disabled no task or thread is started; ``snapshot``
+still reports executor occupancy on demand because that is read lazily.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from opentelemetry import metrics
+
+from utils.ml_logging import get_logger
+
+logger = get_logger("utils.loop_health")
+
+ExecutorProvider = Callable[[], Optional[Executor]]
+
+
+def executor_stats(executor: Optional[Executor]) -> Optional[Dict[str, int]]:
+    """
+    Return occupancy for a ``ThreadPoolExecutor``.
+
+    ``active`` is derived from the executor's idle-thread semaphore and is
+    approximate; ``queued`` is the number of submitted items not yet picked up.
+    """
+    if not isinstance(executor, ThreadPoolExecutor):
+        return None
+
+    threads = len(getattr(executor, "_threads", ()) or ())
+    idle_semaphore = getattr(executor, "_idle_semaphore", None)
+    idle = getattr(idle_semaphore, "_value", 0) if idle_semaphore else 0
+    work_queue = getattr(executor, "_work_queue", None)
+    return {
+        "max_workers": getattr(executor, "_max_workers", 0),
+        "threads": threads,
+        "active": max(threads - idle, 0),
+        "queued": work_queue.qsize() if work_queue is not None else 0,
+    }
+
+
+class EventLoopHealthMonitor:
+    """Low-overhead lag sampler, stall watchdog and executor reporter."""
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = True,
+        interval_ms: int = 250,
+        slow_callback_ms: int = 100,
+        window: int = 240,
+        max_stack_samples: int = 20,
+        stack_limit: int = 25,
+    ) -> None:
+        self.enabled = enabled
+        self.interval_s = max(interval_ms, 10) / 1000
+        self.slow_callback_s = max(slow_callback_ms, 10) / 1000
+        self.stack_limit = stack_limit
+
+        self._lags_ms: Deque[float] = deque(maxlen=window)
+        self._max_lag_ms = 0.0
+        self._slow_callbacks = 0
+        self._stalls: Deque[Dict[str, Any]] = deque(maxlen=max_stack_samples)
+        self._executors: Dict[str, ExecutorProvider] = {}
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._sampler_task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._started_at: Optional[float] = None
+
+        self._instruments_ready = False
+        self._lag_histogram = None
+        self._slow_counter = None
+
+    # ------------------------------------------------------------------ #
+    # Registration / lifecycle
+    # ------------------------------------------------------------------ #
+    def register_executor(self, name: str, provider: ExecutorProvider) -> None:
+        """Track an executor; ``provider`` is resolved on every read."""
+        self._executors[name] = provider
+
+    def register_default_executor(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Track the loop's default executor (created lazily by asyncio)."""
+        self.register_executor("default", lambda: getattr(loop, "_default_executor", None))
+
+    async def start(self) -> None:
+        """Start sampling on the running loop (no-op when disabled)."""
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        if "default" not in self._executors:
+            self.register_default_executor(self._loop)
+        self._setup_instruments()
+
+        if not self.enabled:
+            logger.info("event loop monitor disabled")
+            return
+
+        self._stop.clear()
+        self._started_at = time.time()
+        self._sampler_task = asyncio.create_task(
+            self._sample_lag(), name="event-loop-lag-sampler"
+        )
+        self._watchdog = threading.Thread(
+            target=self._watch_for_stalls, name="event-loop-watchdog", daemon=True
+        )
+        self._watchdog.start()
+        logger.info(
+            "event loop monitor started",
+            extra={
+                "interval_ms": round(self.interval_s * 1000),
+                "slow_callback_ms": round(self.slow_callback_s * 1000),
+            },
+        )
+
+    async def stop(self) -> None:
+        """Stop the sampler task and watchdog thread."""
+        self._stop.set()
+        if self._sampler_task and not self._sampler_task.done():
+            self._sampler_task.cancel()
+            try:
+                await self._sampler_task
+            except asyncio.CancelledError:
+                pass
+        self._sampler_task = None
+        if self._watchdog and self._watchdog.is_alive():
+            await asyncio.to_thread(self._watchdog.join, self.slow_callback_s * 2)
+        self._watchdog = None
+
+    # ------------------------------------------------------------------ #
+    # Reporting
+    # ------------------------------------------------------------------ #
+    def executor_snapshot(self) -> Dict[str, Optional[Dict[str, int]]]:
+        snapshot: Dict[str, Optional[Dict[str, int]]] = {}
+        for name, provider in self._executors.items():
+            try:
+                snapshot[name] = executor_stats(provider())
+            except Exception:  # pragma: no cover - provider errors are non-fatal
+                snapshot[name] = None
+        return snapshot
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a JSON-serialisable health summary."""
+        lags = sorted(self._lags_ms)
+        lag_summary: Dict[str, Any] = {"samples": len(lags)}
+        if lags:
+            lag_summary.update(
+                {
+                    "last_ms": round(self._lags_ms[-1], 2),
+                    "avg_ms": round(sum(lags) / len(lags), 2),
+                    "p95_ms": round(lags[min(int(len(lags) * 0.95), len(lags) - 1)], 2),
+                    "max_ms": round(self._max_lag_ms, 2),
+                }
+            )
+
+        return {
+            "enabled": self.enabled,
+            "running": bool(self._sampler_task and not self._sampler_task.done()),
+            "started_at": self._started_at,
+            "interval_ms": round(self.interval_s * 1000),
+            "slow_callback_threshold_ms": round(self.slow_callback_s * 1000),
+            "lag": lag_summary,
+            "slow_callbacks": self._slow_callbacks,
+            "recent_stalls": list(self._stalls),
+            "executors": self.executor_snapshot(),
+        }
+
+    # ------------------------------------------------------------------ #
+    # Sampling internals
+    # ------------------------------------------------------------------ #
+    async def _sample_lag(self) -> None:
+        loop = asyncio.get_running_loop()
+        while not self._stop.is_set():
+            scheduled = loop.time()
+            await asyncio.sleep(self.interval_s)
+            lag_ms = max((loop.time() - scheduled - self.interval_s) * 1000, 0.0)
+            self._lags_ms.append(lag_ms)
+            if lag_ms > self._max_lag_ms:
+                self._max_lag_ms = lag_ms
+            if self._lag_histogram is not None:
+                self._lag_histogram.record(lag_ms)
+
+    def _watch_for_stalls(self) -> None:
+        """
+        Post a no-op into the loop and wait for it to run.
+
+        If it does not run within the slow-callback threshold the loop is
+        blocked by whatever is currently executing on its thread, so that
+        thread's stack is captured before the callback returns.
+        """
+        loop = self._loop
+        while not self._stop.is_set() and loop is not None and not loop.is_closed():
+            ran = threading.Event()
+            posted_at = time.perf_counter()
+            try:
+                loop.call_soon_threadsafe(ran.set)
+            except RuntimeError:
+                return  # loop closed
+
+            if not ran.wait(self.slow_callback_s):
+                stack = self._capture_loop_stack()
+                while not ran.wait(0.05):
+                    if self._stop.is_set() or loop.is_closed():
+                        return
+                duration_ms = (time.perf_counter() - posted_at) * 1000
+                self._record_stall(duration_ms, stack)
+
+            self._stop.wait(self.slow_callback_s)
+
+    def _capture_loop_stack(self) -> List[str]:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return []
+        return [line.rstrip() for line in traceback.format_stack(frame, limit=self.stack_limit)]
+
+    def _record_stall(self, duration_ms: float, stack: List[str]) -> None:
+        self._slow_callbacks += 1
+        self._stalls.append(
+            {"timestamp": time.time(), "duration_ms": round(duration_ms, 2), "stack": stack}
+        )
+        if self._slow_counter is not None:
+            self._slow_counter.add(1)
+        logger.warning(
+            "event loop blocked for %.1f ms",
+            duration_ms,
+            extra={"blocked_ms": round(duration_ms, 2), "stack_top": stack[-1] if stack else None},
+        )
+
+    # ------------------------------------------------------------------ #
+    # OpenTelemetry
+    # ------------------------------------------------------------------ #
+    def _setup_instruments(self) -> None:
+        if self._instruments_ready:
+            return
+        self._instruments_ready = True
+        try:
+            meter = metrics.get_meter("rtagent.loop_health")
+            self._lag_histogram = meter.create_histogram(
+                "rtagent.event_loop.lag",
+                unit="ms",
+                description="Delay between scheduled and actual event-loop wake-up",
+            )
+            self._slow_counter = meter.create_counter(
+                "rtagent.event_loop.slow_callbacks",
+                description="Callbacks that blocked the event loop past the threshold",
+            )
+            meter.create_observable_gauge(
+                "rtagent.executor.active",
+                callbacks=[self._observe_executor("active")],
+                description="Approximate busy worker threads per executor",
+            )
+            meter.create_observable_gauge(
+                "rtagent.executor.queued",
+                callbacks=[self._observe_executor("queued")],
+                description="Work items waiting for a worker thread per executor",
+            )
+        except Exception as exc:  # pragma: no cover - telemetry must never break startup
+            logger.warning("event loop metrics unavailable: %s", exc)
+
+    def _observe_executor(self, field_name: str):
+        def _callback(_options):
+            observations = []
+            for name, stats in self.executor_snapshot().items():
+                if stats is not None:
+                    observations.append(
+                        metrics.Observation(stats[field_name], {"executor": name})
+                    )
+            return observations
+
+        return _callback
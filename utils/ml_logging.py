@@ -1,9 +1,14 @@
+import atexit
 import functools
 import json
 import logging
+import logging.handlers
 import os
+import queue
+import random
+import threading
 import time
-from typing import Callable, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from colorama import Fore, Style
 from colorama import init as colorama_init
@@ -21,6 +26,7 @@ except Exception:
 _telemetry_disabled = os.getenv("DISABLE_CLOUD_TELEMETRY", "false").lower() == "true"
 
 if not _telemetry_disabled:
+    from opentelemetry import context as otel_context
     from opentelemetry import trace
     from opentelemetry.sdk._logs import LoggingHandler
     from utils.telemetry_config import (
@@ -29,6 +35,7 @@ if not _telemetry_disabled:
     )
 else:
     # Mock objects when telemetry is disabled
+    otel_context = None
     trace = None
     LoggingHandler = None
     setup_azure_monitor = lambda *args, **kwargs: None
@@ -36,6 +43,14 @@ else:
 
 colorama_init(autoreset=True)
 
+# "sync" formats and writes on the calling thread; "queue" hands records to a
+# background listener thread (see get_logger).
+LOG_PIPELINE = os.getenv("LOG_PIPELINE", "sync").lower()
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+# Per-logger hot-path throttling, e.g. "v1.realtime=50,tts=20:0.25"
+# (records/second, optional ":sample_rate").
+LOG_RATE_LIMITS = os.getenv("LOG_RATE_LIMITS", "")
+
 # Define a new logging level named "KEYINFO" with a level of 25
 KEYINFO_LEVEL_NUM = 25
 logging.addLevelName(KEYINFO_LEVEL_NUM, "KEYINFO")
@@ -50,6 +65,15 @@ logging.Logger.keyinfo = keyinfo
 
 
 class JsonFormatter(logging.Formatter):
+    # Custom span attributes copied onto records by TraceLogFilter
+    EXTRA_PREFIXES: Tuple[str, ...] = (
+        "call_",
+        "session_",
+        "agent_",
+        "model_",
+        "operation_",
+    )
+
     def format(self, record: logging.LogRecord) -> str:
         record.funcName = getattr(record, "func_name_override", record.funcName)
         record.filename = getattr(record, "file_name_override", record.filename)
@@ -75,14 +99,14 @@ class JsonFormatter(logging.Formatter):
             "line": record.lineno,
         }
 
-        # Add any custom span attributes as additional fields
-        for attr_name in dir(record):
-            if attr_name.startswith(
-                ("call_", "session_", "agent_", "model_", "operation_")
-            ):
-                log_record[attr_name] = getattr(record, attr_name)
+        # Add any custom span attributes as additional fields. Only instance
+        # attributes can match, so scan the record dict rather than dir().
+        prefixes = self.EXTRA_PREFIXES
+        for attr_name, value in record.__dict__.items():
+            if attr_name.startswith(prefixes):
+                log_record[attr_name] = value
 
-        return json.dumps(log_record)
+        return json.dumps(log_record, default=str)
 
 
 class PrettyFormatter(logging.Formatter):
@@ -108,16 +132,30 @@ class PrettyFormatter(logging.Formatter):
 class TraceLogFilter(logging.Filter):
     def filter(self, record):
         if _telemetry_disabled or trace is None:
-            # Set default values when telemetry is disabled
+            self.apply(record, None)
+            return True
+        self.apply(record, trace.get_current_span())
+        return True
+
+    @staticmethod
+    def apply(
+        record: logging.LogRecord, span: Any, recording: Optional[bool] = None
+    ) -> None:
+        """
+        Copy trace ids and correlation attributes from ``span`` onto ``record``.
+
+        ``recording`` overrides ``span.is_recording()`` for spans captured
+        earlier on another thread that may have ended since.
+        """
+        if span is None:
             record.trace_id = "-"
             record.span_id = "-"
             record.session_id = "-"
             record.call_connection_id = "-"
             record.operation_name = "-"
             record.component = "-"
-            return True
+            return
 
-        span = trace.get_current_span()
         context = span.get_span_context() if span else None
         record.trace_id = (
             f"{context.trace_id:032x}" if context and context.trace_id else "-"
@@ -127,7 +165,9 @@ class TraceLogFilter(logging.Filter):
         )
 
         # Extract span attributes for correlation - these become customDimensions in App Insights
-        if span and span.is_recording():
+        if recording is None:
+            recording = bool(span and span.is_recording())
+        if recording:
             # Get span attributes that were set via TraceContext or manually
             span_attributes = getattr(span, "_attributes", {})
 
@@ -157,9 +197,223 @@ class TraceLogFilter(logging.Filter):
             record.operation_name = "-"
             record.component = "-"
 
+
+class HotPathFilter(logging.Filter):
+    """
+    Per-logger rate limit (token bucket) and sampling for chatty records.
+
+    Only records at ``max_level`` and below are throttled; warnings and errors
+    always pass. Dropped records are counted and reported by
+    :func:`logging_stats`.
+    """
+
+    def __init__(
+        self,
+        rate_per_sec: Optional[float] = None,
+        sample_rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        max_level: int = logging.INFO,
+    ):
+        super().__init__()
+        self.rate_per_sec = rate_per_sec if rate_per_sec and rate_per_sec > 0 else None
+        self.sample_rate = 1.0 if sample_rate is None else min(max(sample_rate, 0.0), 1.0)
+        self.burst = burst or (self.rate_per_sec or 1.0)
+        self.max_level = max_level
+        self.dropped = 0
+        self._tokens = self.burst
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level:
+            return True
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            self.dropped += 1
+            return False
+        if self.rate_per_sec is None:
+            return True
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._last) * self.rate_per_sec
+            )
+            self._last = now
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return True
+            self.dropped += 1
+            return False
+
+
+class _SpanCaptureFilter(logging.Filter):
+    """
+    Caller-side half of TraceLogFilter for the queue pipeline.
+
+    Only a reference to the active span is stored here. Attribute extraction
+    runs on the listener thread.
+    """
+
+    def filter(self, record):
+        if trace is not None:
+            span = trace.get_current_span()
+            if span.get_span_context().is_valid:
+                record._otel_span = span
+                record._otel_recording = span.is_recording()
         return True
 
 
+class _FastQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that defers formatting and drops records when the queue is full."""
+
+    def __init__(self, log_queue: queue.Queue, *, console: bool = True):
+        super().__init__(log_queue)
+        self.console = console
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Resolve %-args now (they may be mutated later) but leave JSON or
+        # colour formatting to the listener thread. exc_info stays on the
+        # record so the Azure handler can still report exceptions.
+        record.msg = record.getMessage()
+        record.args = None
+        if not self.console:
+            record._skip_console = True
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def _console_filter(record: logging.LogRecord) -> bool:
+    """Keep records from telemetry-only loggers off the pipeline's console handler."""
+    return not record.__dict__.get("_skip_console", False)
+
+
+class _PipelineListener(logging.handlers.QueueListener):
+    """Enriches records with span data and re-enters the span for OTel handlers."""
+
+    def handle(self, record: logging.LogRecord) -> None:
+        span = record.__dict__.pop("_otel_span", None)
+        recording = record.__dict__.pop("_otel_recording", None)
+        TraceLogFilter.apply(record, span, recording)
+        token = None
+        if span is not None and otel_context is not None:
+            token = otel_context.attach(trace.set_span_in_context(span))
+        try:
+            super().handle(record)
+        finally:
+            if token is not None:
+                otel_context.detach(token)
+
+
+_pipeline_lock = threading.Lock()
+_pipeline: Optional[Tuple[_FastQueueHandler, _PipelineListener]] = None
+# Same queue, for loggers created with include_stream_handler=False: their
+# records reach Azure Monitor through the listener but not the console.
+_telemetry_only_handler: Optional[_FastQueueHandler] = None
+_hot_path_filters: Dict[str, HotPathFilter] = {}
+
+
+def _parse_rate_limits(raw: str) -> Dict[str, Tuple[float, Optional[float]]]:
+    limits: Dict[str, Tuple[float, Optional[float]]] = {}
+    for item in filter(None, (part.strip() for part in raw.split(","))):
+        try:
+            name, spec = item.split("=", 1)
+            rate, _, sample = spec.partition(":")
+            limits[name.strip()] = (float(rate), float(sample) if sample else None)
+        except ValueError:
+            continue
+    return limits
+
+
+_env_rate_limits = _parse_rate_limits(LOG_RATE_LIMITS)
+
+
+def _azure_logging_available() -> bool:
+    return (
+        not _telemetry_disabled
+        and LoggingHandler is not None
+        and is_azure_monitor_configured()
+    )
+
+
+def _get_pipeline(is_production: bool) -> Tuple[_FastQueueHandler, _PipelineListener]:
+    """Create (once) the shared queue handler and its background listener."""
+    global _pipeline, _telemetry_only_handler
+    with _pipeline_lock:
+        if _pipeline is None:
+            log_queue: queue.Queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+            stream = logging.StreamHandler()
+            stream.setFormatter(JsonFormatter() if is_production else PrettyFormatter())
+            stream.addFilter(_console_filter)
+            listener = _PipelineListener(log_queue, stream, respect_handler_level=True)
+            listener.start()
+            atexit.register(shutdown_logging)
+            _pipeline = (_FastQueueHandler(log_queue), listener)
+            _telemetry_only_handler = _FastQueueHandler(log_queue, console=False)
+
+        handler, listener = _pipeline
+        has_azure_handler = LoggingHandler is not None and any(
+            isinstance(h, LoggingHandler) for h in listener.handlers
+        )
+        if not has_azure_handler and _azure_logging_available():
+            try:
+                listener.handlers = listener.handlers + (
+                    LoggingHandler(level=logging.INFO),
+                )
+            except Exception:
+                pass
+        return _pipeline
+
+
+def shutdown_logging() -> None:
+    """Flush and stop the queue pipeline listener (safe to call repeatedly)."""
+    global _pipeline, _telemetry_only_handler
+    with _pipeline_lock:
+        pipeline, _pipeline = _pipeline, None
+        _telemetry_only_handler = None
+    if pipeline is not None:
+        try:
+            pipeline[1].stop()
+        except Exception:
+            pass
+
+
+def configure_hot_path(
+    name: str,
+    rate_limit_per_sec: Optional[float] = None,
+    sample_rate: Optional[float] = None,
+) -> HotPathFilter:
+    """Install (or replace) rate limiting/sampling on logger ``name``."""
+    logger = logging.getLogger(name)
+    previous = _hot_path_filters.pop(name, None)
+    if previous is not None:
+        logger.removeFilter(previous)
+    hot_path = HotPathFilter(rate_per_sec=rate_limit_per_sec, sample_rate=sample_rate)
+    # Run first so throttled records skip span lookups entirely.
+    logger.filters.insert(0, hot_path)
+    _hot_path_filters[name] = hot_path
+    return hot_path
+
+
+def logging_stats() -> Dict[str, Any]:
+    """Pipeline queue depth and drop counters for diagnostics."""
+    pipeline = _pipeline
+    telemetry_only = _telemetry_only_handler
+    dropped = pipeline[0].dropped if pipeline else 0
+    if telemetry_only is not None:
+        dropped += telemetry_only.dropped
+    return {
+        "pipeline": "queue" if pipeline else "sync",
+        "queued": pipeline[0].queue.qsize() if pipeline else 0,
+        "dropped_queue_full": dropped,
+        "rate_limited": {name: f.dropped for name, f in _hot_path_filters.items()},
+    }
+
+
 def set_span_correlation_attributes(
     call_connection_id: Optional[str] = None,
     session_id: Optional[str] = None,
@@ -248,24 +502,56 @@ def get_logger(
     name: str = "micro",
     level: Optional[int] = None,
     include_stream_handler: bool = True,
+    *,
+    pipeline: Optional[str] = None,
+    rate_limit_per_sec: Optional[float] = None,
+    sample_rate: Optional[float] = None,
 ) -> logging.Logger:
+    """
+    Return a configured logger.
+
+    ``pipeline="queue"`` (default from ``LOG_PIPELINE``) enqueues records for
+    a shared background listener thread. That thread does span enrichment,
+    formatting and I/O for both the console and Azure Monitor, so the caller
+    only pays for a span lookup and a queue put. With
+    ``include_stream_handler=False`` records still go through the queue to
+    Azure Monitor (when configured) but skip the console.
+
+    ``rate_limit_per_sec`` / ``sample_rate`` (or a ``LOG_RATE_LIMITS`` entry
+    for ``name``) throttle INFO-and-below records on hot paths.
+    """
     logger = logging.getLogger(name)
 
     if level is not None or logger.level == 0:
         logger.setLevel(level or logging.INFO)
 
+    if rate_limit_per_sec is None and sample_rate is None and name in _env_rate_limits:
+        rate_limit_per_sec, sample_rate = _env_rate_limits[name]
+    if rate_limit_per_sec is not None or sample_rate is not None:
+        configure_hot_path(name, rate_limit_per_sec, sample_rate)
+
     is_production = os.environ.get("ENV", "dev").lower() == "prod"
 
+    if (pipeline or LOG_PIPELINE) == "queue":
+        queue_handler, _ = _get_pipeline(is_production)
+        if not any(isinstance(f, _SpanCaptureFilter) for f in logger.filters):
+            logger.addFilter(_SpanCaptureFilter())
+        if include_stream_handler:
+            if queue_handler not in logger.handlers:
+                logger.addHandler(queue_handler)
+        elif (
+            _azure_logging_available()
+            and _telemetry_only_handler is not None
+            and _telemetry_only_handler not in logger.handlers
+        ):
+            logger.addHandler(_telemetry_only_handler)
+        return logger
+
     # Ensure Azure Monitor LoggingHandler is attached if not already present
     has_azure_handler = LoggingHandler is not None and any(
         isinstance(h, LoggingHandler) for h in logger.handlers
     )
-    should_attach_azure_handler = (
-        not has_azure_handler
-        and not _telemetry_disabled
-        and LoggingHandler is not None
-        and is_azure_monitor_configured()
-    )
+    should_attach_azure_handler = not has_azure_handler and _azure_logging_available()
 
     if should_attach_azure_handler:
         try:
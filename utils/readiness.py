@@ -0,0 +1,218 @@
+"""
+Background dependency prober.
+
+Readiness probes from orchestrators arrive on every replica every few
+seconds. Running each dependency check inline would put that load on
+Redis, ACS and friends. A probe could also take several seconds when a
+dependency is slow. :class:`ReadinessProber` instead refreshes every
+registered component on its own schedule and keeps the latest result in
+memory, so the readiness endpoint only reads a snapshot.
+
+Scheduling per component:
+
+- healthy results are refreshed every ``interval_s`` with +/- ``jitter``
+  (fraction of the interval) so replicas do not probe in lockstep;
+- consecutive failures back off exponentially, capped at ``max_backoff_s``;
+- each check is bounded by ``timeout_s``; a timeout counts as a failure.
+
+Each :class:`ProbeResult` records when it was taken, so callers can report
+staleness per component. A result is stale once its next scheduled probe is
+overdue by more than one interval, which means the probe loop is stuck.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from utils.ml_logging import get_logger
+
+logger = get_logger("utils.readiness")
+
+CheckFn = Callable[[], Awaitable[Any]]
+
+
+@dataclass
+class ProbeResult:
+    """Latest outcome of one component check."""
+
+    value: Any = None
+    healthy: bool = False
+    error: Optional[str] = None
+    checked_at: Optional[float] = None  # time.monotonic()
+    duration_ms: float = 0.0
+    consecutive_failures: int = 0
+    next_probe_in_s: float = 0.0
+
+    def age_s(self, now: Optional[float] = None) -> Optional[float]:
+        if self.checked_at is None:
+            return None
+        return (now if now is not None else time.monotonic()) - self.checked_at
+
+
+@dataclass
+class _Component:
+    name: str
+    check: CheckFn
+    is_healthy: Callable[[Any], bool]
+    interval_s: float
+    timeout_s: float
+    result: ProbeResult
+    task: Optional[asyncio.Task] = None
+    refresh: Optional[asyncio.Event] = None
+
+
+def _status_is_healthy(value: Any) -> bool:
+    return getattr(value, "status", None) == "healthy"
+
+
+class ReadinessProber:
+    """Refreshes component checks in the background and caches the results."""
+
+    def __init__(
+        self,
+        *,
+        interval_s: float = 10.0,
+        timeout_s: float = 1.0,
+        max_backoff_s: float = 120.0,
+        jitter: float = 0.1,
+    ) -> None:
+        self.interval_s = interval_s
+        self.timeout_s = timeout_s
+        self.max_backoff_s = max_backoff_s
+        self.jitter = jitter
+        self._components: Dict[str, _Component] = {}
+        self._running = False
+
+    def register(
+        self,
+        name: str,
+        check: CheckFn,
+        *,
+        interval_s: Optional[float] = None,
+        timeout_s: Optional[float] = None,
+        is_healthy: Callable[[Any], bool] = _status_is_healthy,
+    ) -> None:
+        """Add a component. ``is_healthy`` classifies the check's return value."""
+        if name in self._components:
+            raise ValueError(f"component already registered: {name}")
+        component = _Component(
+            name=name,
+            check=check,
+            is_healthy=is_healthy,
+            interval_s=interval_s or self.interval_s,
+            timeout_s=timeout_s or self.timeout_s,
+            result=ProbeResult(),
+        )
+        self._components[name] = component
+        if self._running:
+            self._spawn(component)
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    async def start(self) -> None:
+        """Run one probe of every component, then keep refreshing in the background."""
+        if self._running:
+            return
+        self._running = True
+        await asyncio.gather(*(self._probe(c) for c in self._components.values()))
+        for component in self._components.values():
+            self._spawn(component)
+
+    async def stop(self) -> None:
+        self._running = False
+        tasks = [c.task for c in self._components.values() if c.task is not None]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        for component in self._components.values():
+            component.task = None
+
+    def snapshot(self) -> Dict[str, ProbeResult]:
+        """Latest result per component (no I/O)."""
+        return {name: c.result for name, c in self._components.items()}
+
+    def is_stale(self, name: str, now: Optional[float] = None) -> bool:
+        """True if ``name`` has never been probed or its next probe is overdue."""
+        component = self._components[name]
+        age = component.result.age_s(now)
+        if age is None:
+            return True
+        limit = (
+            component.result.next_probe_in_s + component.timeout_s + component.interval_s
+        )
+        return age > limit
+
+    def request_refresh(self, name: Optional[str] = None) -> None:
+        """Wake the loop for ``name`` (or every component) ahead of schedule."""
+        for component in self._components.values():
+            if name in (None, component.name) and component.refresh is not None:
+                component.refresh.set()
+
+    def next_delay(self, component_name: str) -> float:
+        """Seconds until the next probe of ``component_name``, including jitter."""
+        component = self._components[component_name]
+        failures = component.result.consecutive_failures
+        base = component.interval_s
+        if failures:
+            base = min(base * (2 ** failures), max(self.max_backoff_s, component.interval_s))
+        spread = base * self.jitter
+        return max(0.0, base + random.uniform(-spread, spread))
+
+    def _spawn(self, component: _Component) -> None:
+        component.refresh = asyncio.Event()
+        component.task = asyncio.create_task(
+            self._loop(component), name=f"readiness-probe-{component.name}"
+        )
+
+    async def _loop(self, component: _Component) -> None:
+        while self._running:
+            delay = self.next_delay(component.name)
+            component.result.next_probe_in_s = round(delay, 3)
+            try:
+                await asyncio.wait_for(component.refresh.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+            component.refresh.clear()
+            await self._probe(component)
+
+    async def _probe(self, component: _Component) -> None:
+        started = time.monotonic()
+        previous = component.result
+        try:
+            value = await asyncio.wait_for(component.check(), timeout=component.timeout_s)
+            healthy = bool(component.is_healthy(value))
+            error = None if healthy else getattr(value, "error", None) or "unhealthy"
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            value, healthy = None, False
+            error = f"check timed out after {component.timeout_s:.2f}s"
+        except Exception as exc:
+            value, healthy = None, False
+            error = str(exc) or type(exc).__name__
+
+        finished = time.monotonic()
+        failures = 0 if healthy else previous.consecutive_failures + 1
+        component.result = ProbeResult(
+            value=value,
+            healthy=healthy,
+            error=error,
+            checked_at=finished,
+            duration_ms=round((finished - started) * 1000, 2),
+            consecutive_failures=failures,
+        )
+        if healthy != previous.healthy or previous.checked_at is None:
+            log = logger.info if healthy else logger.warning
+            log(
+                "readiness component %s is %s",
+                component.name,
+                "healthy" if healthy else "unhealthy",
+                extra={"component": component.name, "error": error},
+            )
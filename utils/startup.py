@@ -0,0 +1,262 @@
+"""
+Application startup orchestration and profiling.
+
+:class:`StartupGraph` runs lifecycle steps that declare their dependencies.
+A step starts as soon as everything it depends on has finished, so
+independent network handshakes (Redis, Cosmos DB, ACS, Azure OpenAI auth)
+overlap instead of running back to back. Shutdown runs in reverse completion
+order, which always stops a step before the steps it depends on.
+
+:class:`ImportProfiler` attributes module import time to top-level packages
+(self time, excluding nested imports of other packages) so the startup
+dashboard can show where cold-start time goes before the lifespan begins.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import builtins
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from opentelemetry import trace
+from opentelemetry.trace import Status, StatusCode
+
+from utils.ml_logging import get_logger
+
+logger = get_logger("utils.startup")
+
+StepCallable = Callable[[], Awaitable[None]]
+
+
+# --------------------------------------------------------------------------- #
+#  Import profiling
+# --------------------------------------------------------------------------- #
+class ImportProfiler:
+    """Accumulates import self time per top-level package.
+
+    Installed by wrapping :func:`builtins.__import__`; only imports of modules
+    not yet in ``sys.modules`` are timed, so already-loaded imports add a
+    single dictionary lookup.
+    """
+
+    def __init__(self) -> None:
+        self.totals: Dict[str, float] = {}
+        self._local = threading.local()
+        self._previous: Callable[..., Any] = builtins.__import__
+        self._active = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def install(cls) -> "ImportProfiler":
+        profiler = cls()
+        profiler.start()
+        return profiler
+
+    def start(self) -> None:
+        if self._active:
+            return
+        self._previous = builtins.__import__
+        builtins.__import__ = self._import
+        self._active = True
+
+    def stop(self) -> None:
+        if not self._active:
+            return
+        self._active = False
+        # If something wrapped __import__ after us, stay in its chain as a
+        # pass-through rather than dropping its wrapper.
+        if builtins.__import__ == self._import:
+            builtins.__import__ = self._previous
+
+    def top(self, limit: int = 10) -> List[Tuple[str, float]]:
+        """Return the ``limit`` packages with the highest import time (sec)."""
+        with self._lock:
+            ranked = sorted(self.totals.items(), key=lambda item: item[1], reverse=True)
+        return ranked[:limit]
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original = self._previous
+        if not self._active or (level == 0 and name in sys.modules):
+            return original(name, globals, locals, fromlist, level)
+
+        root = self._root(name, globals, level)
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        frame = [root, time.perf_counter(), 0.0]
+        stack.append(frame)
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            stack.pop()
+            elapsed = time.perf_counter() - frame[1]
+            self_time = elapsed - frame[2]
+            if stack:
+                stack[-1][2] += elapsed
+            if self_time > 0:
+                with self._lock:
+                    self.totals[root] = self.totals.get(root, 0.0) + self_time
+
+    @staticmethod
+    def _root(name: str, globals: Optional[dict], level: int) -> str:
+        if level and globals:
+            package = globals.get("__package__") or globals.get("__name__") or ""
+            return package.partition(".")[0] or name
+        return name.partition(".")[0]
+
+
+# --------------------------------------------------------------------------- #
+#  Dependency-ordered lifecycle
+# --------------------------------------------------------------------------- #
+@dataclass
+class StartupStep:
+    name: str
+    start: StepCallable
+    shutdown: Optional[StepCallable] = None
+    depends_on: Tuple[str, ...] = ()
+    started_at: float = 0.0
+    duration: float = 0.0
+    done: bool = field(default=False, repr=False)
+
+
+class StartupGraph:
+    """Runs startup steps concurrently, respecting declared dependencies."""
+
+    def __init__(self, tracer: Optional[trace.Tracer] = None) -> None:
+        self._tracer = tracer or trace.get_tracer(__name__)
+        self._steps: Dict[str, StartupStep] = {}
+        self.executed: List[StartupStep] = []
+        self.began_at: float = 0.0
+        self.wall_time: float = 0.0
+
+    def add(
+        self,
+        name: str,
+        start: StepCallable,
+        shutdown: Optional[StepCallable] = None,
+        *,
+        depends_on: Iterable[str] = (),
+    ) -> None:
+        if name in self._steps:
+            raise ValueError(f"duplicate startup step: {name}")
+        self._steps[name] = StartupStep(name, start, shutdown, tuple(depends_on))
+
+    @property
+    def results(self) -> List[Tuple[str, float]]:
+        """``(name, seconds)`` per executed step, in completion order."""
+        return [(step.name, round(step.duration, 2)) for step in self.executed]
+
+    def validate(self) -> None:
+        """Reject unknown dependencies and cycles before anything runs."""
+        for step in self._steps.values():
+            missing = [dep for dep in step.depends_on if dep not in self._steps]
+            if missing:
+                raise ValueError(f"step {step.name} depends on unknown {missing}")
+
+        visiting, visited = set(), set()
+
+        def visit(name: str, path: Tuple[str, ...]) -> None:
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"startup dependency cycle: {' -> '.join(path + (name,))}")
+            visiting.add(name)
+            for dep in self._steps[name].depends_on:
+                visit(dep, path + (name,))
+            visiting.discard(name)
+            visited.add(name)
+
+        for name in self._steps:
+            visit(name, ())
+
+    async def start(self, phase: str = "startup") -> None:
+        """Run every step; on the first failure cancel the rest and re-raise.
+
+        Steps that completed before the failure stay in :attr:`executed` so
+        :meth:`shutdown` can release them.
+        """
+        self.validate()
+        self.began_at = time.perf_counter()
+        pending = dict(self._steps)
+        running: Dict[asyncio.Task, StartupStep] = {}
+        try:
+            while pending or running:
+                for name, step in list(pending.items()):
+                    if all(self._steps[dep].done for dep in step.depends_on):
+                        del pending[name]
+                        task = asyncio.create_task(self._run(step, phase), name=f"{phase}.{name}")
+                        running[task] = step
+                finished, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                failure: Optional[BaseException] = None
+                for task in finished:
+                    step = running.pop(task)
+                    error = task.exception()
+                    if error is not None:
+                        failure = failure or error
+                        continue
+                    step.done = True
+                    self.executed.append(step)
+                if failure is not None:
+                    raise failure
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+            self.wall_time = time.perf_counter() - self.began_at
+
+    async def shutdown(self, phase: str = "shutdown") -> None:
+        """Run shutdown callbacks in reverse completion order; errors are logged."""
+        for step in reversed(self.executed):
+            if step.shutdown is None:
+                continue
+            with self._tracer.start_as_current_span(f"{phase}.{step.name}") as span:
+                began = time.perf_counter()
+                logger.info(f"{phase} stage started", extra={"stage": step.name})
+                try:
+                    await step.shutdown()
+                except Exception as exc:  # pragma: no cover - defensive path
+                    span.record_exception(exc)
+                    span.set_status(Status(StatusCode.ERROR, str(exc)))
+                    logger.error(f"{phase} stage failed", extra={"stage": step.name, "error": str(exc)})
+                    continue
+                duration = time.perf_counter() - began
+                span.set_attribute("duration_sec", duration)
+                logger.info(
+                    f"{phase} stage completed",
+                    extra={"stage": step.name, "duration_sec": round(duration, 2)},
+                )
+
+    def profile_lines(self) -> List[str]:
+        """Per-step offset/duration rows plus the parallelism summary."""
+        lines = []
+        for step in self.executed:
+            offset = step.started_at - self.began_at
+            deps = ", ".join(step.depends_on) or "-"
+            lines.append(f"   {step.name:<13}{step.duration:>6.2f}  @{offset:>5.2f}  after {deps}")
+        serial = sum(step.duration for step in self.executed)
+        lines.append(f"   {'total':<13}{self.wall_time:>6.2f}  (sequential {serial:.2f})")
+        return lines
+
+    async def _run(self, step: StartupStep, phase: str) -> None:
+        with self._tracer.start_as_current_span(f"{phase}.{step.name}") as span:
+            span.set_attribute("depends_on", list(step.depends_on))
+            step.started_at = time.perf_counter()
+            logger.info(f"{phase} stage started", extra={"stage": step.name})
+            try:
+                await step.start()
+            except Exception as exc:
+                span.record_exception(exc)
+                span.set_status(Status(StatusCode.ERROR, str(exc)))
+                logger.error(f"{phase} stage failed", extra={"stage": step.name, "error": str(exc)})
+                raise
+            step.duration = time.perf_counter() - step.started_at
+            span.set_attribute("duration_sec", step.duration)
+            logger.info(
+                f"{phase} stage completed",
+                extra={"stage": step.name, "duration_sec": round(step.duration, 2)},
+            )
@@ -0,0 +1,327 @@
+"""
+Hot-path span event policy.
+
+Long-lived spans (the speech recognizer session span, TTS synthesis spans)
+receive events from code paths that run many times per second. Every
+``span.add_event`` call is kept in memory until the span ends, so a
+10-minute call that records one event per 20 ms audio chunk holds tens of
+thousands of events on a single span.
+
+:func:`record_span_event` routes those events through a central policy that
+is configured per component and per event name:
+
+- ``sample_rate`` keeps a random fraction of events (``0`` keeps none).
+- ``every_n`` keeps the first event and then every Nth one per span.
+- ``metric`` folds every occurrence - kept or not - into an OpenTelemetry
+  counter, or into a histogram of ``value_attribute`` when one is set.
+- ``max_events_per_span`` caps the events any one span accepts through the
+  policy; further events are counted in the ``telemetry.events_dropped``
+  span attribute instead of being stored.
+
+Error, exception, cancellation and auth-failure events are never sampled out
+or capped: they are rare and are what a trace is read for. Once a span's cap
+is reached they are still attached and counted in
+``telemetry.events_exempt``.
+
+Rules are looked up by ``"component.event"``, then ``"component.*"``, then
+``"*"``. The built-in defaults can be extended or overridden with the
+``TELEMETRY_EVENT_POLICY`` environment variable (a JSON object of rule
+name to rule fields) and ``TELEMETRY_MAX_EVENTS_PER_SPAN``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+import threading
+import weakref
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from opentelemetry import metrics
+
+from utils.ml_logging import get_logger
+
+logger = get_logger("utils.telemetry_policy")
+
+_DEFAULT_MAX_EVENTS_PER_SPAN = int(os.getenv("TELEMETRY_MAX_EVENTS_PER_SPAN", "256"))
+
+# Substrings of event names that mark failures (``tts_synthesis_failed``,
+# ``recognition_canceled``, ``recognition_authentication_error``, ...).
+_CRITICAL_MARKERS = ("error", "exception", "fail", "cancel", "auth")
+
+
+def _is_critical(name: str) -> bool:
+    lowered = name.lower()
+    return any(marker in lowered for marker in _CRITICAL_MARKERS)
+
+
+@dataclass(frozen=True)
+class EventRule:
+    """How one kind of span event is recorded."""
+
+    sample_rate: float = 1.0
+    every_n: int = 1
+    metric: Optional[str] = None
+    value_attribute: Optional[str] = None
+    unit: str = ""
+    max_events_per_span: Optional[int] = None
+
+
+DEFAULT_RULES: Dict[str, EventRule] = {
+    # One event per 20 ms chunk: metrics only.
+    "speech_recognizer.audio_chunk": EventRule(
+        sample_rate=0.0,
+        metric="rtagent.speech.audio_chunk.size",
+        value_attribute="size",
+        unit="By",
+    ),
+    # Several partials per utterance: keep a trail, count all of them.
+    "speech_recognizer.partial_recognition_received": EventRule(
+        every_n=10,
+        metric="rtagent.speech.partial_results",
+    ),
+    # Per-sentence setup breadcrumbs carry no data worth storing on the span.
+    "text_to_speech.tts_config_created": EventRule(
+        sample_rate=0.0, metric="rtagent.tts.setup_steps"
+    ),
+    "text_to_speech.tts_synthesizer_created": EventRule(
+        sample_rate=0.0, metric="rtagent.tts.setup_steps"
+    ),
+    "text_to_speech.tts_frame_config_created": EventRule(
+        sample_rate=0.0, metric="rtagent.tts.setup_steps"
+    ),
+    "text_to_speech.tts_frame_synthesizer_created": EventRule(
+        sample_rate=0.0, metric="rtagent.tts.setup_steps"
+    ),
+    "text_to_speech.tts_speaker_synthesizer_created": EventRule(
+        sample_rate=0.0, metric="rtagent.tts.setup_steps"
+    ),
+    "text_to_speech.tts_speaker_ssml_created": EventRule(
+        sample_rate=0.0, metric="rtagent.tts.setup_steps"
+    ),
+}
+
+
+class _SpanState:
+    __slots__ = ("events", "dropped", "exempt", "seen")
+
+    def __init__(self) -> None:
+        self.events = 0
+        self.dropped = 0
+        self.exempt = 0
+        self.seen: Dict[str, int] = {}
+
+
+def _parse_rules(raw: str) -> Dict[str, EventRule]:
+    allowed = {f.name for f in fields(EventRule)}
+    rules: Dict[str, EventRule] = {}
+    for name, spec in json.loads(raw).items():
+        unknown = set(spec) - allowed
+        if unknown:
+            raise ValueError(f"unknown fields for {name}: {sorted(unknown)}")
+        rules[name] = EventRule(**spec)
+    return rules
+
+
+class TelemetryPolicy:
+    """Applies :class:`EventRule` sampling, folding and caps to span events."""
+
+    def __init__(
+        self,
+        rules: Optional[Mapping[str, EventRule]] = None,
+        *,
+        max_events_per_span: int = _DEFAULT_MAX_EVENTS_PER_SPAN,
+        meter: Optional[metrics.Meter] = None,
+    ) -> None:
+        self.rules: Dict[str, EventRule] = dict(DEFAULT_RULES if rules is None else rules)
+        self.max_events_per_span = max_events_per_span
+        self._meter = meter
+        self._resolved: Dict[Tuple[str, str], EventRule] = {}
+        self._instruments: Dict[str, Any] = {}
+        self._spans: "weakref.WeakKeyDictionary[Any, _SpanState]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self.recorded = 0
+        self.sampled_out = 0
+        self.capped = 0
+        self.exempt = 0
+
+    @classmethod
+    def from_env(cls) -> "TelemetryPolicy":
+        rules = dict(DEFAULT_RULES)
+        raw = os.getenv("TELEMETRY_EVENT_POLICY", "").strip()
+        if raw:
+            try:
+                rules.update(_parse_rules(raw))
+            except (ValueError, TypeError) as exc:
+                logger.warning("Ignoring invalid TELEMETRY_EVENT_POLICY: %s", exc)
+        return cls(rules)
+
+    def rule_for(self, component: str, name: str) -> EventRule:
+        key = (component, name)
+        rule = self._resolved.get(key)
+        if rule is None:
+            rule = (
+                self.rules.get(f"{component}.{name}")
+                or self.rules.get(f"{component}.*")
+                or self.rules.get("*")
+                or EventRule()
+            )
+            self._resolved[key] = rule
+        return rule
+
+    def record(
+        self,
+        span: Any,
+        component: str,
+        name: str,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Record ``name`` on ``span`` if the policy allows it.
+
+        Returns True when the event was added to the span.
+        """
+        rule = self.rule_for(component, name)
+        if rule.metric:
+            self._fold(rule, component, name, attributes)
+        if span is not None and _is_critical(name):
+            return self._record_critical(span, name, attributes)
+
+        if span is None or rule.sample_rate <= 0.0:
+            self.sampled_out += 1
+            return False
+        if rule.sample_rate < 1.0 and random.random() >= rule.sample_rate:
+            self.sampled_out += 1
+            return False
+
+        with self._lock:
+            state = self._spans.get(span)
+            if state is None:
+                state = self._spans[span] = _SpanState()
+            if rule.every_n > 1:
+                seen = state.seen.get(name, 0)
+                state.seen[name] = seen + 1
+                if seen % rule.every_n:
+                    self.sampled_out += 1
+                    return False
+            cap = (
+                rule.max_events_per_span
+                if rule.max_events_per_span is not None
+                else self.max_events_per_span
+            )
+            if state.events >= cap:
+                state.dropped += 1
+                dropped = state.dropped
+            else:
+                state.events += 1
+                dropped = 0
+
+        if dropped:
+            self.capped += 1
+            span.set_attribute("telemetry.events_dropped", dropped)
+            return False
+        span.add_event(name, attributes or {})
+        self.recorded += 1
+        return True
+
+    def _record_critical(
+        self, span: Any, name: str, attributes: Optional[Dict[str, Any]]
+    ) -> bool:
+        with self._lock:
+            state = self._spans.get(span)
+            if state is None:
+                state = self._spans[span] = _SpanState()
+            if state.events >= self.max_events_per_span:
+                state.exempt += 1
+                exempt = state.exempt
+            else:
+                state.events += 1
+                exempt = 0
+
+        if exempt:
+            self.exempt += 1
+            span.set_attribute("telemetry.events_exempt", exempt)
+        span.add_event(name, attributes or {})
+        self.recorded += 1
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "recorded": self.recorded,
+            "sampled_out": self.sampled_out,
+            "capped": self.capped,
+            "exempt": self.exempt,
+            "tracked_spans": len(self._spans),
+        }
+
+    def _fold(
+        self,
+        rule: EventRule,
+        component: str,
+        name: str,
+        attributes: Optional[Dict[str, Any]],
+    ) -> None:
+        instrument = self._instruments.get(rule.metric)
+        if instrument is None:
+            instrument = self._create_instrument(rule)
+        if instrument is False:
+            return
+        labels = {"component": component, "event": name}
+        if rule.value_attribute:
+            value = (attributes or {}).get(rule.value_attribute)
+            if isinstance(value, (int, float)):
+                instrument.record(value, labels)
+        else:
+            instrument.add(1, labels)
+
+    def _create_instrument(self, rule: EventRule) -> Any:
+        try:
+            meter = self._meter or metrics.get_meter("rtagent.telemetry")
+            if rule.value_attribute:
+                instrument = meter.create_histogram(
+                    rule.metric, unit=rule.unit, description=f"Folded span events ({rule.value_attribute})"
+                )
+            else:
+                instrument = meter.create_counter(
+                    rule.metric, unit=rule.unit, description="Folded span events"
+                )
+        except Exception as exc:  # pragma: no cover - telemetry must never break callers
+            logger.warning("telemetry metric %s unavailable: %s", rule.metric, exc)
+            instrument = False
+        self._instruments[rule.metric] = instrument
+        return instrument
+
+
+_policy: Optional[TelemetryPolicy] = None
+
+
+def get_telemetry_policy() -> TelemetryPolicy:
+    """Return the process-wide policy, built from the environment on first use."""
+    global _policy
+    if _policy is None:
+        _policy = TelemetryPolicy.from_env()
+    return _policy
+
+
+def configure_telemetry_policy(policy: Optional[TelemetryPolicy]) -> None:
+    """Replace the process-wide policy (``None`` rebuilds it from the environment)."""
+    global _policy
+    _policy = policy
+
+
+def record_span_event(
+    span: Any,
+    component: str,
+    name: str,
+    attributes: Optional[Dict[str, Any]] = None,
+) -> bool:
+    """Add ``name`` to ``span`` subject to the process-wide telemetry policy.
+
+    Never raises: tracing must not break the audio path.
+    """
+    try:
+        return get_telemetry_policy().record(span, component, name, attributes)
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.debug("span event %s.%s not recorded: %s", component, name, exc)
+        return False